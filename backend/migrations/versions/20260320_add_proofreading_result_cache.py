@@ -0,0 +1,58 @@
+"""Add proofreading_result_cache table.
+
+Revision ID: add_proofreading_result_cache
+Revises: add_pipeline_tasks
+Create Date: 2026-03-20
+
+Persistent tier of the content-addressed proofreading result cache, so
+re-proofreading an unchanged article skips the AI call across instances.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision = "add_proofreading_result_cache"
+down_revision = "add_pipeline_tasks"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "proofreading_result_cache",
+        sa.Column("cache_key", sa.String(64), primary_key=True),
+        sa.Column("article_id", sa.Integer, nullable=True),
+        sa.Column("analysis_mode", sa.String(30), nullable=False),
+        sa.Column("prompt_hash", sa.String(64), nullable=True),
+        sa.Column("manifest_fingerprint", sa.String(64), nullable=False),
+        sa.Column("engine_version", sa.String(20), nullable=False),
+        sa.Column("result", JSONB, nullable=False),
+        sa.Column("hit_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("last_accessed_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "idx_proofreading_result_cache_expires_at",
+        "proofreading_result_cache",
+        ["expires_at"],
+    )
+    op.create_index(
+        "idx_proofreading_result_cache_last_accessed_at",
+        "proofreading_result_cache",
+        ["last_accessed_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_proofreading_result_cache_last_accessed_at",
+        table_name="proofreading_result_cache",
+    )
+    op.drop_index(
+        "idx_proofreading_result_cache_expires_at",
+        table_name="proofreading_result_cache",
+    )
+    op.drop_table("proofreading_result_cache")
@@ -0,0 +1,32 @@
+"""Add drive_sync_state table.
+
+Revision ID: add_drive_sync_state
+Revises: add_proofreading_result_cache
+Create Date: 2026-03-22
+
+Per-folder modifiedTime watermark so Google Drive sync only lists and
+exports documents changed since the previous run.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "add_drive_sync_state"
+down_revision = "add_proofreading_result_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "drive_sync_state",
+        sa.Column("folder_id", sa.String(255), primary_key=True),
+        sa.Column("modified_watermark", sa.String(40), nullable=True),
+        sa.Column("last_synced_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("drive_sync_state")
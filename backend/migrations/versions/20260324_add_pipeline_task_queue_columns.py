@@ -0,0 +1,54 @@
+"""Add job queue columns to pipeline_tasks.
+
+Revision ID: add_pipeline_task_queue_columns
+Revises: add_drive_sync_state
+Create Date: 2026-03-24
+
+Turns pipeline_tasks into a durable job queue: priority, retry bookkeeping
+and worker leases with heartbeats, claimed with FOR UPDATE SKIP LOCKED.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "add_pipeline_task_queue_columns"
+down_revision = "add_drive_sync_state"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("pipeline_tasks", sa.Column("priority", sa.Integer, nullable=False, server_default="0"))
+    op.add_column("pipeline_tasks", sa.Column("attempts", sa.Integer, nullable=False, server_default="0"))
+    op.add_column("pipeline_tasks", sa.Column("max_attempts", sa.Integer, nullable=False, server_default="3"))
+    op.add_column(
+        "pipeline_tasks",
+        sa.Column("run_after", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    op.add_column("pipeline_tasks", sa.Column("lease_owner", sa.String(100), nullable=True))
+    op.add_column("pipeline_tasks", sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("pipeline_tasks", sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("pipeline_tasks", sa.Column("started_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_index(
+        "idx_pipeline_tasks_claim",
+        "pipeline_tasks",
+        ["task_type", "status", "priority", "run_after"],
+    )
+    op.create_index("idx_pipeline_tasks_lease_expires_at", "pipeline_tasks", ["lease_expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_pipeline_tasks_lease_expires_at", table_name="pipeline_tasks")
+    op.drop_index("idx_pipeline_tasks_claim", table_name="pipeline_tasks")
+    for column in (
+        "started_at",
+        "heartbeat_at",
+        "lease_expires_at",
+        "lease_owner",
+        "run_after",
+        "max_attempts",
+        "attempts",
+        "priority",
+    ):
+        op.drop_column("pipeline_tasks", column)
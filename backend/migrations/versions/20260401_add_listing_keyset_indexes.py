@@ -0,0 +1,27 @@
+"""Add (updated_at, id) indexes for keyset pagination.
+
+Revision ID: add_listing_keyset_indexes
+Revises: add_pipeline_task_queue_columns
+Create Date: 2026-04-01
+
+The article and worklist list endpoints page with cursors on
+(updated_at DESC, id DESC); these indexes serve each page as a range scan.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "add_listing_keyset_indexes"
+down_revision = "add_pipeline_task_queue_columns"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("idx_articles_updated_at_id", "articles", ["updated_at", "id"])
+    op.create_index("idx_worklist_items_updated_at_id", "worklist_items", ["updated_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_worklist_items_updated_at_id", table_name="worklist_items")
+    op.drop_index("idx_articles_updated_at_id", table_name="articles")
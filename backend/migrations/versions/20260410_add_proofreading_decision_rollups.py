@@ -0,0 +1,110 @@
+"""Add proofreading decision rollup tables.
+
+Revision ID: add_proofreading_decision_rollups
+Revises: add_listing_keyset_indexes
+Create Date: 2026-04-10
+
+Daily decision counts and correction-pair counts that the decision analytics
+endpoints read instead of scanning proofreading_decisions.  Existing history
+is backfilled the same way the service records new decisions: suggestion_type
+is rule_category (or 'unknown') and, as decisions carry no confidence score,
+confidence_sum is 0.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "add_proofreading_decision_rollups"
+down_revision = "add_listing_keyset_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "proofreading_decision_rollups",
+        sa.Column("day", sa.Date, primary_key=True),
+        sa.Column("suggestion_type", sa.String(50), primary_key=True),
+        sa.Column("rule_id", sa.String(20), primary_key=True),
+        sa.Column("decision", sa.String(20), primary_key=True),
+        sa.Column("decision_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("confidence_sum", sa.Float, nullable=False, server_default="0"),
+        sa.Column("sample_text", sa.String(50), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index(
+        "idx_proofreading_decision_rollups_type_day",
+        "proofreading_decision_rollups",
+        ["suggestion_type", "day"],
+    )
+
+    op.create_table(
+        "proofreading_correction_rollups",
+        sa.Column("day", sa.Date, primary_key=True),
+        sa.Column("suggestion_type", sa.String(50), primary_key=True),
+        sa.Column("decision", sa.String(20), primary_key=True),
+        sa.Column("pattern_hash", sa.String(32), primary_key=True),
+        sa.Column("original_snippet", sa.String(50), nullable=False),
+        sa.Column("replacement_snippet", sa.String(50), nullable=False),
+        sa.Column("decision_count", sa.Integer, nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "idx_proofreading_correction_rollups_decision_day",
+        "proofreading_correction_rollups",
+        ["decision", "day"],
+    )
+
+    op.execute(
+        """
+        INSERT INTO proofreading_decision_rollups
+            (day, suggestion_type, rule_id, decision, decision_count, confidence_sum, sample_text)
+        SELECT CAST(created_at AS DATE),
+               COALESCE(rule_category, 'unknown'),
+               rule_id,
+               decision_type,
+               COUNT(*),
+               0,
+               MIN(LEFT(original_text, 50))
+        FROM proofreading_decisions
+        GROUP BY 1, 2, 3, 4
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO proofreading_correction_rollups
+            (day, suggestion_type, decision, pattern_hash,
+             original_snippet, replacement_snippet, decision_count)
+        SELECT day, suggestion_type, decision,
+               MD5(original_snippet || '_' || replacement_snippet),
+               original_snippet, replacement_snippet, COUNT(*)
+        FROM (
+            SELECT CAST(created_at AS DATE) AS day,
+                   COALESCE(rule_category, 'unknown') AS suggestion_type,
+                   decision_type AS decision,
+                   LEFT(original_text, 50) AS original_snippet,
+                   LEFT(
+                       CASE WHEN decision_type = 'modified' THEN modified_content
+                            ELSE suggested_text END,
+                       50
+                   ) AS replacement_snippet
+            FROM proofreading_decisions
+            WHERE decision_type = 'accepted'
+               OR (decision_type = 'modified' AND modified_content IS NOT NULL)
+        ) AS pairs
+        GROUP BY day, suggestion_type, decision, original_snippet, replacement_snippet
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_proofreading_correction_rollups_decision_day",
+        table_name="proofreading_correction_rollups",
+    )
+    op.drop_table("proofreading_correction_rollups")
+    op.drop_index(
+        "idx_proofreading_decision_rollups_type_day",
+        table_name="proofreading_decision_rollups",
+    )
+    op.drop_table("proofreading_decision_rollups")
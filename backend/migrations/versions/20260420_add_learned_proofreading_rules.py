@@ -0,0 +1,34 @@
+"""Add learned_proofreading_rules table.
+
+Revision ID: add_learned_proofreading_rules
+Revises: add_proofreading_decision_rollups
+Create Date: 2026-04-20
+
+Published learned rules, loaded by every API and worker process at start-up
+and polled for changes, so a publish is not lost on restart and reaches
+processes other than the one that handled it.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "add_learned_proofreading_rules"
+down_revision = "add_proofreading_decision_rollups"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "learned_proofreading_rules",
+        sa.Column("rule_id", sa.String(100), primary_key=True),
+        sa.Column("definition", postgresql.JSONB, nullable=False),
+        sa.Column("ruleset_id", sa.String(100), nullable=True),
+        sa.Column("published_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("learned_proofreading_rules")
@@ -0,0 +1,38 @@
+"""Add dedupe_key and its partial unique index to pipeline_tasks.
+
+Revision ID: add_pipeline_task_dedupe_key
+Revises: add_learned_proofreading_rules
+Create Date: 2026-04-25
+
+enqueue(dedupe=True) used to check for an unfinished job and then insert,
+so two concurrent requests could both enqueue.  The unique index over
+unfinished keyed rows lets the insert itself use ON CONFLICT DO NOTHING.
+Existing rows have no key and are not covered.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "add_pipeline_task_dedupe_key"
+down_revision = "add_learned_proofreading_rules"
+branch_labels = None
+depends_on = None
+
+DEDUPE_INDEX_WHERE = "dedupe_key IS NOT NULL AND status IN ('pending', 'processing')"
+
+
+def upgrade() -> None:
+    op.add_column("pipeline_tasks", sa.Column("dedupe_key", sa.String(200), nullable=True))
+    op.create_index(
+        "uq_pipeline_tasks_dedupe",
+        "pipeline_tasks",
+        ["task_type", "dedupe_key"],
+        unique=True,
+        postgresql_where=sa.text(DEDUPE_INDEX_WHERE),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_pipeline_tasks_dedupe", table_name="pipeline_tasks")
+    op.drop_column("pipeline_tasks", "dedupe_key")
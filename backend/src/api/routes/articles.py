@@ -8,10 +8,10 @@ from pathlib import Path
 from typing import Any
 
 from bs4 import BeautifulSoup
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import delete, select
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import attributes, selectinload
+from sqlalchemy.orm import attributes, load_only, selectinload
 
 from src.api.schemas import ProofreadingResponse
 from src.api.schemas.article import (
@@ -35,31 +35,68 @@ from src.models import Article
 from src.models.article_image import ArticleImage
 from src.models.proofreading import ProofreadingDecision
 from src.models.seo_suggestions import SEOSuggestion
+from src.services.pagination import cached_count, keyset_page, next_cursor
 from src.services.proofreading import (
     ArticlePayload,
     ArticleSection,
     ImageMetadata,
     ProofreadingAnalysisService,
 )
+from src.services.proofreading.incremental import IncrementalSnapshot
 
 logger = get_logger(__name__)
 router = APIRouter()
 
 
+# Columns ArticleListResponse needs (plus the keyset); bodies and JSONB stay in the DB
+LIST_COLUMNS = (
+    Article.id,
+    Article.title,
+    Article.status,
+    Article.author_id,
+    Article.created_at,
+    Article.updated_at,
+    Article.published_at,
+)
+
+
 @router.get("", response_model=list[ArticleListResponse])
 async def list_articles(
+    response: Response,
     skip: int = 0,
     limit: int = 20,
+    cursor: str | None = None,
     session: AsyncSession = Depends(get_session),
 ) -> list[Article]:
-    """List articles."""
-    result = await session.execute(
-        select(Article)
-        .order_by(Article.created_at.desc())
-        .offset(skip)
-        .limit(limit)
+    """List articles, most recently updated first.
+
+    Pass a response's ``X-Next-Cursor`` header back as ``cursor`` for the
+    next page (``skip`` still pages by offset).  ``X-Total-Count`` carries
+    a cached total.
+    """
+    try:
+        query = keyset_page(
+            select(Article).options(load_only(*LIST_COLUMNS)), Article, cursor, limit
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    if not cursor:
+        query = query.offset(skip)
+
+    result = await session.execute(query)
+    articles = list(result.scalars().all())
+
+    total = await cached_count(
+        session,
+        select(func.count()).select_from(Article),
+        "articles",
+        table=Article.__tablename__,
     )
-    return list(result.scalars().all())
+    response.headers["X-Total-Count"] = str(total)
+    cursor_after = next_cursor(articles, limit)
+    if cursor_after:
+        response.headers["X-Next-Cursor"] = cursor_after
+    return articles
 
 
 @router.get("/{article_id}", response_model=ArticleResponse)
@@ -160,15 +197,26 @@ async def patch_article(
 @router.post("/{article_id}/proofread", response_model=ProofreadingResponse)
 async def proofread_article(
     article_id: int,
+    incremental: bool = False,
     session: AsyncSession = Depends(get_session),
 ) -> ProofreadingResponse:
-    """Run unified proofreading (AI + deterministic checks) for an article."""
+    """Run unified proofreading (AI + deterministic checks) for an article.
+
+    With ``incremental=true`` only paragraphs edited since the previous
+    incremental run are re-checked.
+    """
     article = await _fetch_article(session, article_id)
     payload = _build_article_payload(article)
     service = _get_proofreading_service()
+    snapshot = None
 
     try:
-        result = await service.analyze_article(payload)
+        if incremental:
+            result, snapshot = await service.analyze_article_incremental(
+                payload, _load_incremental_snapshot(article.article_metadata)
+            )
+        else:
+            result = await service.analyze_article(payload)
     except Exception as exc:  # noqa: BLE001 - propagate as HTTP error
         logger.error(
             "proofreading_analysis_failed",
@@ -185,9 +233,20 @@ async def proofread_article(
         issue.model_dump(mode="json") for issue in result.issues
     ]
     article.critical_issues_count = result.statistics.blocking_issue_count
+    previous_snapshot = (article.article_metadata or {}).get("proofreading", {}).get(
+        "incremental_snapshot"
+    )
     article.article_metadata = _merge_proofreading_metadata(
         article.article_metadata, result.model_dump(mode="json")
     )
+    if snapshot is not None:
+        article.article_metadata["proofreading"]["incremental_snapshot"] = (
+            snapshot.model_dump(mode="json")
+        )
+    elif previous_snapshot is not None:
+        article.article_metadata["proofreading"]["incremental_snapshot"] = (
+            previous_snapshot
+        )
 
     session.add(article)
     await session.commit()
@@ -225,9 +284,8 @@ async def reparse_article(
         storage = await create_google_drive_storage()
 
         # Export Google Doc as HTML (preserves structure and images)
-        request = storage.service.files().export(fileId=file_id, mimeType="text/html")
-        raw_html_bytes = request.execute()
-        raw_html = raw_html_bytes.decode("utf-8", errors="ignore") if isinstance(raw_html_bytes, bytes) else raw_html_bytes
+        raw_html_bytes = await storage.export_file(file_id, "text/html")
+        raw_html = raw_html_bytes.decode("utf-8", errors="ignore")
 
         # Parse with latest parser (Claude Sonnet 4.5) using unified prompt
         # for primary_category classification and focus_keyword extraction
@@ -617,6 +675,20 @@ def _merge_proofreading_metadata(
     return metadata
 
 
+def _load_incremental_snapshot(
+    metadata: dict[str, Any] | None,
+) -> IncrementalSnapshot | None:
+    """Return the stored paragraph snapshot, ignoring missing or stale data."""
+    raw = (metadata or {}).get("proofreading", {}).get("incremental_snapshot")
+    if not raw:
+        return None
+    try:
+        return IncrementalSnapshot.model_validate(raw)
+    except ValueError:
+        logger.warning("proofreading_incremental_snapshot_invalid")
+        return None
+
+
 @lru_cache(maxsize=1)
 def _get_proofreading_service() -> ProofreadingAnalysisService:
     """Provide a cached ProofreadingAnalysisService instance."""
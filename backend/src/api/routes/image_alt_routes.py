@@ -5,6 +5,7 @@ Provides endpoints for generating AI-suggested alt text and descriptions for ima
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,6 +16,8 @@ from src.models.article_image import ArticleImage
 from src.models.worklist import WorklistItem
 from src.services.image_alt_generator import (
     GenerationMethod,
+    ImageAltRequest,
+    ImageAltSuggestion,
     ImageType,
     get_image_alt_generator_service,
 )
@@ -126,6 +129,10 @@ class BatchImageAltRequest(BaseModel):
         default=True,
         description="Whether to use vision analysis"
     )
+    stream: bool = Field(
+        default=False,
+        description="Stream suggestions as NDJSON lines as soon as each is ready"
+    )
 
 
 class BatchImageAltResponse(BaseModel):
@@ -136,6 +143,25 @@ class BatchImageAltResponse(BaseModel):
     failed_count: int
 
 
+def _to_response(suggestion: ImageAltSuggestion) -> ImageAltSuggestionResponse:
+    return ImageAltSuggestionResponse(
+        image_id=suggestion.image_id,
+        parsed_alt_text=suggestion.parsed_alt_text,
+        parsed_caption=suggestion.parsed_caption,
+        parsed_description=suggestion.parsed_description,
+        suggested_alt_text=suggestion.suggested_alt_text,
+        suggested_alt_text_confidence=suggestion.suggested_alt_text_confidence,
+        suggested_description=suggestion.suggested_description,
+        suggested_description_confidence=suggestion.suggested_description_confidence,
+        image_type=suggestion.image_type.value,
+        detected_text=suggestion.detected_text,
+        generation_method=suggestion.generation_method.value,
+        model_used=suggestion.model_used,
+        tokens_used=suggestion.tokens_used,
+        error_message=suggestion.error_message
+    )
+
+
 # === API Endpoints ===
 
 
@@ -215,22 +241,7 @@ async def generate_image_alt(
         tokens=suggestion.tokens_used
     )
 
-    return ImageAltSuggestionResponse(
-        image_id=suggestion.image_id,
-        parsed_alt_text=suggestion.parsed_alt_text,
-        parsed_caption=suggestion.parsed_caption,
-        parsed_description=suggestion.parsed_description,
-        suggested_alt_text=suggestion.suggested_alt_text,
-        suggested_alt_text_confidence=suggestion.suggested_alt_text_confidence,
-        suggested_description=suggestion.suggested_description,
-        suggested_description_confidence=suggestion.suggested_description_confidence,
-        image_type=suggestion.image_type.value,
-        detected_text=suggestion.detected_text,
-        generation_method=suggestion.generation_method.value,
-        model_used=suggestion.model_used,
-        tokens_used=suggestion.tokens_used,
-        error_message=suggestion.error_message
-    )
+    return _to_response(suggestion)
 
 
 @router.post(
@@ -246,7 +257,7 @@ async def generate_all_image_alt(
     worklist_item_id: int,
     request: BatchImageAltRequest = BatchImageAltRequest(image_ids=[]),
     db: AsyncSession = Depends(get_session)
-) -> BatchImageAltResponse:
+) -> BatchImageAltResponse | StreamingResponse:
     """Generate alt text for all images in a worklist item"""
 
     # Fetch worklist item
@@ -284,34 +295,39 @@ async def generate_all_image_alt(
         "excerpt": article.body_text[:500] if article.body_text else ""
     }
 
-    # Generate suggestions for each image
+    # Generate suggestions for all images (fetched once, packed into few vision calls)
     service = get_image_alt_generator_service()
-    suggestions = []
-    total_tokens = 0
-    successful = 0
-    failed = 0
-
-    for image in images:
-        # Determine image URL
-        image_url = image.preview_path or image.source_url
-
-        # Build context for this image
-        article_context = {
-            **article_context_base,
-            "position": image.position or 0,
-            "is_featured": image.position == 0
-        }
-
-        suggestion = await service.generate_suggestions(
+    alt_requests = [
+        ImageAltRequest(
             image_id=image.id,
-            image_url=image_url,
-            article_context=article_context,
+            # Prefer the local preview written at ingestion, fall back to the source URL
+            image_url=image.preview_path or image.source_url,
+            article_context={
+                **article_context_base,
+                "position": image.position or 0,
+                "is_featured": image.position == 0
+            },
             parsed_alt_text=image.alt_text,
             parsed_caption=image.caption,
-            parsed_description=image.description,
-            use_vision=request.use_vision
+            parsed_description=image.description
         )
+        for image in images
+    ]
+    batch = service.generate_suggestions_batch(alt_requests, use_vision=request.use_vision)
+
+    if request.stream:
+        async def ndjson_lines():
+            async for suggestion in batch:
+                yield _to_response(suggestion).model_dump_json() + "\n"
 
+        return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+    by_image_id = {}
+    total_tokens = 0
+    successful = 0
+    failed = 0
+
+    async for suggestion in batch:
         total_tokens += suggestion.tokens_used
 
         if suggestion.generation_method == GenerationMethod.FAILED:
@@ -319,22 +335,9 @@ async def generate_all_image_alt(
         else:
             successful += 1
 
-        suggestions.append(ImageAltSuggestionResponse(
-            image_id=suggestion.image_id,
-            parsed_alt_text=suggestion.parsed_alt_text,
-            parsed_caption=suggestion.parsed_caption,
-            parsed_description=suggestion.parsed_description,
-            suggested_alt_text=suggestion.suggested_alt_text,
-            suggested_alt_text_confidence=suggestion.suggested_alt_text_confidence,
-            suggested_description=suggestion.suggested_description,
-            suggested_description_confidence=suggestion.suggested_description_confidence,
-            image_type=suggestion.image_type.value,
-            detected_text=suggestion.detected_text,
-            generation_method=suggestion.generation_method.value,
-            model_used=suggestion.model_used,
-            tokens_used=suggestion.tokens_used,
-            error_message=suggestion.error_message
-        ))
+        by_image_id[suggestion.image_id] = _to_response(suggestion)
+
+    suggestions = [by_image_id[image.id] for image in images if image.id in by_image_id]
 
     logger.info(
         "batch_image_alt_generated",
@@ -237,7 +237,7 @@ async def generate_all_optimizations(
     # Generate optimizations
     try:
         result = await service.generate_all_optimizations(
-            article=article, regenerate=request.regenerate
+            article=article, regenerate=request.regenerate, stream=request.stream
         )
         logger.info(
             f"Successfully generated optimizations for article {article_id}: "
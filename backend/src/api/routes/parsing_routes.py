@@ -73,6 +73,7 @@ async def generate_optimizations_background(article_id: int) -> None:
             result = await service.generate_all_optimizations(
                 article=article,
                 regenerate=False,  # Don't regenerate if already exists
+                stream=True,  # Title/SEO suggestions become visible before FAQs
             )
 
             logger.info(
@@ -254,6 +255,9 @@ async def parse_article(
         use_ai_parsing=request.use_ai,
         anthropic_api_key=settings.ANTHROPIC_API_KEY if request.use_ai else None,
         storage_path=str(settings.IMAGE_STORAGE_PATH),
+        max_concurrent_images=settings.IMAGE_DOWNLOAD_CONCURRENCY,
+        max_images_per_host=settings.IMAGE_DOWNLOAD_PER_HOST,
+        preview_max_size=settings.IMAGE_PREVIEW_MAX_SIZE,
     )
 
     try:
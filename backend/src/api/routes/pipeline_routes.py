@@ -2,9 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
-import uuid
-from datetime import UTC, datetime
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -13,9 +10,10 @@ from sqlalchemy import select
 from sqlalchemy.exc import TimeoutError as SATimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.config.database import get_db_config, get_session
+from src.config.database import get_session
 from src.config.logging import get_logger
 from src.models.pipeline_task import PipelineTask
+from src.workers.queue import get_job_queue
 
 logger = get_logger(__name__)
 
@@ -46,6 +44,22 @@ class TaskStatusResponse(BaseModel):
     error: str | None = None
 
 
+class MessageBatchRequest(BaseModel):
+    kind: str = Field(
+        ..., description="unified_optimization | proofreading | seo_analysis"
+    )
+    article_ids: list[int] | None = Field(
+        default=None, description="Articles to process (default: the kind's backlog)"
+    )
+    limit: int | None = Field(default=None, ge=1, description="Cap on backlog articles")
+
+
+class MessageBatchResponse(BaseModel):
+    task_id: str
+    status: str
+    message: str
+
+
 class CleanupRequest(BaseModel):
     worklist_item_id: int = Field(..., description="ID of the published worklist item to clean up")
 
@@ -66,14 +80,11 @@ class CleanupResponse(BaseModel):
     response_model=AutoPublishResponse,
     status_code=status.HTTP_202_ACCEPTED,
 )
-async def auto_publish(
-    payload: AutoPublishRequest,
-    session: AsyncSession = Depends(get_session),
-) -> AutoPublishResponse:
+async def auto_publish(payload: AutoPublishRequest) -> AutoPublishResponse:
     """Trigger the auto-publish pipeline for a Google Doc.
 
-    Creates a DB-tracked task and runs the pipeline in a background
-    asyncio task.  Returns 202 immediately.
+    Enqueues a durable ``auto_publish`` job (see ``src.workers.tasks``)
+    and returns 202 immediately; any instance's worker may run it.
     """
     google_doc_url = payload.google_doc_url
     sheet_row = payload.sheet_row
@@ -84,55 +95,10 @@ async def auto_publish(
         sheet_row=sheet_row,
     )
 
-    # Persist task record in DB so status survives instance restarts
-    task_id = str(uuid.uuid4())
-    task = PipelineTask(
-        id=task_id,
-        task_type="auto_publish",
-        status="processing",
-        input={"google_doc_url": google_doc_url, "sheet_row": sheet_row},
+    task_id = await get_job_queue().enqueue(
+        "auto_publish",
+        {"google_doc_url": google_doc_url, "sheet_row": sheet_row},
     )
-    session.add(task)
-    await session.commit()
-
-    async def _run_pipeline(tid: str, doc_url: str, row: int | None) -> None:
-        """Execute the auto-publish pipeline in the background."""
-        db_config = get_db_config()
-        try:
-            from src.services.worklist.auto_publish import AutoPublishService
-
-            service = AutoPublishService(session=None)  # type: ignore[arg-type]
-            result = await service.process_google_doc(
-                google_doc_url=doc_url,
-                sheet_row=row,
-            )
-            async with db_config.session() as s:
-                t = await s.get(PipelineTask, tid)
-                if t:
-                    t.status = "completed"
-                    t.result = result
-                    t.completed_at = datetime.now(UTC)
-                    await s.commit()
-            logger.info("auto_publish_background_completed", task_id=tid)
-        except Exception as exc:
-            logger.error(
-                "auto_publish_background_failed",
-                task_id=tid,
-                error=str(exc),
-                exc_info=True,
-            )
-            try:
-                async with db_config.session() as s:
-                    t = await s.get(PipelineTask, tid)
-                    if t:
-                        t.status = "failed"
-                        t.error = str(exc) or repr(exc) or type(exc).__name__
-                        t.completed_at = datetime.now(UTC)
-                        await s.commit()
-            except Exception:
-                logger.error("pipeline_task_status_update_failed", task_id=tid, exc_info=True)
-
-    asyncio.create_task(_run_pipeline(task_id, google_doc_url, sheet_row))
 
     logger.info(
         "auto_publish_background_task_created",
@@ -185,6 +151,41 @@ async def get_auto_publish_status(
     )
 
 
+@router.post(
+    "/message-batches",
+    response_model=MessageBatchResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_message_batch(payload: MessageBatchRequest) -> MessageBatchResponse:
+    """Queue a bulk AI backfill on the Anthropic Message Batches API.
+
+    The ``message_batch_submit`` job creates the batches; each batch gets a
+    ``message_batch_collect`` job (visible via the task status endpoint)
+    that applies its results once Anthropic has finished.
+    """
+    from src.workers.message_batches import SUBMIT_TASK, batch_kinds
+
+    if payload.kind not in batch_kinds():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown batch kind {payload.kind!r}; expected one of {batch_kinds()}",
+        )
+
+    task_id = await get_job_queue().enqueue(SUBMIT_TASK, payload.model_dump())
+    logger.info(
+        "message_batch_requested",
+        task_id=task_id,
+        kind=payload.kind,
+        articles=len(payload.article_ids) if payload.article_ids else None,
+        limit=payload.limit,
+    )
+    return MessageBatchResponse(
+        task_id=task_id,
+        status="queued",
+        message=f"{payload.kind} message batch submission queued",
+    )
+
+
 @router.post(
     "/cleanup",
     response_model=CleanupResponse,
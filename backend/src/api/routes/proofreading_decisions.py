@@ -3,6 +3,8 @@
 實現 T7.3 的 RESTful API 端點，提供決策管理的完整功能。
 """
 
+import asyncio
+import time
 from datetime import datetime
 from typing import Any
 
@@ -63,6 +65,8 @@ from src.schemas.proofreading_decision import (
     TrendType,
     UserPreferencesResponse,
 )
+from src.services.proofreading.learned_rule_store import save_published_rules
+from src.services.proofreading.learned_rules import get_learned_rule_registry
 from src.services.proofreading_decision import (
     DateRange,
     DecisionInput,
@@ -1516,8 +1520,18 @@ async def publish_rules(
         # 生成規則集ID
         ruleset_id = f"ruleset_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
 
-        # TODO: 實際應該保存到數據庫
-        logger.info(f"發布規則集: {ruleset_id}, 包含 {len(rules_to_publish)} 個規則")
+        # 熱加載到確定性規則引擎（只有已批准/已修改的規則會生效）；測試模式只編譯校驗
+        registry = get_learned_rule_registry()
+        if request.test_mode:
+            learned = await asyncio.to_thread(registry.compile, rules_to_publish)
+        else:
+            # 先寫入數據庫（其他進程輪詢加載、重啟後恢復），再熱加載到本進程
+            await save_published_rules(session, rules_to_publish, ruleset_id=ruleset_id)
+            learned = await asyncio.to_thread(registry.publish, rules_to_publish)
+        logger.info(
+            f"發布規則集: {ruleset_id}, 包含 {len(rules_to_publish)} 個規則, "
+            f"引擎規則版本 {learned.version[:8]}"
+        )
 
         return PublishRulesResponse(
             success=True,
@@ -1532,6 +1546,14 @@ async def publish_rules(
                 "code_generation": {
                     "success": True,
                     "compiled_rules": f"/api/v1/proofreading/rules/compiled/{ruleset_id}"
+                },
+                "learned_rules": {
+                    "version": learned.version,
+                    "active": registry.version == learned.version,
+                    "active_rules": len(learned),
+                    "rejected_rules": [
+                        {"rule_id": r.rule_id, "reason": r.reason} for r in learned.rejected
+                    ],
                 }
             }
         )
@@ -1556,52 +1578,46 @@ async def test_rules(
         測試結果
     """
     try:
-        # 應用規則到測試內容
+        # 應用規則到測試內容（與引擎使用同一編譯與 ReDoS 篩查，按內容哈希緩存）
+        started = time.perf_counter()
         result_text = request.test_content
         changes = []
 
-        # 簡單的模擬規則應用
-        if request.rules:
-            import re
-            for rule in request.rules:
-                if rule.pattern and rule.replacement:
-                    # Reject overly complex patterns to prevent ReDoS
-                    if len(rule.pattern) > 500:
-                        changes.append({
-                            "rule_id": rule.rule_id,
-                            "type": "error",
-                            "position": [0, 0],
-                            "original": "",
-                            "replacement": "",
-                            "confidence": 0,
-                            "error": "Pattern too long (max 500 chars)"
-                        })
-                        continue
-                    try:
-                        compiled = re.compile(rule.pattern)
-                    except re.error as regex_err:
-                        changes.append({
-                            "rule_id": rule.rule_id,
-                            "type": "error",
-                            "position": [0, 0],
-                            "original": "",
-                            "replacement": "",
-                            "confidence": 0,
-                            "error": f"Invalid regex pattern: {regex_err}"
-                        })
-                        continue
-                    matches = list(compiled.finditer(result_text))
-                    for match in reversed(matches):  # 從後往前替換避免位置偏移
-                        start, end = match.span()
-                        changes.append({
-                            "rule_id": rule.rule_id,
-                            "type": "replacement",
-                            "position": [start, end],
-                            "original": match.group(),
-                            "replacement": rule.replacement,
-                            "confidence": rule.confidence
-                        })
-                        result_text = result_text[:start] + rule.replacement + result_text[end:]
+        testable = [rule for rule in request.rules or [] if rule.pattern and rule.replacement]
+        ruleset = await asyncio.to_thread(
+            get_learned_rule_registry().compile, testable, reviewed_only=False
+        )
+        compiled_by_id = {compiled.rule_id: compiled for compiled in ruleset.rules}
+        rejected_by_id = {rejected.rule_id: rejected.reason for rejected in ruleset.rejected}
+
+        for rule in testable:
+            if rule.rule_id in rejected_by_id:
+                changes.append({
+                    "rule_id": rule.rule_id,
+                    "type": "error",
+                    "position": [0, 0],
+                    "original": "",
+                    "replacement": "",
+                    "confidence": 0,
+                    "error": rejected_by_id[rule.rule_id]
+                })
+                continue
+            compiled = compiled_by_id.get(rule.rule_id)
+            if compiled is None:
+                continue
+            matches = list(compiled.pattern.finditer(result_text))
+            for match in reversed(matches):  # 從後往前替換避免位置偏移
+                start, end = match.span()
+                replacement = compiled.render_replacement(match)
+                changes.append({
+                    "rule_id": rule.rule_id,
+                    "type": "replacement",
+                    "position": [start, end],
+                    "original": match.group(),
+                    "replacement": replacement,
+                    "confidence": rule.confidence
+                })
+                result_text = result_text[:start] + replacement + result_text[end:]
 
         return TestRulesResponse(
             success=True,
@@ -1609,7 +1625,7 @@ async def test_rules(
                 "original": request.test_content,
                 "result": result_text,
                 "changes": changes,
-                "execution_time_ms": 15
+                "execution_time_ms": round((time.perf_counter() - started) * 1000, 2)
             }
         )
 
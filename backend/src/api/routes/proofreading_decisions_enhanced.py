@@ -2,6 +2,7 @@
 增強版校對決策API - 包含完整的規則發布功能
 """
 
+import asyncio
 from datetime import datetime
 from pathlib import Path
 from typing import Literal
@@ -18,6 +19,8 @@ from src.schemas.proofreading_decision import (
     PublishRulesResponse,
     ReviewStatus,
 )
+from src.services.proofreading.learned_rule_store import save_published_rules
+from src.services.proofreading.learned_rules import get_learned_rule_registry
 from src.services.rule_compiler import rule_compiler
 
 router = APIRouter(prefix="/api/v1/proofreading/decisions", tags=["proofreading"])
@@ -127,6 +130,15 @@ async def publish_rules_enhanced(
         with open(json_path, "w", encoding="utf-8") as f:
             json.dump(json_config, f, ensure_ascii=False, indent=2)
 
+        # 4. 熱加載到確定性規則引擎（測試模式只編譯校驗，不生效）
+        registry = get_learned_rule_registry()
+        if request.test_mode:
+            learned = await asyncio.to_thread(registry.compile, rules_to_publish)
+        else:
+            # 先寫入數據庫（其他進程輪詢加載、重啟後恢復），再熱加載到本進程
+            await save_published_rules(session, rules_to_publish, ruleset_id=ruleset_id)
+            learned = await asyncio.to_thread(registry.publish, rules_to_publish)
+
         # 儲存發布記錄
         published_rulesets[ruleset_id] = {
             "ruleset_id": ruleset_id,
@@ -136,6 +148,7 @@ async def publish_rules_enhanced(
             "python_module": str(python_module_path),
             "ts_module": str(ts_module_path),
             "json_config": str(json_path),
+            "learned_version": learned.version,
             "created_at": datetime.utcnow(),
             "status": "active" if not request.test_mode else "test"
         }
@@ -159,6 +172,14 @@ async def publish_rules_enhanced(
                     "typescript_module": str(ts_module_path.name),
                     "json_config": str(json_path.name)
                 },
+                "learned_rules": {
+                    "version": learned.version,
+                    "active": registry.version == learned.version,
+                    "active_rules": len(learned),
+                    "rejected_rules": [
+                        {"rule_id": r.rule_id, "reason": r.reason} for r in learned.rejected
+                    ],
+                },
                 "download_urls": {
                     "python": f"/api/v1/proofreading/decisions/rules/download/{ruleset_id}/python",
                     "typescript": f"/api/v1/proofreading/decisions/rules/download/{ruleset_id}/typescript",
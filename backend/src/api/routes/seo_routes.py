@@ -16,14 +16,9 @@ from src.api.schemas.seo_analysis import (
 from src.config.database import get_session as get_db
 from src.config.logging import get_logger
 from src.models.article import Article
+from src.models.pipeline_task import PipelineTask, PipelineTaskStatus
 from src.models.seo import SEOMetadata
-
-try:
-    from celery.result import AsyncResult
-    from src.workers.celery_app import celery_app
-except ImportError:
-    AsyncResult = None  # type: ignore[assignment,misc]
-    celery_app = None  # type: ignore[assignment]
+from src.workers.queue import get_job_queue
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -304,22 +299,19 @@ async def analyze_article_seo(article_id: int) -> SEOAnalysisSingleResponse:
         HTTPException: If task queuing fails
     """
     try:
-        # Lazy import to avoid circular dependency
-        from src.workers.tasks import analyze_seo_single_task
-
-        task = analyze_seo_single_task.delay(article_id)
+        task_id = await get_job_queue().enqueue("seo_analysis", {"article_id": article_id})
 
         logger.info(
             "seo_analysis_task_queued",
-            task_id=task.id,
+            task_id=task_id,
             article_id=article_id,
         )
 
         return SEOAnalysisSingleResponse(
-            task_id=task.id,
+            task_id=task_id,
             message=f"SEO analysis task queued for article {article_id}",
             article_id=article_id,
-            status_url=f"/v1/seo/status/{task.id}",
+            status_url=f"/v1/seo/status/{task_id}",
         )
 
     except Exception as e:
@@ -351,22 +343,19 @@ async def analyze_batch_seo(limit: int | None = None) -> SEOAnalysisBatchRespons
         HTTPException: If task queuing fails
     """
     try:
-        # Lazy import to avoid circular dependency
-        from src.workers.tasks import analyze_seo_batch_task
-
-        task = analyze_seo_batch_task.delay(limit)
+        task_id = await get_job_queue().enqueue("seo_batch_analysis", {"limit": limit})
 
         logger.info(
             "seo_batch_analysis_task_queued",
-            task_id=task.id,
+            task_id=task_id,
             limit=limit,
         )
 
         return SEOAnalysisBatchResponse(
-            task_id=task.id,
+            task_id=task_id,
             message=f"Batch SEO analysis task queued{f' (limit: {limit})' if limit else ''}",
             limit=limit,
-            status_url=f"/v1/seo/status/{task.id}",
+            status_url=f"/v1/seo/status/{task_id}",
         )
 
     except Exception as e:
@@ -382,12 +371,24 @@ async def analyze_batch_seo(limit: int | None = None) -> SEOAnalysisBatchRespons
         ) from e
 
 
+# Map job queue states to the SEO task API states
+_SEO_TASK_STATUS_MAP = {
+    PipelineTaskStatus.PENDING.value: "pending",
+    PipelineTaskStatus.PROCESSING.value: "running",
+    PipelineTaskStatus.COMPLETED.value: "completed",
+    PipelineTaskStatus.FAILED.value: "failed",
+    PipelineTaskStatus.CANCELLED.value: "failed",
+}
+
+
 @router.get("/seo/status/{task_id}", response_model=SEOTaskStatusResponse)
-async def get_seo_task_status(task_id: str) -> SEOTaskStatusResponse:
+async def get_seo_task_status(
+    task_id: str, db: AsyncSession = Depends(get_db)
+) -> SEOTaskStatusResponse:
     """Get status of SEO analysis task.
 
     Args:
-        task_id: Celery task ID
+        task_id: Job queue task ID
 
     Returns:
         SEOTaskStatusResponse with task status and result
@@ -395,63 +396,37 @@ async def get_seo_task_status(task_id: str) -> SEOTaskStatusResponse:
     Raises:
         HTTPException: If task not found or status check fails
     """
-    try:
-        task_result = AsyncResult(task_id, app=celery_app)
-
-        # Map Celery states to our status
-        status_map = {
-            "PENDING": "pending",
-            "STARTED": "running",
-            "SUCCESS": "completed",
-            "FAILURE": "failed",
-            "RETRY": "running",
-            "REVOKED": "failed",
-        }
-
-        status_value = status_map.get(task_result.state, "unknown")
-
-        response = SEOTaskStatusResponse(
-            task_id=task_id,
-            status=status_value,
-        )
-
-        # Add result if completed
-        if task_result.state == "SUCCESS":
-            result_data = task_result.result
-            if result_data:
-                response.result = result_data
-
-        # Add error if failed
-        elif task_result.state == "FAILURE":
-            response.error = str(task_result.result)
-
-        logger.debug(
-            "seo_task_status_checked",
-            task_id=task_id,
-            status=status_value,
+    task = await db.get(PipelineTask, task_id)
+    if task is None or not task.task_type.startswith("seo_"):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"SEO task {task_id} not found",
         )
 
-        return response
+    status_value = _SEO_TASK_STATUS_MAP.get(task.status, "unknown")
+    response = SEOTaskStatusResponse(task_id=task_id, status=status_value)
+    if task.status == PipelineTaskStatus.COMPLETED.value and task.result:
+        response.result = task.result
+    elif task.error:
+        response.error = task.error
+
+    logger.debug(
+        "seo_task_status_checked",
+        task_id=task_id,
+        status=status_value,
+    )
 
-    except Exception as e:
-        logger.error(
-            "seo_task_status_check_failed",
-            task_id=task_id,
-            error=str(e),
-            exc_info=True,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to check task status: {str(e)}",
-        ) from e
+    return response
 
 
 @router.delete("/seo/task/{task_id}")
 async def cancel_seo_task(task_id: str) -> dict[str, str]:
-    """Cancel a running SEO analysis task.
+    """Cancel a queued SEO analysis task.
+
+    Only tasks that have not started yet can be cancelled.
 
     Args:
-        task_id: Celery task ID
+        task_id: Job queue task ID
 
     Returns:
         dict with cancellation status
@@ -460,26 +435,7 @@ async def cancel_seo_task(task_id: str) -> dict[str, str]:
         HTTPException: If task cannot be cancelled
     """
     try:
-        task_result = AsyncResult(task_id, app=celery_app)
-
-        if task_result.state in ["SUCCESS", "FAILURE"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Cannot cancel {task_result.state.lower()} task",
-            )
-
-        # Revoke the task
-        task_result.revoke(terminate=True)
-
-        logger.info("seo_task_cancelled", task_id=task_id)
-
-        return {
-            "message": f"SEO analysis task {task_id} cancelled",
-            "status": "cancelled",
-        }
-
-    except HTTPException:
-        raise
+        cancelled = await get_job_queue().cancel(task_id)
     except Exception as e:
         logger.error(
             "seo_task_cancel_failed",
@@ -491,3 +447,16 @@ async def cancel_seo_task(task_id: str) -> dict[str, str]:
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to cancel task: {str(e)}",
         ) from e
+
+    if not cancelled:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only pending tasks can be cancelled",
+        )
+
+    logger.info("seo_task_cancelled", task_id=task_id)
+
+    return {
+        "message": f"SEO analysis task {task_id} cancelled",
+        "status": "cancelled",
+    }
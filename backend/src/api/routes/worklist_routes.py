@@ -2,10 +2,8 @@
 
 from __future__ import annotations
 
-import asyncio
 import hashlib
 import json
-import uuid
 from datetime import UTC, datetime
 from typing import Any
 
@@ -30,23 +28,23 @@ from src.api.schemas import (
 from src.config.database import get_db_config, get_session
 from src.config.logging import get_logger
 from src.models import Article, ArticleFAQ, ProofreadingDecision, WorklistItem
-from src.models.pipeline_task import PipelineTask
+from src.services.pagination import next_cursor
 from src.services.worklist import WorklistService
+from src.workers.queue import get_job_queue
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/worklist", tags=["Worklist"])
 
 WorklistListResponse = PaginatedResponse[WorklistItemResponse]
 
-# Guard to prevent overlapping sync cycles
-_sync_lock = asyncio.Lock()
-
-
 @router.get("", response_model=WorklistListResponse)
 async def list_worklist_items(
     status_filter: str | None = Query(default=None, alias="status"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(
+        default=None, description="next_cursor of the previous page; overrides offset"
+    ),
     session: AsyncSession = Depends(get_session),
 ) -> WorklistListResponse:
     """List worklist items with optional status filtering."""
@@ -56,6 +54,7 @@ async def list_worklist_items(
             status=status_filter,
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
     except ValueError as exc:
         raise HTTPException(
@@ -78,6 +77,7 @@ async def list_worklist_items(
         total=total,
         page=page,
         page_size=limit,
+        next_cursor=next_cursor(items, limit),
     )
 
 
@@ -106,16 +106,16 @@ async def get_sync_status(
 async def trigger_worklist_sync() -> WorklistSyncTriggerResponse:
     """Trigger asynchronous sync with Google Drive.
 
-    Returns 202 immediately and runs sync in the background.
+    Enqueues a durable ``worklist_sync`` job and returns 202 immediately.
     Poll GET /sync-status for progress.
     """
-    from src.config.database import get_db_config
-    from src.models import PipelineTask
-
     queued_at = datetime.now(UTC).isoformat()
 
-    # Guard: skip if a sync is already running
-    if _sync_lock.locked():
+    # Guard: skip if a sync is already queued or running on any instance
+    task_id = await get_job_queue().enqueue(
+        "worklist_sync", {"triggered_at": queued_at}, dedupe=True
+    )
+    if task_id is None:
         return WorklistSyncTriggerResponse(
             status="skipped",
             message="Previous sync still running",
@@ -123,24 +123,6 @@ async def trigger_worklist_sync() -> WorklistSyncTriggerResponse:
             queued_at=queued_at,
         )
 
-    db_config = get_db_config()
-    task_id = str(uuid.uuid4())
-
-    # Phase 1: Create task in DB
-    async with db_config.session() as session:
-        task = PipelineTask(
-            id=task_id,
-            task_type="worklist_sync",
-            status="processing",
-            input={"triggered_at": queued_at},
-        )
-        session.add(task)
-        await session.commit()
-
-    # Phase 2: Schedule as a fire-and-forget asyncio task
-    # (avoids BaseHTTPMiddleware blocking the response until completion)
-    asyncio.create_task(_run_sync_task(task_id))
-
     return WorklistSyncTriggerResponse(
         status="accepted",
         message="Sync task queued for background processing",
@@ -461,45 +443,6 @@ async def save_review_decisions(
 
 # --- Background Tasks ---
 
-async def _run_sync_task(task_id: str) -> None:
-    """Background task to run the full sync flow."""
-    from src.config.database import get_db_config
-    from src.models import PipelineTask
-    from src.services.worklist.service import WorklistService
-
-    db_config = get_db_config()
-    logger.info("worklist_sync_background_started", task_id=task_id)
-
-    async with _sync_lock:
-        try:
-            # Step 1: Execute sync
-            async with db_config.session() as s:
-                svc = WorklistService(s)
-                result = await svc.trigger_sync()
-
-            # Step 2: Update task status to completed
-            async with db_config.session() as s:
-                t = await s.get(PipelineTask, task_id)
-                if t:
-                    t.status = "completed"
-                    t.result = result
-                    t.completed_at = datetime.now(UTC)
-                    await s.commit()
-            logger.info("worklist_sync_background_completed", task_id=task_id)
-        except Exception as exc:
-            logger.error("worklist_sync_background_failed", task_id=task_id, error=str(exc), exc_info=True)
-            try:
-                async with db_config.session() as s:
-                    t = await s.get(PipelineTask, task_id)
-                    if t:
-                        t.status = "failed"
-                        t.error = str(exc)
-                        t.completed_at = datetime.now(UTC)
-                        await s.commit()
-            except Exception:
-                logger.error("sync_task_status_update_failed", task_id=task_id, exc_info=True)
-
-
 async def _run_publish_task(item_id: int):
     """Background task to run the full Playwright publishing flow."""
     from datetime import datetime
@@ -53,10 +53,18 @@ class PaginatedResponse(BaseSchema, Generic[T]):
     page: int = Field(..., ge=1, description="Current page number")
     page_size: int = Field(..., ge=1, description="Number of items per page")
     total_pages: int = Field(..., ge=0, description="Total number of pages")
+    next_cursor: str | None = Field(
+        default=None, description="Cursor for the next page; absent on the last page"
+    )
 
     @classmethod
     def create(
-        cls, items: list[T], total: int, page: int, page_size: int
+        cls,
+        items: list[T],
+        total: int,
+        page: int,
+        page_size: int,
+        next_cursor: str | None = None,
     ) -> "PaginatedResponse[T]":
         """Create paginated response from query results.
 
@@ -65,6 +73,7 @@ class PaginatedResponse(BaseSchema, Generic[T]):
             total: Total number of items
             page: Current page number
             page_size: Number of items per page
+            next_cursor: Keyset cursor for the following page, if any
 
         Returns:
             PaginatedResponse: Paginated response object
@@ -76,6 +85,7 @@ class PaginatedResponse(BaseSchema, Generic[T]):
             page=page,
             page_size=page_size,
             total_pages=total_pages,
+            next_cursor=next_cursor,
         )
 
 
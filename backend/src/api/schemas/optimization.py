@@ -30,6 +30,10 @@ class GenerateOptimizationsRequest(BaseSchema):
     regenerate: bool = Field(
         False, description="Force regeneration even if optimizations already exist"
     )
+    stream: bool = Field(
+        False,
+        description="Stream the AI answer and save title/SEO suggestions before FAQs finish",
+    )
     options: OptimizationOptions = Field(
         default_factory=OptimizationOptions, description="Optimization generation options"
     )
@@ -9,7 +9,7 @@ from src.api.schemas.base import BaseSchema
 class SEOAnalysisSingleResponse(BaseSchema):
     """Schema for single article SEO analysis response."""
 
-    task_id: str = Field(..., description="Celery task ID")
+    task_id: str = Field(..., description="Job queue task ID")
     message: str = Field(..., description="Status message")
     article_id: int = Field(..., description="Article ID being analyzed")
     status_url: str = Field(..., description="URL to check task status")
@@ -18,7 +18,7 @@ class SEOAnalysisSingleResponse(BaseSchema):
 class SEOAnalysisBatchResponse(BaseSchema):
     """Schema for batch SEO analysis response."""
 
-    task_id: str = Field(..., description="Celery task ID")
+    task_id: str = Field(..., description="Job queue task ID")
     message: str = Field(..., description="Status message")
     limit: int | None = Field(None, description="Limit on articles to process")
     status_url: str = Field(..., description="URL to check task status")
@@ -27,7 +27,7 @@ class SEOAnalysisBatchResponse(BaseSchema):
 class SEOTaskStatusResponse(BaseSchema):
     """Schema for SEO task status check."""
 
-    task_id: str = Field(..., description="Celery task ID")
+    task_id: str = Field(..., description="Job queue task ID")
     status: str = Field(..., description="Task status (PENDING, STARTED, SUCCESS, FAILURE)")
     result: dict | None = Field(None, description="Task result if completed")
     error: str | None = Field(None, description="Error message if failed")
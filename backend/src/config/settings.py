@@ -117,6 +117,19 @@ class Settings(BaseSettings):
         description="OpenAI model to use for vision tasks",
     )
 
+    IMAGE_ALT_IMAGES_PER_CALL: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Images packed into one vision request by batch alt-text generation",
+    )
+    IMAGE_ALT_CONCURRENCY: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Image fetches / vision requests in flight during batch alt-text generation",
+    )
+
     # Vertex AI Configuration (for Gemini models)
     VERTEX_AI_PROJECT: str = Field(
         default="",
@@ -148,12 +161,81 @@ class Settings(BaseSettings):
         default="",
         description="Google Drive folder ID for file uploads",
     )
+    GOOGLE_DRIVE_SYNC_EXPORT_CONCURRENCY: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Documents exported/parsed in parallel during worklist sync",
+    )
+    GOOGLE_DRIVE_SYNC_PIPELINE_CONCURRENCY: int = Field(
+        default=2,
+        ge=1,
+        le=16,
+        description="New worklist items run through the AI pipeline in parallel during sync",
+    )
+    GOOGLE_DRIVE_IO_WORKERS: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Threads running blocking Google Drive API calls (shared by all requests)",
+    )
+    GOOGLE_DRIVE_REQUEST_TIMEOUT_SECONDS: float = Field(
+        default=60.0,
+        gt=0,
+        description="Socket and per-call timeout for Google Drive metadata/list/export calls",
+    )
+    GOOGLE_DRIVE_DOWNLOAD_TIMEOUT_SECONDS: float = Field(
+        default=600.0,
+        gt=0,
+        description="Overall timeout for one streamed Google Drive download",
+    )
+    GOOGLE_DRIVE_DOWNLOAD_CHUNK_SIZE: int = Field(
+        default=4 * 1024 * 1024,
+        ge=256 * 1024,
+        description="Chunk size in bytes for streamed Google Drive downloads",
+    )
 
     # Local Image Storage Configuration (Phase 7)
     IMAGE_STORAGE_PATH: Path = Field(
         default=PROJECT_ROOT / "data" / "images",
         description="Local path for storing downloaded article images",
     )
+    IMAGE_CACHE_PATH: Path = Field(
+        default=PROJECT_ROOT / "data" / "image_cache",
+        description="Content-addressed cache of downloaded images and derived data",
+    )
+    IMAGE_CACHE_MAX_BYTES: int = Field(
+        default=2 * 1024**3,
+        ge=16 * 1024 * 1024,
+        description="Size budget of the image cache; least recently used images are evicted",
+    )
+    IMAGE_CACHE_REVALIDATE_SECONDS: int = Field(
+        default=86400,
+        ge=0,
+        description="Serve cached images without revalidation for this long",
+    )
+    IMAGE_CACHE_MIN_IDLE_SECONDS: int = Field(
+        default=3600,
+        ge=0,
+        description="Never evict cached images accessed more recently than this",
+    )
+    IMAGE_DOWNLOAD_CONCURRENCY: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Image downloads in flight per article during parsing",
+    )
+    IMAGE_DOWNLOAD_PER_HOST: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Image downloads in flight per source host",
+    )
+    IMAGE_PREVIEW_MAX_SIZE: int = Field(
+        default=800,
+        ge=64,
+        description="Longest edge in pixels of generated image previews",
+    )
 
     # CMS Integration
     CMS_TYPE: Literal["wordpress", "strapi", "contentful", "ghost"] = Field(
@@ -184,6 +266,21 @@ class Settings(BaseSettings):
         default="",
         description="HTTP Basic Auth password (site-level authentication)",
     )
+    WORDPRESS_REST_PUBLISH_ENABLED: bool = Field(
+        default=True,
+        description="Create WordPress posts over REST, using the browser only for unsupported steps",
+    )
+    WORDPRESS_MEDIA_UPLOAD_CONCURRENCY: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Parallel media uploads per REST publish",
+    )
+    WORDPRESS_TAXONOMY_CACHE_TTL_SECONDS: int = Field(
+        default=3600,
+        ge=0,
+        description="How long the tag/category name → ID cache is trusted before reloading",
+    )
 
     # GAS (Google Apps Script) Automation
     GAS_API_KEY: str = Field(
@@ -246,6 +343,119 @@ class Settings(BaseSettings):
         description="Enable unified parser that combines parsing + SEO + proofreading + FAQ in one API call",
     )
 
+    # Playwright Browser Pool (WordPress publishing)
+    PLAYWRIGHT_POOL_SIZE: int = Field(
+        default=1,
+        ge=1,
+        le=8,
+        description="Concurrent Chromium browsers per instance (1 suits 2-CPU/2GB Cloud Run)",
+    )
+    PLAYWRIGHT_BROWSER_MAX_USES: int = Field(
+        default=20,
+        ge=1,
+        description="Publishes served by one browser before it is recycled",
+    )
+    PLAYWRIGHT_BROWSER_MAX_MEMORY_MB: int = Field(
+        default=1200,
+        ge=0,
+        description="Recycle browsers when Chromium RSS exceeds this (0 disables the check)",
+    )
+    PLAYWRIGHT_SESSION_TTL_SECONDS: int = Field(
+        default=6 * 3600,
+        ge=60,
+        description="Reuse window for a WordPress login whose cookies carry no expiry",
+    )
+
+    # Background Job Queue (pipeline_tasks)
+    JOB_QUEUE_WORKER_ENABLED: bool = Field(
+        default=True,
+        description="Run a job queue worker inside each API process",
+    )
+    JOB_QUEUE_POLL_INTERVAL_SECONDS: float = Field(
+        default=2.0,
+        gt=0,
+        description="Seconds between job queue polls when idle",
+    )
+    JOB_QUEUE_LEASE_SECONDS: int = Field(
+        default=120,
+        ge=10,
+        description="Job lease length; renewed by heartbeats every third of it",
+    )
+
+    # List Endpoints
+    LIST_COUNT_CACHE_SECONDS: int = Field(
+        default=30,
+        ge=0,
+        description="Seconds a list endpoint's total count is reused",
+    )
+    LIST_COUNT_ESTIMATE_MIN_ROWS: int = Field(
+        default=50000,
+        ge=0,
+        description="Unfiltered totals above this use the planner's row estimate (0 disables)",
+    )
+
+    # Message Batches (bulk AI backfills)
+    AI_BATCH_MAX_REQUESTS: int = Field(
+        default=1000,
+        ge=1,
+        le=100000,
+        description="Requests packed into one Anthropic message batch",
+    )
+    AI_BATCH_POLL_INTERVAL_SECONDS: int = Field(
+        default=300,
+        ge=10,
+        description="Seconds between status polls of a submitted message batch",
+    )
+
+    # Proofreading Result Cache
+    PROOFREADING_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Reuse stored proofreading results for unchanged articles",
+    )
+    PROOFREADING_CACHE_TTL_SECONDS: int = Field(
+        default=7 * 24 * 3600,
+        ge=60,
+        description="How long a cached proofreading result stays valid",
+    )
+    PROOFREADING_CACHE_MEMORY_MAX_ENTRIES: int = Field(
+        default=256,
+        ge=0,
+        le=10000,
+        description="In-process LRU size (0 disables the memory tier)",
+    )
+    PROOFREADING_CACHE_DB_MAX_ENTRIES: int = Field(
+        default=20000,
+        ge=0,
+        description="Max rows kept in proofreading_result_cache (0 disables the database tier)",
+    )
+
+    # Learned Proofreading Rules
+    PROOFREADING_LEARNED_RULE_TIME_BUDGET_MS: float = Field(
+        default=50.0,
+        gt=0,
+        le=5000,
+        description="Max time one learned rule may take on a probe text before it is rejected",
+    )
+    PROOFREADING_LEARNED_RULE_REFRESH_SECONDS: float = Field(
+        default=60.0,
+        ge=0,
+        description="How often each process reloads published learned rules (0 loads them once at start-up)",
+    )
+
+    # Deterministic Rule Execution
+    PROOFREADING_RULE_WORKERS: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description="Worker processes for deterministic proofreading rules (0 runs them in a thread)",
+    )
+    PROOFREADING_RULE_BATCH_SIZE: int = Field(
+        default=16,
+        ge=1,
+        le=500,
+        description="Articles sent to a rule worker process per dispatch",
+    )
+
     # Retry Configuration
     MAX_RETRIES: int = Field(default=3, ge=0, le=10)
     RETRY_DELAY: int = Field(
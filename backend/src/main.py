@@ -1,5 +1,6 @@
 """FastAPI application entry point."""
 
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
@@ -13,6 +14,11 @@ from src.api.middleware.auth import AuthenticationMiddleware
 from src.api.routes import register_routes
 from src.config import get_settings, setup_logging
 from src.config.database import get_db_config
+from src.services.cms_adapter.taxonomy import warm_wordpress_taxonomy
+from src.services.proofreading.learned_rule_store import refresh_learned_rules
+from src.services.proofreading.rule_executor import close_rule_executor, get_rule_executor
+from src.services.providers.playwright_browser_pool import close_browser_pool
+from src.workers.queue import JobWorker, get_job_queue
 
 # Initialize logging
 setup_logging()
@@ -32,9 +38,36 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     db_config = get_db_config()
     app.state.db_config = db_config
 
+    # Start the background job worker (handlers register on import)
+    job_worker = None
+    if settings.JOB_QUEUE_WORKER_ENABLED:
+        import src.workers.tasks  # noqa: F401
+
+        job_worker = JobWorker(get_job_queue())
+        job_worker.start()
+    app.state.job_worker = job_worker
+
+    # Load WordPress tags/categories in the background
+    taxonomy_warmup = asyncio.create_task(warm_wordpress_taxonomy())
+
+    # Load published learned rules and keep them in sync with other processes
+    learned_rules_refresh = asyncio.create_task(
+        refresh_learned_rules(settings.PROOFREADING_LEARNED_RULE_REFRESH_SECONDS)
+    )
+
+    # Spawn and warm the deterministic rule workers (if configured)
+    rule_workers_warmup = asyncio.create_task(get_rule_executor().start())
+
     yield
 
     # Shutdown
+    taxonomy_warmup.cancel()
+    rule_workers_warmup.cancel()
+    learned_rules_refresh.cancel()
+    await close_rule_executor()
+    if job_worker is not None:
+        await job_worker.stop()
+    await close_browser_pool()
     await db_config.close()
 
 
@@ -5,6 +5,8 @@ from src.models.article import Article, ArticleStatus, ArticleStatusHistory
 from src.models.article_faq import ArticleFAQ, FAQQuestionType, FAQSearchIntent, FAQStatus
 from src.models.article_image import ArticleImage, ArticleImageReview, ImageReviewAction
 from src.models.base import Base, SoftDeleteMixin, TimestampMixin
+from src.models.drive_sync_state import DriveSyncState
+from src.models.learned_proofreading_rule import LearnedProofreadingRule
 from src.models.pipeline_task import PipelineTask, PipelineTaskStatus
 from src.models.proofreading import (
     DecisionType,
@@ -15,6 +17,11 @@ from src.models.proofreading import (
     TuningJobStatus,
     TuningJobType,
 )
+from src.models.proofreading_decision_rollup import (
+    ProofreadingCorrectionRollup,
+    ProofreadingDecisionRollup,
+)
+from src.models.proofreading_result_cache import ProofreadingResultCacheEntry
 from src.models.publish import (
     ExecutionLog,
     LogLevel,
@@ -80,9 +87,11 @@ __all__ = [
     # Worklist
     "WorklistItem",
     "WorklistStatus",
+    "DriveSyncState",
     # Storage
     "UploadedFile",
     # Proofreading
+    "LearnedProofreadingRule",
     "DecisionType",
     "FeedbackStatus",
     "TuningJobType",
@@ -90,4 +99,7 @@ __all__ = [
     "ProofreadingHistory",
     "ProofreadingDecision",
     "FeedbackTuningJob",
+    "ProofreadingDecisionRollup",
+    "ProofreadingCorrectionRollup",
+    "ProofreadingResultCacheEntry",
 ]
@@ -5,7 +5,7 @@ from decimal import Decimal
 from enum import Enum as PyEnum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Enum, Float, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import Enum, Float, ForeignKey, Index, Integer, Numeric, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -561,6 +561,11 @@ class Article(Base, TimestampMixin):
         order_by="ArticleFAQ.position",
     )
 
+    __table_args__ = (
+        # Keyset pagination of the article list
+        Index("idx_articles_updated_at_id", "updated_at", "id"),
+    )
+
     def __repr__(self) -> str:
         """String representation.
 
@@ -0,0 +1,39 @@
+"""Per-folder Google Drive sync watermark."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class DriveSyncState(Base):
+    """Incremental sync cursor for one Drive folder.
+
+    ``modified_watermark`` is the Drive ``modifiedTime`` up to which every
+    file in the folder has been synced; the next sync only lists files with
+    ``modifiedTime >= modified_watermark``.
+    """
+
+    __tablename__ = "drive_sync_state"
+
+    folder_id: Mapped[str] = mapped_column(
+        String(255), primary_key=True, comment="Google Drive folder identifier"
+    )
+    modified_watermark: Mapped[str | None] = mapped_column(
+        String(40), nullable=True, comment="RFC 3339 modifiedTime cursor"
+    )
+    last_synced_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, comment="Last completed sync run"
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(),
+        onupdate=func.now(), comment="Last watermark change"
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<DriveSyncState(folder={self.folder_id}, "
+            f"watermark={self.modified_watermark})>"
+        )
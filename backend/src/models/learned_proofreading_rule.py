@@ -0,0 +1,39 @@
+"""Published learned proofreading rules (source of truth for every process)."""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class LearnedProofreadingRule(Base):
+    """One published ``DraftRule``, hot-loaded into every rule engine.
+
+    API workers and pipeline workers load this table at start-up and poll it,
+    so a publish handled by one process reaches all of them and survives
+    restarts.
+    """
+
+    __tablename__ = "learned_proofreading_rules"
+
+    rule_id: Mapped[str] = mapped_column(
+        String(100), primary_key=True, comment="DraftRule.rule_id"
+    )
+    definition: Mapped[dict] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"),
+        nullable=False,
+        comment="Serialized DraftRule",
+    )
+    ruleset_id: Mapped[str | None] = mapped_column(
+        String(100), nullable=True, comment="Publish that last wrote the rule"
+    )
+    published_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(),
+        onupdate=func.now(), comment="Last publish of the rule"
+    )
+
+    def __repr__(self) -> str:
+        return f"<LearnedProofreadingRule(rule_id={self.rule_id}, ruleset={self.ruleset_id})>"
@@ -1,14 +1,20 @@
-"""Generic pipeline task tracking model for async background jobs."""
+"""Generic pipeline task tracking model for async background jobs.
+
+Rows double as the durable job queue used by ``src.workers.queue``.
+"""
 
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from sqlalchemy import DateTime, Index, String, Text, func, text
+from sqlalchemy import DateTime, Index, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.models.base import Base
 
+# Rows covered by the dedupe unique index: keyed jobs that have not finished
+DEDUPE_INDEX_WHERE = "dedupe_key IS NOT NULL AND status IN ('pending', 'processing')"
+
 
 class PipelineTaskStatus(str, PyEnum):
     """Pipeline task status."""
@@ -17,6 +23,7 @@ class PipelineTaskStatus(str, PyEnum):
     PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
+    CANCELLED = "cancelled"
 
 
 class PipelineTask(Base):
@@ -25,6 +32,13 @@ class PipelineTask(Base):
     Replaces the in-memory _task_results dict in pipeline_routes.py
     so task state survives Cloud Run instance restarts and works
     across multiple instances.
+
+    Queue columns: workers claim ``pending`` rows whose ``run_after`` has
+    passed (highest ``priority`` first), own them through ``lease_owner`` /
+    ``lease_expires_at`` while ``processing``, and re-queue them with a later
+    ``run_after`` on failure until ``attempts`` reaches ``max_attempts``.
+    A partial unique index allows one unfinished job per
+    ``(task_type, dedupe_key)``.
     """
 
     __tablename__ = "pipeline_tasks"
@@ -59,10 +73,55 @@ class PipelineTask(Base):
     completed_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True, comment="When task finished"
     )
+    priority: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0",
+        comment="Higher runs first"
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0",
+        comment="Number of times the task was claimed"
+    )
+    max_attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=3, server_default="3",
+        comment="Attempts before the task is marked failed"
+    )
+    run_after: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(),
+        comment="Earliest time the task may be claimed (retry backoff)"
+    )
+    lease_owner: Mapped[str | None] = mapped_column(
+        String(100), nullable=True, comment="Worker currently holding the task"
+    )
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True,
+        comment="Lease deadline; renewed by worker heartbeats"
+    )
+    heartbeat_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, comment="Last worker heartbeat"
+    )
+    started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, comment="First time the task was claimed"
+    )
+    dedupe_key: Mapped[str | None] = mapped_column(
+        String(200), nullable=True,
+        comment="At most one pending/processing task per (task_type, dedupe_key)"
+    )
 
     __table_args__ = (
         Index("idx_pipeline_tasks_type_status", "task_type", "status"),
         Index("idx_pipeline_tasks_created_at", "created_at"),
+        Index(
+            "idx_pipeline_tasks_claim",
+            "task_type", "status", "priority", "run_after",
+        ),
+        Index("idx_pipeline_tasks_lease_expires_at", "lease_expires_at"),
+        Index(
+            "uq_pipeline_tasks_dedupe",
+            "task_type", "dedupe_key",
+            unique=True,
+            postgresql_where=text(DEDUPE_INDEX_WHERE),
+            sqlite_where=text(DEDUPE_INDEX_WHERE),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,94 @@
+"""Daily rollups of proofreading decisions for the analytics endpoints."""
+
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, Float, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class ProofreadingDecisionRollup(Base):
+    """Decision counts per (day, suggestion_type, rule_id, decision).
+
+    Maintained incrementally by ``ProofreadingDecisionService`` in the same
+    transaction as the decision itself, so pattern and quality analytics sum
+    a few rows per day instead of scanning ``proofreading_decisions``.
+    """
+
+    __tablename__ = "proofreading_decision_rollups"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True, comment="Decision day (UTC)")
+    suggestion_type: Mapped[str] = mapped_column(
+        String(50), primary_key=True, comment="Suggestion type / rule category"
+    )
+    rule_id: Mapped[str] = mapped_column(
+        String(20), primary_key=True, comment="Rule that raised the suggestion"
+    )
+    decision: Mapped[str] = mapped_column(
+        String(20), primary_key=True, comment="DecisionType value"
+    )
+    decision_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0", comment="Number of decisions"
+    )
+    confidence_sum: Mapped[float] = mapped_column(
+        Float, nullable=False, default=0.0, server_default="0", comment="Sum of confidence scores"
+    )
+    sample_text: Mapped[str | None] = mapped_column(
+        String(50), nullable=True, comment="First original text seen for this bucket"
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(),
+        onupdate=func.now(), comment="Last increment"
+    )
+
+    __table_args__ = (
+        Index("idx_proofreading_decision_rollups_type_day", "suggestion_type", "day"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ProofreadingDecisionRollup(day={self.day}, type={self.suggestion_type}, "
+            f"rule={self.rule_id}, decision={self.decision}, count={self.decision_count})>"
+        )
+
+
+class ProofreadingCorrectionRollup(Base):
+    """Counts of (original → replacement) pairs per day and decision.
+
+    Accepted decisions record the suggested text, modified decisions the
+    editor's own correction.  Texts are truncated to 50 characters, matching
+    the pattern key used by custom-correction analysis.
+    """
+
+    __tablename__ = "proofreading_correction_rollups"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True, comment="Decision day (UTC)")
+    suggestion_type: Mapped[str] = mapped_column(
+        String(50), primary_key=True, comment="Suggestion type / rule category"
+    )
+    decision: Mapped[str] = mapped_column(
+        String(20), primary_key=True, comment="DecisionType value"
+    )
+    pattern_hash: Mapped[str] = mapped_column(
+        String(32), primary_key=True, comment="MD5 of '<original>_<replacement>'"
+    )
+    original_snippet: Mapped[str] = mapped_column(
+        String(50), nullable=False, comment="Original text (first 50 chars)"
+    )
+    replacement_snippet: Mapped[str] = mapped_column(
+        String(50), nullable=False, comment="Replacement text (first 50 chars)"
+    )
+    decision_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0", comment="Number of decisions"
+    )
+
+    __table_args__ = (
+        Index("idx_proofreading_correction_rollups_decision_day", "decision", "day"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ProofreadingCorrectionRollup(day={self.day}, type={self.suggestion_type}, "
+            f"{self.original_snippet!r}->{self.replacement_snippet!r}, count={self.decision_count})>"
+        )
@@ -0,0 +1,67 @@
+"""Persistent tier of the content-addressed proofreading result cache."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class ProofreadingResultCacheEntry(Base):
+    """Stored ``ProofreadingResult`` keyed by payload + prompt + rule versions.
+
+    Rows are never updated in place: any change to the article body, the
+    prompt, the rule manifest or the deterministic engine produces a new
+    ``cache_key``.  Stale rows simply age out via ``expires_at`` / LRU pruning.
+    """
+
+    __tablename__ = "proofreading_result_cache"
+
+    cache_key: Mapped[str] = mapped_column(
+        String(64), primary_key=True, comment="SHA256 cache key"
+    )
+    article_id: Mapped[int | None] = mapped_column(
+        Integer, nullable=True, comment="Article that produced the entry (informational)"
+    )
+    analysis_mode: Mapped[str] = mapped_column(
+        String(30), nullable=False, comment="AnalysisMode value"
+    )
+    prompt_hash: Mapped[str | None] = mapped_column(
+        String(64), nullable=True, comment="SHA256 of system+user prompt"
+    )
+    manifest_fingerprint: Mapped[str] = mapped_column(
+        String(64), nullable=False, comment="RuleManifest.fingerprint"
+    )
+    engine_version: Mapped[str] = mapped_column(
+        String(20), nullable=False, comment="DeterministicRuleEngine.version"
+    )
+    result: Mapped[dict] = mapped_column(
+        JSONB, nullable=False, comment="Serialized ProofreadingResult"
+    )
+    hit_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0", comment="Number of cache hits"
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(),
+        comment="When the entry was stored"
+    )
+    last_accessed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(),
+        comment="Last read or write (LRU ordering)"
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, comment="TTL deadline"
+    )
+
+    __table_args__ = (
+        Index("idx_proofreading_result_cache_expires_at", "expires_at"),
+        Index("idx_proofreading_result_cache_last_accessed_at", "last_accessed_at"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ProofreadingResultCacheEntry(key={self.cache_key[:12]}, "
+            f"mode={self.analysis_mode}, hits={self.hit_count})>"
+        )
@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum as PyEnum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Enum, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base, TimestampMixin
@@ -159,6 +159,11 @@ class WorklistItem(Base, TimestampMixin):
         uselist=False,
     )
 
+    __table_args__ = (
+        # Keyset pagination of the worklist
+        Index("idx_worklist_items_updated_at_id", "updated_at", "id"),
+    )
+
     def mark_status(self, status: WorklistStatus) -> None:
         """Update worklist status and sync timestamp."""
         self.status = status
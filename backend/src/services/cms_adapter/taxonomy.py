@@ -0,0 +1,160 @@
+"""Process-wide cache of WordPress term IDs (tags and categories).
+
+Resolving a term name used to list the first 100 terms on every publish,
+so larger taxonomies were silently missed.  ``TaxonomyCache`` pages through
+a taxonomy once, keeps a case-folded ``name -> id`` map for
+``WORDPRESS_TAXONOMY_CACHE_TTL_SECONDS`` and records terms as they are
+created.  Concurrent requests for the same missing term share one create
+call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import html
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Literal
+
+from src.config import get_settings
+from src.config.logging import get_logger
+
+logger = get_logger(__name__)
+
+Taxonomy = Literal["tags", "categories"]
+
+
+def term_key(name: str) -> str:
+    """Normalise a term name the way WordPress compares them."""
+    return html.unescape(name).strip().casefold()
+
+
+class TaxonomyCache:
+    """Case-folded term name → ID map for one taxonomy on one site."""
+
+    def __init__(self, taxonomy: Taxonomy, ttl_seconds: float) -> None:
+        self.taxonomy = taxonomy
+        self.ttl_seconds = ttl_seconds
+        self._terms: dict[str, int] = {}
+        self._loaded_at: float | None = None
+        self._load_lock = asyncio.Lock()
+        self._pending: dict[str, asyncio.Future[int]] = {}
+
+    @property
+    def is_fresh(self) -> bool:
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl_seconds
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def get(self, name: str) -> int | None:
+        return self._terms.get(term_key(name))
+
+    def add(self, name: str, term_id: int) -> None:
+        self._terms[term_key(name)] = term_id
+
+    def invalidate(self) -> None:
+        self._loaded_at = None
+
+    async def ensure_loaded(
+        self, fetch_all: Callable[[], Awaitable[Iterable[tuple[str, int]]]]
+    ) -> None:
+        """Reload every term once the TTL has lapsed (one loader at a time)."""
+        if self.is_fresh:
+            return
+        async with self._load_lock:
+            if self.is_fresh:
+                return
+            started = time.monotonic()
+            terms = {term_key(name): term_id for name, term_id in await fetch_all()}
+            self._terms = terms
+            self._loaded_at = time.monotonic()
+            logger.info(
+                "wordpress_taxonomy_loaded",
+                taxonomy=self.taxonomy,
+                terms=len(terms),
+                elapsed_ms=round((self._loaded_at - started) * 1000),
+            )
+
+    async def resolve(
+        self,
+        names: list[str],
+        create: Callable[[str], Awaitable[int]],
+    ) -> list[int]:
+        """Term IDs for ``names`` in order, creating unseen terms concurrently.
+
+        Duplicate names (after case folding) resolve to a single ID.
+        """
+        keys: dict[str, str] = {}
+        for name in names:
+            if name and name.strip():
+                keys.setdefault(term_key(name), name.strip())
+
+        missing = [(key, name) for key, name in keys.items() if key not in self._terms]
+        if missing:
+            await asyncio.gather(*(self._create_once(key, name, create) for key, name in missing))
+        return [self._terms[key] for key in keys if key in self._terms]
+
+    async def _create_once(
+        self, key: str, name: str, create: Callable[[str], Awaitable[int]]
+    ) -> None:
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(create(name))
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+        term_id = await asyncio.shield(pending)
+        self._terms[key] = term_id
+
+
+_caches: dict[tuple[str, Taxonomy], TaxonomyCache] = {}
+
+
+def get_taxonomy_cache(api_base: str, taxonomy: Taxonomy) -> TaxonomyCache:
+    """Shared cache for ``taxonomy`` on the site served at ``api_base``."""
+    cache = _caches.get((api_base, taxonomy))
+    if cache is None:
+        cache = TaxonomyCache(taxonomy, get_settings().WORDPRESS_TAXONOMY_CACHE_TTL_SECONDS)
+        _caches[(api_base, taxonomy)] = cache
+    return cache
+
+
+def clear_taxonomy_caches() -> None:
+    """Forget every cached taxonomy (tests, credential changes)."""
+    _caches.clear()
+
+
+async def warm_wordpress_taxonomy() -> None:
+    """Load the configured site's tags and categories at startup.
+
+    Also reports categories from ``config/wordpress_taxonomy.py`` that do
+    not exist in WordPress yet; they are created on first use.
+    """
+    from src.config.wordpress_taxonomy import get_category_candidates
+    from src.services.cms_adapter.wordpress_adapter import WordPressAdapter
+
+    settings = get_settings()
+    if not (settings.CMS_BASE_URL and settings.CMS_APPLICATION_PASSWORD):
+        return
+
+    http_auth = None
+    if settings.CMS_HTTP_AUTH_USERNAME and settings.CMS_HTTP_AUTH_PASSWORD:
+        http_auth = (settings.CMS_HTTP_AUTH_USERNAME, settings.CMS_HTTP_AUTH_PASSWORD)
+    adapter = WordPressAdapter(
+        settings.CMS_BASE_URL,
+        {
+            "username": settings.CMS_USERNAME,
+            "application_password": settings.CMS_APPLICATION_PASSWORD,
+        },
+        http_auth=http_auth,
+    )
+    try:
+        await asyncio.gather(adapter.load_terms("categories"), adapter.load_terms("tags"))
+        categories = get_taxonomy_cache(adapter.api_base, "categories")
+        missing = [name for name in get_category_candidates() if categories.get(name) is None]
+        if missing:
+            logger.warning("wordpress_taxonomy_missing_categories", categories=missing)
+    except Exception as exc:  # noqa: BLE001 - warming is best effort
+        logger.warning("wordpress_taxonomy_warm_failed", error=str(exc))
+    finally:
+        await adapter.close()
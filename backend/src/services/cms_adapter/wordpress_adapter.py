@@ -1,5 +1,8 @@
 """WordPress REST API adapter implementation."""
 
+import asyncio
+import mimetypes
+import os
 from typing import Any
 
 import httpx
@@ -11,9 +14,13 @@ from src.services.cms_adapter.base import (
     CMSAdapter,
     PublishResult,
 )
+from src.services.cms_adapter.taxonomy import Taxonomy, get_taxonomy_cache
 
 logger = get_logger(__name__)
 
+# WordPress REST maximum page size
+TERMS_PER_PAGE = 100
+
 
 class WordPressAdapter(CMSAdapter):
     """WordPress CMS adapter using REST API."""
@@ -83,7 +90,7 @@ class WordPressAdapter(CMSAdapter):
             if metadata.tags and metadata.status != "draft":
                 try:
                     # Get or create tag IDs
-                    tag_ids = await self._get_or_create_tag_ids(metadata.tags)
+                    tag_ids = await self.get_or_create_term_ids("tags", metadata.tags)
                     post_data["tags"] = tag_ids
                 except Exception as e:
                     logger.warning("wordpress_tags_skip", error=str(e))
@@ -91,8 +98,8 @@ class WordPressAdapter(CMSAdapter):
             # Add categories if provided (skip for drafts to avoid 404 errors on some WP installations)
             if metadata.categories and metadata.status != "draft":
                 try:
-                    category_ids = await self._get_or_create_category_ids(
-                        metadata.categories
+                    category_ids = await self.get_or_create_term_ids(
+                        "categories", metadata.categories
                     )
                     post_data["categories"] = category_ids
                 except Exception as e:
@@ -214,90 +221,215 @@ class WordPressAdapter(CMSAdapter):
         Returns:
             str: WordPress tag ID
         """
-        client = await self._get_client()
-
         try:
-            response = await client.post(
-                f"{self.api_base}/tags", json={"name": tag_name}
-            )
-
-            if response.status_code in [200, 201]:
-                result = response.json()
-                return str(result["id"])
-            else:
-                raise Exception(f"Failed to create tag: {response.text}")
-
+            tag_id = await self._create_term("tags", tag_name)
         except Exception as e:
             logger.error("wordpress_create_tag_exception", error=str(e), exc_info=True)
             raise
+        return str(tag_id)
 
     async def get_tags(self) -> list[dict[str, Any]]:
         """Get all WordPress tags.
 
         Returns:
-            list: List of tag objects
+            list: List of tag objects (``id`` and ``name``)
+        """
+        return await self._fetch_all_terms("tags")
+
+    async def create_post(self, post_data: dict[str, Any]) -> dict[str, Any]:
+        """Create a post from a raw REST payload.
+
+        Args:
+            post_data: Fields accepted by ``POST /wp/v2/posts`` (title, content,
+                status, tags, categories, featured_media, meta, ...)
+
+        Returns:
+            dict: Created post as returned by WordPress
+
+        Raises:
+            httpx.HTTPStatusError: If WordPress rejects the request
         """
         client = await self._get_client()
-        response = await client.get(f"{self.api_base}/tags", params={"per_page": 100})
+        response = await client.post(f"{self.api_base}/posts", json=post_data)
         response.raise_for_status()
         return response.json()
 
-    async def _get_or_create_tag_ids(self, tag_names: list[str]) -> list[int]:
-        """Get or create tag IDs for tag names.
+    async def update_post(self, post_id: int | str, post_data: dict[str, Any]) -> dict[str, Any]:
+        """Update fields of an existing post.
 
         Args:
-            tag_names: List of tag names
+            post_id: WordPress post ID
+            post_data: Fields to change
 
         Returns:
-            list: List of tag IDs
+            dict: Updated post as returned by WordPress
         """
-        existing_tags = await self.get_tags()
-        tag_map = {tag["name"].lower(): tag["id"] for tag in existing_tags}
+        client = await self._get_client()
+        response = await client.post(f"{self.api_base}/posts/{post_id}", json=post_data)
+        response.raise_for_status()
+        return response.json()
 
-        tag_ids = []
-        for name in tag_names:
-            if name.lower() in tag_map:
-                tag_ids.append(tag_map[name.lower()])
-            else:
-                # Create new tag
-                tag_id = await self.create_tag(name)
-                tag_ids.append(int(tag_id))
+    async def upload_media(
+        self,
+        file_path: str,
+        *,
+        filename: str | None = None,
+        alt_text: str = "",
+        caption: str = "",
+        description: str = "",
+    ) -> dict[str, Any]:
+        """Upload a local file to the media library.
+
+        Args:
+            file_path: Local file to upload
+            filename: Name to store it under (defaults to the file's basename)
+            alt_text: Image alt text
+            caption: Attachment caption
+            description: Attachment description
+
+        Returns:
+            dict: Media object (``id``, ``source_url``, ...)
+        """
+        client = await self._get_client()
+        filename = filename or os.path.basename(file_path)
+        content_type = (
+            mimetypes.guess_type(file_path)[0]
+            or mimetypes.guess_type(filename)[0]
+            or "application/octet-stream"
+        )
+        data = await asyncio.to_thread(self._read_file, file_path)
+
+        response = await client.post(
+            f"{self.api_base}/media",
+            content=data,
+            headers={
+                "Content-Type": content_type,
+                "Content-Disposition": f'attachment; filename="{filename}"',
+            },
+        )
+        response.raise_for_status()
+        media = response.json()
+
+        fields = {
+            key: value
+            for key, value in (
+                ("alt_text", alt_text),
+                ("caption", caption),
+                ("description", description),
+            )
+            if value
+        }
+        if fields:
+            response = await client.post(f"{self.api_base}/media/{media['id']}", json=fields)
+            response.raise_for_status()
+            media = response.json()
 
-        return tag_ids
+        logger.info("wordpress_media_uploaded", media_id=media["id"], filename=filename)
+        return media
 
-    async def _get_or_create_category_ids(
-        self, category_names: list[str]
+    async def delete_media(self, media_id: int | str) -> None:
+        """Permanently delete a media library item (media has no trash).
+
+        Args:
+            media_id: WordPress media ID
+
+        Raises:
+            httpx.HTTPStatusError: If WordPress rejects the request
+        """
+        client = await self._get_client()
+        response = await client.delete(
+            f"{self.api_base}/media/{media_id}", params={"force": "true"}
+        )
+        response.raise_for_status()
+
+    async def get_rest_namespaces(self) -> list[str]:
+        """List REST namespaces exposed by the site (e.g. ``yoast/v1``).
+
+        Returns:
+            list: Namespace identifiers
+        """
+        client = await self._get_client()
+        response = await client.get(f"{self.base_url}/wp-json")
+        response.raise_for_status()
+        return response.json().get("namespaces", [])
+
+    async def get_or_create_term_ids(
+        self, taxonomy: Taxonomy, names: list[str]
     ) -> list[int]:
-        """Get or create category IDs.
+        """Resolve term names to IDs, creating missing terms.
+
+        Names are matched case-insensitively against the shared taxonomy
+        cache; unseen terms are created concurrently.
 
         Args:
-            category_names: List of category names
+            taxonomy: ``tags`` or ``categories``
+            names: Term names
 
         Returns:
-            list: List of category IDs
+            list: Term IDs in input order
         """
+        await self.load_terms(taxonomy)
+        cache = get_taxonomy_cache(self.api_base, taxonomy)
+        return await cache.resolve(names, lambda name: self._create_term(taxonomy, name))
+
+    async def load_terms(self, taxonomy: Taxonomy) -> None:
+        """Fill the shared taxonomy cache unless it is still fresh.
+
+        Args:
+            taxonomy: ``tags`` or ``categories``
+        """
+
+        async def fetch_all() -> list[tuple[str, int]]:
+            return [(term["name"], term["id"]) for term in await self._fetch_all_terms(taxonomy)]
+
+        await get_taxonomy_cache(self.api_base, taxonomy).ensure_loaded(fetch_all)
+
+    @staticmethod
+    def _read_file(file_path: str) -> bytes:
+        with open(file_path, "rb") as f:
+            return f.read()
+
+    async def _fetch_all_terms(self, taxonomy: Taxonomy) -> list[dict[str, Any]]:
+        """Page through every term; pages after the first are fetched concurrently."""
         client = await self._get_client()
+        url = f"{self.api_base}/{taxonomy}"
+        params = {"per_page": TERMS_PER_PAGE, "_fields": "id,name"}
 
-        # Get existing categories
-        response = await client.get(
-            f"{self.api_base}/categories", params={"per_page": 100}
-        )
-        existing_categories = response.json()
-        category_map = {cat["name"].lower(): cat["id"] for cat in existing_categories}
+        response = await client.get(url, params={**params, "page": 1})
+        response.raise_for_status()
+        terms = response.json()
+        total_pages = int(response.headers.get("X-WP-TotalPages", 1))
 
-        category_ids = []
-        for name in category_names:
-            if name.lower() in category_map:
-                category_ids.append(category_map[name.lower()])
-            else:
-                # Create new category
-                response = await client.post(
-                    f"{self.api_base}/categories", json={"name": name}
-                )
-                if response.status_code in [200, 201]:
-                    category_ids.append(response.json()["id"])
+        async def fetch_page(page: int) -> list[dict[str, Any]]:
+            page_response = await client.get(url, params={**params, "page": page})
+            page_response.raise_for_status()
+            return page_response.json()
+
+        for page_terms in await asyncio.gather(
+            *(fetch_page(page) for page in range(2, total_pages + 1))
+        ):
+            terms.extend(page_terms)
+        return terms
 
-        return category_ids
+    async def _create_term(self, taxonomy: Taxonomy, name: str) -> int:
+        """Create a term and record it in the cache.
+
+        A ``term_exists`` rejection (created elsewhere since the cache was
+        loaded) resolves to the existing term's ID.
+        """
+        client = await self._get_client()
+        response = await client.post(f"{self.api_base}/{taxonomy}", json={"name": name})
+
+        if response.status_code in [200, 201]:
+            term_id = response.json()["id"]
+        elif response.status_code == 400 and response.json().get("code") == "term_exists":
+            term_id = response.json()["data"]["term_id"]
+        else:
+            raise Exception(f"Failed to create {taxonomy} term {name!r}: {response.text}")
+
+        get_taxonomy_cache(self.api_base, taxonomy).add(name, term_id)
+        logger.info("wordpress_term_created", taxonomy=taxonomy, name=name, term_id=term_id)
+        return term_id
 
     async def health_check(self) -> bool:
         """Check WordPress health.
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import re
-from datetime import datetime
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from hashlib import sha256
 import html
 from html.parser import HTMLParser
 from typing import Any
@@ -17,12 +19,12 @@ try:
     import yaml
 except ImportError:  # pragma: no cover - PyYAML optional in some environments
     yaml = None  # type: ignore[assignment]
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import get_settings
 from src.config.logging import get_logger
-from src.models import WorklistItem, WorklistStatus
+from src.models import DriveSyncState, WorklistItem, WorklistStatus
 from src.services.storage import create_google_drive_storage
 from src.services.worklist.pipeline import WorklistPipelineService
 
@@ -162,122 +164,100 @@ class GoogleDriveSyncService:
         session: AsyncSession,
         folder_id: str | None = None,
         db_config=None,
+        *,
+        export_concurrency: int | None = None,
+        pipeline_concurrency: int | None = None,
     ) -> None:
         self.session = session
         self.db_config = db_config
         self.settings = get_settings()
         self.folder_id = folder_id or self.settings.GOOGLE_DRIVE_FOLDER_ID
+        self.export_concurrency = export_concurrency or getattr(
+            self.settings, "GOOGLE_DRIVE_SYNC_EXPORT_CONCURRENCY", 4
+        )
+        self.pipeline_concurrency = pipeline_concurrency or getattr(
+            self.settings, "GOOGLE_DRIVE_SYNC_PIPELINE_CONCURRENCY", 2
+        )
         self._storage = None
+        # Files that failed to sync this run; they hold the folder watermark back.
+        self._retry_file_ids: set[str] = set()
         self.pipeline = WorklistPipelineService(session)
         self.metrics_collector = get_metrics_collector()
 
-    async def sync_worklist(self, max_results: int = 100) -> dict[str, Any]:
-        """Synchronize documents from Google Drive into worklist items."""
+    async def sync_worklist(
+        self, max_results: int = 100, *, full_scan: bool = False
+    ) -> dict[str, Any]:
+        """Synchronize documents from Google Drive into worklist items.
+
+        Only files modified at or after the folder's stored watermark are
+        listed (``full_scan`` ignores it).  Files whose ``modifiedTime`` and
+        ``version`` match the ``drive_metadata`` recorded by the previous
+        sync are counted as ``unchanged`` without being exported; exported
+        files whose content hash did not change only refresh their revision
+        metadata.
+
+        With ``db_config`` every file is handled by its own task: export and
+        parsing run in a pool of ``export_concurrency`` workers, each upsert
+        uses a short dedicated session, and newly created items go through
+        the AI pipeline in a pool of ``pipeline_concurrency`` workers.  A
+        failure in one file never affects the others.  Without ``db_config``
+        files are processed sequentially on the shared session.
+        """
         storage = await self._get_storage()
 
         if not self.folder_id:
             raise ValueError("Google Drive folder ID is not configured.")
 
+        watermark = None if full_scan else await self._load_watermark()
         try:
-            files = await storage.list_files(folder_id=self.folder_id, max_results=max_results)
+            # Oldest changes first, so a truncated page never skips past a file.
+            files = await storage.list_files(
+                folder_id=self.folder_id,
+                max_results=max_results,
+                modified_after=watermark,
+                order_by="modifiedTime",
+            )
         except Exception as exc:
             logger.error("google_drive_sync_list_failed", error=str(exc), exc_info=True)
             raise
 
+        known = await self._load_known_revisions(files)
+        self._retry_file_ids = set()
         summary = {
             "processed": 0,
             "created": 0,
             "updated": 0,
+            "unchanged": 0,
             "skipped": 0,
             "auto_processed": 0,
             "auto_failed": 0,
             "errors": [],
         }
 
-        for file_metadata in files:
-            summary["processed"] += 1
-            try:
-                # Phase 1: Hydrate document from Google Drive (no DB needed).
-                # This is the slow part (~15s per file for export + parsing).
-                parsed = await self._hydrate_document(storage, file_metadata)
-                if parsed is None:
-                    summary["skipped"] += 1
-                    continue
-
-                # Phase 2: Upsert in a SHORT session (returns connection to pool fast).
-                if self.db_config is not None:
-                    async with self.db_config.session() as item_session:
-                        self.session = item_session
-                        item, created = await self._upsert_worklist_item(parsed)
-                    # Session closed — connection returned to pool.
-
-                    if created:
-                        summary["created"] += 1
-                        # Phase 3: AI parsing + proofreading in its OWN session.
-                        # This takes 2-5 minutes; the session commits before the
-                        # AI call (pipeline.py line 147) but we use manual
-                        # enter/exit so a dead connection doesn't crash the loop.
-                        pipeline_ctx = self.db_config.session()
-                        pipeline_session = await pipeline_ctx.__aenter__()
-                        try:
-                            item_p = await pipeline_session.get(
-                                WorklistItem, item.id
-                            )
-                            pipeline = WorklistPipelineService(pipeline_session)
-                            await pipeline.process_new_item(item_p)
-                            summary["auto_processed"] += 1
-                        except Exception as exc:
-                            summary["auto_failed"] += 1
-                            logger.error(
-                                "worklist_pipeline_failed",
-                                file_id=file_metadata.get("id"),
-                                error=str(exc),
-                                exc_info=True,
-                            )
-                        finally:
-                            try:
-                                await pipeline_ctx.__aexit__(None, None, None)
-                            except Exception:
-                                pass  # Connection may have died during AI parsing
-                    else:
-                        summary["updated"] += 1
-                else:
-                    # Fallback: use the original long-lived session
-                    item, created = await self._upsert_worklist_item(parsed)
-                    if created:
-                        summary["created"] += 1
-                        try:
-                            await self.pipeline.process_new_item(item)
-                            summary["auto_processed"] += 1
-                        except Exception as exc:
-                            summary["auto_failed"] += 1
-                            logger.error(
-                                "worklist_pipeline_failed",
-                                file_id=file_metadata.get("id"),
-                                error=str(exc),
-                                exc_info=True,
-                            )
-                    else:
-                        summary["updated"] += 1
-                    await self.session.commit()
-            except Exception as exc:
-                try:
-                    await self.session.rollback()
-                except Exception:
-                    pass  # Session may already be closed
-                logger.error(
-                    "google_drive_sync_item_failed",
-                    file_id=file_metadata.get("id"),
-                    error=str(exc) or type(exc).__name__,
-                    exc_info=True,
+        if self.db_config is not None:
+            export_slots = asyncio.Semaphore(self.export_concurrency)
+            pipeline_slots = asyncio.Semaphore(self.pipeline_concurrency)
+            await asyncio.gather(
+                *(
+                    self._sync_file(
+                        storage,
+                        file_metadata,
+                        summary,
+                        export_slots,
+                        pipeline_slots,
+                        known.get(file_metadata.get("id")),
+                    )
+                    for file_metadata in files
                 )
-                summary["errors"].append(
-                    {
-                        "file_id": file_metadata.get("id"),
-                        "error": str(exc) or type(exc).__name__,
-                    }
+            )
+        else:
+            for file_metadata in files:
+                await self._sync_file_in_shared_session(
+                    storage, file_metadata, summary, known.get(file_metadata.get("id"))
                 )
 
+        await self._save_watermark(self._next_watermark(files, watermark))
+
         # Log metrics summary if available
         if self.metrics_collector:
             metrics_summary = self.metrics_collector.get_summary()
@@ -285,6 +265,266 @@ class GoogleDriveSyncService:
 
         return summary
 
+    async def _sync_file(
+        self,
+        storage,
+        file_metadata: dict,
+        summary: dict[str, Any],
+        export_slots: asyncio.Semaphore,
+        pipeline_slots: asyncio.Semaphore,
+        previous: dict[str, Any] | None = None,
+    ) -> None:
+        """Hydrate, upsert and (if new) run the pipeline for one Drive file."""
+        summary["processed"] += 1
+        if self._is_unchanged(file_metadata, previous):
+            summary["unchanged"] += 1
+            return
+        try:
+            # Phase 1: Hydrate document from Google Drive (no DB needed).
+            # This is the slow part (~15s per file for export + parsing).
+            async with export_slots:
+                parsed = await self._hydrate_document(storage, file_metadata)
+            if parsed is None:
+                summary["skipped"] += 1
+                return
+
+            # Phase 2: Upsert in a SHORT session (returns connection to pool fast).
+            async with self.db_config.session() as item_session:
+                if self._content_unchanged(parsed, previous):
+                    await self._record_revision(parsed, previous, item_session)
+                    summary["unchanged"] += 1
+                    return
+                item, created = await self._upsert_worklist_item(
+                    parsed, session=item_session
+                )
+                item_id = item.id
+            # Session closed — connection returned to pool.
+        except Exception as exc:
+            self._record_sync_error(summary, file_metadata, exc)
+            return
+
+        if not created:
+            summary["updated"] += 1
+            return
+
+        summary["created"] += 1
+        # Phase 3: AI parsing + proofreading (2-5 minutes) in its OWN session.
+        async with pipeline_slots:
+            await self._run_pipeline(item_id, file_metadata, summary)
+
+    async def _run_pipeline(
+        self, item_id: int, file_metadata: dict, summary: dict[str, Any]
+    ) -> None:
+        """Run the worklist pipeline for a newly created item in a fresh session."""
+        # The pipeline commits before each AI call, but we use manual
+        # enter/exit so a dead connection doesn't crash the sync.
+        pipeline_ctx = self.db_config.session()
+        pipeline_session = await pipeline_ctx.__aenter__()
+        try:
+            item = await pipeline_session.get(WorklistItem, item_id)
+            pipeline = WorklistPipelineService(pipeline_session)
+            await pipeline.process_new_item(item)
+            summary["auto_processed"] += 1
+        except Exception as exc:
+            summary["auto_failed"] += 1
+            logger.error(
+                "worklist_pipeline_failed",
+                file_id=file_metadata.get("id"),
+                error=str(exc),
+                exc_info=True,
+            )
+        finally:
+            try:
+                await pipeline_ctx.__aexit__(None, None, None)
+            except Exception:
+                pass  # Connection may have died during AI parsing
+
+    async def _sync_file_in_shared_session(
+        self,
+        storage,
+        file_metadata: dict,
+        summary: dict[str, Any],
+        previous: dict[str, Any] | None = None,
+    ) -> None:
+        """Sequential fallback using the long-lived ``self.session``."""
+        summary["processed"] += 1
+        if self._is_unchanged(file_metadata, previous):
+            summary["unchanged"] += 1
+            return
+        try:
+            parsed = await self._hydrate_document(storage, file_metadata)
+            if parsed is None:
+                summary["skipped"] += 1
+                return
+
+            if self._content_unchanged(parsed, previous):
+                await self._record_revision(parsed, previous, self.session)
+                await self.session.commit()
+                summary["unchanged"] += 1
+                return
+
+            item, created = await self._upsert_worklist_item(parsed)
+            if created:
+                summary["created"] += 1
+                try:
+                    await self.pipeline.process_new_item(item)
+                    summary["auto_processed"] += 1
+                except Exception as exc:
+                    summary["auto_failed"] += 1
+                    logger.error(
+                        "worklist_pipeline_failed",
+                        file_id=file_metadata.get("id"),
+                        error=str(exc),
+                        exc_info=True,
+                    )
+            else:
+                summary["updated"] += 1
+            await self.session.commit()
+        except Exception as exc:
+            try:
+                await self.session.rollback()
+            except Exception:
+                pass  # Session may already be closed
+            self._record_sync_error(summary, file_metadata, exc)
+
+    def _record_sync_error(
+        self, summary: dict[str, Any], file_metadata: dict, exc: Exception
+    ) -> None:
+        if file_metadata.get("id"):
+            self._retry_file_ids.add(file_metadata["id"])
+        logger.error(
+            "google_drive_sync_item_failed",
+            file_id=file_metadata.get("id"),
+            error=str(exc) or type(exc).__name__,
+            exc_info=True,
+        )
+        summary["errors"].append(
+            {
+                "file_id": file_metadata.get("id"),
+                "error": str(exc) or type(exc).__name__,
+            }
+        )
+
+    @staticmethod
+    def _is_unchanged(file_metadata: dict, previous: dict[str, Any] | None) -> bool:
+        """True if Drive reports the same revision that was synced last time."""
+        if not previous:
+            return False
+        modified_time = file_metadata.get("modifiedTime")
+        return (
+            modified_time is not None
+            and previous.get("modifiedTime") == modified_time
+            and previous.get("version") == file_metadata.get("version")
+        )
+
+    @staticmethod
+    def _content_unchanged(parsed: dict[str, Any], previous: dict[str, Any] | None) -> bool:
+        """True if the exported content hashes to the previously synced value."""
+        content_hash = parsed["drive_metadata"].get("content_hash")
+        return bool(previous) and content_hash is not None and (
+            previous.get("content_hash") == content_hash
+        )
+
+    async def _record_revision(
+        self, parsed: dict[str, Any], previous: dict[str, Any], session: AsyncSession
+    ) -> None:
+        """Store the new revision metadata without rewriting item content."""
+        drive_metadata = parsed["drive_metadata"]
+        await session.execute(
+            update(WorklistItem)
+            .where(WorklistItem.drive_file_id == drive_metadata["id"])
+            .values(
+                drive_metadata={**previous, **drive_metadata},
+                synced_at=datetime.utcnow(),
+            )
+        )
+
+    @asynccontextmanager
+    async def _state_session(self):
+        """Session for sync bookkeeping: a short one with ``db_config``."""
+        if self.db_config is not None:
+            async with self.db_config.session() as session:
+                yield session
+        else:
+            yield self.session
+
+    async def _load_known_revisions(self, files: list[dict]) -> dict[str, dict[str, Any]]:
+        """Return stored ``drive_metadata`` keyed by Drive file ID."""
+        file_ids = [file_metadata["id"] for file_metadata in files if file_metadata.get("id")]
+        if not file_ids:
+            return {}
+        stmt = select(WorklistItem.drive_file_id, WorklistItem.drive_metadata).where(
+            WorklistItem.drive_file_id.in_(file_ids)
+        )
+        try:
+            async with self._state_session() as session:
+                rows = (await session.execute(stmt)).all()
+        except Exception as exc:  # noqa: BLE001 - change detection is an optimisation
+            await self._rollback_shared_session()
+            logger.warning("google_drive_sync_revisions_unavailable", error=str(exc))
+            return {}
+        return {drive_file_id: metadata or {} for drive_file_id, metadata in rows}
+
+    async def _load_watermark(self) -> str | None:
+        try:
+            async with self._state_session() as session:
+                state = await session.get(DriveSyncState, self.folder_id)
+                return state.modified_watermark if state else None
+        except Exception as exc:  # noqa: BLE001 - fall back to a full listing
+            await self._rollback_shared_session()
+            logger.warning("google_drive_sync_watermark_unavailable", error=str(exc))
+            return None
+
+    def _next_watermark(self, files: list[dict], previous: str | None) -> str | None:
+        """Advance to the newest listed ``modifiedTime``, or hold at the oldest failure.
+
+        A failed file keeps the watermark at its own ``modifiedTime`` so it is
+        listed (and retried) again; everything before it is already synced.
+        """
+        failed = [
+            file_metadata.get("modifiedTime")
+            for file_metadata in files
+            if file_metadata.get("id") in self._retry_file_ids
+        ]
+        if failed:
+            if not all(failed):
+                return previous
+            candidate = min(failed)
+        else:
+            candidate = max(
+                (f["modifiedTime"] for f in files if f.get("modifiedTime")), default=None
+            )
+        if candidate is None or (previous and candidate < previous):
+            return previous
+        return candidate
+
+    async def _save_watermark(self, watermark: str | None) -> None:
+        try:
+            async with self._state_session() as session:
+                state = await session.get(DriveSyncState, self.folder_id)
+                if state is None:
+                    state = DriveSyncState(folder_id=self.folder_id)
+                    session.add(state)
+                state.modified_watermark = watermark
+                state.last_synced_at = datetime.now(UTC)
+                await session.commit()
+        except Exception as exc:  # noqa: BLE001 - next run simply rescans
+            await self._rollback_shared_session()
+            logger.warning("google_drive_sync_watermark_save_failed", error=str(exc))
+            return
+        logger.info(
+            "google_drive_sync_watermark_saved",
+            folder_id=self.folder_id,
+            watermark=watermark,
+        )
+
+    async def _rollback_shared_session(self) -> None:
+        if self.db_config is None and self.session is not None:
+            try:
+                await self.session.rollback()
+            except Exception:
+                pass  # Session may already be closed
+
     async def _get_storage(self):
         if self._storage is None:
             self._storage = await create_google_drive_storage()
@@ -337,9 +577,11 @@ class GoogleDriveSyncService:
                     parsing_time_ms=parsing_time,
                     parsing_status=parsing_status.value if parsing_status else None,
                 )
+                content_hash = sha256(html_content.encode("utf-8")).hexdigest()
             elif mime_type and mime_type.startswith("text/"):
                 raw = await storage.download_file(file_id)
                 content = raw.decode("utf-8", errors="ignore")
+                content_hash = sha256(raw).hexdigest()
             else:
                 # Record skipped file
                 if self.metrics_collector and ExportStatus:
@@ -369,6 +611,7 @@ class GoogleDriveSyncService:
             # Log at WARNING (not ERROR) and return None so the caller
             # counts this as "skipped" instead of double-logging an ERROR
             # via the google_drive_sync_item_failed handler.
+            self._retry_file_ids.add(file_id)
             logger.warning(
                 "google_drive_fetch_failed",
                 file_id=file_id,
@@ -392,6 +635,9 @@ class GoogleDriveSyncService:
             "mimeType": mime_type,
             "webViewLink": file_metadata.get("webViewLink"),
             "createdTime": file_metadata.get("createdTime"),
+            "modifiedTime": file_metadata.get("modifiedTime"),
+            "version": file_metadata.get("version"),
+            "content_hash": content_hash,
         }
         return parsed
 
@@ -399,11 +645,8 @@ class GoogleDriveSyncService:
         """Export Google Doc to the requested MIME type."""
         for attempt in range(max_retries):
             try:
-                request = storage.service.files().export(fileId=file_id, mimeType=mime_type)
-                content = request.execute()
-                if isinstance(content, bytes):
-                    return content.decode("utf-8", errors="ignore")
-                return str(content)
+                content = await storage.export_file(file_id, mime_type)
+                return content.decode("utf-8", errors="ignore")
             except HttpError as http_error:
                 status = getattr(http_error, "resp", {}).status if hasattr(http_error, "resp") else None
                 error_msg = str(http_error)
@@ -706,9 +949,14 @@ class GoogleDriveSyncService:
         }
 
     async def _upsert_worklist_item(
-        self, payload: dict[str, Any]
+        self, payload: dict[str, Any], session: AsyncSession | None = None
     ) -> tuple[WorklistItem, bool]:
-        """Insert or update worklist item and return (item, created?)."""
+        """Insert or update worklist item and return (item, created?).
+
+        ``session`` defaults to ``self.session``; concurrent syncs pass their
+        own short-lived session.
+        """
+        session = session or self.session
         drive_metadata = payload.get("drive_metadata", {})
         drive_file_id = drive_metadata.get("id")
 
@@ -716,7 +964,7 @@ class GoogleDriveSyncService:
             raise ValueError("Drive metadata missing file ID.")
 
         stmt = select(WorklistItem).where(WorklistItem.drive_file_id == drive_file_id)
-        result = await self.session.execute(stmt)
+        result = await session.execute(stmt)
         existing = result.scalar_one_or_none()
 
         now = datetime.utcnow()
@@ -757,8 +1005,8 @@ class GoogleDriveSyncService:
             if not existing.seo_keywords:
                 existing.seo_keywords = payload.get("seo_keywords", [])
 
-            self.session.add(existing)
-            await self.session.flush()
+            session.add(existing)
+            await session.flush()
             return existing, False
 
         item = WorklistItem(
@@ -776,6 +1024,6 @@ class GoogleDriveSyncService:
             notes=payload.get("notes") or [],
             synced_at=now,
         )
-        self.session.add(item)
-        await self.session.flush()
+        session.add(item)
+        await session.flush()
         return item, True
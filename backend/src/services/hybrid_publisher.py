@@ -15,9 +15,7 @@ from typing import Any
 from src.api.schemas.seo import SEOMetadata
 from src.config import get_logger, get_settings
 from src.services.computer_use_cms import ComputerUseCMSService
-from src.services.providers.playwright_wordpress_publisher import (
-    create_playwright_publisher,
-)
+from src.services.providers.wordpress_rest_publisher import publish_rest_first
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -323,7 +321,7 @@ class HybridPublisher:
         author_name: str | None = None,
         faqs: list[dict[str, str]] | None = None,
     ) -> dict[str, Any]:
-        """Publish using Playwright (free).
+        """Publish using the REST fast path, with Playwright for the rest (free).
 
         Args:
             cms_url: WordPress URL
@@ -345,11 +343,7 @@ class HybridPublisher:
         """
         logger.info("publishing_with_playwright")
 
-        playwright_publisher = await create_playwright_publisher(
-            self.playwright_config_path
-        )
-
-        result = await playwright_publisher.publish_article(
+        result = await publish_rest_first(
             cms_url=cms_url,
             username=username,
             password=password,
@@ -357,11 +351,12 @@ class HybridPublisher:
             article_body=article_body,
             seo_data=seo_data,
             article_images=article_images or [],
-            headless=True,
             publish_mode=publish_mode,
             tags=tags,
             primary_category=primary_category,
             secondary_categories=secondary_categories,
+            playwright_config_path=self.playwright_config_path,
+            skip_visual_verification=False,
         )
 
         return result
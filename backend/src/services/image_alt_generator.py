@@ -8,17 +8,21 @@ Implements smart detection to distinguish between:
 Phase 13: Enhanced Image Review
 """
 
+import asyncio
 import base64
+import hashlib
 import json
 import re
-from dataclasses import dataclass
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass
 from enum import Enum
+from pathlib import Path
 
-import httpx
 from openai import AsyncOpenAI
 
 from src.config.logging import get_logger
 from src.config.settings import get_settings
+from src.services.storage.image_store import StoredImage, get_image_store
 
 logger = get_logger(__name__)
 
@@ -54,6 +58,16 @@ class VisionProvider(str, Enum):
     OPENAI = "openai"
 
 
+# Vision results worth caching (context fallbacks and failures are not)
+VISION_METHODS = frozenset(
+    {
+        GenerationMethod.VISION,
+        GenerationMethod.VISION_INFOGRAPHIC,
+        GenerationMethod.VISION_PHOTO,
+    }
+)
+
+
 @dataclass
 class ImageAltSuggestion:
     """Generated alt text and description suggestion"""
@@ -81,6 +95,28 @@ class ImageAltSuggestion:
     error_message: str | None = None
 
 
+@dataclass
+class ImageAltRequest:
+    """One image to describe in ``generate_suggestions_batch``"""
+    image_id: int
+    image_url: str | None
+    article_context: dict
+    parsed_alt_text: str | None = None
+    parsed_caption: str | None = None
+    parsed_description: str | None = None
+
+
+@dataclass
+class _BatchImage:
+    """An image of a batch whose bytes have been loaded once"""
+    order: int
+    request: ImageAltRequest
+    image_bytes: bytes | None = None
+    mime_type: str = "image/jpeg"
+    sha256: str | None = None
+    cache_key: str | None = None
+
+
 class ImageAltGeneratorService:
     """Service for generating image alt text and descriptions using vision AI
 
@@ -141,6 +177,19 @@ class ImageAltGeneratorService:
 confidence 為 0-1 之間的數值，表示你對建議的信心程度。
 對於信息圖，如果文字清晰可讀，confidence 應該較高（0.9+）。"""
 
+    # Appended to PROMPT_IMAGE_ANALYSIS when several images share one request
+    PROMPT_BATCH_SUFFIX = """
+
+**本次請求包含多張圖片**
+每張圖片前都有「圖片 N」標記及其上下文。請逐張獨立分析，不要混淆不同圖片的內容。
+請以 JSON 格式回覆，images 陣列中每張圖片一個物件，index 對應圖片編號：
+{
+  "images": [
+    {"index": 1, "image_type": "...", "detected_text": "...", "alt_text": "...",
+     "alt_text_confidence": 0.95, "description": "...", "description_confidence": 0.95}
+  ]
+}"""
+
     # System prompt for context-based fallback
     PROMPT_CONTEXT_FALLBACK = """你是一個專業的圖片 SEO 和無障礙專家。由於無法直接看到圖片，請根據文章上下文推斷圖片內容並生成：
 
@@ -177,6 +226,9 @@ confidence 為 0-1 之間的數值，表示你對建議的信心程度。
         self.use_vertex_ai = settings.USE_VERTEX_AI_FOR_VISION and VERTEX_AI_AVAILABLE
         self.provider = VisionProvider.GEMINI if self.use_vertex_ai else VisionProvider.OPENAI
 
+        # Shared image cache: downloads and generated alt texts
+        self.image_store = get_image_store()
+
         # Initialize Vertex AI (Gemini)
         self.gemini_model: GenerativeModel | None = None
         self.gemini_model_name = settings.VERTEX_AI_MODEL
@@ -259,12 +311,20 @@ confidence 為 0-1 之間的數值，表示你對建議的信心程度。
 
         # Try vision analysis first if enabled and URL available
         if use_vision and image_url:
-            image_accessible = await self._check_image_accessible(image_url)
-            if image_accessible:
+            stored = await self._fetch_stored_image(image_url)
+            if stored is not None:
+                cache_key = self._alt_text_cache_key(
+                    article_context, parsed_alt_text, parsed_caption, parsed_description
+                )
+                cached = await self.image_store.alt_text(stored.sha256, cache_key)
+                if cached:
+                    logger.info(f"Reusing cached alt text for image {image_id}")
+                    return self._suggestion_from_cache(image_id, cached)
+
                 logger.info(f"Image accessible, using {self.provider.value} vision for image {image_id}")
 
                 if self.use_vertex_ai:
-                    return await self._generate_with_gemini(
+                    suggestion = await self._generate_with_gemini(
                         image_id=image_id,
                         image_url=image_url,
                         article_context=article_context,
@@ -273,7 +333,7 @@ confidence 為 0-1 之間的數值，表示你對建議的信心程度。
                         parsed_description=parsed_description
                     )
                 else:
-                    return await self._generate_with_openai(
+                    suggestion = await self._generate_with_openai(
                         image_id=image_id,
                         image_url=image_url,
                         article_context=article_context,
@@ -281,6 +341,11 @@ confidence 為 0-1 之間的數值，表示你對建議的信心程度。
                         parsed_caption=parsed_caption,
                         parsed_description=parsed_description
                     )
+                if suggestion.generation_method in VISION_METHODS:
+                    await self.image_store.save_alt_text(
+                        stored.sha256, cache_key, asdict(suggestion)
+                    )
+                return suggestion
             else:
                 logger.info(f"Image not accessible, falling back to context for image {image_id}")
 
@@ -293,28 +358,307 @@ confidence 為 0-1 之間的數值，表示你對建議的信心程度。
             parsed_description=parsed_description
         )
 
-    async def _check_image_accessible(self, image_url: str) -> bool:
-        """Check if image URL is accessible
+    async def generate_suggestions_batch(
+        self,
+        requests: list[ImageAltRequest],
+        use_vision: bool = True,
+        images_per_call: int | None = None,
+        concurrency: int | None = None
+    ) -> AsyncIterator[ImageAltSuggestion]:
+        """Generate suggestions for many images, yielding each as soon as it is ready
+
+        Every image is fetched once (through the image store, or read from
+        disk for local paths) and its bytes are reused for the vision call.
+        Uncached images are sent ``images_per_call`` at a time in one
+        multimodal request, with at most ``concurrency`` requests in flight.
+        Images a packed answer does not cover are retried one by one.
 
         Args:
-            image_url: URL to check
+            requests: Images with their article context
+            use_vision: Whether to attempt vision analysis
+            images_per_call: Images per vision request (IMAGE_ALT_IMAGES_PER_CALL)
+            concurrency: Fetches / AI requests in flight (IMAGE_ALT_CONCURRENCY)
+
+        Yields:
+            ImageAltSuggestion per request, in completion order
+        """
+        settings = get_settings()
+        images_per_call = images_per_call or settings.IMAGE_ALT_IMAGES_PER_CALL
+        slots = asyncio.Semaphore(concurrency or settings.IMAGE_ALT_CONCURRENCY)
+
+        if not self.use_vertex_ai and not self.openai_client:
+            for request in requests:
+                yield await self.generate_suggestions(
+                    image_id=request.image_id,
+                    image_url=request.image_url,
+                    article_context=request.article_context,
+                    parsed_alt_text=request.parsed_alt_text,
+                    parsed_caption=request.parsed_caption,
+                    parsed_description=request.parsed_description
+                )
+            return
+
+        loads = [
+            asyncio.create_task(self._load_batch_image(order, request, use_vision, slots))
+            for order, request in enumerate(requests)
+        ]
+        followups: list[asyncio.Task] = []
+        try:
+            images: list[_BatchImage] = []
+            for done in asyncio.as_completed(loads):
+                image, cached = await done
+                if cached is not None:
+                    yield cached
+                elif image.image_bytes is None:
+                    followups.append(asyncio.create_task(self._context_for_batch(image, slots)))
+                else:
+                    images.append(image)
+
+            # Neighbouring images share context, so group them in document order
+            images.sort(key=lambda image: image.order)
+            for start in range(0, len(images), images_per_call):
+                followups.append(
+                    asyncio.create_task(
+                        self._describe_batch_group(images[start:start + images_per_call], slots)
+                    )
+                )
+            for done in asyncio.as_completed(followups):
+                for suggestion in await done:
+                    yield suggestion
+        finally:
+            for task in (*loads, *followups):
+                task.cancel()
+
+    async def _load_batch_image(
+        self,
+        order: int,
+        request: ImageAltRequest,
+        use_vision: bool,
+        slots: asyncio.Semaphore
+    ) -> tuple[_BatchImage, ImageAltSuggestion | None]:
+        """Load an image's bytes once and look up its cached suggestion"""
+        image = _BatchImage(order=order, request=request)
+        if not (use_vision and request.image_url):
+            return image, None
+
+        async with slots:
+            if request.image_url.startswith(("http://", "https://")):
+                stored = await self._fetch_stored_image(request.image_url)
+                if stored is None:
+                    return image, None
+                image.image_bytes = await self.image_store.read_bytes(stored)
+                image.sha256 = stored.sha256
+                image.mime_type = self._mime_type(request.image_url, stored.content_type)
+            else:
+                # Local preview / source file written by image ingestion
+                path = Path(request.image_url)
+                try:
+                    image.image_bytes = await asyncio.to_thread(path.read_bytes)
+                except OSError as e:
+                    logger.debug(f"Local image not readable: {e}")
+                    return image, None
+                image.sha256 = hashlib.sha256(image.image_bytes).hexdigest()
+                image.mime_type = self._mime_type(request.image_url)
+
+        image.cache_key = self._alt_text_cache_key(
+            request.article_context,
+            request.parsed_alt_text,
+            request.parsed_caption,
+            request.parsed_description
+        )
+        cached = await self.image_store.alt_text(image.sha256, image.cache_key)
+        if cached:
+            return image, self._suggestion_from_cache(request.image_id, cached)
+        return image, None
+
+    async def _context_for_batch(
+        self,
+        image: _BatchImage,
+        slots: asyncio.Semaphore
+    ) -> list[ImageAltSuggestion]:
+        request = image.request
+        async with slots:
+            return [
+                await self._generate_from_context(
+                    image_id=request.image_id,
+                    article_context=request.article_context,
+                    parsed_alt_text=request.parsed_alt_text,
+                    parsed_caption=request.parsed_caption,
+                    parsed_description=request.parsed_description
+                )
+            ]
+
+    async def _describe_batch_group(
+        self,
+        images: list[_BatchImage],
+        slots: asyncio.Semaphore
+    ) -> list[ImageAltSuggestion]:
+        """Describe a group of images with one multimodal request
+
+        Images missing from the answer (or all of them, if the request
+        fails) go through the single-image path instead.
+        """
+        answers: dict[int, dict] = {}
+        tokens_used = 0
+        model_used = self.gemini_model_name if self.use_vertex_ai else self.openai_model
+        async with slots:
+            try:
+                if self.use_vertex_ai:
+                    content, tokens_used = await self._batch_request_gemini(images)
+                else:
+                    content, tokens_used = await self._batch_request_openai(images)
+                for entry in self._parse_json_response(content).get("images", []):
+                    if isinstance(entry, dict) and isinstance(entry.get("index"), int):
+                        answers[entry["index"]] = entry
+            except Exception as e:
+                logger.error(f"Batched vision generation failed for {len(images)} images: {e}")
+
+        suggestions = []
+        per_image_tokens = tokens_used // len(images)
+        for index, image in enumerate(images, start=1):
+            request = image.request
+            answer = answers.get(index)
+            if answer is None:
+                async with slots:
+                    suggestion = await self._describe_loaded_image(image)
+            else:
+                suggestion = self._vision_suggestion(
+                    image_id=request.image_id,
+                    result=answer,
+                    parsed_alt_text=request.parsed_alt_text,
+                    parsed_caption=request.parsed_caption,
+                    parsed_description=request.parsed_description,
+                    model_used=model_used,
+                    tokens_used=per_image_tokens
+                )
+                await self.image_store.save_alt_text(
+                    image.sha256, image.cache_key, asdict(suggestion)
+                )
+            suggestions.append(suggestion)
+
+        logger.info(
+            f"Described {len(answers)}/{len(images)} images in one {self.provider.value} "
+            f"request ({tokens_used} tokens)"
+        )
+        return suggestions
+
+    async def _describe_loaded_image(self, image: _BatchImage) -> ImageAltSuggestion:
+        """Single-image vision call on the bytes the batch already loaded"""
+        request = image.request
+        generate = self._generate_with_gemini if self.use_vertex_ai else self._generate_with_openai
+        suggestion = await generate(
+            image_id=request.image_id,
+            image_url=request.image_url,
+            article_context=request.article_context,
+            parsed_alt_text=request.parsed_alt_text,
+            parsed_caption=request.parsed_caption,
+            parsed_description=request.parsed_description,
+            image_bytes=image.image_bytes,
+            mime_type=image.mime_type
+        )
+        if suggestion.generation_method in VISION_METHODS:
+            await self.image_store.save_alt_text(
+                image.sha256, image.cache_key, asdict(suggestion)
+            )
+        return suggestion
+
+    def _batch_image_label(self, index: int, image: _BatchImage) -> str:
+        """Per-image context line block for a packed request"""
+        request = image.request
+        context = request.article_context
+        is_featured = context.get("is_featured", False)
+        position = context.get("position", 0)
+        position_desc = "特色圖片（文章封面）" if is_featured else f"第 {position + 1} 張配圖"
+        excerpt = context.get("excerpt", "")[:500] if context.get("excerpt") else ""
+        return f"""圖片 {index}：
+- 標題：{context.get("title", "")}
+- 摘要：{excerpt}
+- 圖片位置：{position_desc}
+- 現有圖說：{request.parsed_caption or "無"}
+- 現有 Alt Text：{request.parsed_alt_text or "無"}"""
+
+    async def _batch_request_openai(self, images: list[_BatchImage]) -> tuple[str, int]:
+        content: list[dict] = []
+        for index, image in enumerate(images, start=1):
+            encoded = base64.b64encode(image.image_bytes).decode("ascii")
+            content.append({"type": "text", "text": self._batch_image_label(index, image)})
+            content.append({
+                "type": "image_url",
+                "image_url": {
+                    "url": f"data:{image.mime_type};base64,{encoded}",
+                    "detail": "high"  # Use high detail for better OCR
+                }
+            })
+        response = await self.openai_client.chat.completions.create(
+            model=self.openai_model,
+            messages=[
+                {"role": "system", "content": self.PROMPT_IMAGE_ANALYSIS + self.PROMPT_BATCH_SUFFIX},
+                {"role": "user", "content": content}
+            ],
+            max_tokens=1000 * len(images),
+            temperature=0.2,
+            response_format={"type": "json_object"}
+        )
+        tokens_used = response.usage.total_tokens if response.usage else 0
+        return response.choices[0].message.content, tokens_used
+
+    async def _batch_request_gemini(self, images: list[_BatchImage]) -> tuple[str, int]:
+        prompt = self.PROMPT_IMAGE_ANALYSIS + self.PROMPT_BATCH_SUFFIX
+        parts: list = [prompt]
+        for index, image in enumerate(images, start=1):
+            parts.append(self._batch_image_label(index, image))
+            parts.append(Part.from_data(image.image_bytes, mime_type=image.mime_type))
+        response = await self.gemini_model.generate_content_async(
+            parts,
+            generation_config={
+                "temperature": 0.2,
+                "max_output_tokens": 1000 * len(images),
+                "response_mime_type": "application/json"
+            }
+        )
+        content = response.text
+        # Estimate tokens (Gemini doesn't always return usage)
+        tokens_used = len(prompt.split()) + len(content.split()) + 500 * len(images)
+        return content, tokens_used
+
+    @staticmethod
+    def _mime_type(image_url: str, content_type: str | None = None) -> str:
+        """Image MIME type from the response header or the URL suffix"""
+        if content_type and content_type.startswith("image/"):
+            return content_type.split(";")[0]
+        lowered = image_url.lower()
+        if lowered.endswith(".png"):
+            return "image/png"
+        if lowered.endswith(".gif"):
+            return "image/gif"
+        if lowered.endswith(".webp"):
+            return "image/webp"
+        return "image/jpeg"
+
+    async def _fetch_stored_image(self, image_url: str) -> StoredImage | None:
+        """Fetch the image through the shared image store
+
+        A recently seen image costs no network call; an older one costs a
+        conditional request at most.
+
+        Args:
+            image_url: URL to fetch
 
         Returns:
-            True if image can be fetched
+            The stored image, or None if it cannot be fetched or is not an image
         """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.head(image_url, follow_redirects=True)
-                if response.status_code == 200:
-                    content_type = response.headers.get("content-type", "")
-                    return content_type.startswith("image/")
-                return False
+            stored = await self.image_store.fetch(image_url)
         except Exception as e:
             logger.debug(f"Image accessibility check failed: {e}")
-            return False
+            return None
+        if stored.content_type and not stored.content_type.startswith("image/"):
+            logger.debug(f"Not an image ({stored.content_type}): {image_url}")
+            return None
+        return stored
 
     async def _fetch_image_bytes(self, image_url: str) -> bytes | None:
-        """Fetch image bytes from URL
+        """Fetch image bytes from URL (via the image store)
 
         Args:
             image_url: URL to fetch
@@ -322,16 +666,51 @@ confidence 為 0-1 之間的數值，表示你對建議的信心程度。
         Returns:
             Image bytes or None if failed
         """
+        stored = await self._fetch_stored_image(image_url)
+        if stored is None:
+            return None
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(image_url, follow_redirects=True)
-                if response.status_code == 200:
-                    return response.content
-                return None
-        except Exception as e:
-            logger.error(f"Failed to fetch image: {e}")
+            return await self.image_store.read_bytes(stored)
+        except OSError as e:
+            logger.error(f"Failed to read cached image: {e}")
             return None
 
+    def _alt_text_cache_key(
+        self,
+        article_context: dict,
+        parsed_alt_text: str | None,
+        parsed_caption: str | None,
+        parsed_description: str | None
+    ) -> str:
+        """Identify everything besides the image bytes that a suggestion depends on"""
+        model = self.gemini_model_name if self.use_vertex_ai else self.openai_model
+        payload = json.dumps(
+            {
+                "model": f"{self.provider.value}:{model}",
+                "context": article_context,
+                "alt_text": parsed_alt_text,
+                "caption": parsed_caption,
+                "description": parsed_description,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @staticmethod
+    def _suggestion_from_cache(image_id: int, cached: dict) -> ImageAltSuggestion:
+        """Rebuild a cached suggestion for (possibly another record of) the same image"""
+        return ImageAltSuggestion(
+            **{
+                **cached,
+                "image_id": image_id,
+                "image_type": ImageType(cached["image_type"]),
+                "generation_method": GenerationMethod(cached["generation_method"]),
+                "tokens_used": 0,
+            }
+        )
+
     async def _generate_with_gemini(
         self,
         image_id: int,
@@ -339,7 +718,9 @@ confidence 為 0-1 之間的數值，表示你對建議的信心程度。
         article_context: dict,
         parsed_alt_text: str | None,
         parsed_caption: str | None,
-        parsed_description: str | None
+        parsed_description: str | None,
+        image_bytes: bytes | None = None,
+        mime_type: str | None = None
     ) -> ImageAltSuggestion:
         """Generate using Gemini 3.0 Flash vision analysis
 
@@ -350,6 +731,8 @@ confidence 為 0-1 之間的數值，表示你對建議的信心程度。
             parsed_alt_text: Existing alt text
             parsed_caption: Existing caption
             parsed_description: Existing description
+            image_bytes: Already loaded image (skips the fetch)
+            mime_type: MIME type of ``image_bytes``
 
         Returns:
             ImageAltSuggestion with Gemini-based suggestions
@@ -377,7 +760,8 @@ confidence 為 0-1 之間的數值，表示你對建議的信心程度。
 
         try:
             # Fetch image bytes for Gemini
-            image_bytes = await self._fetch_image_bytes(image_url)
+            if image_bytes is None:
+                image_bytes = await self._fetch_image_bytes(image_url)
             if not image_bytes:
                 logger.warning(f"Failed to fetch image {image_id}, falling back to context")
                 return await self._generate_from_context(
@@ -388,17 +772,10 @@ confidence 為 0-1 之間的數值，表示你對建議的信心程度。
                     parsed_description=parsed_description
                 )
 
-            # Determine image MIME type
-            mime_type = "image/jpeg"
-            if image_url.lower().endswith(".png"):
-                mime_type = "image/png"
-            elif image_url.lower().endswith(".gif"):
-                mime_type = "image/gif"
-            elif image_url.lower().endswith(".webp"):
-                mime_type = "image/webp"
-
             # Create Gemini content parts
-            image_part = Part.from_data(image_bytes, mime_type=mime_type)
+            image_part = Part.from_data(
+                image_bytes, mime_type=mime_type or self._mime_type(image_url)
+            )
 
             # Generate with Gemini
             full_prompt = f"{self.PROMPT_IMAGE_ANALYSIS}\n\n{user_prompt}"
@@ -420,42 +797,21 @@ confidence 為 0-1 之間的數值，表示你對建議的信心程度。
             # Parse JSON response
             result = self._parse_json_response(content)
 
-            # Determine image type and generation method
-            image_type_str = result.get("image_type", "unknown")
-            if image_type_str == "infographic":
-                image_type = ImageType.INFOGRAPHIC
-                generation_method = GenerationMethod.VISION_INFOGRAPHIC
-            elif image_type_str == "photo":
-                image_type = ImageType.PHOTO
-                generation_method = GenerationMethod.VISION_PHOTO
-            else:
-                image_type = ImageType.UNKNOWN
-                generation_method = GenerationMethod.VISION
-
-            detected_text = result.get("detected_text")
-            if detected_text == "null" or detected_text == "":
-                detected_text = None
-
-            logger.info(
-                f"Image {image_id} analyzed with Gemini: type={image_type.value}, "
-                f"has_text={detected_text is not None}"
-            )
-
-            return ImageAltSuggestion(
+            suggestion = self._vision_suggestion(
                 image_id=image_id,
+                result=result,
                 parsed_alt_text=parsed_alt_text,
                 parsed_caption=parsed_caption,
                 parsed_description=parsed_description,
-                suggested_alt_text=result.get("alt_text", ""),
-                suggested_alt_text_confidence=result.get("alt_text_confidence", 0.9),
-                suggested_description=result.get("description", ""),
-                suggested_description_confidence=result.get("description_confidence", 0.9),
-                image_type=image_type,
-                detected_text=detected_text,
-                generation_method=generation_method,
                 model_used=self.gemini_model_name,
                 tokens_used=tokens_used
             )
+            logger.info(
+                f"Image {image_id} analyzed with Gemini: type={suggestion.image_type.value}, "
+                f"has_text={suggestion.detected_text is not None}"
+            )
+
+            return suggestion
 
         except Exception as e:
             logger.error(f"Gemini vision generation failed: {e}")
@@ -468,7 +824,9 @@ confidence 為 0-1 之間的數值，表示你對建議的信心程度。
                     article_context=article_context,
                     parsed_alt_text=parsed_alt_text,
                     parsed_caption=parsed_caption,
-                    parsed_description=parsed_description
+                    parsed_description=parsed_description,
+                    image_bytes=image_bytes,
+                    mime_type=mime_type
                 )
             # Fall back to context-based generation
             return await self._generate_from_context(
@@ -486,7 +844,9 @@ confidence 為 0-1 之間的數值，表示你對建議的信心程度。
         article_context: dict,
         parsed_alt_text: str | None,
         parsed_caption: str | None,
-        parsed_description: str | None
+        parsed_description: str | None,
+        image_bytes: bytes | None = None,
+        mime_type: str | None = None
     ) -> ImageAltSuggestion:
         """Generate using GPT-4o vision analysis (fallback)
 
@@ -497,6 +857,8 @@ confidence 為 0-1 之間的數值，表示你對建議的信心程度。
             parsed_alt_text: Existing alt text
             parsed_caption: Existing caption
             parsed_description: Existing description
+            image_bytes: Already loaded image, sent inline instead of the URL
+            mime_type: MIME type of ``image_bytes``
 
         Returns:
             ImageAltSuggestion with OpenAI-based suggestions
@@ -522,6 +884,10 @@ confidence 為 0-1 之間的數值，表示你對建議的信心程度。
 2. Alt Text 必須包含圖片上的文字信息（如果有的話）
 3. 結合圖片視覺內容和文章上下文，生成最準確的建議"""
 
+        if image_bytes is not None:
+            encoded = base64.b64encode(image_bytes).decode("ascii")
+            image_url = f"data:{mime_type or self._mime_type(image_url)};base64,{encoded}"
+
         try:
             response = await self.openai_client.chat.completions.create(
                 model=self.openai_model,
@@ -555,43 +921,22 @@ confidence 為 0-1 之間的數值，表示你對建議的信心程度。
             # Parse JSON response
             result = self._parse_json_response(content)
 
-            # Determine image type and generation method
-            image_type_str = result.get("image_type", "unknown")
-            if image_type_str == "infographic":
-                image_type = ImageType.INFOGRAPHIC
-                generation_method = GenerationMethod.VISION_INFOGRAPHIC
-            elif image_type_str == "photo":
-                image_type = ImageType.PHOTO
-                generation_method = GenerationMethod.VISION_PHOTO
-            else:
-                image_type = ImageType.UNKNOWN
-                generation_method = GenerationMethod.VISION
-
-            detected_text = result.get("detected_text")
-            if detected_text == "null" or detected_text == "":
-                detected_text = None
-
-            logger.info(
-                f"Image {image_id} analyzed with OpenAI: type={image_type.value}, "
-                f"has_text={detected_text is not None}, "
-                f"tokens={tokens_used}"
-            )
-
-            return ImageAltSuggestion(
+            suggestion = self._vision_suggestion(
                 image_id=image_id,
+                result=result,
                 parsed_alt_text=parsed_alt_text,
                 parsed_caption=parsed_caption,
                 parsed_description=parsed_description,
-                suggested_alt_text=result.get("alt_text", ""),
-                suggested_alt_text_confidence=result.get("alt_text_confidence", 0.9),
-                suggested_description=result.get("description", ""),
-                suggested_description_confidence=result.get("description_confidence", 0.9),
-                image_type=image_type,
-                detected_text=detected_text,
-                generation_method=generation_method,
                 model_used=self.openai_model,
                 tokens_used=tokens_used
             )
+            logger.info(
+                f"Image {image_id} analyzed with OpenAI: type={suggestion.image_type.value}, "
+                f"has_text={suggestion.detected_text is not None}, "
+                f"tokens={tokens_used}"
+            )
+
+            return suggestion
 
         except Exception as e:
             logger.error(f"OpenAI vision generation failed: {e}")
@@ -714,6 +1059,62 @@ confidence 為 0-1 之間的數值，表示你對建議的信心程度。
                 error_message=str(e)
             )
 
+    def _vision_suggestion(
+        self,
+        image_id: int,
+        result: dict,
+        parsed_alt_text: str | None,
+        parsed_caption: str | None,
+        parsed_description: str | None,
+        model_used: str,
+        tokens_used: int
+    ) -> ImageAltSuggestion:
+        """Turn one parsed vision answer into a suggestion
+
+        Args:
+            image_id: Database ID
+            result: Parsed JSON answer for this image
+            parsed_alt_text: Existing alt text
+            parsed_caption: Existing caption
+            parsed_description: Existing description
+            model_used: Model that produced the answer
+            tokens_used: Tokens attributed to this image
+
+        Returns:
+            ImageAltSuggestion with vision-based suggestions
+        """
+        # Determine image type and generation method
+        image_type_str = result.get("image_type", "unknown")
+        if image_type_str == "infographic":
+            image_type = ImageType.INFOGRAPHIC
+            generation_method = GenerationMethod.VISION_INFOGRAPHIC
+        elif image_type_str == "photo":
+            image_type = ImageType.PHOTO
+            generation_method = GenerationMethod.VISION_PHOTO
+        else:
+            image_type = ImageType.UNKNOWN
+            generation_method = GenerationMethod.VISION
+
+        detected_text = result.get("detected_text")
+        if detected_text == "null" or detected_text == "":
+            detected_text = None
+
+        return ImageAltSuggestion(
+            image_id=image_id,
+            parsed_alt_text=parsed_alt_text,
+            parsed_caption=parsed_caption,
+            parsed_description=parsed_description,
+            suggested_alt_text=result.get("alt_text", ""),
+            suggested_alt_text_confidence=result.get("alt_text_confidence", 0.9),
+            suggested_description=result.get("description", ""),
+            suggested_description_confidence=result.get("description_confidence", 0.9),
+            image_type=image_type,
+            detected_text=detected_text,
+            generation_method=generation_method,
+            model_used=model_used,
+            tokens_used=tokens_used
+        )
+
     def _parse_json_response(self, content: str) -> dict:
         """Parse JSON response from AI, handling potential formatting issues
 
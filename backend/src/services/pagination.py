@@ -0,0 +1,101 @@
+"""Keyset cursors and cheap totals for list endpoints.
+
+List endpoints page newest-change-first on ``(updated_at, id)``.  A cursor
+is the opaque, URL-safe encoding of the last row's key; the next page is a
+range scan past it on the ``(updated_at, id)`` index, so page 500 costs the
+same as page 1 (OFFSET would read and discard every earlier row).
+
+Totals are reused for ``LIST_COUNT_CACHE_SECONDS``.  On PostgreSQL an
+unfiltered total above ``LIST_COUNT_ESTIMATE_MIN_ROWS`` comes from the
+planner's row estimate instead of a full ``count(*)``.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import time
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import get_settings
+
+# (engine URL, key) -> (expires at, total)
+_count_cache: dict[tuple[str, str], tuple[float, int]] = {}
+
+
+def encode_cursor(updated_at: datetime, row_id: int) -> str:
+    raw = json.dumps([updated_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Inverse of ``encode_cursor``; ValueError for anything it did not produce."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        updated_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(updated_at), int(row_id)
+    except (ValueError, TypeError):
+        raise ValueError(f"Invalid cursor '{cursor}'.") from None
+
+
+def keyset_page(query: Select, model: Any, cursor: str | None, limit: int) -> Select:
+    """Order ``query`` newest change first and restrict it to the page after ``cursor``."""
+    if cursor:
+        updated_at, row_id = decode_cursor(cursor)
+        query = query.where(tuple_(model.updated_at, model.id) < tuple_(updated_at, row_id))
+    return query.order_by(model.updated_at.desc(), model.id.desc()).limit(limit)
+
+
+def next_cursor(rows: Sequence[Any], limit: int) -> str | None:
+    """Cursor for the page after ``rows``, or None when this was the last page."""
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(last.updated_at, last.id)
+
+
+async def cached_count(
+    session: AsyncSession,
+    count_query: Select,
+    key: str,
+    *,
+    table: str | None = None,
+) -> int:
+    """Run ``count_query`` at most once per cache window for ``key``.
+
+    Pass ``table`` only for unfiltered counts; it allows the planner
+    estimate to stand in for the exact count on large tables.
+    """
+    settings = get_settings()
+    bind = session.get_bind()
+    cache_key = (str(bind.url), key)
+    now = time.monotonic()
+    cached = _count_cache.get(cache_key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    total: int | None = None
+    min_rows = settings.LIST_COUNT_ESTIMATE_MIN_ROWS
+    if table and min_rows and bind.dialect.name == "postgresql":
+        estimate = await session.scalar(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": table},
+        )
+        # reltuples is -1 until the table has been analyzed
+        if estimate is not None and estimate >= min_rows:
+            total = int(estimate)
+    if total is None:
+        total = int(await session.scalar(count_query) or 0)
+
+    if settings.LIST_COUNT_CACHE_SECONDS:
+        _count_cache[cache_key] = (now + settings.LIST_COUNT_CACHE_SECONDS, total)
+    return total
+
+
+def clear_count_cache() -> None:
+    _count_cache.clear()
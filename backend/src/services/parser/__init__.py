@@ -5,6 +5,7 @@ from src.services.parser.article_processor import (
     ArticleProcessingService,
     create_article_processor,
 )
+from src.services.parser.gdoc_document import DocSection, ParsedGoogleDoc
 from src.services.parser.image_processor import (
     ImageProcessorService,
     create_image_processor,
@@ -17,6 +18,7 @@ from src.services.parser.models import (
     ParsingResult,
 )
 from src.services.parser.html_utils import (
+    PlainTextOffsetMap,
     strip_html_tags,
     calculate_plain_text_position,
     find_text_position_in_plain,
@@ -38,8 +40,11 @@ __all__ = [
     "ImageMetadata",
     "ParsingResult",
     "ParsingError",
+    "ParsedGoogleDoc",
+    "DocSection",
     # HTML utilities (Spec 014)
     "strip_html_tags",
+    "PlainTextOffsetMap",
     "calculate_plain_text_position",
     "find_text_position_in_plain",
     "validate_position",
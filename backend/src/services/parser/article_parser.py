@@ -9,6 +9,7 @@ This service extracts structured data from raw Google Doc HTML, including:
 """
 
 import logging
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
@@ -24,6 +25,8 @@ from src.services.parser.faq_extractor import (
     FAQExtractor,
     get_faq_extractor,
 )
+from src.services.parser.gdoc_document import DocSection, ParsedGoogleDoc
+from src.services.parser.gdoc_document import normalize_gdoc_html as _normalize_gdoc_html
 from src.services.parser.featured_image_detector import (
     FeaturedImageDetector,
     get_featured_image_detector,
@@ -35,9 +38,17 @@ from src.services.parser.models import (
     ParsingError,
     ParsingResult,
 )
+from src.services.parser.streaming_json import JSONObjectStream
 
 logger = logging.getLogger(__name__)
 
+# Called with (key, value) for each top-level field of the AI answer as soon
+# as it has finished streaming
+SectionCallback = Callable[[str, Any], None]
+
+# Without these fields a streamed answer cut off by max_tokens is unusable
+REQUIRED_AI_FIELDS = ("title_main", "body_html")
+
 
 def _repair_json(text: str) -> str | None:
     """Attempt to repair truncated or malformed JSON.
@@ -204,57 +215,7 @@ def _repair_json(text: str) -> str | None:
     return repaired
 
 
-def _normalize_gdoc_html(html: str) -> str:
-    """Normalize raw Google Doc HTML for reliable regex matching.
-
-    Google Docs exports HTML with:
-    - Content wrapped in <span class="..."> inside <p> and <h2> tags
-    - <p> and <h2> tags with class/id attributes
-    - Unicode characters HTML-entity-encoded (e.g., &#9552; for ═)
-
-    This function normalizes by:
-    1. Decoding HTML entities (&#9552; → ═, &#65306; → ：, &nbsp; → space)
-    2. Unwrapping <span> tags with class= attributes (Google Docs layout classes),
-       preserving spans with style="color:..." (author intros, styled text)
-    3. Stripping class/id attributes from <p> and <h2> tags
-
-    Result: <p class="c3"><span class="c0">═══</span></p> → <p>═══</p>
-    But: <span style="color:#1155cc">作者介紹</span> is preserved.
-    """
-    import re
-    from html import unescape
-
-    if not html:
-        return html
-
-    # Step 1: Decode HTML entities
-    normalized = unescape(html)
-
-    # Step 2: Unwrap <span> tags that have class= attributes (Google Docs layout spans)
-    # Preserve any <span> that contains style= (e.g., color-styled author intros)
-    # Google Docs may emit <span class="c0" style="color:#1155cc"> — keep these
-    prev = None
-    while prev != normalized:
-        prev = normalized
-        # Match spans with class= but WITHOUT style= attribute
-        normalized = re.sub(
-            r'<span\s+class=(?:(?!style=)[^>])*>(.*?)</span>', r'\1', normalized, flags=re.DOTALL
-        )
-
-    # Also strip bare <span> tags without any attributes
-    prev = None
-    while prev != normalized:
-        prev = normalized
-        normalized = re.sub(r'<span>(.*?)</span>', r'\1', normalized, flags=re.DOTALL)
-
-    # Step 3: Strip class/id/style attributes from <p> and <h2> tags only
-    # (does NOT affect <span> tags — color styles are preserved)
-    normalized = re.sub(r'<(p|h2)\s+[^>]*>', r'<\1>', normalized, flags=re.IGNORECASE)
-
-    return normalized
-
-
-def _extract_metadata_sections(body_html: str) -> dict[str, Any]:
+def _extract_metadata_sections(body_html: "str | ParsedGoogleDoc") -> dict[str, Any]:
     """Extract structured metadata from sections after the divider in body_html.
 
     The Google Doc article format includes metadata sections after a divider line:
@@ -267,7 +228,7 @@ def _extract_metadata_sections(body_html: str) -> dict[str, Any]:
     This function extracts and parses these sections BEFORE body truncation.
 
     Args:
-        body_html: The body HTML content from AI parsing
+        body_html: The document HTML, or the already parsed document
 
     Returns:
         Dict with extracted metadata:
@@ -280,8 +241,6 @@ def _extract_metadata_sections(body_html: str) -> dict[str, Any]:
         - aeo_paragraph: str or None
         - image_alt_texts: list of {position, alt_text, drive_link}
     """
-    import re
-
     result: dict[str, Any] = {
         "proofreading_suggestions": [],
         "seo_title_variants": [],
@@ -296,42 +255,16 @@ def _extract_metadata_sections(body_html: str) -> dict[str, Any]:
     if not body_html:
         return result
 
-    # Normalize Google Doc HTML for reliable regex matching
-    body_html = _normalize_gdoc_html(body_html)
-
-    # Find the first divider to get metadata content after it
-    divider_pattern = r'<p>\s*[-—–─═_=·•]{5,}[-—–─═_=·•\s]*</p>'
-    divider_match = re.search(divider_pattern, body_html, flags=re.IGNORECASE)
-
-    if not divider_match:
-        # Fallback: check for metadata H2 headers without divider
-        metadata_h2_pattern = r'<h2[^>]*>\s*(?:校對結果|Meta\s*\+?\s*AEO|圖片\s*Alt\s*Text)\s*</h2>'
-        metadata_h2_match = re.search(metadata_h2_pattern, body_html, flags=re.IGNORECASE)
-        if not metadata_h2_match:
-            logger.debug("[METADATA EXTRACT] No divider or metadata H2 found, nothing to extract")
-            return result
-        metadata_content = body_html[metadata_h2_match.start():]
-    else:
-        metadata_content = body_html[divider_match.end():]
-
-    # Remove additional dividers within the metadata content
-    metadata_content = re.sub(divider_pattern, '', metadata_content)
-
-    logger.info(f"[METADATA EXTRACT] Found metadata content: {len(metadata_content)} chars")
-
-    # Split into sections by H2 headers
-    # Pattern: <h2>Section Name</h2> ... (content until next <h2> or end)
-    section_pattern = r'<h2[^>]*>\s*(.*?)\s*</h2>'
-    sections: dict[str, str] = {}
-    section_matches = list(re.finditer(section_pattern, metadata_content, flags=re.IGNORECASE | re.DOTALL))
+    doc = body_html if isinstance(body_html, ParsedGoogleDoc) else ParsedGoogleDoc(body_html)
+    if doc.metadata_start is None:
+        logger.debug("[METADATA EXTRACT] No divider or metadata H2 found, nothing to extract")
+        return result
 
-    for i, match in enumerate(section_matches):
-        section_name = re.sub(r'<[^>]+>', '', match.group(1)).strip()
-        start = match.end()
-        end = section_matches[i + 1].start() if i + 1 < len(section_matches) else len(metadata_content)
-        section_content = metadata_content[start:end].strip()
-        sections[section_name] = section_content
-        logger.debug(f"[METADATA EXTRACT] Section '{section_name}': {len(section_content)} chars")
+    # Sections are split at their H2 headers (text before the first H2 is ignored)
+    sections = doc.sections
+    logger.info(f"[METADATA EXTRACT] Found {len(sections)} metadata sections")
+    for section_name, section in sections.items():
+        logger.debug(f"[METADATA EXTRACT] Section '{section_name}': {len(section.blocks)} blocks")
 
     # --- Parse 校對結果 (Proofreading Suggestions) ---
     for name, content in sections.items():
@@ -371,7 +304,13 @@ def _extract_metadata_sections(body_html: str) -> dict[str, Any]:
     return result
 
 
-def _parse_proofreading_section(html_content: str) -> list[dict[str, str]]:
+def _as_section(html_content: str | DocSection) -> DocSection:
+    if isinstance(html_content, DocSection):
+        return html_content
+    return DocSection.from_html(html_content)
+
+
+def _parse_proofreading_section(html_content: str | DocSection) -> list[dict[str, str]]:
     """Parse the 校對結果 section into structured proofreading suggestions.
 
     Handles multiple formats:
@@ -392,11 +331,10 @@ def _parse_proofreading_section(html_content: str) -> list[dict[str, str]]:
         1. XXX → YYY（原因）
     """
     import re
-    from bs4 import BeautifulSoup
 
     suggestions = []
-    soup = BeautifulSoup(html_content, "html.parser")
-    text_content = soup.get_text(separator="\n")
+    section = _as_section(html_content)
+    text_content = section.text
 
     # Pattern 0 (highest priority): Google Doc multi-paragraph format
     # Groups lines by numbered headers like "1. 【...】"
@@ -513,7 +451,7 @@ def _parse_proofreading_section(html_content: str) -> list[dict[str, str]]:
     return suggestions
 
 
-def _parse_meta_aeo_section(html_content: str) -> dict[str, Any]:
+def _parse_meta_aeo_section(html_content: str | DocSection) -> dict[str, Any]:
     """Parse the Meta + AEO section into structured SEO and AEO data.
 
     Handles two formats:
@@ -541,7 +479,6 @@ def _parse_meta_aeo_section(html_content: str) -> dict[str, Any]:
     Uses a state machine approach to handle both formats.
     """
     import re
-    from bs4 import BeautifulSoup
 
     result: dict[str, Any] = {
         "seo_title_variants": [],
@@ -552,8 +489,7 @@ def _parse_meta_aeo_section(html_content: str) -> dict[str, Any]:
         "aeo_paragraph": None,
     }
 
-    soup = BeautifulSoup(html_content, "html.parser")
-    text_content = soup.get_text(separator="\n")
+    text_content = _as_section(html_content).text
     lines = [line.strip() for line in text_content.split("\n") if line.strip()]
 
     # Known field labels (used by state machine for label-only lines)
@@ -758,7 +694,9 @@ def _parse_meta_aeo_section(html_content: str) -> dict[str, Any]:
     return result
 
 
-def _parse_image_alt_text_section(html_content: str) -> list[dict[str, str | None]]:
+def _parse_image_alt_text_section(
+    html_content: str | DocSection,
+) -> list[dict[str, str | None]]:
     """Parse the 圖片 Alt Text section into structured image alt text data.
 
     Handles multiple formats:
@@ -775,22 +713,21 @@ def _parse_image_alt_text_section(html_content: str) -> list[dict[str, str | Non
            https://drive.google.com/...
     """
     import re
-    from bs4 import BeautifulSoup
 
     alt_texts = []
-    soup = BeautifulSoup(html_content, "html.parser")
-    text_content = soup.get_text(separator="\n")
+    section = _as_section(html_content)
+    text_content = section.text
 
     # Also extract links from <a> tags
     links_by_position: dict[int, str] = {}
-    for a_tag in soup.find_all("a", href=True):
-        href = a_tag["href"]
-        if "drive.google.com" in href or "docs.google.com" in href:
-            # Try to find the numbered position context
-            parent_text = a_tag.parent.get_text() if a_tag.parent else ""
-            num_match = re.match(r'(\d+)', parent_text.strip())
-            if num_match:
-                links_by_position[int(num_match.group(1))] = href
+    for block, block_content in zip(section.blocks, section.texts, strict=True):
+        for a_tag in block.find_all("a", href=True):
+            href = a_tag["href"]
+            if "drive.google.com" in href or "docs.google.com" in href:
+                # The numbered position is at the start of the enclosing paragraph
+                num_match = re.match(r'(\d+)', block_content.strip())
+                if num_match:
+                    links_by_position[int(num_match.group(1))] = href
 
     # Pattern: number. alt_text (optional_url)
     pattern = re.compile(
@@ -1129,24 +1066,29 @@ class ArticleParserService:
         self,
         raw_html: str,
         fallback_to_heuristic: bool = True,
+        on_section: SectionCallback | None = None,
     ) -> ParsingResult:
         """Parse a Google Doc HTML document into structured article data.
 
         Args:
             raw_html: Raw HTML content from Google Docs
             fallback_to_heuristic: Whether to fall back to heuristic parsing if AI fails
+            on_section: Receives each top-level AI field (title, author, images,
+                SEO, FAQs...) as soon as it has streamed in
 
         Returns:
             ParsingResult with parsed article data or errors
         """
         logger.info("Starting article parsing")
         start_time = datetime.utcnow()
+        # Parsed once; both strategies and the metadata extractors share it
+        doc = ParsedGoogleDoc(raw_html)
 
         try:
             # Primary: AI-based parsing
             if self.use_ai:
                 logger.info("Attempting AI-based parsing")
-                result = self._parse_with_ai(raw_html)
+                result = self._parse_with_ai(raw_html, on_section=on_section, doc=doc)
 
                 if result.success:
                     logger.info("AI parsing succeeded")
@@ -1164,7 +1106,7 @@ class ArticleParserService:
 
             # Fallback: Heuristic-based parsing
             logger.info("Using heuristic-based parsing")
-            result = self._parse_with_heuristics(raw_html)
+            result = self._parse_with_heuristics(raw_html, doc=doc)
 
             result.metadata["parsing_duration_ms"] = (
                 datetime.utcnow() - start_time
@@ -1243,11 +1185,52 @@ class ArticleParserService:
 
         return cleaned
 
-    def _parse_with_ai(self, raw_html: str) -> ParsingResult:
+    def _stream_ai_response(
+        self,
+        client: Any,
+        prompt: str,
+        on_section: SectionCallback | None,
+    ) -> tuple[Any, JSONObjectStream]:
+        """Stream Claude's answer, reporting top-level JSON fields as they complete."""
+        sections = JSONObjectStream()
+        with client.messages.stream(
+            model=self.model,
+            max_tokens=16384,  # Increased for unified parsing with long articles
+            temperature=0.0,  # Deterministic for parsing
+            messages=[
+                {
+                    "role": "user",
+                    "content": prompt,
+                }
+            ],
+        ) as stream:
+            for text in stream.text_stream:
+                for key, value in sections.feed(text):
+                    if on_section is None:
+                        continue
+                    try:
+                        on_section(key, value)
+                    except Exception as e:  # noqa: BLE001 - a preview must not break parsing
+                        logger.warning(f"Section callback failed for {key}: {e}")
+            message = stream.get_final_message()
+        return message, sections
+
+    def _parse_with_ai(
+        self,
+        raw_html: str,
+        on_section: SectionCallback | None = None,
+        doc: ParsedGoogleDoc | None = None,
+    ) -> ParsingResult:
         """Parse document using AI (Claude).
 
+        The answer is streamed: ``on_section`` sees every top-level field as
+        soon as it is complete, and if the output is cut off by
+        ``max_tokens`` the fields that did finish are still used.
+
         Args:
             raw_html: Raw HTML content
+            on_section: Optional per-field callback (see ``parse_document``)
+            doc: ``raw_html`` already parsed (built here when omitted)
 
         Returns:
             ParsingResult with AI-parsed data
@@ -1283,17 +1266,12 @@ class ArticleParserService:
 
             # Call Claude API
             logger.info(f"[DEBUG] Calling Claude API (model={self.model})")
-            message = client.messages.create(
-                model=self.model,
-                max_tokens=16384,  # Increased for unified parsing with long articles
-                temperature=0.0,  # Deterministic for parsing
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    }
-                ],
-            )
+            message, streamed = self._stream_ai_response(client, prompt, on_section)
+            truncated = message.stop_reason == "max_tokens"
+            if truncated:
+                logger.warning(
+                    f"Claude output hit max_tokens; streamed fields: {list(streamed.members)}"
+                )
 
             # Extract response text
             response_text = message.content[0].text
@@ -1332,9 +1310,14 @@ class ArticleParserService:
                         logger.info("[DEBUG] JSON repair successful!")
                     except json.JSONDecodeError as repair_error:
                         logger.error(f"[DEBUG] JSON repair also failed: {repair_error}")
-                        raise initial_error  # Re-raise the original error
-                else:
-                    raise initial_error
+                if parsed_data is None:
+                    if not all(field in streamed.members for field in REQUIRED_AI_FIELDS):
+                        raise initial_error
+                    # Truncated or malformed tail: keep the fields that streamed in whole
+                    logger.warning(
+                        f"Using {len(streamed.members)} fields completed before the JSON broke off"
+                    )
+                    parsed_data = dict(streamed.members)
 
             if parsed_data is None:
                 raise json.JSONDecodeError("Failed to parse JSON", cleaned_response, 0)
@@ -1355,7 +1338,9 @@ class ArticleParserService:
 
             # Phase 15: Extract metadata sections from ORIGINAL raw_html (not AI body_html)
             # AI body_html may exclude metadata sections, so we extract from raw source
-            doc_metadata = _extract_metadata_sections(raw_html)
+            if doc is None:
+                doc = ParsedGoogleDoc(raw_html)
+            doc_metadata = _extract_metadata_sections(doc)
 
             # Clean metadata sections from body_html (truncates at divider)
             cleaned_body_html = _clean_metadata_sections_from_body(parsed_data["body_html"])
@@ -1386,8 +1371,7 @@ class ArticleParserService:
             ai_seo_extracted = parsed_data.get("seo_title_extracted", False)
 
             # Also run heuristic extraction for comparison
-            soup = BeautifulSoup(raw_html, "html.parser")
-            heuristic_seo_result = self._extract_seo_title(soup)
+            heuristic_seo_result = self._extract_seo_title(doc.soup)
             heuristic_seo_title = heuristic_seo_result.get("seo_title")
             heuristic_seo_extracted = heuristic_seo_result.get("extracted", False)
 
@@ -1468,6 +1452,9 @@ class ArticleParserService:
                         "input_tokens": message.usage.input_tokens,
                         "output_tokens": message.usage.output_tokens,
                     },
+                    "stop_reason": message.stop_reason,
+                    "truncated": truncated,
+                    "streamed_sections": list(streamed.members),
                 },
             )
 
@@ -1915,11 +1902,14 @@ Process the above {content_type} and return the complete JSON response:"""
 
         return parsed_images
 
-    def _parse_with_heuristics(self, raw_html: str) -> ParsingResult:
+    def _parse_with_heuristics(
+        self, raw_html: str, doc: ParsedGoogleDoc | None = None
+    ) -> ParsingResult:
         """Parse document using heuristic rules (BeautifulSoup).
 
         Args:
             raw_html: Raw HTML content
+            doc: ``raw_html`` already parsed (built here when omitted)
 
         Returns:
             ParsingResult with heuristic-parsed data
@@ -1927,9 +1917,16 @@ Process the above {content_type} and return the complete JSON response:"""
         logger.debug("Starting heuristic parsing")
 
         try:
-            soup = BeautifulSoup(raw_html, "html.parser")
+            if doc is None:
+                doc = ParsedGoogleDoc(raw_html)
+
+            # Phase 15: Extract metadata sections from the ORIGINAL document (not extracted body)
+            # body_html from heuristic extraction may exclude metadata sections.
+            # Runs first: _extract_body below edits the shared soup.
+            doc_metadata = _extract_metadata_sections(doc)
 
             # Extract components
+            soup = doc.soup
             title_data = self._extract_title(soup)
             seo_title_data = self._extract_seo_title(soup)
             author_data = self._extract_author(soup)
@@ -1937,10 +1934,6 @@ Process the above {content_type} and return the complete JSON response:"""
             seo_data = self._extract_seo_metadata(soup)
             images = self._extract_images(soup)
 
-            # Phase 15: Extract metadata sections from ORIGINAL raw_html (not extracted body)
-            # body_html from heuristic extraction may exclude metadata sections
-            doc_metadata = _extract_metadata_sections(raw_html)
-
             # Clean metadata sections from body_html
             cleaned_body_html = _clean_metadata_sections_from_body(body_html)
 
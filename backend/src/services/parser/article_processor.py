@@ -8,10 +8,12 @@ This service orchestrates the complete article processing pipeline:
 5. Save to database
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Any
+from urllib.parse import urlsplit
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -20,8 +22,9 @@ from src.models.article_faq import ArticleFAQ
 from src.models.article_image import ArticleImage
 from src.services.internal_links import InternalLinkService, get_internal_link_service
 from src.services.parser.article_parser import ArticleParserService
-from src.services.parser.image_processor import ImageProcessorService
+from src.services.parser.image_processor import PREVIEW_MAX_SIZE, ImageProcessorService
 from src.services.parser.models import ParsedArticle, ParsingResult, RelatedArticle
+from src.services.storage.image_store import ImageStore, StoredImage, get_image_store
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +38,10 @@ class ArticleProcessingService:
         image_processor: ImageProcessorService,
         storage_base_path: str = "/tmp/cms_images",
         internal_link_service: InternalLinkService | None = None,
+        max_concurrent_images: int = 8,
+        max_images_per_host: int = 4,
+        preview_max_size: int = PREVIEW_MAX_SIZE,
+        image_store: ImageStore | None = None,
     ):
         """Initialize article processing service.
 
@@ -43,9 +50,17 @@ class ArticleProcessingService:
             image_processor: ImageProcessorService instance
             storage_base_path: Base path for storing downloaded images
             internal_link_service: InternalLinkService for related article matching
+            max_concurrent_images: Image downloads in flight per article
+            max_images_per_host: Image downloads in flight per host
+            preview_max_size: Longest edge of generated preview images (px)
+            image_store: Content-addressed image cache shared with publishing
         """
         self.article_parser = article_parser
         self.image_processor = image_processor
+        self.image_store = image_store or get_image_store()
+        self.max_concurrent_images = max_concurrent_images
+        self.max_images_per_host = max_images_per_host
+        self.preview_max_size = preview_max_size
         self.storage_base_path = Path(storage_base_path)
         self.storage_base_path.mkdir(parents=True, exist_ok=True)
         self.internal_link_service = internal_link_service or get_internal_link_service()
@@ -438,6 +453,12 @@ class ArticleProcessingService:
     ) -> list[ArticleImage]:
         """Download and process images for an article.
 
+        Images are fetched concurrently (at most ``max_concurrent_images`` in
+        flight, ``max_images_per_host`` per host) through the image store, so
+        a reparse of an unchanged article transfers no image bodies and reuses
+        the cached metadata and previews.  Decoding runs off the event loop.
+        Records are added in document order once all downloads have settled.
+
         Args:
             article_id: Database ID of the article
             parsed_images: List of ParsedImage objects from parser
@@ -448,63 +469,106 @@ class ArticleProcessingService:
         """
         logger.info(f"Processing {len(parsed_images)} images for article {article_id}")
 
-        created_images = []
-
-        for idx, parsed_img in enumerate(parsed_images):
-            try:
-                # Download image
-                logger.debug(
-                    f"Downloading image {idx+1}/{len(parsed_images)}: {parsed_img.source_url}"
-                )
-
-                # Generate storage paths
-                article_dir = self.storage_base_path / f"article_{article_id}"
-                article_dir.mkdir(parents=True, exist_ok=True)
+        # Generate storage paths
+        article_dir = self.storage_base_path / f"article_{article_id}"
+        article_dir.mkdir(parents=True, exist_ok=True)
 
-                source_filename = f"image_{idx}_{Path(parsed_img.source_url).suffix or '.jpg'}"
-                source_path = article_dir / source_filename
-                preview_path = article_dir / f"preview_{source_filename}"
+        slots = asyncio.Semaphore(self.max_concurrent_images)
+        host_slots: dict[str, asyncio.Semaphore] = {}
 
-                # Download and extract metadata
-                image_metadata = await self.image_processor.process_image_from_url(
-                    parsed_img.source_url,
-                    download_to_path=str(source_path),
-                )
+        async def ingest(idx: int, parsed_img) -> ArticleImage | None:
+            host = urlsplit(parsed_img.source_url).netloc
+            host_slot = host_slots.setdefault(
+                host, asyncio.Semaphore(self.max_images_per_host)
+            )
+            source_filename = f"image_{idx}_{Path(parsed_img.source_url).suffix or '.jpg'}"
+            source_path = article_dir / source_filename
+            try:
+                async with host_slot, slots:
+                    logger.debug(
+                        f"Fetching image {idx+1}/{len(parsed_images)}: {parsed_img.source_url}"
+                    )
+                    stored = await self.image_store.fetch(parsed_img.source_url)
+                image_metadata, has_preview = await self._image_metadata(stored)
 
-                # TODO: Generate preview/thumbnail (future enhancement)
-                # For now, just use same image for preview
+                await self.image_store.link_to(stored.path, source_path)
                 preview_path = source_path
-
-                # Create database record
-                article_image = ArticleImage(
-                    article_id=article_id,
-                    preview_path=str(preview_path),
-                    source_path=str(source_path),
-                    source_url=parsed_img.source_url,
-                    caption=parsed_img.caption,
-                    position=parsed_img.position,
-                    image_metadata=image_metadata,
-                )
-
-                db_session.add(article_image)
-                created_images.append(article_image)
-
-                logger.debug(
-                    f"Image {idx+1} processed: {article_image.image_width}x{article_image.image_height}px"
-                )
-
+                if has_preview:
+                    preview_path = article_dir / f"preview_{source_filename}"
+                    await self.image_store.link_to(stored.preview_path, preview_path)
             except Exception as e:
                 logger.error(
                     f"Failed to process image {idx+1} ({parsed_img.source_url}): {e}"
                 )
                 # Continue processing other images
+                return None
+
+            image_metadata = {
+                **image_metadata,
+                "source_info": {
+                    "original_url": parsed_img.source_url,
+                    "original_filename": source_filename,
+                },
+            }
+            return ArticleImage(
+                article_id=article_id,
+                preview_path=str(preview_path),
+                source_path=str(source_path),
+                source_url=parsed_img.source_url,
+                caption=parsed_img.caption,
+                position=parsed_img.position,
+                image_metadata=image_metadata,
+            )
+
+        results = await asyncio.gather(
+            *(ingest(idx, parsed_img) for idx, parsed_img in enumerate(parsed_images))
+        )
+
+        created_images = []
+        for idx, article_image in enumerate(results):
+            if article_image is None:
                 continue
+            db_session.add(article_image)
+            created_images.append(article_image)
+            logger.debug(
+                f"Image {idx+1} processed: {article_image.image_width}x{article_image.image_height}px"
+            )
 
         logger.info(
             f"Successfully processed {len(created_images)}/{len(parsed_images)} images"
         )
         return created_images
 
+    async def _image_metadata(self, stored: StoredImage) -> tuple[dict[str, Any], bool]:
+        """Metadata of a stored image and whether it has a separate preview.
+
+        Both are computed once per distinct content and kept in the store.
+        """
+        cached = await self.image_store.metadata(stored.sha256)
+        if (
+            cached
+            and cached["preview_max_size"] == self.preview_max_size
+            and (not cached["has_preview"] or stored.preview_path.exists())
+        ):
+            return cached["metadata"], cached["has_preview"]
+
+        metadata, preview_path = await self.image_processor.process_downloaded_image_async(
+            str(stored.path),
+            stored.url,
+            str(stored.preview_path),
+            self.preview_max_size,
+        )
+        has_preview = preview_path != str(stored.path)
+        await self.image_store.save_metadata(
+            stored.sha256,
+            {
+                "metadata": metadata,
+                "has_preview": has_preview,
+                "preview_max_size": self.preview_max_size,
+            },
+        )
+        return metadata, has_preview
+
     async def reprocess_images(
         self,
         article_id: int,
@@ -562,6 +626,9 @@ async def create_article_processor(
     use_ai_parsing: bool = True,
     anthropic_api_key: str | None = None,
     storage_path: str = "/tmp/cms_images",
+    max_concurrent_images: int = 8,
+    max_images_per_host: int = 4,
+    preview_max_size: int = PREVIEW_MAX_SIZE,
 ) -> ArticleProcessingService:
     """Factory function to create ArticleProcessingService.
 
@@ -569,6 +636,9 @@ async def create_article_processor(
         use_ai_parsing: Whether to use AI-based parsing
         anthropic_api_key: Anthropic API key (required if use_ai_parsing=True)
         storage_path: Base path for image storage
+        max_concurrent_images: Image downloads in flight per article
+        max_images_per_host: Image downloads in flight per host
+        preview_max_size: Longest edge of generated preview images (px)
 
     Returns:
         ArticleProcessingService instance
@@ -584,4 +654,7 @@ async def create_article_processor(
         article_parser=article_parser,
         image_processor=image_processor,
         storage_base_path=storage_path,
+        max_concurrent_images=max_concurrent_images,
+        max_images_per_host=max_images_per_host,
+        preview_max_size=preview_max_size,
     )
@@ -18,6 +18,8 @@ from typing import Any
 
 from bs4 import BeautifulSoup, Comment, Tag
 
+from src.services.parser.gdoc_document import HTML_PARSER, ParsedGoogleDoc
+
 logger = logging.getLogger(__name__)
 
 
@@ -108,30 +110,38 @@ class FAQExtractor:
             re.IGNORECASE
         )
 
-    def extract(self, html_content: str) -> FAQExtractionResult:
+    def extract(self, html_content: str | ParsedGoogleDoc) -> FAQExtractionResult:
         """Extract FAQ section from HTML content.
 
+        The document is parsed once and every DOM-based detection method
+        reads that same tree.
+
         Args:
-            html_content: Raw HTML content of the article
+            html_content: Raw HTML content of the article, or the parsed document
 
         Returns:
             FAQExtractionResult with extracted FAQs or empty result
         """
-        if not html_content:
+        doc = (
+            html_content
+            if isinstance(html_content, ParsedGoogleDoc)
+            else ParsedGoogleDoc(html_content)
+        )
+        if not doc.html:
             return FAQExtractionResult()
 
         # Try different detection methods in order of specificity
-        result = self._try_html_comment_markers(html_content)
+        result = self._try_html_comment_markers(doc.html)
         if result.found:
             return result
 
+        soup = doc.soup
+
         # Try Google Doc friendly text markers (【FAQ開始】/【FAQ結束】)
-        result = self._try_text_markers(html_content)
+        result = self._try_text_markers(soup)
         if result.found:
             return result
 
-        soup = BeautifulSoup(html_content, "html.parser")
-
         result = self._try_css_class_markers(soup)
         if result.found:
             return result
@@ -198,7 +208,7 @@ class FAQExtractor:
 
         return FAQExtractionResult()
 
-    def _try_text_markers(self, html_content: str) -> FAQExtractionResult:
+    def _try_text_markers(self, soup: BeautifulSoup) -> FAQExtractionResult:
         """Try to find FAQ section using Google Doc friendly text markers.
 
         Supports markers like:
@@ -208,7 +218,6 @@ class FAQExtractor:
         - ===FAQ===...===/FAQ===
         """
         # Get plain text for matching
-        soup = BeautifulSoup(html_content, "html.parser")
         plain_text = soup.get_text()
 
         # Define start/end marker pairs (start_pattern, end_pattern)
@@ -241,7 +250,7 @@ class FAQExtractor:
 
                     if faq_text:
                         # Parse the FAQ content
-                        faqs = self._parse_text_patterns(f"<p>{faq_text}</p>")
+                        faqs = self._parse_qa_text(faq_text)
 
                         if faqs:
                             # Calculate the raw text to remove (for body cleanup)
@@ -390,7 +399,7 @@ class FAQExtractor:
         4. Q/A text patterns
         5. Numbered Q1/A1 format
         """
-        soup = BeautifulSoup(faq_html, "html.parser")
+        soup = BeautifulSoup(faq_html, HTML_PARSER)
         faqs: list[ExtractedFAQ] = []
 
         # Try definition list format
@@ -409,7 +418,7 @@ class FAQExtractor:
             return details_faqs
 
         # Try text-based Q/A patterns
-        text_faqs = self._parse_text_patterns(faq_html)
+        text_faqs = self._parse_qa_text(soup.get_text())
         if text_faqs:
             return text_faqs
 
@@ -492,9 +501,14 @@ class FAQExtractor:
             if summary:
                 question = summary.get_text(strip=True)
 
-                # Answer is the content after summary
-                summary.extract()
-                answer = details.get_text(strip=True)
+                # Answer is the content after summary (read without detaching
+                # it, so the tree stays intact for the later text patterns)
+                answer = "".join(
+                    text.strip()
+                    for text in details.find_all(string=True)
+                    if not isinstance(text, Comment)
+                    and not any(parent is summary for parent in text.parents)
+                )
 
                 if question and answer:
                     faqs.append(ExtractedFAQ(
@@ -506,14 +520,10 @@ class FAQExtractor:
 
         return faqs
 
-    def _parse_text_patterns(self, html_content: str) -> list[ExtractedFAQ]:
-        """Parse FAQ from text-based Q/A patterns."""
+    def _parse_qa_text(self, text: str) -> list[ExtractedFAQ]:
+        """Parse FAQ from text-based Q/A patterns in plain text."""
         faqs = []
 
-        # Get plain text
-        soup = BeautifulSoup(html_content, "html.parser")
-        text = soup.get_text()
-
         # Pattern 1: Q1: ... A1: ... format
         qa_pattern = re.compile(
             r"Q\s*(\d+)\s*[：:．.]\s*(.+?)\s*A\s*\1\s*[：:．.]\s*(.+?)(?=Q\s*\d+|$)",
@@ -0,0 +1,226 @@
+"""One Google Doc export, parsed once and shared by every extractor.
+
+A raw export used to be turned into a DOM by the heuristic parser, the AI
+path's SEO-title check and again by each metadata-section parser (校對結果,
+Meta + AEO, 圖片 Alt Text).  ``ParsedGoogleDoc`` parses it once and derives
+everything else from that tree on first use:
+
+- ``blocks``: the paragraph-level elements (p, headings, list items, table
+  rows...) in document order, containers such as div/ul/table being
+  transparent;
+- ``block_texts``: the visible text of each block, one line per block
+  (Google Docs splits a paragraph into many styled spans, so joining the
+  span texts of a block matters);
+- ``sections``: the metadata sections after the divider line, split at
+  their ``<h2>`` headings.
+
+``normalize_gdoc_html`` is the string-level counterpart for the regex based
+body cleanup: one linear pass of a tag tokenizer.
+
+The soup is shared: extractors that edit it (``_extract_body`` decomposes
+elements) must run after the read-only ones.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass
+from functools import cached_property
+from html import unescape
+
+from bs4 import BeautifulSoup, Comment, NavigableString, Tag
+
+logger = logging.getLogger(__name__)
+
+# html.parser, not lxml: the two repair malformed nesting differently (lxml
+# drops text from "<b>x<p>y</b>"), and extractor output must not change
+HTML_PARSER = "html.parser"
+
+BLOCK_TAGS = frozenset(
+    {"p", "h1", "h2", "h3", "h4", "h5", "h6", "li", "dt", "dd", "blockquote", "pre", "tr"}
+)
+# Elements inside a block that still start a new line of its text
+_LINE_BREAK_TAGS = BLOCK_TAGS | {"br", "div", "td", "th"}
+
+DIVIDER_PATTERN = re.compile(r"[-—–─═_=·•]{5,}[-—–─═_=·•\s]*")
+METADATA_HEADING_PATTERN = re.compile(
+    r"(?:校對結果|Meta\s*\+?\s*AEO|圖片\s*Alt\s*Text)", re.IGNORECASE
+)
+
+# The only tags normalization touches: <span ...>, </span> and <p|h2 attrs>.
+# Everything between them is copied unchanged.  A token cannot contain "<",
+# so each match attempt stops at the next "<" and the scan is linear.
+_TOKEN_PATTERN = re.compile(
+    r"<(?:(?P<close>/span)|span(?:\s[^<>]*)?|(?P<block>[pP]|[hH]2)\s[^<>]*)>"
+)
+# Google Docs layout span: class= first, no inline style
+_LAYOUT_SPAN = re.compile(r"<span\s+class=")
+
+
+def normalize_gdoc_html(html: str) -> str:
+    """Normalize raw Google Doc HTML for reliable regex matching.
+
+    Google Docs exports HTML with:
+    - Content wrapped in <span class="..."> inside <p> and <h2> tags
+    - <p> and <h2> tags with class/id attributes
+    - Unicode characters HTML-entity-encoded (e.g., &#9552; for ═)
+
+    This function normalizes by:
+    1. Decoding HTML entities (&#9552; → ═, &#65306; → ：, &nbsp; → space)
+    2. Unwrapping <span> tags with class= attributes (Google Docs layout classes),
+       preserving spans with style="color:..." (author intros, styled text)
+    3. Stripping class/id/style attributes from <p> and <h2> tags
+
+    Result: <p class="c3"><span class="c0">═══</span></p> → <p>═══</p>
+    But: <span style="color:#1155cc">作者介紹</span> is preserved.
+
+    Entities are decoded first, as before, so escaped tags such as
+    ``&lt;span class="c0"&gt;`` are unwrapped like literal ones.  Steps 2
+    and 3 then happen in a single left-to-right pass over the tokens.  Open
+    spans are kept on a stack, so each ``</span>`` closes its own start tag
+    however deep the nesting (``<span><span style=...>x</span>y</span>``
+    keeps ``y`` outside the styled span), and a layout span without an end
+    tag is left as is.
+    """
+    if not html:
+        return html
+
+    html = unescape(html)
+
+    parts: list[str] = []
+    # One entry per open <span>: index of its start tag in ``parts`` if it
+    # is a layout span to unwrap, else None
+    spans: list[int | None] = []
+    pos = 0
+    for match in _TOKEN_PATTERN.finditer(html):
+        if match.start() > pos:
+            parts.append(html[pos : match.start()])
+        pos = match.end()
+
+        block = match.group("block")
+        if block:
+            parts.append(f"<{block}>")
+        elif match.group("close"):
+            start = spans.pop() if spans else None
+            if start is None:
+                parts.append(match.group())
+            else:
+                # Unwrap: drop both tags, keep the content between
+                parts[start] = ""
+        else:
+            token = match.group()
+            layout = _LAYOUT_SPAN.match(token)
+            unwrap = token == "<span>" or (
+                layout is not None and "style=" not in token[layout.end() :]
+            )
+            spans.append(len(parts) if unwrap else None)
+            parts.append(token)
+
+    if pos < len(html):
+        parts.append(html[pos:])
+    return "".join(parts)
+
+
+def block_text(element: Tag) -> str:
+    """Visible text of ``element``; <br> and nested blocks start new lines."""
+    parts: list[str] = []
+    for node in element.descendants:
+        if isinstance(node, NavigableString):
+            if not isinstance(node, Comment):
+                parts.append(str(node))
+        elif node.name in _LINE_BREAK_TAGS:
+            parts.append("\n")
+    return "".join(parts)
+
+
+@dataclass
+class DocSection:
+    """The blocks under one metadata ``<h2>`` heading."""
+
+    name: str
+    blocks: list[Tag]
+    texts: list[str]
+
+    @classmethod
+    def from_html(cls, html_content: str, name: str = "") -> DocSection:
+        """Section over a standalone fragment (callers that only hold HTML)."""
+        doc = ParsedGoogleDoc(html_content)
+        if doc.blocks:
+            return cls(name, doc.blocks, doc.block_texts)
+        return cls(name, [doc.soup], [doc.soup.get_text(separator="\n")])
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.texts)
+
+
+class ParsedGoogleDoc:
+    """Lazily derived views over a single parse of a Google Doc export."""
+
+    def __init__(self, html: str | None) -> None:
+        self.html = html or ""
+
+    @cached_property
+    def soup(self) -> BeautifulSoup:
+        return BeautifulSoup(self.html, HTML_PARSER)
+
+    @cached_property
+    def blocks(self) -> list[Tag]:
+        """Outermost block-level elements in document order."""
+        blocks: list[Tag] = []
+        for element in self.soup.find_all(BLOCK_TAGS):
+            if not any(parent.name in BLOCK_TAGS for parent in element.parents):
+                blocks.append(element)
+        return blocks
+
+    @cached_property
+    def block_texts(self) -> list[str]:
+        return [block_text(block) for block in self.blocks]
+
+    @cached_property
+    def text(self) -> str:
+        """One line per block; what the section parsers split and match on."""
+        return "\n".join(self.block_texts)
+
+    def is_divider(self, index: int) -> bool:
+        return self.blocks[index].name == "p" and bool(
+            DIVIDER_PATTERN.fullmatch(self.block_texts[index].strip())
+        )
+
+    @cached_property
+    def metadata_start(self) -> int | None:
+        """Index of the first block of the metadata area, if there is one.
+
+        The area starts after the first divider line or, without one, at
+        the first metadata ``<h2>`` heading.
+        """
+        for index in range(len(self.blocks)):
+            if self.is_divider(index):
+                return index + 1
+        for index, block in enumerate(self.blocks):
+            if block.name == "h2" and METADATA_HEADING_PATTERN.fullmatch(
+                self.block_texts[index].strip()
+            ):
+                return index
+        return None
+
+    @cached_property
+    def sections(self) -> dict[str, DocSection]:
+        """Metadata sections by heading text; later duplicates win."""
+        start = self.metadata_start
+        if start is None:
+            return {}
+        sections: dict[str, DocSection] = {}
+        current: DocSection | None = None
+        for index in range(start, len(self.blocks)):
+            if self.is_divider(index):
+                continue
+            block = self.blocks[index]
+            if block.name == "h2":
+                current = DocSection(self.block_texts[index].strip(), [], [])
+                sections[current.name] = current
+            elif current is not None:
+                current.blocks.append(block)
+                current.texts.append(self.block_texts[index])
+        return sections
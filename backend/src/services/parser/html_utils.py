@@ -12,11 +12,12 @@ from __future__ import annotations
 
 import html
 import re
+from array import array
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from html.entities import html5
 from typing import Optional
 
-from bs4 import BeautifulSoup
-
 
 @dataclass
 class Position:
@@ -67,19 +68,17 @@ def strip_html_tags(
     if not html_content:
         return ""
 
-    # Use BeautifulSoup for robust HTML parsing
-    # 'html.parser' is the built-in parser, no external dependencies
-    soup = BeautifulSoup(html_content, "html.parser")
-
-    # Get text content, preserving some structure with separator
-    if preserve_whitespace:
-        text = soup.get_text()
-    else:
-        text = soup.get_text(separator=" ")
-
-    # Decode HTML entities if requested
-    if decode_entities:
-        text = html.unescape(text)
+    # Same tokenizer and entity decoding as PlainTextOffsetMap, so offsets
+    # computed there index into this string.  Node boundaries separate text
+    # with a space unless whitespace is preserved.
+    separator = "" if preserve_whitespace else " "
+    parts: list[str] = []
+    for start, end, text in _text_runs(html_content):
+        if text is None:
+            parts.append(separator)
+        else:
+            parts.append(text if decode_entities else html_content[start:end])
+    text = "".join(parts)
 
     # Normalize whitespace unless preserving
     if not preserve_whitespace:
@@ -90,6 +89,209 @@ def strip_html_tags(
     return text
 
 
+# Tokens that are not text: comments, CDATA, declarations, tags, character
+# references.  Tag attributes may contain quoted ">" characters.  References
+# are matched like html.unescape (HTML5) does: the ";" is optional, so "&lt 6"
+# decodes to "< 6".
+_HTML_TOKEN_PATTERN = re.compile(
+    r"(?P<comment><!--.*?(?:-->|\Z))"
+    r"|<!\[CDATA\[(?P<cdata>.*?)(?:\]\]>|\Z)"
+    r"|(?P<decl><[!?][^>]*>)"
+    r"|(?P<raw><(?P<raw_name>script|style)\b(?:[^>\"']|\"[^\"]*\"|'[^']*')*>.*?(?:</(?P=raw_name)\s*>|\Z))"
+    r"|(?P<tag></?[a-zA-Z][^\s/>]*(?:[^>\"']|\"[^\"]*\"|'[^']*')*>)"
+    r"|(?P<entity>&(?:#[0-9]+;?|#[xX][0-9a-fA-F]+;?|[^\t\n\f <&#;]{1,32};?))",
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+def _decode_reference(reference: str) -> tuple[int, str]:
+    """Decode the character reference ``reference`` starts with.
+
+    Returns how many characters of ``reference`` it spans and their text.
+    A named reference without ";" only covers its longest known prefix
+    ("&ltfoo" is "<" followed by text); an unknown name covers nothing.
+    """
+    name = reference[1:]
+    if name.startswith("#") or name in html5:
+        return len(reference), html.unescape(reference)
+    for length in range(len(name) - 1, 1, -1):
+        if name[:length] in html5:
+            return length + 1, html5[name[:length]]
+    return 0, ""
+
+
+def _text_runs(content: str) -> Iterator[tuple[int, int, str | None]]:
+    """Split HTML into ``(start, end, text)`` runs in document order.
+
+    ``text`` is the decoded text of ``content[start:end]``: the raw characters
+    of a text run, or what a character reference decodes to.  It is ``None``
+    for tags, comments and declarations, which separate text nodes.  Script
+    and style bodies are skipped.  This is the only place entities are
+    decoded.
+    """
+    position = 0
+    for token in _HTML_TOKEN_PATTERN.finditer(content):
+        start = token.start()
+        if token.lastgroup == "entity":
+            consumed, decoded = _decode_reference(token.group())
+            if consumed:
+                if start > position:
+                    yield position, start, content[position:start]
+                yield start, start + consumed, decoded
+                position = start + consumed
+            # The rest of the match is plain text
+            continue
+        if start > position:
+            yield position, start, content[position:start]
+        if token.group("cdata") is not None:
+            yield start, token.start("cdata"), None
+            yield token.start("cdata"), token.end("cdata"), token.group("cdata")
+            yield token.end("cdata"), token.end(), None
+        else:
+            yield start, token.end(), None
+        position = token.end()
+    if position < len(content):
+        yield position, len(content), content[position:]
+
+
+class PlainTextOffsetMap:
+    """Map HTML offsets to plain-text offsets in a single tokenizer pass.
+
+    The plain text is exactly what ``strip_html_tags`` returns (both read the
+    document through ``_text_runs``: text nodes joined by a space, entities
+    decoded once, whitespace collapsed, stripped), and for every HTML offset
+    two plain offsets are recorded:
+
+    - a *start* offset: where the next visible character lands, so a range
+      beginning on a tag or whitespace starts at the following text;
+    - an *end* offset: how many visible characters precede it, so a range
+      ending on a tag or whitespace does not swallow the separator.
+
+    Building the map is O(n); each conversion afterwards is O(1). Use one map
+    per document and ``to_plain_many`` to convert all issue positions at once.
+
+    Examples:
+        >>> offsets = PlainTextOffsetMap("<p>Hello</p><p>World</p>")
+        >>> offsets.plain_text
+        'Hello World'
+        >>> offsets.to_plain(15, 20)
+        Position(start=6, end=11)
+    """
+
+    def __init__(self, html_content: str | None) -> None:
+        self.html_content = html_content or ""
+        size = len(self.html_content) + 1
+        self._start_map = array("l", [0]) * size
+        self._end_map = array("l", [0]) * size
+        self._plain_chars: list[str] = []
+        # True when whitespace or a node boundary was seen since the last char
+        self._pending_space = False
+        # First HTML offset whose start mapping is still unknown
+        self._unresolved_from = 0
+
+        self._build()
+        self.plain_text = "".join(self._plain_chars)
+        del self._plain_chars
+
+    def _build(self) -> None:
+        content = self.html_content
+        for start, end, text in _text_runs(content):
+            if text is None:
+                self._emit_boundary(start, end)
+            elif text == content[start:end]:
+                self._emit_text(start, end)
+            else:
+                # A decoded reference maps as one unit
+                self._emit(start, end, text)
+
+        plain_length = len(self._plain_chars)
+        self._resolve_starts(len(content) + 1, plain_length)
+        self._end_map[len(content)] = plain_length
+
+    def _resolve_starts(self, until: int, plain_offset: int) -> None:
+        start_map = self._start_map
+        for offset in range(self._unresolved_from, until):
+            start_map[offset] = plain_offset
+        self._unresolved_from = max(self._unresolved_from, until)
+
+    def _emit_boundary(self, html_start: int, html_end: int) -> None:
+        """Tags, comments and declarations separate text nodes."""
+        plain_length = len(self._plain_chars)
+        end_map = self._end_map
+        for offset in range(html_start, html_end):
+            end_map[offset] = plain_length
+        if self._plain_chars:
+            self._pending_space = True
+
+    def _emit_text(self, html_start: int, html_end: int) -> None:
+        content = self.html_content
+        for offset in range(html_start, html_end):
+            self._emit(offset, offset + 1, content[offset])
+
+    def _emit(self, html_start: int, html_end: int, decoded: str) -> None:
+        """Emit the decoded text of ``html_content[html_start:html_end]``."""
+        plain_chars = self._plain_chars
+        end_map = self._end_map
+        for offset in range(html_start, html_end):
+            end_map[offset] = len(plain_chars)
+
+        first_visible: int | None = None
+        for char in decoded:
+            if char.isspace():
+                if plain_chars:
+                    self._pending_space = True
+                continue
+            if self._pending_space:
+                plain_chars.append(" ")
+                self._pending_space = False
+            if first_visible is None:
+                first_visible = len(plain_chars)
+            plain_chars.append(char)
+
+        if first_visible is not None:
+            # Pending offsets and offsets inside an entity start at this text
+            self._resolve_starts(html_end, first_visible)
+
+    def _validate(self, html_start: int, html_end: int) -> None:
+        if html_start < 0:
+            raise ValueError(f"html_start cannot be negative: {html_start}")
+        if html_end < 0:
+            raise ValueError(f"html_end cannot be negative: {html_end}")
+        if html_start > html_end:
+            raise ValueError(
+                f"html_start ({html_start}) cannot be greater than html_end ({html_end})"
+            )
+        if html_end > len(self.html_content):
+            raise ValueError(
+                f"html_end ({html_end}) exceeds content length ({len(self.html_content)})"
+            )
+
+    def to_plain_offset(self, html_offset: int, *, is_end: bool = False) -> int:
+        """Convert a single HTML offset (range start, or exclusive end) to plain text."""
+        self._validate(html_offset, html_offset)
+        return self._end_map[html_offset] if is_end else self._start_map[html_offset]
+
+    def to_plain(self, html_start: int, html_end: int) -> Position:
+        """Convert an HTML ``[start, end)`` range to plain-text coordinates."""
+        self._validate(html_start, html_end)
+        start = self._start_map[html_start]
+        end = self._end_map[html_end]
+        # Empty or whitespace/tag-only ranges collapse onto the next text
+        return Position(start=start, end=max(start, end))
+
+    def to_plain_many(
+        self, ranges: Iterable[tuple[int, int]]
+    ) -> list[Position | None]:
+        """Batch-convert HTML ranges; invalid ranges yield ``None``."""
+        positions: list[Position | None] = []
+        for html_start, html_end in ranges:
+            try:
+                positions.append(self.to_plain(html_start, html_end))
+            except (TypeError, ValueError):
+                positions.append(None)
+        return positions
+
+
 def calculate_plain_text_position(
     html_content: str,
     html_start: int,
@@ -102,9 +304,9 @@ def calculate_plain_text_position(
     plain text (without HTML tags). This function converts HTML positions
     to their equivalent plain text positions.
 
-    Algorithm:
-    1. Take the HTML content up to html_start, strip tags → plain_start
-    2. Take the HTML content up to html_end, strip tags → plain_end
+    Builds a ``PlainTextOffsetMap`` for the document. When converting many
+    positions in the same document, build the map once and call
+    ``PlainTextOffsetMap.to_plain`` / ``to_plain_many`` instead.
 
     Args:
         html_content: The full HTML content string.
@@ -123,34 +325,10 @@ def calculate_plain_text_position(
         Position(start=0, end=5)  # "Hello" in plain text
 
         >>> html = "<p>段落一</p><p>段落二</p>"
-        >>> calculate_plain_text_position(html, 12, 15)  # "段落二" in HTML
+        >>> calculate_plain_text_position(html, 13, 16)  # "段落二" in HTML
         Position(start=4, end=7)  # "段落二" in plain text (with space separator)
     """
-    # Validate inputs
-    if html_start < 0:
-        raise ValueError(f"html_start cannot be negative: {html_start}")
-    if html_end < 0:
-        raise ValueError(f"html_end cannot be negative: {html_end}")
-    if html_start > html_end:
-        raise ValueError(
-            f"html_start ({html_start}) cannot be greater than html_end ({html_end})"
-        )
-    if html_end > len(html_content):
-        raise ValueError(
-            f"html_end ({html_end}) exceeds content length ({len(html_content)})"
-        )
-
-    # Calculate plain text length up to html_start
-    content_before_start = html_content[:html_start]
-    plain_before_start = strip_html_tags(content_before_start)
-    plain_start = len(plain_before_start)
-
-    # Calculate plain text length up to html_end
-    content_before_end = html_content[:html_end]
-    plain_before_end = strip_html_tags(content_before_end)
-    plain_end = len(plain_before_end)
-
-    return Position(start=plain_start, end=plain_end)
+    return PlainTextOffsetMap(html_content).to_plain(html_start, html_end)
 
 
 def find_text_position_in_plain(
@@ -262,7 +440,8 @@ def process_issue_positions(
         [{"id": "1", "position": {"start": 3, "end": 8},
           "plain_text_position": {"start": 0, "end": 5}}]
     """
-    plain_content = strip_html_tags(html_content)
+    offset_map = PlainTextOffsetMap(html_content)
+    plain_content = offset_map.plain_text
 
     for issue in issues:
         html_position = issue.get("position")
@@ -270,8 +449,7 @@ def process_issue_positions(
 
         if html_position:
             try:
-                plain_pos = calculate_plain_text_position(
-                    html_content,
+                plain_pos = offset_map.to_plain(
                     html_position["start"],
                     html_position["end"],
                 )
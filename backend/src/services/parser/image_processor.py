@@ -6,14 +6,23 @@ This service uses PIL/Pillow to extract:
 - Color mode and transparency
 - EXIF metadata (camera, GPS, etc.)
 - File size and aspect ratio
+
+Downloads are streamed straight to disk and all PIL work (metadata, preview
+thumbnails) runs on a small shared thread pool so the event loop stays free
+while an article's images are ingested concurrently.
 """
 
+import asyncio
 import io
 import logging
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from math import gcd
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 import httpx
 from PIL import Image, ExifTags
@@ -22,6 +31,27 @@ from src.services.parser.models import ImageMetadata
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+PREVIEW_MAX_SIZE = 800
+
+_decode_executor: ThreadPoolExecutor | None = None
+_decode_executor_lock = threading.Lock()
+
+
+def _get_decode_executor() -> ThreadPoolExecutor:
+    """Return the shared thread pool for PIL decoding and file writes."""
+    global _decode_executor
+    with _decode_executor_lock:
+        if _decode_executor is None:
+            # Pillow releases the GIL while decoding, so threads scale here
+            _decode_executor = ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 1),
+                thread_name_prefix="image-decode",
+            )
+        return _decode_executor
+
 
 class ImageProcessorService:
     """Service for processing images and extracting technical metadata."""
@@ -60,7 +90,8 @@ class ImageProcessorService:
 
         Args:
             image_url: URL of image to process
-            download_to_path: Optional path to save downloaded image
+            download_to_path: Optional path to save downloaded image; the
+                download is then streamed to disk instead of held in memory
 
         Returns:
             Complete metadata dict conforming to JSONB spec
@@ -71,22 +102,81 @@ class ImageProcessorService:
         """
         logger.debug(f"Processing image from URL: {image_url}")
 
-        # Download image
+        if download_to_path:
+            await self.download_to_file(image_url, download_to_path)
+            metadata, _ = await self._offload(
+                self.process_downloaded_image, download_to_path, image_url
+            )
+            return metadata
+
         response = await self.http_client.get(image_url)
         response.raise_for_status()
+        return await self._offload(
+            self.process_image_bytes, response.content, image_url
+        )
 
-        image_bytes = response.content
+    async def download_to_file(self, image_url: str, file_path: str) -> int:
+        """Stream ``image_url`` into ``file_path`` chunk by chunk.
 
-        # Save to file if requested
-        if download_to_path:
-            Path(download_to_path).write_bytes(image_bytes)
-            logger.debug(f"Saved image to: {download_to_path}")
-
-        # Process image bytes
-        return self.process_image_bytes(
-            image_bytes,
-            source_url=image_url,
-            file_path=download_to_path,
+        Writes run on the decode pool; a partial file is removed on failure.
+
+        Returns:
+            Number of bytes written
+        """
+        size = 0
+        fh = await self._offload(open, file_path, "wb")
+        try:
+            async with self.http_client.stream("GET", image_url) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    await self._offload(fh.write, chunk)
+                    size += len(chunk)
+        except BaseException:
+            await self._offload(fh.close)
+            Path(file_path).unlink(missing_ok=True)
+            raise
+        await self._offload(fh.close)
+        logger.debug(f"Saved image to: {file_path} ({size} bytes)")
+        return size
+
+    def process_downloaded_image(
+        self,
+        file_path: str,
+        source_url: str | None = None,
+        preview_path: str | None = None,
+        preview_max_size: int = PREVIEW_MAX_SIZE,
+    ) -> tuple[dict[str, Any], str]:
+        """Blocking: extract metadata and write a preview from one decode.
+
+        Args:
+            file_path: Downloaded image file
+            source_url: Optional source URL for metadata
+            preview_path: Where to write the preview; no preview when None
+            preview_max_size: Longest preview edge in pixels
+
+        Returns:
+            (metadata, path of the preview) - the preview path is
+            ``file_path`` itself when the image is already small enough or
+            its format cannot be re-encoded
+        """
+        with Image.open(file_path) as img:
+            metadata = self._build_metadata(
+                img, os.path.getsize(file_path), source_url=source_url, file_path=file_path
+            )
+            if preview_path and self._write_preview(img, preview_path, preview_max_size):
+                return metadata, preview_path
+        return metadata, file_path
+
+    async def process_downloaded_image_async(
+        self,
+        file_path: str,
+        source_url: str | None = None,
+        preview_path: str | None = None,
+        preview_max_size: int = PREVIEW_MAX_SIZE,
+    ) -> tuple[dict[str, Any], str]:
+        """``process_downloaded_image`` on the decode pool."""
+        return await self._offload(
+            self.process_downloaded_image, file_path, source_url, preview_path, preview_max_size
         )
 
     def process_image_file(self, file_path: str) -> dict[str, Any]:
@@ -100,13 +190,8 @@ class ImageProcessorService:
         """
         logger.debug(f"Processing image from file: {file_path}")
 
-        with open(file_path, "rb") as f:
-            image_bytes = f.read()
-
-        return self.process_image_bytes(
-            image_bytes,
-            file_path=file_path,
-        )
+        metadata, _ = self.process_downloaded_image(file_path)
+        return metadata
 
     def process_image_bytes(
         self,
@@ -125,9 +210,20 @@ class ImageProcessorService:
             Complete metadata dict conforming to JSONB spec version 1.0
         """
         img = Image.open(io.BytesIO(image_bytes))
+        return self._build_metadata(
+            img, len(image_bytes), source_url=source_url, file_path=file_path
+        )
 
+    def _build_metadata(
+        self,
+        img: Image.Image,
+        file_size: int,
+        source_url: str | None = None,
+        file_path: str | None = None,
+    ) -> dict[str, Any]:
+        """Build the JSONB metadata document for an opened image."""
         # Extract technical specifications
-        tech_specs = self._extract_technical_specs(img, len(image_bytes))
+        tech_specs = self._extract_technical_specs(img, file_size)
 
         # Extract EXIF data
         exif_data = self._extract_exif_data(img)
@@ -156,17 +252,42 @@ class ImageProcessorService:
                 metadata["source_info"]["original_filename"] = Path(file_path).name
 
         # Validation
-        validation = self._validate_image(img, len(image_bytes))
+        validation = self._validate_image(img, file_size)
         if validation["validation_errors"] or validation["validation_warnings"]:
             metadata["validation"] = validation
 
         logger.debug(
             f"Processed image: {tech_specs['width']}x{tech_specs['height']}, "
-            f"{tech_specs['format']}, {len(image_bytes)} bytes"
+            f"{tech_specs['format']}, {file_size} bytes"
         )
 
         return metadata
 
+    def _write_preview(self, img: Image.Image, preview_path: str, max_size: int) -> bool:
+        """Save a thumbnail of ``img`` no larger than ``max_size`` on either edge.
+
+        Returns:
+            False when no separate preview is needed or possible
+        """
+        img_format = img.format
+        if max(img.size) <= max_size or img_format not in self.MIME_TYPES:
+            return False
+        preview = img.copy()
+        preview.thumbnail((max_size, max_size))
+        try:
+            preview.save(preview_path, format=img_format)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to write preview {preview_path}: {e}")
+            Path(preview_path).unlink(missing_ok=True)
+            return False
+        return True
+
+    @staticmethod
+    async def _offload(func: Callable[..., T], *args: Any) -> T:
+        """Run blocking file / PIL work on the shared decode pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_decode_executor(), func, *args)
+
     def _extract_technical_specs(self, img: Image.Image, file_size: int) -> dict[str, Any]:
         """Extract technical specifications from PIL Image.
 
@@ -0,0 +1,94 @@
+"""Incremental parser for the top-level members of a streamed JSON object.
+
+The parser and optimizer prompts are answered with one large JSON object.
+``JSONObjectStream`` is fed text deltas as they arrive and returns every
+top-level member as soon as its value is complete, so callers can use the
+title, author or SEO fields long before ``body_html`` has finished.
+Anything before the opening brace (e.g. a ```json fence) is ignored.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class JSONObjectStream:
+    """Scan a streamed JSON object and emit ``(key, value)`` per finished member."""
+
+    def __init__(self) -> None:
+        self._chunks: list[str] = []
+        self._member: list[str] = []
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self.complete = False
+        self.members: dict[str, Any] = {}
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    def feed(self, chunk: str) -> list[tuple[str, Any]]:
+        """Consume ``chunk``; return the members it completed, in order.
+
+        Only ``chunk`` is scanned, so feeding a long answer delta by delta
+        stays linear in its length.
+        """
+        self._chunks.append(chunk)
+        finished: list[tuple[str, Any]] = []
+        # Start of the part of ``chunk`` that belongs to the current member
+        start = 0
+        for pos, ch in enumerate(chunk):
+            if self.complete:
+                break
+            if not self._started:
+                if ch == "{":
+                    self._started = True
+                    self._depth = 1
+                    start = pos + 1
+            elif self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._member.append(chunk[start:pos])
+                    finished.extend(self._close_member())
+                    self.complete = True
+            elif ch == "," and self._depth == 1:
+                self._member.append(chunk[start:pos])
+                finished.extend(self._close_member())
+                start = pos + 1
+        if self._started and not self.complete:
+            self._member.append(chunk[start:])
+        return finished
+
+    def _close_member(self) -> list[tuple[str, Any]]:
+        member = "".join(self._member).strip()
+        self._member.clear()
+        if not member:
+            return []
+        try:
+            # strict=False: the model sometimes emits raw newlines inside strings
+            parsed = json.loads("{" + member + "}", strict=False)
+        except json.JSONDecodeError as exc:
+            logger.debug(f"Skipping unparseable streamed member ({exc}): {member[:80]!r}")
+            return []
+        self.members.update(parsed)
+        return list(parsed.items())
@@ -23,9 +23,20 @@ from src.models.article import Article
 from src.models.article_faq import ArticleFAQ
 from src.models.seo_suggestions import SEOSuggestion
 from src.models.title_suggestions import TitleSuggestion
+from src.services.parser.article_parser import SectionCallback
+from src.services.parser.streaming_json import JSONObjectStream
 
 logger = logging.getLogger(__name__)
 
+# Message Batches API requests cost half of synchronous ones
+BATCH_PRICE_FACTOR = 0.5
+
+# Suggestion groups saved while streaming, with the answer fields they need
+PROGRESSIVE_GROUPS = {
+    "title": ("title_suggestions",),
+    "seo": ("seo_keywords", "meta_description", "tags"),
+}
+
 
 class UnifiedOptimizationService:
     """统一AI优化服务.
@@ -57,12 +68,17 @@ class UnifiedOptimizationService:
         self,
         article: Article,
         regenerate: bool = False,
+        stream: bool = False,
+        on_section: SectionCallback | None = None,
     ) -> dict[str, Any]:
         """一次性生成所有优化建议.
 
         Args:
             article: Article object with parsed content
             regenerate: Force regeneration even if suggestions exist
+            stream: Stream the answer and save title / SEO suggestions as soon
+                as they are complete, before the FAQs have been generated
+            on_section: Called with each top-level field while streaming
 
         Returns:
             {
@@ -99,20 +115,17 @@ class UnifiedOptimizationService:
         # Call Claude API
         try:
             logger.info(f"Calling Claude API for article {article.id}")
-            response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                messages=[{"role": "user", "content": prompt}],
-            )
+            streamed: JSONObjectStream | None = None
+            if stream:
+                response, streamed = await self._stream_response(article, prompt, on_section)
+            else:
+                response = await self.client.messages.create(**self.build_request_params(prompt))
 
             # Track usage
             input_tokens = response.usage.input_tokens
             output_tokens = response.usage.output_tokens
             total_tokens = input_tokens + output_tokens
-
-            # Calculate cost (Claude Opus 4.5 pricing: $15/M input, $75/M output)
-            cost_usd = (input_tokens / 1_000_000 * 15.0) + (output_tokens / 1_000_000 * 75.0)
+            cost_usd = self._estimate_cost(input_tokens, output_tokens)
 
             duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
 
@@ -126,30 +139,39 @@ class UnifiedOptimizationService:
             raise RuntimeError(f"Failed to generate optimizations: {e}")
 
         # Parse response
+        partial = False
         try:
             result = self._parse_unified_response(response.content[0].text)
         except Exception as e:
-            logger.error(f"Failed to parse Claude response for article {article.id}: {e}")
-            raise ValueError(f"AI response parsing failed: {e}")
+            if not (streamed and streamed.members):
+                logger.error(f"Failed to parse Claude response for article {article.id}: {e}")
+                raise ValueError(f"AI response parsing failed: {e}")
+            # The groups completed while streaming are already saved; the
+            # article stays ungenerated so the next request regenerates it
+            logger.warning(
+                f"Article {article.id}: response broke off ({response.stop_reason}), "
+                f"keeping streamed sections {list(streamed.members)}"
+            )
+            result = dict(streamed.members)
+            partial = True
 
-        # Store to database
-        try:
-            await self._store_optimizations(article.id, result)
-        except Exception as e:
-            logger.error(f"Failed to store optimizations for article {article.id}: {e}")
-            raise RuntimeError(f"Database storage failed: {e}")
+        if not partial:
+            # Store to database
+            try:
+                await self._store_optimizations(article.id, result)
+            except Exception as e:
+                logger.error(f"Failed to store optimizations for article {article.id}: {e}")
+                raise RuntimeError(f"Database storage failed: {e}")
 
-        # Update article metadata
-        article.unified_optimization_generated = True
-        article.unified_optimization_generated_at = datetime.now()
-        article.unified_optimization_cost = Decimal(str(cost_usd))
-        await self.db.commit()
+            await self._mark_generated(article, cost_usd)
 
         # Build response with metadata
         faq_assessment = result.get("faq_assessment", {})
-        faq_applicable = faq_assessment.get("is_applicable", True)
+        # Without an assessment (broken-off stream) applicability is unknown
+        faq_applicable = faq_assessment.get("is_applicable", None if partial else True)
 
         return {
+            "partial": partial,
             "title_suggestions": result.get("title_suggestions", {}),
             "seo_suggestions": {
                 "seo_keywords": result.get("seo_keywords", {}),
@@ -172,6 +194,87 @@ class UnifiedOptimizationService:
             },
         }
 
+    async def _stream_response(
+        self,
+        article: Article,
+        prompt: str,
+        on_section: SectionCallback | None,
+    ) -> tuple[Any, JSONObjectStream]:
+        """Stream the answer, saving each suggestion group once it is complete."""
+        sections = JSONObjectStream()
+        pending_groups = dict(PROGRESSIVE_GROUPS)
+        async with self.client.messages.stream(**self.build_request_params(prompt)) as stream:
+            async for text in stream.text_stream:
+                for key, value in sections.feed(text):
+                    if on_section is not None:
+                        on_section(key, value)
+                for group, keys in list(pending_groups.items()):
+                    if all(k in sections.members for k in keys):
+                        del pending_groups[group]
+                        await self._save_group(article, group, sections.members)
+            response = await stream.get_final_message()
+        if response.stop_reason == "max_tokens":
+            logger.warning(
+                f"Article {article.id}: optimization output hit max_tokens after "
+                f"{list(sections.members)}"
+            )
+        return response, sections
+
+    async def _save_group(self, article: Article, group: str, members: dict[str, Any]) -> None:
+        """Save one suggestion group early; the final store rewrites it in place."""
+        if group == "title":
+            await self._save_title_suggestions(
+                article.id, article, members.get("title_suggestions", {})
+            )
+        else:
+            await self._save_seo_suggestions(
+                article.id,
+                members.get("seo_keywords", {}),
+                members.get("meta_description", {}),
+                members.get("tags", {}),
+            )
+        await self.db.commit()
+        logger.info(f"Article {article.id}: saved streamed {group} suggestions")
+
+    def build_request_params(self, prompt: str) -> dict[str, Any]:
+        """Messages API parameters for ``prompt`` (shared by sync and batch calls)."""
+        return {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    def build_batch_request(self, article: Article) -> dict[str, Any]:
+        """Messages API parameters for ``article`` in a message batch."""
+        if not article.body_html and not article.body:
+            raise ValueError(f"Article {article.id} has no content to optimize")
+        return self.build_request_params(self._build_unified_prompt(article))
+
+    async def apply_batch_result(self, article: Article, message: Any) -> dict[str, Any]:
+        """Store a message-batch answer exactly like a synchronous generation.
+
+        Batch requests are billed at half the synchronous price.
+        """
+        result = self._parse_unified_response(message.content[0].text)
+        await self._store_optimizations(article.id, result)
+        cost_usd = self._estimate_cost(
+            message.usage.input_tokens, message.usage.output_tokens
+        ) * BATCH_PRICE_FACTOR
+        await self._mark_generated(article, cost_usd)
+        return result
+
+    async def _mark_generated(self, article: Article, cost_usd: float) -> None:
+        article.unified_optimization_generated = True
+        article.unified_optimization_generated_at = datetime.now()
+        article.unified_optimization_cost = Decimal(str(cost_usd))
+        await self.db.commit()
+
+    @staticmethod
+    def _estimate_cost(input_tokens: int, output_tokens: int) -> float:
+        # Claude Opus 4.5 pricing: $15/M input, $75/M output
+        return (input_tokens / 1_000_000 * 15.0) + (output_tokens / 1_000_000 * 75.0)
+
     def _build_unified_prompt(self, article: Article) -> str:
         """构建统一优化Prompt.
 
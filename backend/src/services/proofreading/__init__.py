@@ -9,6 +9,7 @@ from .models import (
     ProofreadingStatistics,
     RuleSource,
 )
+from .result_cache import ProofreadingResultCache
 from .service import ProofreadingAnalysisService
 
 __all__ = [
@@ -18,6 +19,7 @@ __all__ = [
     "ProofreadingAnalysisService",
     "ProofreadingIssue",
     "ProofreadingResult",
+    "ProofreadingResultCache",
     "ProofreadingStatistics",
     "RuleSource",
 ]
@@ -23,6 +23,14 @@ RULES_DIR = PACKAGE_ROOT / "rules"
 FULL_RULE_FILE = RULES_DIR / "catalog_full.json"
 LEGACY_RULE_FILE = RULES_DIR / "catalog.json"
 
+# Marks a prompt block as an Anthropic prompt-cache breakpoint
+CACHE_CONTROL: dict[str, str] = {"type": "ephemeral"}
+
+# Rendered system prompts keyed by (manifest fingerprint, include_full_rules,
+# max_rules_in_prompt).  The prompt is byte-identical for every article, which
+# is what lets the API serve it from its prompt cache.
+_SYSTEM_PROMPT_CACHE: dict[tuple[str, bool, int | None], str] = {}
+
 
 class RuleManifest:
     """Utility wrapper around machine-readable rule metadata."""
@@ -306,20 +314,39 @@ class ProofreadingPromptBuilder:
         self.manifest = manifest or load_default_manifest()
         self.include_full_rules = include_full_rules
         self.max_rules_in_prompt = max_rules_in_prompt
+        # fingerprint re-serializes the whole manifest, compute it once
+        self.manifest_fingerprint = self.manifest.fingerprint
 
     def build_prompt(self, payload: ArticlePayload) -> dict[str, str]:
         """Construct user + system prompts.
 
         Returns a dict with `system` and `user` keys so the caller can compose
-        Anthropic messages easily.
+        Anthropic messages easily.  The system prompt is the static, cacheable
+        prefix (rules + guidelines); everything article-specific is in `user`.
         """
-        # Build comprehensive system prompt
-        system_prompt = self._build_system_prompt()
+        return {
+            "system": self.cached_system_prompt(),
+            "user": self._build_user_prompt(payload),
+        }
+
+    def cached_system_prompt(self) -> str:
+        """Return the system prompt, rendering it once per manifest version."""
+        key = (self.manifest_fingerprint, self.include_full_rules, self.max_rules_in_prompt)
+        system_prompt = _SYSTEM_PROMPT_CACHE.get(key)
+        if system_prompt is None:
+            system_prompt = self._build_system_prompt()
+            _SYSTEM_PROMPT_CACHE[key] = system_prompt
+        return system_prompt
 
-        # Build user prompt with article content
-        user_prompt = self._build_user_prompt(payload)
+    @staticmethod
+    def system_blocks(prompt: dict[str, str]) -> list[dict[str, Any]]:
+        """Anthropic ``system`` content blocks with a cache breakpoint.
 
-        return {"system": system_prompt, "user": user_prompt}
+        The breakpoint sits at the end of the system prompt, so the rule
+        catalog is written to the prompt cache on the first call and read
+        back on later calls; the per-article user message is never cached.
+        """
+        return [{"type": "text", "text": prompt["system"], "cache_control": CACHE_CONTROL}]
 
     def _build_system_prompt(self) -> str:
         """Build the comprehensive system prompt with DJY guidelines."""
@@ -369,7 +396,7 @@ class ProofreadingPromptBuilder:
 
 # 规则清单快照
 版本: {self.manifest.version}
-哈希: {self.manifest.fingerprint[:12]}
+哈希: {self.manifest_fingerprint[:12]}
 总规则数: {self.manifest.total_rules}
 
 {rule_table}
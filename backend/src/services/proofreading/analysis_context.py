@@ -0,0 +1,170 @@
+"""Per-run pre-analysis shared by all deterministic rules.
+
+Many rules need the same derived views of an article: URL ranges to skip,
+the parsed DOM, paragraph/heading lists, sentence boundaries.  Computing them
+inside every rule costs O(rules × n) per article.  ``AnalysisContext`` is
+built once per ``DeterministicRuleEngine.run`` and handed to every rule; each
+view is computed lazily on first access and then reused.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from functools import cached_property
+
+from bs4 import BeautifulSoup
+
+from src.services.parser.html_utils import strip_html_tags
+from src.services.proofreading.models import ArticlePayload
+
+# URL 检测正则表达式 - 匹配常见的 URL 格式
+URL_PATTERN = re.compile(
+    r'https?://[^\s<>\[\]「」『』（）\(\)\"\']+|'  # http/https URLs
+    r'www\.[^\s<>\[\]「」『』（）\(\)\"\']+|'  # www URLs
+    r'[a-zA-Z0-9][-a-zA-Z0-9]*\.[a-zA-Z]{2,}(?:/[^\s<>\[\]「」『』（）\(\)\"\']*)?'  # domain.tld/path
+)
+
+MARKDOWN_HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
+SENTENCE_END_PATTERN = re.compile(r"[。！？]")
+
+
+def find_url_ranges(content: str) -> list[tuple[int, int]]:
+    """Find all URL ranges in content.
+
+    Returns a list of (start, end) tuples for each URL found.
+    """
+    ranges: list[tuple[int, int]] = []
+    for match in URL_PATTERN.finditer(content):
+        ranges.append((match.start(), match.end()))
+    return ranges
+
+
+class UrlRangeIndex:
+    """Sorted, non-overlapping URL ranges searchable by bisection.
+
+    ``URL_PATTERN.finditer`` yields ranges in order without overlap, so both
+    the start and end arrays are monotonic and a single bisect answers each
+    query in O(log k).
+    """
+
+    def __init__(self, ranges: list[tuple[int, int]]) -> None:
+        self.ranges = ranges
+        self._starts = [start for start, _ in ranges]
+        self._ends = [end for _, end in ranges]
+
+    @classmethod
+    def from_content(cls, content: str) -> UrlRangeIndex:
+        return cls(find_url_ranges(content))
+
+    def __bool__(self) -> bool:
+        return bool(self.ranges)
+
+    def __len__(self) -> int:
+        return len(self.ranges)
+
+    def overlaps(self, start: int, end: int) -> bool:
+        """True if ``[start, end)`` overlaps any URL range."""
+        index = bisect_left(self._starts, end) - 1
+        return index >= 0 and self._ends[index] > start
+
+    def contains(self, offset: int) -> bool:
+        """True if ``offset`` falls inside a URL range."""
+        index = bisect_right(self._starts, offset) - 1
+        return index >= 0 and offset < self._ends[index]
+
+
+@dataclass(frozen=True)
+class MarkdownHeading:
+    """A ``#``-style heading found in the raw content."""
+
+    level: int
+    text: str
+    offset: int
+    end: int
+
+
+class AnalysisContext:
+    """Lazily computed, per-payload views shared across deterministic rules."""
+
+    def __init__(self, payload: ArticlePayload) -> None:
+        self.payload = payload
+        self.content = payload.original_content
+
+    @classmethod
+    def from_payload(cls, payload: ArticlePayload) -> AnalysisContext:
+        return cls(payload)
+
+    @cached_property
+    def url_ranges(self) -> UrlRangeIndex:
+        return UrlRangeIndex.from_content(self.content)
+
+    @cached_property
+    def plain_text(self) -> str:
+        """Content with HTML tags stripped and entities decoded."""
+        if not self.content:
+            return ""
+        # The string path, so positions from PlainTextOffsetMap index into it
+        return strip_html_tags(self.content)
+
+    @cached_property
+    def soup(self) -> BeautifulSoup:
+        """Parsed DOM of ``original_content`` (treat as read-only)."""
+        return BeautifulSoup(self.content, "html.parser")
+
+    @cached_property
+    def block_texts(self) -> list[str]:
+        """Stripped text of every ``<p>``/``<div>`` element, in document order."""
+        texts: list[str] = []
+        for tag in self.soup.find_all(["p", "div"]):
+            text = tag.get_text(strip=True)
+            if text:
+                texts.append(text)
+        return texts
+
+    @cached_property
+    def paragraphs(self) -> list[str]:
+        """Blank-line separated plain-text paragraphs (stripped, non-empty)."""
+        return [part.strip() for part in self.content.split("\n\n") if part.strip()]
+
+    @cached_property
+    def lines(self) -> list[str]:
+        return self.content.split("\n")
+
+    @cached_property
+    def headings(self) -> list[MarkdownHeading]:
+        return [
+            MarkdownHeading(
+                level=len(match.group(1)),
+                text=match.group(2),
+                offset=match.start(),
+                end=match.end(),
+            )
+            for match in MARKDOWN_HEADING_PATTERN.finditer(self.content)
+        ]
+
+    @cached_property
+    def sentence_spans(self) -> list[tuple[int, int]]:
+        """(start, end) of each segment between 。！？ terminators."""
+        spans: list[tuple[int, int]] = []
+        start = 0
+        for match in SENTENCE_END_PATTERN.finditer(self.content):
+            spans.append((start, match.start()))
+            start = match.end()
+        spans.append((start, len(self.content)))
+        return spans
+
+    @cached_property
+    def sentences(self) -> list[str]:
+        """Stripped, non-empty sentences (same as splitting on 。！？)."""
+        sentences: list[str] = []
+        for start, end in self.sentence_spans:
+            sentence = self.content[start:end].strip()
+            if sentence:
+                sentences.append(sentence)
+        return sentences
+
+    @cached_property
+    def chinese_char_count(self) -> int:
+        return sum(1 for char in self.content if "\u4e00" <= char <= "\u9fff")
@@ -4,29 +4,26 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from enum import Enum
 from functools import lru_cache
-from typing import Any
+from typing import Any, ClassVar
 
-from bs4 import BeautifulSoup
-
-
-# URL 检测正则表达式 - 匹配常见的 URL 格式
-URL_PATTERN = re.compile(
-    r'https?://[^\s<>\[\]「」『』（）\(\)\"\']+|'  # http/https URLs
-    r'www\.[^\s<>\[\]「」『』（）\(\)\"\']+|'  # www URLs
-    r'[a-zA-Z0-9][-a-zA-Z0-9]*\.[a-zA-Z]{2,}(?:/[^\s<>\[\]「」『』（）\(\)\"\']*)?'  # domain.tld/path
+from src.services.proofreading.analysis_context import (  # noqa: F401 - re-exported
+    URL_PATTERN,
+    AnalysisContext,
+    find_url_ranges,
+)
+from src.services.proofreading.learned_rules import (
+    LearnedRuleRegistry,
+    LearnedRuleSet,
+    get_learned_rule_registry,
+)
+from src.services.proofreading.matcher import MultiPatternMatcher
+from src.services.proofreading.rule_specs import (
+    A4_INFORMAL_SPECS,
+    D_TRANSLATION_SPECS,
+    E_SPECIAL_SPECS,
 )
-
-
-def find_url_ranges(content: str) -> list[tuple[int, int]]:
-    """Find all URL ranges in content.
-
-    Returns a list of (start, end) tuples for each URL found.
-    """
-    ranges: list[tuple[int, int]] = []
-    for match in URL_PATTERN.finditer(content):
-        ranges.append((match.start(), match.end()))
-    return ranges
 
 
 def is_within_url(position: int, end_position: int, url_ranges: list[tuple[int, int]]) -> bool:
@@ -39,6 +36,9 @@ def is_within_url(position: int, end_position: int, url_ranges: list[tuple[int,
 
     Returns:
         True if the match overlaps with any URL
+
+    Linear scan kept for callers holding a plain list; rules receive an
+    ``AnalysisContext`` whose ``url_ranges.overlaps`` answers in O(log k).
     """
     for url_start, url_end in url_ranges:
         # Check if any part of the match overlaps with the URL
@@ -52,17 +52,42 @@ from src.services.proofreading.models import (
     RuleSource,
 )
 from src.services.parser.html_utils import strip_html_tags
-from src.services.proofreading.rule_specs import (
-    A4_INFORMAL_SPECS,
-    D_TRANSLATION_SPECS,
-    E_SPECIAL_SPECS,
-)
+
+
+class RuleScope(str, Enum):
+    """How much of the article a rule needs to see.
+
+    Paragraph-scoped rules only look at text around each match, so their
+    issues for a paragraph depend on that paragraph alone and can be reused
+    when it is unchanged (see ``incremental``).  A rule qualifies only if
+    neither its matches nor the context it inspects can reach across a
+    paragraph break (no ``\\s*`` runs or negated classes spanning one, no
+    document-wide counts).  Everything else is document-scoped and always
+    re-runs on the full article.
+    """
+
+    PARAGRAPH = "paragraph"
+    DOCUMENT = "document"
+
+
+@dataclass(frozen=True)
+class EngineState:
+    """The learned rule set a run uses, and the engine version it yields.
+
+    Taken once per analysis so the cache key, the snapshot and the issues
+    all come from the same learned rules even if a publish lands mid-run.
+    """
+
+    version: str
+    learned: LearnedRuleSet | None
 
 
 @dataclass
 class DeterministicRule:
     """Base interface for deterministic rules."""
 
+    scope: ClassVar[RuleScope] = RuleScope.DOCUMENT
+
     rule_id: str
     category: str
     subcategory: str
@@ -72,10 +97,52 @@ class DeterministicRule:
 
     def evaluate(self, payload: ArticlePayload) -> list[ProofreadingIssue]:
         """Run rule on payload returning 0..n issues."""
+        if type(self).evaluate_with_context is DeterministicRule.evaluate_with_context:
+            raise NotImplementedError
+        return self.evaluate_with_context(payload, AnalysisContext.from_payload(payload))
+
+    def evaluate_with_context(
+        self, payload: ArticlePayload, context: AnalysisContext
+    ) -> list[ProofreadingIssue]:
+        """Run rule reusing the engine's per-run pre-analysis.
+
+        Rules that need URL ranges, the parsed DOM, paragraphs or sentences
+        override this instead of ``evaluate``; others ignore ``context``.
+        """
+        return self.evaluate(payload)
+
+
+class PatternMatchingRule(DeterministicRule):
+    """Rule whose hits are plain pattern matches over ``original_content``.
+
+    Subclasses expose their compiled patterns via ``match_patterns`` and turn
+    matches into issues in ``evaluate_matches``.  ``DeterministicRuleEngine``
+    feeds them from a single shared ``MultiPatternMatcher`` scan instead of
+    letting every rule run its own ``finditer``.
+    """
+
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
+    match_patterns: list[re.Pattern[str]]
+
+    def evaluate_with_context(
+        self, payload: ArticlePayload, context: AnalysisContext
+    ) -> list[ProofreadingIssue]:
+        content = payload.original_content
+        matches = [list(pattern.finditer(content)) for pattern in self.match_patterns]
+        return self.evaluate_matches(payload, matches, context)
+
+    def evaluate_matches(
+        self,
+        payload: ArticlePayload,
+        matches: list[list[re.Match[str]]],
+        context: AnalysisContext,
+    ) -> list[ProofreadingIssue]:
+        """Build issues from matches, one list per entry in ``match_patterns``."""
         raise NotImplementedError
 
 
-class DictionaryReplacementRule(DeterministicRule):
+class DictionaryReplacementRule(PatternMatchingRule):
     """Rule backed by a dictionary of non标准写法 -> 标准写法映射。"""
 
     def __init__(
@@ -115,23 +182,29 @@ class DictionaryReplacementRule(DeterministicRule):
             flags = re.IGNORECASE if ignore_case else 0
             compiled = re.compile(value if regex else re.escape(value), flags)
             self._patterns.append(compiled)
+        self.match_patterns = self._patterns
         self.correct_form = correct or ""
         self.description = description
         self.message_template = message
         self.suggestion_template = suggestion
         self.confidence = confidence
 
-    def evaluate(self, payload: ArticlePayload) -> list[ProofreadingIssue]:
+    def evaluate_matches(
+        self,
+        payload: ArticlePayload,
+        matches: list[list[re.Match[str]]],
+        context: AnalysisContext,
+    ) -> list[ProofreadingIssue]:
         issues: list[ProofreadingIssue] = []
         content = payload.original_content
 
-        # 预先计算 URL 范围，避免在 URL 中进行校对
-        url_ranges = find_url_ranges(content)
+        # URL 范围由 AnalysisContext 统一计算，避免在 URL 中进行校对
+        url_ranges = context.url_ranges
 
-        for pattern in self._patterns:
-            for match in pattern.finditer(content):
+        for pattern_matches in matches:
+            for match in pattern_matches:
                 # 跳过在 URL 中的匹配
-                if is_within_url(match.start(), match.end(), url_ranges):
+                if url_ranges.overlaps(match.start(), match.end()):
                     continue
 
                 match_text = match.group()
@@ -210,6 +283,8 @@ def build_dictionary_rules(
 class HalfWidthCommaRule(DeterministicRule):
     """Detect half-width comma misuse within Chinese sentences (B2-002)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     HALF_WIDTH_COMMA_PATTERN = re.compile(r"(?<!\d),(?!\d)")
 
     def __init__(self) -> None:
@@ -222,14 +297,16 @@ class HalfWidthCommaRule(DeterministicRule):
             can_auto_fix=True,
         )
 
-    def evaluate(self, payload: ArticlePayload) -> list[ProofreadingIssue]:
+    def evaluate_with_context(
+        self, payload: ArticlePayload, context: AnalysisContext
+    ) -> list[ProofreadingIssue]:
         issues: list[ProofreadingIssue] = []
         content = payload.original_content
-        url_ranges = find_url_ranges(content)
+        url_ranges = context.url_ranges
         matches = list(self.HALF_WIDTH_COMMA_PATTERN.finditer(content))
         for match in matches:
             # 跳过在 URL 中的匹配
-            if is_within_url(match.start(), match.end(), url_ranges):
+            if url_ranges.overlaps(match.start(), match.end()):
                 continue
             snippet_start = max(0, match.start() - 12)
             snippet_end = min(len(content), match.end() + 12)
@@ -345,6 +422,8 @@ class FeaturedImageLandscapeRule(DeterministicRule):
 class MissingPunctuationRule(DeterministicRule):
     """Detect sentences missing ending punctuation (B1-001)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 匹配句子末尾（中文字符后没有标点）
     SENTENCE_END_PATTERN = re.compile(r"[\u4e00-\u9fff](?=\n|$)", re.MULTILINE)
 
@@ -490,6 +569,8 @@ class HalfWidthDashRule(DeterministicRule):
 class EllipsisFormatRule(DeterministicRule):
     """Check ellipsis format: should use six dots (B1-002)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 匹配单个点或不规范的省略号
     IRREGULAR_ELLIPSIS = re.compile(r"\.{2}(?!\.)|\.{4}(?!\.)|\.{5}(?!\.)|\.{7,}")
 
@@ -540,6 +621,8 @@ class EllipsisFormatRule(DeterministicRule):
 class QuestionMarkAbuseRule(DeterministicRule):
     """Detect multiple consecutive question marks (B1-003)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     MULTIPLE_QUESTION_MARKS = re.compile(r"\?{2,}")
 
     def __init__(self) -> None:
@@ -587,6 +670,8 @@ class QuestionMarkAbuseRule(DeterministicRule):
 class ExclamationMarkAbuseRule(DeterministicRule):
     """Detect multiple consecutive exclamation marks (B1-004)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     MULTIPLE_EXCLAMATION_MARKS = re.compile(r"[!！]{2,}")
 
     def __init__(self) -> None:
@@ -634,6 +719,8 @@ class ExclamationMarkAbuseRule(DeterministicRule):
 class MixedPunctuationRule(DeterministicRule):
     """Detect mixed Chinese and English punctuation (B1-005)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 检测中文段落中使用英文标点的情况
     ENGLISH_PUNCT_IN_CHINESE = re.compile(r"[\u4e00-\u9fff][.!;:][\u4e00-\u9fff]")
 
@@ -802,6 +889,8 @@ class BookTitleMatchingRule(DeterministicRule):
 class B1_006_ColonFormatRule(DeterministicRule):
     """Check colon format (B1-006)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 冒号后缺少空格（在列表或说明时）
     COLON_NO_SPACE = re.compile(r"[:：](?=[^\s\n])")
     # 半角冒号在中文中
@@ -856,6 +945,8 @@ class B1_006_ColonFormatRule(DeterministicRule):
 class B1_007_SemicolonFormatRule(DeterministicRule):
     """Check semicolon format (B1-007)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 半角分号在中文中
     HALFWIDTH_SEMICOLON = re.compile(r";")
 
@@ -907,6 +998,8 @@ class B1_007_SemicolonFormatRule(DeterministicRule):
 class B1_008_ConsecutivePunctuationRule(DeterministicRule):
     """Check consecutive punctuation (B1-008)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 连续标点符号（如：。。、！！等）
     CONSECUTIVE_PUNCT = re.compile(r"([。！？；：，、])\1+")
 
@@ -956,6 +1049,8 @@ class B1_008_ConsecutivePunctuationRule(DeterministicRule):
 class B1_009_PunctuationSpacingRule(DeterministicRule):
     """Check punctuation spacing (B1-009)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 中文标点后有多余空格
     PUNCT_EXTRA_SPACE = re.compile(r"([。！？；：，、]) +")
 
@@ -1001,6 +1096,8 @@ class B1_009_PunctuationSpacingRule(DeterministicRule):
 class B1_010_ChinesePeriodRule(DeterministicRule):
     """Check Chinese period format (B1-010)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 英文句号在中文语境
     ENGLISH_PERIOD = re.compile(r"\.")
 
@@ -1061,6 +1158,8 @@ class B1_010_ChinesePeriodRule(DeterministicRule):
 class B2_003_DunhaoUsageRule(DeterministicRule):
     """Check dunhao (、) usage (B2-003)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 检查在应该用顿号的地方用了逗号
     COMMA_FOR_DUNHAO = re.compile(r"[\u4e00-\u9fff]，[\u4e00-\u9fff]，[\u4e00-\u9fff]")
 
@@ -1111,6 +1210,8 @@ class B2_003_DunhaoUsageRule(DeterministicRule):
 class B2_004_CommaAbuseRule(DeterministicRule):
     """Check comma abuse (B2-004)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 连续多个逗号
     CONSECUTIVE_COMMAS = re.compile(r"(，[\u4e00-\u9fff]{1,20}){4,}")
 
@@ -1256,6 +1357,8 @@ class B4_001_ParenthesesMatchingRule(DeterministicRule):
 class B4_002_ParenthesesFormatRule(DeterministicRule):
     """Check parentheses format (B4-002)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 半角括号在中文中
     HALFWIDTH_PAREN = re.compile(r"[(\)]")
 
@@ -1308,6 +1411,8 @@ class B4_002_ParenthesesFormatRule(DeterministicRule):
 class B5_001_DoubleQuoteMisuseRule(DeterministicRule):
     """Check double quote misuse (B5-001)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 英文双引号在中文中
     ENGLISH_DOUBLE_QUOTE = re.compile(r'"')
 
@@ -1359,6 +1464,8 @@ class B5_001_DoubleQuoteMisuseRule(DeterministicRule):
 class B5_002_SingleQuoteMisuseRule(DeterministicRule):
     """Check single quote misuse (B5-002)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 英文单引号在中文中
     ENGLISH_SINGLE_QUOTE = re.compile(r"'")
 
@@ -1410,6 +1517,8 @@ class B5_002_SingleQuoteMisuseRule(DeterministicRule):
 class B6_001_EmphasisMarkRule(DeterministicRule):
     """Check emphasis mark format (B6-001)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 检查着重号使用（通常用·表示）
     EMPHASIS_PATTERN = re.compile(r"[\u4e00-\u9fff]+·[\u4e00-\u9fff]+")
 
@@ -1456,6 +1565,8 @@ class B6_001_EmphasisMarkRule(DeterministicRule):
 class B7_001_DashFormatRule(DeterministicRule):
     """Check dash format (B7-001)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 单个破折号（应该用双破折号）
     SINGLE_DASH = re.compile(r"(?<![—])—(?![—])")
 
@@ -1501,6 +1612,8 @@ class B7_001_DashFormatRule(DeterministicRule):
 class B7_002_HyphenFormatRule(DeterministicRule):
     """Check hyphen format (B7-002)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 连字符/连接号检查
     HYPHEN_PATTERN = re.compile(r"[\u4e00-\u9fff]-[\u4e00-\u9fff]")
 
@@ -1546,6 +1659,8 @@ class B7_002_HyphenFormatRule(DeterministicRule):
 class B2_001_CommaSpacingRule(DeterministicRule):
     """Check comma spacing in mixed Chinese-English text (B2-001)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 中英文混排时，英文逗号后缺少空格
     COMMA_NO_SPACE = re.compile(r",(?=[a-zA-Z])")
 
@@ -1591,6 +1706,8 @@ class B2_001_CommaSpacingRule(DeterministicRule):
 class B2_006_ConsecutiveCommasRule(DeterministicRule):
     """Check consecutive commas (B2-006)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 连续逗号检测
     CONSECUTIVE_COMMAS = re.compile(r"[,，]{2,}")
 
@@ -1636,6 +1753,8 @@ class B2_006_ConsecutiveCommasRule(DeterministicRule):
 class B2_007_DunhaoCommaMixRule(DeterministicRule):
     """Check dunhao and comma mixing (B2-007)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 顿号和逗号在同一并列结构中混用
     DUNHAO_COMMA_MIX = re.compile(r"[\u4e00-\u9fff]+、[\u4e00-\u9fff]+，[\u4e00-\u9fff]+、")
 
@@ -1726,6 +1845,8 @@ class B3_004_EmptyQuoteRule(DeterministicRule):
 class B3_005_BookTitleQuoteMixRule(DeterministicRule):
     """Check book title and quote mixing (B3-005)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 书名号与引号混用（书籍、文章、电影等应用书名号）
     TITLE_IN_QUOTE = re.compile(r"[""''][\u4e00-\u9fff]{2,8}(?:篇|章|文|书|集|部)[""'']")
 
@@ -2015,6 +2136,8 @@ class B5_003_QuoteMixRule(DeterministicRule):
 class B6_002_DunhaoMisuseRule(DeterministicRule):
     """Check dunhao misuse for non-parallel items (B6-002)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 顿号用于非并列成分（如动词短语间）
     DUNHAO_VERB = re.compile(r"[\u4e00-\u9fff]{2,4}、[\u4e00-\u9fff]{2,4}(?=[，。！？])")
 
@@ -2060,6 +2183,8 @@ class B6_002_DunhaoMisuseRule(DeterministicRule):
 class B6_003_IntervalMarkMisuseRule(DeterministicRule):
     """Check interval mark misuse (B6-003)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 间隔号误用检测（应用于姓名、日期等）
     INTERVAL_MISUSE = re.compile(r"[\u4e00-\u9fff]{1}·[\u4e00-\u9fff]{1}(?![\u4e00-\u9fff])")
 
@@ -2105,6 +2230,8 @@ class B6_003_IntervalMarkMisuseRule(DeterministicRule):
 class B7_003_HyphenFormatRule(DeterministicRule):
     """Check hyphen format in numbers (B7-003)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 数字范围应使用波浪号或连字符
     NUMBER_HYPHEN = re.compile(r"\d+-\d+")
 
@@ -2150,6 +2277,8 @@ class B7_003_HyphenFormatRule(DeterministicRule):
 class B7_005_EllipsisDengRule(DeterministicRule):
     """Check ellipsis and 'deng' duplication (B7-005)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 省略号与"等"重复
     ELLIPSIS_DENG = re.compile(r"[…\.]{2,}等|等[…\.]{2,}")
 
@@ -2195,6 +2324,8 @@ class B7_005_EllipsisDengRule(DeterministicRule):
 class B7_006_DashLengthRule(DeterministicRule):
     """Check dash length (B7-006)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 破折号长度检测（应为两个em dash）
     SHORT_DASH = re.compile(r"(?<![——])—(?![——])")
 
@@ -2240,6 +2371,8 @@ class B7_006_DashLengthRule(DeterministicRule):
 class B1_011_ParagraphEndPunctuationRule(DeterministicRule):
     """Check paragraph ending punctuation (B1-011)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 段落末尾缺少标点
     PARA_NO_PUNCT = re.compile(r"[\u4e00-\u9fff]\n")
 
@@ -2336,6 +2469,8 @@ class B1_012_PunctuationStackingRule(DeterministicRule):
 class B1_013_EnglishPunctuationInChineseRule(DeterministicRule):
     """Check for English punctuation misuse in Chinese text (B1-013)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 英文标点在中文段落中
     ENG_PUNCT_IN_CN = re.compile(r'[\u4e00-\u9fff][,;:!?][\u4e00-\u9fff]')
 
@@ -2428,6 +2563,8 @@ class B1_014_PunctuationLeadingSpaceRule(DeterministicRule):
 class B2_008_DunhaoInMixedTextRule(DeterministicRule):
     """Check dunhao usage in Chinese-English mixed text (B2-008)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     DUNHAO_WITH_ENG = re.compile(r'[a-zA-Z]+、[a-zA-Z]+')
 
     def __init__(self) -> None:
@@ -2470,6 +2607,8 @@ class B2_008_DunhaoInMixedTextRule(DeterministicRule):
 class B2_009_OxfordCommaRule(DeterministicRule):
     """Check for Oxford comma usage (B2-009)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 检测"A、B和C"模式中缺少逗号
     OXFORD_PATTERN = re.compile(r'[\u4e00-\u9fff]{1,5}、[\u4e00-\u9fff]{1,5}[和与及][\u4e00-\u9fff]{1,5}')
 
@@ -2513,6 +2652,8 @@ class B2_009_OxfordCommaRule(DeterministicRule):
 class B2_010_MissingDunhaoRule(DeterministicRule):
     """Check for missing dunhao in short parallel phrases (B2-010)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 检测短并列词组间缺顿号
     PARALLEL_NO_DUNHAO = re.compile(r'[\u4e00-\u9fff]{2,3}\s[\u4e00-\u9fff]{2,3}(?:\s[\u4e00-\u9fff]{2,3})+')
 
@@ -2556,6 +2697,8 @@ class B2_010_MissingDunhaoRule(DeterministicRule):
 class B2_011_DunhaoInLongClausesRule(DeterministicRule):
     """Check for dunhao misuse in long parallel clauses (B2-011)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 检测长句间使用顿号
     LONG_DUNHAO = re.compile(r'[\u4e00-\u9fff，]{10,}、[\u4e00-\u9fff，]{10,}')
 
@@ -2599,6 +2742,8 @@ class B2_011_DunhaoInLongClausesRule(DeterministicRule):
 class B2_012_CommaInShortPhrasesRule(DeterministicRule):
     """Check for comma misuse in short parallel words (B2-012)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 检测短词组间使用逗号
     SHORT_COMMA = re.compile(r'[\u4e00-\u9fff]{2,4}，[\u4e00-\u9fff]{2,4}(?:，[\u4e00-\u9fff]{2,4})+')
 
@@ -2646,6 +2791,8 @@ class B2_012_CommaInShortPhrasesRule(DeterministicRule):
 class B2_013_CommaSpacingEnglishRule(DeterministicRule):
     """Check comma spacing in English text (B2-013)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 英文中逗号后缺空格
     ENG_COMMA_NO_SPACE = re.compile(r',[a-zA-Z]')
 
@@ -2689,6 +2836,8 @@ class B2_013_CommaSpacingEnglishRule(DeterministicRule):
 class B2_014_DunhaoWithDengRule(DeterministicRule):
     """Check for dunhao enumeration ending with 等 (B2-014)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     DUNHAO_DENG = re.compile(r'[\u4e00-\u9fff]{2,5}、[\u4e00-\u9fff]{2,5}(?:、[\u4e00-\u9fff]{2,5})*等')
 
     def __init__(self) -> None:
@@ -2779,6 +2928,8 @@ class B2_015_CommaSemicolonMixRule(DeterministicRule):
 class B3_006_QuoteMisuseRule(DeterministicRule):
     """Check for quotation mark misuse in non-quotation contexts (B3-006)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 检测引号用于强调而非引用
     QUOTE_EMPHASIS = re.compile(r'[""][\u4e00-\u9fff]{1,3}[""](?![说道曰云])')
 
@@ -2822,6 +2973,8 @@ class B3_006_QuoteMisuseRule(DeterministicRule):
 class B3_007_BookTitleOveruseRule(DeterministicRule):
     """Check for book title mark overuse (B3-007)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 检测书名号用于非作品名
     BOOK_TITLE_PATTERN = re.compile(r'《[\u4e00-\u9fff]{1,4}》')
 
@@ -2988,6 +3141,8 @@ class B4_006_NestedParenthesesRule(DeterministicRule):
 class B7_007_DashForParallelRule(DeterministicRule):
     """Check for dash misuse in parallel components (B7-007)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 检测破折号用于并列成分
     DASH_PARALLEL = re.compile(r'[\u4e00-\u9fff]{2,6}—[\u4e00-\u9fff]{2,6}—[\u4e00-\u9fff]{2,6}')
 
@@ -3237,12 +3392,12 @@ class B8_003_LineSpacingRule(DeterministicRule):
             can_auto_fix=True,
         )
 
-    def evaluate(self, payload: ArticlePayload) -> list[ProofreadingIssue]:
+    def evaluate_with_context(
+        self, payload: ArticlePayload, context: AnalysisContext
+    ) -> list[ProofreadingIssue]:
         issues: list[ProofreadingIssue] = []
-        content = payload.original_content
 
-        lines = content.split('\n')
-        for i, line in enumerate(lines):
+        for i, line in enumerate(context.lines):
             if line != line.strip() and line.strip():  # 有内容但有空格
                 snippet = line[:50]
 
@@ -3274,6 +3429,8 @@ class B8_003_LineSpacingRule(DeterministicRule):
 class UnifiedTermMeterRule(DeterministicRule):
     """Enforce '表' for meters, except watches (A1-001)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     METER_PATTERN = re.compile(r"[電电]錶|水錶")
     WATCH_EXCLUSION = re.compile(r"手錶")
 
@@ -3324,6 +3481,8 @@ class UnifiedTermMeterRule(DeterministicRule):
 class UnifiedTermOccupyRule(DeterministicRule):
     """Unify 佔/占 to 占 (A1-010)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     OCCUPY_PATTERN = re.compile(r"佔")
 
     def __init__(self) -> None:
@@ -3370,7 +3529,7 @@ class UnifiedTermOccupyRule(DeterministicRule):
 # ============================================================================
 
 
-class UnifiedTermRule(DeterministicRule):
+class UnifiedTermRule(PatternMatchingRule):
     """Generic unified term rule for A1 category."""
 
     def __init__(
@@ -3390,17 +3549,23 @@ class UnifiedTermRule(DeterministicRule):
             can_auto_fix=True,
         )
         self.wrong_pattern = re.compile(wrong_pattern)
+        self.match_patterns = [self.wrong_pattern]
         self.correct_form = correct_form
         self.description = description
         self.exclusion_pattern = (
             re.compile(exclusion_pattern) if exclusion_pattern else None
         )
 
-    def evaluate(self, payload: ArticlePayload) -> list[ProofreadingIssue]:
+    def evaluate_matches(
+        self,
+        payload: ArticlePayload,
+        matches: list[list[re.Match[str]]],
+        context: AnalysisContext,
+    ) -> list[ProofreadingIssue]:
         issues: list[ProofreadingIssue] = []
         content = payload.original_content
 
-        for match in self.wrong_pattern.finditer(content):
+        for match in matches[0]:
             # Check exclusion pattern if exists
             if self.exclusion_pattern:
                 context_start = max(0, match.start() - 2)
@@ -4016,7 +4181,7 @@ class A1_050_XiangRule(UnifiedTermRule):
 # ============================================================================
 
 
-class VariantWordRule(DeterministicRule):
+class VariantWordRule(PatternMatchingRule):
     """Base class for variant word form rules (A2 subcategory)."""
 
     def __init__(
@@ -4058,17 +4223,23 @@ class VariantWordRule(DeterministicRule):
             self.wrong_pattern = re.compile(wrong_form)
         else:
             self.wrong_pattern = re.compile(re.escape(wrong_form))
+        self.match_patterns = [self.wrong_pattern]
 
         if exclusion_pattern:
             self.exclusion = re.compile(exclusion_pattern)
         else:
             self.exclusion = None
 
-    def evaluate(self, payload: ArticlePayload) -> list[ProofreadingIssue]:
+    def evaluate_matches(
+        self,
+        payload: ArticlePayload,
+        matches: list[list[re.Match[str]]],
+        context: AnalysisContext,
+    ) -> list[ProofreadingIssue]:
         issues: list[ProofreadingIssue] = []
         content = payload.original_content
 
-        for match in self.wrong_pattern.finditer(content):
+        for match in matches[0]:
             # Check exclusion pattern
             if self.exclusion:
                 context_start = max(0, match.start() - 5)
@@ -4470,6 +4641,8 @@ class A2_030_SongChiRule(VariantWordRule):
 class CommonTypoRule(DeterministicRule):
     """Detect common typos like 莫明其妙 (A3-004)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     TYPO_PATTERN = re.compile(r"莫明其妙")
 
     def __init__(self) -> None:
@@ -4516,7 +4689,7 @@ class CommonTypoRule(DeterministicRule):
 # ============================================================================
 
 
-class TypoReplacementRule(DeterministicRule):
+class TypoReplacementRule(PatternMatchingRule):
     """Generic typo replacement rule for A3 category."""
 
     def __init__(
@@ -4535,14 +4708,20 @@ class TypoReplacementRule(DeterministicRule):
             can_auto_fix=True,
         )
         self.wrong_pattern = re.compile(wrong_pattern)
+        self.match_patterns = [self.wrong_pattern]
         self.correct_form = correct_form
         self.description = description
 
-    def evaluate(self, payload: ArticlePayload) -> list[ProofreadingIssue]:
+    def evaluate_matches(
+        self,
+        payload: ArticlePayload,
+        matches: list[list[re.Match[str]]],
+        context: AnalysisContext,
+    ) -> list[ProofreadingIssue]:
         issues: list[ProofreadingIssue] = []
         content = payload.original_content
 
-        for match in self.wrong_pattern.finditer(content):
+        for match in matches[0]:
             snippet_start = max(0, match.start() - 10)
             snippet_end = min(len(content), match.end() + 10)
             snippet = content[snippet_start:snippet_end]
@@ -5404,6 +5583,8 @@ class A3_073_DanWuRule(TypoReplacementRule):
 class InformalLanguageRule(DeterministicRule):
     """Detect informal or internet slang (A4-014)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     INFORMAL_TERMS = [
         "老公",
         "土豪",
@@ -5467,6 +5648,8 @@ class InformalLanguageRule(DeterministicRule):
 class FullWidthDigitRule(DeterministicRule):
     """Detect full-width digits and require half-width (C1-006)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     FULL_WIDTH_DIGIT_PATTERN = re.compile(r"[０-９]+")
 
     def __init__(self) -> None:
@@ -5517,6 +5700,8 @@ class FullWidthDigitRule(DeterministicRule):
 class NumberSeparatorRule(DeterministicRule):
     """Suggest thousand separators for large numbers (C1-001)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 匹配4位及以上的数字（没有逗号分隔）
     LARGE_NUMBER_PATTERN = re.compile(r"\b\d{4,}\b")
 
@@ -5576,6 +5761,8 @@ class NumberSeparatorRule(DeterministicRule):
 class PercentageFormatRule(DeterministicRule):
     """Check percentage format: require space before % (C1-002)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 匹配数字和%之间没有空格的情况
     NO_SPACE_PERCENTAGE = re.compile(r"\d+%")
 
@@ -5624,6 +5811,8 @@ class PercentageFormatRule(DeterministicRule):
 class DecimalPointRule(DeterministicRule):
     """Check decimal point format (C1-003)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 匹配使用中文句号作为小数点的情况
     CHINESE_DECIMAL = re.compile(r"\d+。\d+")
 
@@ -5672,6 +5861,8 @@ class DecimalPointRule(DeterministicRule):
 class DateFormatRule(DeterministicRule):
     """Check date format standardization (C1-004)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 匹配使用中文年月日的日期格式
     CHINESE_DATE = re.compile(r"\d{4}年\d{1,2}月\d{1,2}日")
 
@@ -5725,6 +5916,8 @@ class DateFormatRule(DeterministicRule):
 class CurrencyFormatRule(DeterministicRule):
     """Check currency format (C1-005)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 匹配货币符号和数字之间有空格的情况
     SPACE_IN_CURRENCY = re.compile(r"([¥$€£]) +(\d+)")
 
@@ -5779,6 +5972,8 @@ class CurrencyFormatRule(DeterministicRule):
 class KilometerUnificationRule(DeterministicRule):
     """Unify kilometer terminology: prefer '公里' over '千米' (C2-001)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     QIAN_MI_PATTERN = re.compile(r"千米")
 
     def __init__(self) -> None:
@@ -5823,6 +6018,8 @@ class KilometerUnificationRule(DeterministicRule):
 class SquareMeterSymbolRule(DeterministicRule):
     """Check square meter symbol format (C2-002)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 匹配使用文字"平方米"的情况
     TEXT_SQUARE_METER = re.compile(r"\d+ *平方米")
 
@@ -5919,6 +6116,8 @@ class C1_007_TimeFormatRule(DeterministicRule):
 class C1_008_ScientificNotationRule(DeterministicRule):
     """Check scientific notation format (C1-008)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 匹配科学计数法相关
     LARGE_NUMBER = re.compile(r"(\d{1,3})(,?\d{3}){3,}")  # 大数字建议用科学计数法
 
@@ -6245,6 +6444,8 @@ class C2_006_AreaUnitRule(DeterministicRule):
 class C1_010_NegativeNumberRule(DeterministicRule):
     """Check negative number format (C1-010)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 匹配使用连字符作为负号的数字
     NEGATIVE_PATTERN = re.compile(r"(?<!\d)-(\d+(?:\.\d+)?)")
 
@@ -6457,6 +6658,8 @@ class C1_013_OrdinalNumberRule(DeterministicRule):
 class C1_014_LargeNumberRule(DeterministicRule):
     """Check large number representation (C1-014)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 匹配大数字（7位以上）
     LARGE_NUMBER_PATTERN = re.compile(r"\b(\d{7,})\b")
 
@@ -6512,6 +6715,8 @@ class C1_014_LargeNumberRule(DeterministicRule):
 class C1_015_MixedNumberFormatRule(DeterministicRule):
     """Check mixed number format (C1-015)."""
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # 匹配阿拉伯数字和中文数字混用
     MIXED_PATTERN = re.compile(r"([一二三四五六七八九十百千万亿]+)(\d+)|(\d+)([一二三四五六七八九十百千万亿]+)")
 
@@ -7082,12 +7287,13 @@ class F2_002_ArticleLengthRule(DeterministicRule):
             can_auto_fix=False,
         )
 
-    def evaluate(self, payload: ArticlePayload) -> list[ProofreadingIssue]:
+    def evaluate_with_context(
+        self, payload: ArticlePayload, context: AnalysisContext
+    ) -> list[ProofreadingIssue]:
         issues: list[ProofreadingIssue] = []
-        content = payload.original_content
 
         # 计算中文字符数（去除空格、标点）
-        chinese_chars = len([c for c in content if "\u4e00" <= c <= "\u9fff"])
+        chinese_chars = context.chinese_char_count
 
         if chinese_chars < self.MIN_LENGTH:
             issues.append(
@@ -7161,27 +7367,20 @@ class F2_003_ParagraphLengthRule(DeterministicRule):
             can_auto_fix=False,
         )
 
-    def evaluate(self, payload: ArticlePayload) -> list[ProofreadingIssue]:
+    def evaluate_with_context(
+        self, payload: ArticlePayload, context: AnalysisContext
+    ) -> list[ProofreadingIssue]:
         issues: list[ProofreadingIssue] = []
-        content = payload.original_content
-
-        # Fix: Properly extract paragraphs from HTML content
-        # Use BeautifulSoup to parse HTML and extract paragraph text
-        soup = BeautifulSoup(content, "html.parser")
 
-        # Extract text from <p> tags as paragraphs
-        # Also consider other block elements that might contain paragraph-like content
-        paragraphs = []
-        for tag in soup.find_all(['p', 'div']):
-            # Get text content, stripping nested tags
-            text = tag.get_text(strip=True)
-            if text and len(text) > 10:  # Skip empty or very short elements
-                paragraphs.append(text)
+        # Extract text from <p>/<div> block elements of the shared parsed DOM
+        paragraphs = [
+            text for text in context.block_texts if len(text) > 10
+        ]  # Skip very short elements
 
         # If no HTML paragraphs found, fall back to double-newline splitting
         # (for plain text content)
         if not paragraphs:
-            paragraphs = [p.strip() for p in content.split("\n\n") if p.strip()]
+            paragraphs = context.paragraphs
 
         for i, para in enumerate(paragraphs):
             # 计算段落中文字符数 (count actual Chinese characters, not HTML tags)
@@ -7212,8 +7411,6 @@ class F2_003_ParagraphLengthRule(DeterministicRule):
 class F2_004_HeadingHierarchyRule(DeterministicRule):
     """Check heading hierarchy continuity (F2-004)."""
 
-    HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
-
     def __init__(self) -> None:
         super().__init__(
             rule_id="F2-004",
@@ -7224,15 +7421,16 @@ class F2_004_HeadingHierarchyRule(DeterministicRule):
             can_auto_fix=False,
         )
 
-    def evaluate(self, payload: ArticlePayload) -> list[ProofreadingIssue]:
+    def evaluate_with_context(
+        self, payload: ArticlePayload, context: AnalysisContext
+    ) -> list[ProofreadingIssue]:
         issues: list[ProofreadingIssue] = []
         content = payload.original_content
 
-        headings = []
-        for match in self.HEADING_PATTERN.finditer(content):
-            level = len(match.group(1))
-            text = match.group(2)
-            headings.append((level, text, match.start()))
+        headings = [
+            (heading.level, heading.text, heading.offset)
+            for heading in context.headings
+        ]
 
         # 检查层级跳跃
         for i in range(1, len(headings)):
@@ -7572,7 +7770,6 @@ class F1_010_ImageNamingRule(DeterministicRule):
 class F2_007_HeadingLengthRule(DeterministicRule):
     """Check heading length (F2-007)."""
 
-    HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
     MAX_LENGTH = 60
 
     def __init__(self) -> None:
@@ -7585,14 +7782,16 @@ class F2_007_HeadingLengthRule(DeterministicRule):
             can_auto_fix=False,
         )
 
-    def evaluate(self, payload: ArticlePayload) -> list[ProofreadingIssue]:
+    def evaluate_with_context(
+        self, payload: ArticlePayload, context: AnalysisContext
+    ) -> list[ProofreadingIssue]:
         issues: list[ProofreadingIssue] = []
         content = payload.original_content
 
-        for match in self.HEADING_PATTERN.finditer(content):
-            heading_text = match.group(2).strip()
+        for heading in context.headings:
+            heading_text = heading.text.strip()
             if len(heading_text) > self.MAX_LENGTH:
-                snippet = content[max(0, match.start() - 10) : match.end() + 10]
+                snippet = content[max(0, heading.offset - 10) : heading.end + 10]
 
                 issues.append(
                     ProofreadingIssue(
@@ -7607,7 +7806,7 @@ class F2_007_HeadingLengthRule(DeterministicRule):
                         blocks_publish=self.blocks_publish,
                         source=RuleSource.SCRIPT,
                         attributed_by="F2_007_HeadingLengthRule",
-                        location={"offset": match.start()},
+                        location={"offset": heading.offset},
                         evidence=snippet,
                     )
                 )
@@ -7630,14 +7829,14 @@ class F2_008_FirstParagraphLengthRule(DeterministicRule):
             can_auto_fix=False,
         )
 
-    def evaluate(self, payload: ArticlePayload) -> list[ProofreadingIssue]:
+    def evaluate_with_context(
+        self, payload: ArticlePayload, context: AnalysisContext
+    ) -> list[ProofreadingIssue]:
         issues: list[ProofreadingIssue] = []
-        content = payload.original_content
 
         # 获取第一段（去除标题）
-        lines = content.split('\n')
         first_para = None
-        for line in lines:
+        for line in context.lines:
             stripped = line.strip()
             if stripped and not stripped.startswith('#'):
                 first_para = stripped
@@ -7700,12 +7899,14 @@ class F2_009_ContentSegmentationRule(DeterministicRule):
             can_auto_fix=False,
         )
 
-    def evaluate(self, payload: ArticlePayload) -> list[ProofreadingIssue]:
+    def evaluate_with_context(
+        self, payload: ArticlePayload, context: AnalysisContext
+    ) -> list[ProofreadingIssue]:
         issues: list[ProofreadingIssue] = []
         content = payload.original_content
 
         # 计算中文字符数
-        chinese_chars = len([c for c in content if "\u4e00" <= c <= "\u9fff"])
+        chinese_chars = context.chinese_char_count
 
         # 统计二级及以下标题数量
         headings = self.HEADING_PATTERN.findall(content)
@@ -7846,25 +8047,22 @@ class F3_005_DuplicateContentRule(DeterministicRule):
             can_auto_fix=False,
         )
 
-    def evaluate(self, payload: ArticlePayload) -> list[ProofreadingIssue]:
+    def evaluate_with_context(
+        self, payload: ArticlePayload, context: AnalysisContext
+    ) -> list[ProofreadingIssue]:
         issues: list[ProofreadingIssue] = []
-        content = payload.original_content
-
-        # Fix: Properly extract paragraphs from HTML content
-        # Use BeautifulSoup to parse HTML and extract paragraph text
-        soup = BeautifulSoup(content, "html.parser")
 
-        # Extract text from <p> tags as paragraphs
-        paragraphs = []
-        for tag in soup.find_all(['p', 'div']):
-            text = tag.get_text(strip=True)
-            # Skip empty, very short, or heading-like elements
-            if text and len(text) > 10 and not text.startswith('#'):
-                paragraphs.append(text)
+        # Extract text from <p>/<div> block elements of the shared parsed DOM
+        # Skip very short or heading-like elements
+        paragraphs = [
+            text
+            for text in context.block_texts
+            if len(text) > 10 and not text.startswith('#')
+        ]
 
         # If no HTML paragraphs found, fall back to double-newline splitting
         if not paragraphs:
-            paragraphs = [p.strip() for p in content.split('\n\n') if p.strip() and not p.strip().startswith('#')]
+            paragraphs = [p for p in context.paragraphs if not p.startswith('#')]
 
         # 检查重复段落
         seen = {}
@@ -7958,13 +8156,13 @@ class F3_007_ReadabilityRule(DeterministicRule):
             can_auto_fix=False,
         )
 
-    def evaluate(self, payload: ArticlePayload) -> list[ProofreadingIssue]:
+    def evaluate_with_context(
+        self, payload: ArticlePayload, context: AnalysisContext
+    ) -> list[ProofreadingIssue]:
         issues: list[ProofreadingIssue] = []
-        content = payload.original_content
 
         # 计算平均句子长度
-        sentences = re.split(r'[。！？]', content)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = context.sentences
 
         if sentences:
             avg_length = sum(len(s) for s in sentences) / len(sentences)
@@ -8563,6 +8761,8 @@ class G3_001_GeographicLogicRule(DeterministicRule):
     "上中西部" (impossible combination) or incorrect US state/region pairings.
     """
 
+    scope: ClassVar[RuleScope] = RuleScope.PARAGRAPH
+
     # US geographic regions
     US_REGIONS = {
         "東北部": ["緬因州", "佛蒙特州", "新罕布什爾州", "麻薩諸塞州", "康乃狄克州", "羅德島州",
@@ -8694,9 +8894,11 @@ class G3_002_AIHallucinationDetectionRule(DeterministicRule):
 class DeterministicRuleEngine:
     """Coordinator for all deterministic proofreading rules."""
 
-    VERSION = "2.1.0"  # Batch 11: 390条规则 - G类语境验证新增 (A1:50, A2:30, A3:70, A4:30, B:60, C:24, D:40, E:40, F:40, G:6)
+    VERSION = "2.1.1"  # 段落级规则扩充，旧增量快照失效；Batch 11: 390条规则 - G类语境验证新增 (A1:50, A2:30, A3:70, A4:30, B:60, C:24, D:40, E:40, F:40, G:6)
 
-    def __init__(self) -> None:
+    def __init__(self, learned_rules: LearnedRuleRegistry | None = None) -> None:
+        # 编辑发布的学习规则，热加载，无需重启或部署
+        self.learned_rules = learned_rules or get_learned_rule_registry()
         self.rules: list[DeterministicRule] = [
             # B类 - 标点符号与排版（60条）
             # B1 子类 - 基本标点（14条）
@@ -9009,15 +9211,83 @@ class DeterministicRuleEngine:
             G3_001_GeographicLogicRule(),  # G3-001: 地理逻辑验证
             G3_002_AIHallucinationDetectionRule(),  # G3-002: AI幻觉检测
         ]
+        self._matcher: MultiPatternMatcher | None = None
+        self._matcher_rules: list[DeterministicRule] = []
+
+    @property
+    def version(self) -> str:
+        """Engine version including the active learned rule set.
+
+        Keys result caches and incremental snapshots, so publishing new
+        learned rules invalidates results computed without them.
+        """
+        return self.state().version
+
+    def state(self) -> EngineState:
+        """Pin the active learned rule set together with its engine version."""
+        learned = self.learned_rules.active
+        if learned is None:
+            return EngineState(version=self.VERSION, learned=None)
+        return EngineState(version=f"{self.VERSION}+{learned.version[:8]}", learned=learned)
+
+    def _get_matcher(self) -> MultiPatternMatcher:
+        """Compile (once) a shared matcher for every pattern-only rule.
+
+        Rebuilt automatically if ``self.rules`` is replaced or mutated.
+        """
+        if self._matcher is None or self._matcher_rules != self.rules:
+            matcher = MultiPatternMatcher()
+            for rule_index, rule in enumerate(self.rules):
+                if isinstance(rule, PatternMatchingRule):
+                    for pattern_index, pattern in enumerate(rule.match_patterns):
+                        matcher.add(pattern, owner=(rule_index, pattern_index))
+            matcher.compile()
+            self._matcher = matcher
+            self._matcher_rules = list(self.rules)
+        return self._matcher
+
+    def run(
+        self,
+        payload: ArticlePayload,
+        *,
+        scope: RuleScope | None = None,
+        state: EngineState | None = None,
+    ) -> list[ProofreadingIssue]:
+        """Execute all deterministic rules, or only those of ``scope``.
 
-    def run(self, payload: ArticlePayload) -> list[ProofreadingIssue]:
-        """Execute all deterministic rules."""
+        ``state`` pins the learned rules (default: the active set).
+        """
         issues: list[ProofreadingIssue] = []
-        for rule in self.rules:
-            issues.extend(rule.evaluate(payload))
+        # 本次运行固定使用同一版本的学习规则，发布新版本不影响进行中的运行
+        learned = (state or self.state()).learned
+
+        # 每次运行只做一次预分析（URL 范围、DOM、段落、句子），所有规则共享
+        context = AnalysisContext.from_payload(payload)
+
+        # 一次扫描匹配所有字面量/正则规则，再按规则分发命中结果
+        if scope is RuleScope.DOCUMENT:
+            hits = {}
+        else:
+            hits = self._get_matcher().scan(payload.original_content)
+
+        for rule_index, rule in enumerate(self.rules):
+            if scope is not None and rule.scope is not scope:
+                continue
+            if isinstance(rule, PatternMatchingRule):
+                matches = [
+                    hits.get((rule_index, pattern_index), [])
+                    for pattern_index in range(len(rule.match_patterns))
+                ]
+                if any(matches):
+                    issues.extend(rule.evaluate_matches(payload, matches, context))
+                continue
+            issues.extend(rule.evaluate_with_context(payload, context))
+
+        if learned is not None and scope is not RuleScope.DOCUMENT:
+            issues.extend(learned.evaluate(payload, context))
 
         # 过滤掉落在 URL 范围内的问题
-        url_ranges = find_url_ranges(payload.original_content)
+        url_ranges = context.url_ranges
         if url_ranges:
             filtered_issues: list[ProofreadingIssue] = []
             for issue in issues:
@@ -9026,7 +9296,7 @@ class DeterministicRuleEngine:
                 if offset is not None:
                     # 检查问题是否在 URL 范围内
                     # 假设每个问题的范围很小，只检查起始位置
-                    if not any(url_start <= offset < url_end for url_start, url_end in url_ranges):
+                    if not url_ranges.contains(offset):
                         filtered_issues.append(issue)
                 else:
                     # 没有位置信息的问题保留
@@ -0,0 +1,188 @@
+"""Paragraph-level bookkeeping for incremental re-proofreading.
+
+An article is cut into contiguous paragraph segments (at blank lines and
+closing block tags) and each segment is hashed.  ``IncrementalSnapshot``
+stores, per paragraph digest, the paragraph-scoped rule issues (offsets
+relative to the paragraph) and the AI issues attributed to it.  On the next
+run only paragraphs whose digest is new are re-checked; stored issues of
+unchanged paragraphs are shifted to their new position.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from hashlib import sha256
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from src.services.parser.html_utils import strip_html_tags
+from src.services.proofreading.models import ProofreadingIssue
+
+# 段落边界：空行，或块级元素的闭合标签之后
+PARAGRAPH_BREAK_PATTERN = re.compile(
+    r"\n[ \t\r]*\n\s*|</(?:p|h[1-6]|li|ul|ol|blockquote|figure|table|div)>\s*",
+    re.IGNORECASE,
+)
+
+# Issue location keys holding content offsets
+_OFFSET_KEYS = ("offset", "start", "end")
+
+
+@dataclass(frozen=True)
+class ParagraphSegment:
+    """A contiguous slice ``content[start:end]`` and its SHA256 digest."""
+
+    index: int
+    start: int
+    end: int
+    text: str
+    digest: str
+
+
+def split_paragraphs(content: str) -> list[ParagraphSegment]:
+    """Split content into segments that concatenate back to ``content``."""
+    segments: list[ParagraphSegment] = []
+    start = 0
+    for match in PARAGRAPH_BREAK_PATTERN.finditer(content):
+        end = match.end()
+        if end > start:
+            segments.append(_segment(len(segments), content, start, end))
+            start = end
+    if start < len(content):
+        segments.append(_segment(len(segments), content, start, len(content)))
+    return segments
+
+
+def _segment(index: int, content: str, start: int, end: int) -> ParagraphSegment:
+    text = content[start:end]
+    return ParagraphSegment(
+        index=index,
+        start=start,
+        end=end,
+        text=text,
+        digest=sha256(text.encode("utf-8")).hexdigest(),
+    )
+
+
+def shift_issue(issue: ProofreadingIssue, delta: int) -> ProofreadingIssue:
+    """Return a copy of ``issue`` with its content offsets moved by ``delta``."""
+    shifted = issue.model_copy(deep=True)
+    if delta and shifted.location:
+        for key in _OFFSET_KEYS:
+            value = shifted.location.get(key)
+            if isinstance(value, int):
+                shifted.location[key] = value + delta
+    return shifted
+
+
+def attribute_ai_issues(
+    issues: list[ProofreadingIssue],
+    segments: list[ParagraphSegment],
+    starts: list[int] | None = None,
+) -> tuple[dict[str, list[ProofreadingIssue]], list[ProofreadingIssue]]:
+    """Assign AI issues to paragraphs, rebased to paragraph-relative offsets.
+
+    ``starts[i]`` is where ``segments[i]`` begins in the text the AI saw
+    (default: the segments back to back, as in a partial-run prompt).  An
+    issue belongs to the segment containing its location offset, else to the
+    first segment containing its ``original_text``.
+
+    Returns ``({digest: issues}, unattributed)``; attributed issues have their
+    offsets made relative to the paragraph, like stored script issues.
+    Issues without a usable offset or text, or whose text spans paragraphs,
+    are treated as document-level and returned unchanged.
+    """
+    if starts is None:
+        starts = []
+        position = 0
+        for segment in segments:
+            starts.append(position)
+            position += len(segment.text)
+    plain_texts = {segment.digest: strip_html_tags(segment.text) for segment in segments}
+    by_digest: dict[str, list[ProofreadingIssue]] = {}
+    unattributed: list[ProofreadingIssue] = []
+    for issue in issues:
+        owner = _segment_at(_issue_offset(issue), segments, starts)
+        needle = (issue.original_text or "").strip()
+        if owner is None and needle:
+            for index, segment in enumerate(segments):
+                if needle in segment.text or needle in plain_texts[segment.digest]:
+                    owner = index
+                    break
+        if owner is None:
+            unattributed.append(issue)
+        else:
+            by_digest.setdefault(segments[owner].digest, []).append(
+                shift_issue(issue, -starts[owner])
+            )
+    return by_digest, unattributed
+
+
+def _issue_offset(issue: ProofreadingIssue) -> int | None:
+    if not issue.location:
+        return None
+    for key in ("offset", "start"):
+        value = issue.location.get(key)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def _segment_at(
+    offset: int | None, segments: list[ParagraphSegment], starts: list[int]
+) -> int | None:
+    if offset is None:
+        return None
+    for index, (segment, start) in enumerate(zip(segments, starts, strict=True)):
+        if start <= offset < start + len(segment.text):
+            return index
+    return None
+
+
+class ParagraphRecord(BaseModel):
+    """Stored proofreading state of one paragraph."""
+
+    digest: str = Field(description="SHA256 of the paragraph text")
+    script_issues: list[ProofreadingIssue] = Field(
+        default_factory=list,
+        description="Paragraph-scoped rule issues, offsets relative to the paragraph",
+    )
+    ai_issues: list[ProofreadingIssue] = Field(
+        default_factory=list, description="AI issues attributed to the paragraph"
+    )
+
+
+class IncrementalSnapshot(BaseModel):
+    """Per-paragraph proofreading state carried between runs."""
+
+    analysis_mode: str
+    engine_version: str
+    manifest_fingerprint: str
+    ai_model: str | None = None
+    paragraphs: list[ParagraphRecord] = Field(default_factory=list)
+    document_ai_issues: list[ProofreadingIssue] = Field(
+        default_factory=list,
+        description="AI issues not attributable to a single paragraph",
+    )
+    seo_metadata: dict[str, Any] | None = None
+
+    def is_compatible(
+        self,
+        *,
+        analysis_mode: str,
+        engine_version: str,
+        manifest_fingerprint: str,
+        ai_model: str | None,
+    ) -> bool:
+        """True if stored issues are still valid for this configuration."""
+        return (
+            self.analysis_mode == analysis_mode
+            and self.engine_version == engine_version
+            and self.manifest_fingerprint == manifest_fingerprint
+            and self.ai_model == ai_model
+        )
+
+    def records_by_digest(self) -> dict[str, ParagraphRecord]:
+        return {record.digest: record for record in self.paragraphs}
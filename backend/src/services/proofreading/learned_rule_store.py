@@ -0,0 +1,92 @@
+"""Database persistence for published learned rules.
+
+``LearnedRuleRegistry`` only lives in the memory of one process.  The
+``learned_proofreading_rules`` table is the source of truth: the publish
+endpoints write to it before hot-loading, and every API process loads it at
+start-up and polls it every ``PROOFREADING_LEARNED_RULE_REFRESH_SECONDS``.
+A publish handled by one uvicorn worker therefore reaches the others (and
+their job workers), and survives restarts.  Reloading an unchanged table is
+a cache hit in the registry, so polling costs one small query.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import get_logger
+from src.config.database import get_db_config
+from src.models.learned_proofreading_rule import LearnedProofreadingRule
+from src.schemas.proofreading_decision import DraftRule
+from src.services.proofreading.learned_rules import (
+    LearnedRuleRegistry,
+    LearnedRuleSet,
+    get_learned_rule_registry,
+)
+
+logger = get_logger(__name__)
+
+
+async def save_published_rules(
+    session: AsyncSession,
+    rules: Iterable[DraftRule],
+    *,
+    ruleset_id: str | None = None,
+) -> None:
+    """Store ``rules`` (same rule_id replaces) and commit."""
+    for rule in rules:
+        await session.merge(
+            LearnedProofreadingRule(
+                rule_id=rule.rule_id,
+                definition=rule.model_dump(mode="json"),
+                ruleset_id=ruleset_id,
+            )
+        )
+    await session.commit()
+
+
+async def load_published_rules(session: AsyncSession) -> list[DraftRule]:
+    """Every stored rule; rows that no longer validate are skipped."""
+    rows = (
+        await session.execute(
+            select(LearnedProofreadingRule).order_by(LearnedProofreadingRule.rule_id)
+        )
+    ).scalars().all()
+    rules: list[DraftRule] = []
+    for row in rows:
+        try:
+            rules.append(DraftRule.model_validate(row.definition))
+        except ValidationError as exc:
+            logger.warning("learned_rule_invalid", rule_id=row.rule_id, error=str(exc))
+    return rules
+
+
+async def sync_learned_rules(
+    session: AsyncSession | None = None,
+    registry: LearnedRuleRegistry | None = None,
+) -> LearnedRuleSet:
+    """Make the stored rules the registry's published set."""
+    registry = registry or get_learned_rule_registry()
+    if session is None:
+        async with get_db_config().session() as own_session:
+            rules = await load_published_rules(own_session)
+    else:
+        rules = await load_published_rules(session)
+    # Compiling runs the ReDoS probes; keep it off the event loop
+    return await asyncio.to_thread(registry.replace, rules)
+
+
+async def refresh_learned_rules(interval_seconds: float) -> None:
+    """Load the stored rules now and then every ``interval_seconds`` (0: once)."""
+    while True:
+        try:
+            await sync_learned_rules()
+        except Exception as exc:  # noqa: BLE001 - keep serving with the rules we have
+            logger.warning("learned_rules_refresh_failed", error=str(exc))
+        if interval_seconds <= 0:
+            return
+        await asyncio.sleep(interval_seconds)
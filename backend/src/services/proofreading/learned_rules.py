@@ -0,0 +1,540 @@
+"""Learned proofreading rules hot-loaded into the deterministic engine.
+
+Editors turn their decisions into ``DraftRule``s, review them and publish them
+through ``/rules/drafts/{draft_id}/publish``.  ``LearnedRuleRegistry`` compiles
+the published rules into a ``LearnedRuleSet``: one ``MultiPatternMatcher``
+over every rule pattern, versioned by a SHA256 of the rule definitions.
+Compiled sets are cached by that hash, so publishing or testing the same rules
+again never recompiles them.
+
+``DeterministicRuleEngine.run`` reads ``registry.active`` once per run.  A
+publish builds the new set off to the side and then swaps one reference, so a
+run sees either the old version or the new one, never a mix.  The version is
+folded into ``DeterministicRuleEngine.version``, which keys the result cache
+and incremental snapshots.
+
+Patterns are written by editors, so every regex is screened before it can go
+live (ReDoS guard):
+
+- patterns longer than ``MAX_PATTERN_LENGTH`` are rejected;
+- a repeat whose body holds another repeat or an alternation at any depth
+  (``(a+)+``, ``((ab)*)*``, ``(a|aa)*``) is rejected outright — the classic
+  exponential backtracking shapes, found by walking the parsed regex;
+- every other regex is timed alone on probe texts of growing length in a
+  child process, and rejected as soon as one scan exceeds the per-rule time
+  budget.  Python's ``re`` cannot be interrupted, so a probe that never
+  returns is killed at a hard deadline.
+
+At run time the learned scan is timed as a watchdog, and a set that overruns
+its budget on ``MAX_CONSECUTIVE_OVERRUNS`` articles in a row is switched off
+until the next publish.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from hashlib import sha256
+from re import _constants, _parser
+from typing import Any
+
+from src.config import get_logger, get_settings
+from src.schemas.proofreading_decision import DraftRule
+from src.services.proofreading.analysis_context import AnalysisContext
+from src.services.proofreading.matcher import MultiPatternMatcher, literal_text
+from src.services.proofreading.models import ArticlePayload, ProofreadingIssue, RuleSource
+from src.services.rule_compiler import CompiledRule, RuleCompiler
+
+logger = get_logger(__name__)
+
+MAX_PATTERN_LENGTH = 500
+PROBE_LENGTHS = (64, 512, 4096)
+MAX_CONSECUTIVE_OVERRUNS = 3
+MAX_CACHED_SETS = 16
+# Interpreter start-up allowance on top of the probe budget before the kill
+PROBE_STARTUP_GRACE_S = 2.0
+
+# Category of issues raised by learned rules (built-in rules use A-G)
+LEARNED_CATEGORY = "L"
+
+_REPEATS = (_constants.MAX_REPEAT, _constants.MIN_REPEAT, _constants.POSSESSIVE_REPEAT)
+
+# Runs in a bare child interpreter (-I -S): stdlib only
+_PROBE_SCRIPT = """
+import json, re, sys, time
+job = json.load(sys.stdin)
+pattern = re.compile(job["source"], job["flags"])
+for length, text in job["probes"]:
+    start = time.perf_counter()
+    for _ in pattern.finditer(text):
+        pass
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if elapsed_ms > job["budget_ms"]:
+        print(json.dumps({"length": length, "elapsed_ms": elapsed_ms}))
+        break
+"""
+
+
+@dataclass(frozen=True)
+class RejectedRule:
+    """A rule left out of a compiled set, with the reason shown to editors."""
+
+    rule_id: str
+    reason: str
+
+
+@dataclass(frozen=True)
+class LearnedRuleSpec:
+    """Picklable description of a screened set, for rebuilding it in another process."""
+
+    version: str
+    rules: tuple[DraftRule, ...]
+    time_budget_ms: float
+
+
+def _children(op: Any, av: Any) -> list[Any]:
+    """Sub-patterns nested under one parsed regex node."""
+    if op in _REPEATS:
+        return [av[2]]
+    if op is _constants.SUBPATTERN:
+        return [av[3]]
+    if op is _constants.BRANCH:
+        return list(av[1])
+    if op in (_constants.ASSERT, _constants.ASSERT_NOT):
+        return [av[1]]
+    if op is _constants.ATOMIC_GROUP:
+        return [av]
+    if op is _constants.GROUPREF_EXISTS:
+        return [branch for branch in av[1:] if branch is not None]
+    return []
+
+
+def _is_repeat(op: Any, av: Any) -> bool:
+    return op in _REPEATS and av[1] > 1
+
+
+def _repeats_or_branches(items: Any) -> bool:
+    for op, av in items:
+        # A fixed count such as x{3} can only match one way
+        if op is _constants.BRANCH or (_is_repeat(op, av) and av[0] != av[1]):
+            return True
+        if any(_repeats_or_branches(child) for child in _children(op, av)):
+            return True
+    return False
+
+
+def _has_nested_repetition(items: Any) -> bool:
+    """True if a repeat's body holds a repeat or an alternation, at any depth."""
+    for op, av in items:
+        if _is_repeat(op, av) and _repeats_or_branches(av[2]):
+            return True
+        if any(_has_nested_repetition(child) for child in _children(op, av)):
+            return True
+    return False
+
+
+def _probe_texts(source: str, length: int) -> list[str]:
+    """Texts built from the pattern's own characters, ending in a mismatch."""
+    alphabet = "".join(dict.fromkeys(c for c in source if c.isalnum())) + "a1"
+    spaced = " ".join(alphabet) + " "
+    return [
+        (alphabet[0] * length) + "\x00",
+        (alphabet * (length // len(alphabet) + 1))[:length] + "\x00",
+        (spaced * (length // len(spaced) + 1))[:length] + "\x00",
+    ]
+
+
+def _probe(pattern: re.Pattern[str], time_budget_ms: float) -> str | None:
+    """Time ``pattern`` on the probe texts in a child process killed at a deadline."""
+    probes = [
+        (length, text)
+        for length in PROBE_LENGTHS
+        for text in _probe_texts(pattern.pattern, length)
+    ]
+    deadline_s = PROBE_STARTUP_GRACE_S + time_budget_ms * len(probes) / 1000
+    job = {
+        "source": pattern.pattern,
+        "flags": pattern.flags,
+        "probes": probes,
+        "budget_ms": time_budget_ms,
+    }
+    try:
+        completed = subprocess.run(
+            [sys.executable, "-I", "-S", "-c", _PROBE_SCRIPT],
+            input=json.dumps(job),
+            capture_output=True,
+            text=True,
+            timeout=deadline_s,
+            check=True,
+        )
+    except subprocess.TimeoutExpired:
+        return f"Exceeded time budget (probe killed after {deadline_s:.1f} s)"
+    except (OSError, subprocess.CalledProcessError) as exc:
+        return f"Could not be screened: {exc}"
+    if not completed.stdout.strip():
+        return None
+    overrun = json.loads(completed.stdout)
+    return (
+        f"Exceeded time budget ({overrun['elapsed_ms']:.1f} ms > {time_budget_ms:g} ms "
+        f"on a {overrun['length']}-char probe)"
+    )
+
+
+def screen_pattern(pattern: re.Pattern[str], time_budget_ms: float) -> str | None:
+    """Return why ``pattern`` is unsafe to run on articles, or None if it is safe."""
+    source = pattern.pattern
+    if len(source) > MAX_PATTERN_LENGTH:
+        return f"Pattern too long (max {MAX_PATTERN_LENGTH} chars)"
+    if literal_text(re.compile(source)) is not None:
+        return None  # plain literal: linear scan
+    if _has_nested_repetition(_parser.parse(source, pattern.flags)):
+        return "Nested quantifier may cause catastrophic backtracking"
+    return _probe(pattern, time_budget_ms)
+
+
+def _drop_noop_ignorecase(pattern: re.Pattern[str]) -> re.Pattern[str]:
+    """Compile caseless literals without IGNORECASE so they join the automaton."""
+    if not pattern.flags & re.IGNORECASE:
+        return pattern
+    plain = re.compile(pattern.pattern)
+    literal = literal_text(plain)
+    if literal is not None and literal.lower() == literal.upper():
+        return plain
+    return pattern
+
+
+def ruleset_version(rules: Iterable[DraftRule], *, reviewed_only: bool = True) -> str:
+    """SHA256 over the canonical definitions of ``rules``."""
+    canonical = [
+        rule.model_dump(
+            mode="json",
+            include={
+                "rule_id", "rule_type", "natural_language", "pattern",
+                "replacement", "conditions", "confidence", "review_status",
+            },
+        )
+        for rule in sorted(rules, key=lambda r: r.rule_id)
+    ]
+    blob = json.dumps(
+        {"rules": canonical, "reviewed_only": reviewed_only},
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return sha256(blob.encode("utf-8")).hexdigest()
+
+
+class LearnedRuleSet:
+    """Compiled, immutable set of learned rules sharing one matcher."""
+
+    def __init__(
+        self,
+        version: str,
+        rules: list[CompiledRule],
+        definitions: list[DraftRule],
+        rejected: list[RejectedRule],
+        time_budget_ms: float,
+    ) -> None:
+        self.version = version
+        self.rules = rules
+        self.definitions = definitions
+        self.rejected = rejected
+        self.time_budget_ms = time_budget_ms
+        self._descriptions = {rule.rule_id: rule.natural_language for rule in definitions}
+        # Backreferences, named groups and global inline flags do not survive
+        # being merged with other patterns; those rules run their own finditer.
+        self._matcher = MultiPatternMatcher()
+        for rule_index, rule in enumerate(rules):
+            self._matcher.add(rule.pattern, owner=rule_index)
+        self._matcher.compile()
+        self._overruns = 0
+        self.disabled = False
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    @property
+    def run_budget_ms(self) -> float:
+        """Time the whole set may spend on one article."""
+        return self.time_budget_ms * max(1, len(self.rules))
+
+    @property
+    def spec(self) -> LearnedRuleSpec:
+        """The rules that passed screening, under this set's version."""
+        return LearnedRuleSpec(
+            version=self.version,
+            rules=tuple(self.definitions),
+            time_budget_ms=self.time_budget_ms,
+        )
+
+    def rearm(self) -> None:
+        """Re-enable a set switched off by the watchdog."""
+        self._overruns = 0
+        self.disabled = False
+
+    def evaluate(
+        self, payload: ArticlePayload, context: AnalysisContext
+    ) -> list[ProofreadingIssue]:
+        """Issues for every learned-rule match in ``payload.original_content``."""
+        if self.disabled or not self.rules:
+            return []
+
+        content = payload.original_content
+        start = time.perf_counter()
+        hits = self._matcher.scan(content)
+        self._watch((time.perf_counter() - start) * 1000, len(content))
+
+        issues: list[ProofreadingIssue] = []
+        for rule_index in sorted(hits):
+            rule = self.rules[rule_index]
+            if not rule.applies_to(payload.metadata):
+                continue
+            for match in hits[rule_index]:
+                if context.url_ranges.overlaps(match.start(), match.end()):
+                    continue
+                issues.append(self._issue(rule, match, content))
+        return issues
+
+    def _watch(self, elapsed_ms: float, content_length: int) -> None:
+        if elapsed_ms <= self.run_budget_ms:
+            self._overruns = 0
+            return
+        self._overruns += 1
+        logger.warning(
+            "learned_rules_over_budget",
+            version=self.version[:12],
+            elapsed_ms=round(elapsed_ms, 1),
+            budget_ms=self.run_budget_ms,
+            content_length=content_length,
+            consecutive_overruns=self._overruns,
+        )
+        if self._overruns >= MAX_CONSECUTIVE_OVERRUNS:
+            self.disabled = True
+            logger.error(
+                "learned_rules_disabled",
+                version=self.version[:12],
+                rules=len(self.rules),
+            )
+
+    def _issue(
+        self, rule: CompiledRule, match: re.Match[str], content: str
+    ) -> ProofreadingIssue:
+        original = match.group()
+        replacement = rule.render_replacement(match) if rule.replacement else None
+        description = self._descriptions.get(rule.rule_id) or "編輯學習規則"
+        snippet = content[max(0, match.start() - 12):min(len(content), match.end() + 12)]
+        return ProofreadingIssue(
+            rule_id=rule.rule_id,
+            category=LEARNED_CATEGORY,
+            subcategory=rule.rule_type,
+            message=f"{description}（检测到“{original}”）。",
+            original_text=original,
+            suggested_text=replacement,
+            suggestion=f"将“{original}”替换为“{replacement}”。" if replacement else None,
+            severity="warning",
+            confidence=rule.confidence,
+            can_auto_fix=replacement is not None,
+            source=RuleSource.SCRIPT,
+            attributed_by=f"LearnedRuleSet:{self.version[:12]}",
+            location={"offset": match.start()},
+            evidence=snippet,
+        )
+
+
+class LearnedRuleRegistry:
+    """Compiles, caches and activates learned rule sets for this process."""
+
+    def __init__(
+        self,
+        *,
+        time_budget_ms: float | None = None,
+        max_cached_sets: int = MAX_CACHED_SETS,
+    ) -> None:
+        self._time_budget_ms = time_budget_ms
+        self.max_cached_sets = max_cached_sets
+        self._cache: OrderedDict[str, LearnedRuleSet] = OrderedDict()
+        self._published: dict[str, DraftRule] = {}
+        self._active: LearnedRuleSet | None = None
+        self._compiler = RuleCompiler()
+        self._lock = threading.Lock()
+        # Serializes changes to the published set (compile runs outside _lock)
+        self._publish_lock = threading.Lock()
+
+    @property
+    def time_budget_ms(self) -> float:
+        if self._time_budget_ms is None:
+            return get_settings().PROOFREADING_LEARNED_RULE_TIME_BUDGET_MS
+        return self._time_budget_ms
+
+    @property
+    def active(self) -> LearnedRuleSet | None:
+        """Set the engine should apply, or None (nothing published / disabled)."""
+        active = self._active
+        if active is None or active.disabled:
+            return None
+        return active
+
+    @property
+    def version(self) -> str | None:
+        active = self.active
+        return active.version if active is not None else None
+
+    def compile(
+        self, rules: Iterable[DraftRule], *, reviewed_only: bool = True
+    ) -> LearnedRuleSet:
+        """Compile ``rules`` into a set, reusing a cached one with the same hash."""
+        rules = list(rules)
+        budget = self.time_budget_ms
+        version = ruleset_version(rules, reviewed_only=reviewed_only)
+        return self._cached(
+            f"{version}:{budget:g}",
+            lambda: self._build(version, rules, reviewed_only, budget),
+        )
+
+    def publish(self, rules: Iterable[DraftRule]) -> LearnedRuleSet:
+        """Add ``rules`` to the published set (same rule_id replaces) and activate it."""
+        with self._publish_lock:
+            merged = dict(self._published)
+            for rule in rules:
+                merged[rule.rule_id] = rule
+            return self._activate_published(merged)
+
+    def replace(self, rules: Iterable[DraftRule]) -> LearnedRuleSet:
+        """Make ``rules`` the whole published set (e.g. as stored in the database)."""
+        with self._publish_lock:
+            return self._activate_published({rule.rule_id: rule for rule in rules})
+
+    def _activate_published(self, published: dict[str, DraftRule]) -> LearnedRuleSet:
+        ruleset = self.compile(published.values())
+        self._published = published
+        self.activate(ruleset)
+        return ruleset
+
+    def activate(self, ruleset: LearnedRuleSet | None) -> bool:
+        """Swap ``ruleset`` in; returns False if that version is already active."""
+        current = self._active
+        if ruleset is not None and ruleset.disabled:
+            ruleset.rearm()
+        elif current is not None and ruleset is not None and current.version == ruleset.version:
+            return False
+        self._active = ruleset
+        logger.info(
+            "learned_rules_activated",
+            version=ruleset.version[:12] if ruleset else None,
+            previous_version=current.version[:12] if current else None,
+            rules=len(ruleset) if ruleset else 0,
+            rejected=len(ruleset.rejected) if ruleset else 0,
+        )
+        return True
+
+    def load(self, spec: LearnedRuleSpec | None) -> None:
+        """Activate a set screened by another process (e.g. the API for a rule worker).
+
+        The rules in ``spec`` already passed screening, so they are compiled
+        without the timing probes; each version is compiled once and cached.
+        """
+        if spec is None:
+            if self._active is not None:
+                self.activate(None)
+            return
+        current = self._active
+        if current is not None and current.version == spec.version:
+            return
+        ruleset = self._cached(
+            f"{spec.version}:{spec.time_budget_ms:g}",
+            lambda: self._build(
+                spec.version, list(spec.rules), False, spec.time_budget_ms, screen=False
+            ),
+        )
+        self.activate(ruleset)
+
+    def clear(self) -> None:
+        """Withdraw every published rule."""
+        with self._publish_lock:
+            self._published = {}
+            self.activate(None)
+
+    def _cached(
+        self, cache_key: str, build: Callable[[], LearnedRuleSet]
+    ) -> LearnedRuleSet:
+        with self._lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                return cached
+
+        ruleset = build()
+        with self._lock:
+            self._cache[cache_key] = ruleset
+            while len(self._cache) > self.max_cached_sets:
+                self._cache.popitem(last=False)
+        return ruleset
+
+    def _build(
+        self,
+        version: str,
+        rules: list[DraftRule],
+        reviewed_only: bool,
+        time_budget_ms: float,
+        *,
+        screen: bool = True,
+    ) -> LearnedRuleSet:
+        rejected: list[RejectedRule] = []
+        candidates: list[DraftRule] = []
+        for rule in rules:
+            if not rule.pattern:
+                continue
+            if len(rule.pattern) > MAX_PATTERN_LENGTH:
+                rejected.append(
+                    RejectedRule(rule.rule_id, f"Pattern too long (max {MAX_PATTERN_LENGTH} chars)")
+                )
+                continue
+            try:
+                re.compile(rule.pattern)
+            except re.error as exc:
+                rejected.append(RejectedRule(rule.rule_id, f"Invalid regex pattern: {exc}"))
+                continue
+            candidates.append(rule)
+
+        compiled_rules: list[CompiledRule] = []
+        for compiled in self._compiler.compile_rules(candidates, reviewed_only=reviewed_only):
+            if compiled.pattern is None:
+                continue
+            reason = screen_pattern(compiled.pattern, time_budget_ms) if screen else None
+            if reason is not None:
+                rejected.append(RejectedRule(compiled.rule_id, reason))
+                continue
+            compiled.pattern = _drop_noop_ignorecase(compiled.pattern)
+            compiled_rules.append(compiled)
+
+        if rejected:
+            logger.warning(
+                "learned_rules_rejected",
+                version=version[:12],
+                rejected=[(r.rule_id, r.reason) for r in rejected],
+            )
+        by_id = {rule.rule_id: rule for rule in candidates}
+        return LearnedRuleSet(
+            version=version,
+            rules=compiled_rules,
+            definitions=[by_id[compiled.rule_id] for compiled in compiled_rules],
+            rejected=rejected,
+            time_budget_ms=time_budget_ms,
+        )
+
+
+_registry: LearnedRuleRegistry | None = None
+
+
+def get_learned_rule_registry() -> LearnedRuleRegistry:
+    """Process-wide registry shared by every ``DeterministicRuleEngine``."""
+    global _registry
+    if _registry is None:
+        _registry = LearnedRuleRegistry()
+    return _registry
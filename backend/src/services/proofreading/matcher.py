@@ -0,0 +1,308 @@
+"""Single-pass multi-pattern matching for deterministic proofreading rules.
+
+Most deterministic rules (A1 统一用字, A2 异形词, A3 常见错字, dictionary-backed
+A4/D/E rules) are nothing more than "find every occurrence of pattern X".
+Running one ``finditer`` per rule means hundreds of full passes over the
+article.  ``MultiPatternMatcher`` compiles all of those patterns up-front:
+
+- plain literals go into an Aho-Corasick automaton (one pass, all hits);
+- real regexes are merged into one alternation used to locate candidate
+  positions, where each member pattern is then tried with an anchored match.
+  Each branch carries its pattern's flags as a scoped group (``(?ms:...)``).
+- patterns whose meaning depends on being alone in a regex (backreferences,
+  named groups, conditionals, global inline flags) run their own
+  ``finditer``.
+
+The results are identical to calling ``pattern.finditer(content)`` for each
+pattern individually (same matches, same order), so rules can consume them
+without any behavioural change.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
+
+# Characters that make a pattern more than a plain literal
+_REGEX_META = re.compile(r"[.^$*+?{}\[\]|()]")
+# Constructs that change meaning or fail to compile once several patterns
+# share one alternation: numbered/named backreferences, named groups,
+# conditionals and global inline flags.  An escaped backslash before a digit
+# is a false positive, which only costs a standalone scan.
+_UNMERGEABLE = re.compile(r"\\[1-9]|\(\?P[<=]|\(\?\(|\(\?[aiLmsux]+\)")
+# Flags that can be scoped to one branch of the alternation
+_INLINE_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+    (re.ASCII, "a"),
+)
+
+
+def literal_text(pattern: re.Pattern[str]) -> str | None:
+    """Return the literal string a pattern matches, or None if it is a real regex.
+
+    Patterns built with ``re.escape`` are recognised as literals.  Patterns with
+    flags other than the implicit ``re.UNICODE`` (e.g. IGNORECASE) are treated
+    as regexes so their semantics are preserved exactly.
+    """
+    if pattern.flags & ~re.UNICODE:
+        return None
+    source = pattern.pattern
+    if not source:
+        return None
+
+    chars: list[str] = []
+    index = 0
+    while index < len(source):
+        char = source[index]
+        if char == "\\":
+            if index + 1 >= len(source):
+                return None
+            escaped = source[index + 1]
+            # \d, \s, \b, \1 ... are regex constructs, not escaped literals
+            if escaped.isalnum() and escaped.isascii():
+                return None
+            chars.append(escaped)
+            index += 2
+            continue
+        if _REGEX_META.match(char):
+            return None
+        chars.append(char)
+        index += 1
+    return "".join(chars)
+
+
+def _merged_alternative(pattern: re.Pattern[str]) -> str | None:
+    """``pattern`` as one branch of a merged alternation, or None if it must run alone."""
+    if _UNMERGEABLE.search(pattern.pattern):
+        return None
+    flags = pattern.flags & ~re.UNICODE
+    letters = ""
+    for flag, letter in _INLINE_FLAGS:
+        if flags & flag:
+            letters += letter
+            flags &= ~flag
+    if flags:
+        return None
+    source = pattern.pattern
+    if pattern.flags & re.VERBOSE:
+        # A trailing comment would otherwise swallow the closing parenthesis
+        source += "\n"
+    return f"(?{letters}:{source})"
+
+
+class AhoCorasickAutomaton:
+    """Minimal Aho-Corasick automaton over str keywords.
+
+    ``iter_matches`` yields ``(start, keyword_index)`` for every occurrence of
+    every keyword, including overlapping ones.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self.keywords: list[str] = list(keywords)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[int]] = [[]]
+
+        for keyword_index, keyword in enumerate(self.keywords):
+            if not keyword:
+                raise ValueError("Aho-Corasick keywords must be non-empty")
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(keyword_index)
+
+        self._build_failure_links()
+        # Jump straight to the next possible keyword start while in the root
+        # state, so keyword-free stretches are skipped at C speed.
+        self._first_chars = (
+            re.compile("[" + "".join(re.escape(char) for char in self._goto[0]) + "]")
+            if self._goto[0]
+            else None
+        )
+
+    def _build_failure_links(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                candidate = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = candidate if candidate != next_state else 0
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+    def iter_matches(self, text: str) -> Iterable[tuple[int, int]]:
+        if self._first_chars is None:
+            return
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        keywords = self.keywords
+        first_chars = self._first_chars
+        text_length = len(text)
+        state = 0
+        position = 0
+        while position < text_length:
+            if state == 0:
+                next_start = first_chars.search(text, position)
+                if next_start is None:
+                    return
+                position = next_start.start()
+            char = text[position]
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword_index in output[state]:
+                yield position - len(keywords[keyword_index]) + 1, keyword_index
+            position += 1
+
+
+@dataclass
+class _PatternEntry:
+    pattern: re.Pattern[str]
+    owners: list[Hashable] = field(default_factory=list)
+
+
+class MultiPatternMatcher:
+    """Scan a text once for many compiled patterns and route hits to owners.
+
+    Usage::
+
+        matcher = MultiPatternMatcher()
+        matcher.add(rule_pattern, owner=("A3-005", 0))
+        matcher.compile()
+        hits = matcher.scan(content)   # {owner: [re.Match, ...]}
+    """
+
+    def __init__(self) -> None:
+        self._entries: list[_PatternEntry] = []
+        self._index: dict[tuple[str, int], int] = {}
+        self._automaton: AhoCorasickAutomaton | None = None
+        self._literal_entries: list[int] = []
+        self._regex_entries: list[int] = []
+        self._standalone_entries: list[int] = []
+        self._merged_regex: re.Pattern[str] | None = None
+        self._compiled = False
+
+    def add(self, pattern: re.Pattern[str], owner: Hashable) -> None:
+        """Register a compiled pattern on behalf of ``owner``."""
+        key = (pattern.pattern, pattern.flags)
+        entry_index = self._index.get(key)
+        if entry_index is None:
+            entry_index = len(self._entries)
+            self._index[key] = entry_index
+            self._entries.append(_PatternEntry(pattern=pattern))
+        self._entries[entry_index].owners.append(owner)
+        self._compiled = False
+
+    @property
+    def pattern_count(self) -> int:
+        return len(self._entries)
+
+    def compile(self) -> None:
+        """Build the automaton and the merged alternation."""
+        literals: list[str] = []
+        alternatives: list[str] = []
+        self._literal_entries = []
+        self._regex_entries = []
+        self._standalone_entries = []
+        for entry_index, entry in enumerate(self._entries):
+            literal = literal_text(entry.pattern)
+            if literal is not None:
+                self._literal_entries.append(entry_index)
+                literals.append(literal)
+                continue
+            alternative = _merged_alternative(entry.pattern)
+            if alternative is None:
+                self._standalone_entries.append(entry_index)
+            else:
+                self._regex_entries.append(entry_index)
+                alternatives.append(alternative)
+
+        self._automaton = AhoCorasickAutomaton(literals) if literals else None
+        self._merged_regex = re.compile("|".join(alternatives)) if alternatives else None
+        self._compiled = True
+
+    def scan(self, text: str) -> dict[Hashable, list[re.Match[str]]]:
+        """Return ``{owner: matches}`` equivalent to per-pattern ``finditer``."""
+        if not self._compiled:
+            self.compile()
+
+        matches_by_entry: dict[int, list[re.Match[str]]] = {}
+        self._scan_literals(text, matches_by_entry)
+        self._scan_regexes(text, matches_by_entry)
+        for entry_index in self._standalone_entries:
+            matches = list(self._entries[entry_index].pattern.finditer(text))
+            if matches:
+                matches_by_entry[entry_index] = matches
+
+        hits: dict[Hashable, list[re.Match[str]]] = {}
+        for entry_index, matches in matches_by_entry.items():
+            for owner in self._entries[entry_index].owners:
+                hits[owner] = matches
+        return hits
+
+    def _scan_literals(
+        self, text: str, matches_by_entry: dict[int, list[re.Match[str]]]
+    ) -> None:
+        if self._automaton is None:
+            return
+        # Collect raw (possibly overlapping) hits, then apply finditer's
+        # leftmost non-overlapping semantics per keyword.
+        starts: dict[int, list[int]] = {}
+        for start, keyword_index in self._automaton.iter_matches(text):
+            starts.setdefault(keyword_index, []).append(start)
+
+        for keyword_index, positions in starts.items():
+            entry_index = self._literal_entries[keyword_index]
+            pattern = self._entries[entry_index].pattern
+            length = len(self._automaton.keywords[keyword_index])
+            matches: list[re.Match[str]] = []
+            last_end = -1
+            for start in sorted(positions):
+                if start < last_end:
+                    continue
+                match = pattern.match(text, start)
+                if match is not None:
+                    matches.append(match)
+                    last_end = start + length
+            if matches:
+                matches_by_entry[entry_index] = matches
+
+    def _scan_regexes(
+        self, text: str, matches_by_entry: dict[int, list[re.Match[str]]]
+    ) -> None:
+        if self._merged_regex is None:
+            return
+        next_allowed = dict.fromkeys(self._regex_entries, 0)
+        position = 0
+        text_length = len(text)
+        while position <= text_length:
+            candidate = self._merged_regex.search(text, position)
+            if candidate is None:
+                break
+            start = candidate.start()
+            for entry_index in self._regex_entries:
+                if start < next_allowed[entry_index]:
+                    continue
+                match = self._entries[entry_index].pattern.match(text, start)
+                if match is None:
+                    continue
+                matches_by_entry.setdefault(entry_index, []).append(match)
+                # finditer resumes at match end (one past it for empty matches)
+                next_allowed[entry_index] = max(match.end(), start + 1)
+            position = start + 1
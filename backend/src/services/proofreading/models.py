@@ -221,6 +221,12 @@ class ProcessingMetadata(BaseModel):
     prompt_tokens: int | None = Field(default=None)
     completion_tokens: int | None = Field(default=None)
     total_tokens: int | None = Field(default=None)
+    cache_creation_input_tokens: int | None = Field(
+        default=None, description="Prompt tokens written to the Anthropic prompt cache"
+    )
+    cache_read_input_tokens: int | None = Field(
+        default=None, description="Prompt tokens served from the Anthropic prompt cache"
+    )
     prompt_hash: str | None = Field(
         default=None, description="Hash of prompt for regression tracking"
     )
@@ -0,0 +1,349 @@
+"""Content-addressed cache of proofreading results.
+
+Re-proofreading an article whose body has not changed (worklist retries,
+``/articles/{id}/proofread`` re-runs) produces the same AI prompt and the same
+deterministic rule hits, so the stored ``ProofreadingResult`` can be reused.
+
+The cache key covers everything that can change the outcome:
+
+- SHA256 of the normalized ``ArticlePayload`` (canonical JSON, ``article_id``
+  excluded — it only matters where the prompt itself embeds it);
+- ``prompt_hash`` (mode, focus categories, prompt template);
+- ``RuleManifest.fingerprint`` and ``DeterministicRuleEngine.version`` (includes the learned rule set);
+- the AI model and analysis mode.
+
+Two tiers are consulted in order: a per-process LRU (``InMemoryResultCache``)
+and the ``proofreading_result_cache`` table (``DatabaseResultCache``).  Both
+expire entries after a TTL.  Database errors are logged and treated as a
+miss — the cache must never make proofreading fail.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from hashlib import sha256
+from typing import Any
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import get_logger, get_settings
+from src.models.proofreading_result_cache import ProofreadingResultCacheEntry
+from src.services.proofreading.models import ArticlePayload, ProofreadingResult
+
+logger = get_logger(__name__)
+
+
+def hash_payload(payload: ArticlePayload) -> str:
+    """SHA256 of the payload in canonical JSON form (``article_id`` excluded)."""
+    normalized = json.dumps(
+        payload.model_dump(mode="json", exclude={"article_id"}),
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def build_cache_key(
+    payload: ArticlePayload,
+    *,
+    mode: str,
+    prompt_hash: str | None,
+    manifest_fingerprint: str,
+    engine_version: str,
+    model: str | None,
+) -> str:
+    """Return the content address for a proofreading run."""
+    parts = [
+        hash_payload(payload),
+        mode,
+        prompt_hash or "",
+        manifest_fingerprint,
+        engine_version,
+        model or "",
+    ]
+    return sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheRecord:
+    """A stored result plus the inputs that produced it."""
+
+    key: str
+    result: dict[str, Any]
+    analysis_mode: str
+    prompt_hash: str | None
+    manifest_fingerprint: str
+    engine_version: str
+    article_id: int | None = None
+    stored_at: datetime | None = None
+    hit_count: int = 0
+
+
+@dataclass
+class CacheHit:
+    """Result returned from a cache lookup."""
+
+    result: ProofreadingResult
+    tier: str
+    stored_at: datetime | None
+    hit_count: int
+
+
+class InMemoryResultCache:
+    """Per-process LRU with TTL."""
+
+    tier = "memory"
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        # key -> (expires_at on self._clock, record)
+        self._entries: OrderedDict[str, tuple[float, CacheRecord]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> CacheRecord | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, record = entry
+        if self._clock() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        record.hit_count += 1
+        return record
+
+    async def set(self, record: CacheRecord) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[record.key] = (self._clock() + self.ttl_seconds, record)
+        self._entries.move_to_end(record.key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class DatabaseResultCache:
+    """``proofreading_result_cache`` table backend.
+
+    TTL is enforced on read via ``expires_at``.  Every ``prune_every`` writes
+    the table is pruned: expired rows are deleted, then the least recently
+    accessed rows beyond ``max_entries``.
+    """
+
+    tier = "database"
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        *,
+        ttl_seconds: int,
+        max_entries: int,
+        prune_every: int = 100,
+    ) -> None:
+        self._session_factory = session_factory
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.prune_every = prune_every
+        self._writes_since_prune = 0
+
+    def _sessions(self) -> async_sessionmaker[AsyncSession]:
+        if self._session_factory is None:
+            from src.config.database import get_db_config
+
+            self._session_factory = get_db_config().get_session_factory()
+        return self._session_factory
+
+    async def get(self, key: str) -> CacheRecord | None:
+        now = datetime.now(UTC)
+        try:
+            async with self._sessions()() as session:
+                row = await session.scalar(
+                    select(ProofreadingResultCacheEntry).where(
+                        ProofreadingResultCacheEntry.cache_key == key,
+                        ProofreadingResultCacheEntry.expires_at > now,
+                    )
+                )
+                if row is None:
+                    return None
+                await session.execute(
+                    update(ProofreadingResultCacheEntry)
+                    .where(ProofreadingResultCacheEntry.cache_key == key)
+                    .values(
+                        hit_count=ProofreadingResultCacheEntry.hit_count + 1,
+                        last_accessed_at=now,
+                    )
+                )
+                await session.commit()
+                return CacheRecord(
+                    key=row.cache_key,
+                    result=row.result,
+                    analysis_mode=row.analysis_mode,
+                    prompt_hash=row.prompt_hash,
+                    manifest_fingerprint=row.manifest_fingerprint,
+                    engine_version=row.engine_version,
+                    article_id=row.article_id,
+                    stored_at=row.created_at,
+                    hit_count=row.hit_count + 1,
+                )
+        except Exception as exc:  # noqa: BLE001 - cache failures degrade to a miss
+            logger.warning("proofreading_cache_db_get_failed", error=str(exc))
+            return None
+
+    async def set(self, record: CacheRecord) -> None:
+        now = datetime.now(UTC)
+        values = {
+            "cache_key": record.key,
+            "article_id": record.article_id,
+            "analysis_mode": record.analysis_mode,
+            "prompt_hash": record.prompt_hash,
+            "manifest_fingerprint": record.manifest_fingerprint,
+            "engine_version": record.engine_version,
+            "result": record.result,
+            "hit_count": 0,
+            "created_at": now,
+            "last_accessed_at": now,
+            "expires_at": now + timedelta(seconds=self.ttl_seconds),
+        }
+        stmt = insert(ProofreadingResultCacheEntry).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ProofreadingResultCacheEntry.cache_key],
+            set_={
+                "result": stmt.excluded.result,
+                "article_id": stmt.excluded.article_id,
+                "created_at": stmt.excluded.created_at,
+                "last_accessed_at": stmt.excluded.last_accessed_at,
+                "expires_at": stmt.excluded.expires_at,
+            },
+        )
+        try:
+            async with self._sessions()() as session:
+                await session.execute(stmt)
+                await session.commit()
+        except Exception as exc:  # noqa: BLE001 - cache failures must not fail proofreading
+            logger.warning("proofreading_cache_db_set_failed", error=str(exc))
+            return
+
+        self._writes_since_prune += 1
+        if self._writes_since_prune >= self.prune_every:
+            self._writes_since_prune = 0
+            await self.prune()
+
+    async def prune(self) -> int:
+        """Delete expired rows and trim to ``max_entries`` by last access."""
+        now = datetime.now(UTC)
+        removed = 0
+        try:
+            async with self._sessions()() as session:
+                expired = await session.execute(
+                    delete(ProofreadingResultCacheEntry).where(
+                        ProofreadingResultCacheEntry.expires_at <= now
+                    )
+                )
+                removed += expired.rowcount or 0
+
+                overflow_keys = (
+                    select(ProofreadingResultCacheEntry.cache_key)
+                    .order_by(ProofreadingResultCacheEntry.last_accessed_at.desc())
+                    .offset(self.max_entries)
+                    .scalar_subquery()
+                )
+                overflow = await session.execute(
+                    delete(ProofreadingResultCacheEntry).where(
+                        ProofreadingResultCacheEntry.cache_key.in_(overflow_keys)
+                    )
+                )
+                removed += overflow.rowcount or 0
+                await session.commit()
+        except Exception as exc:  # noqa: BLE001 - pruning is best effort
+            logger.warning("proofreading_cache_db_prune_failed", error=str(exc))
+            return 0
+
+        if removed:
+            logger.info("proofreading_cache_pruned", removed=removed)
+        return removed
+
+
+class ProofreadingResultCache:
+    """Two-tier (memory → database) proofreading result cache."""
+
+    def __init__(
+        self,
+        *,
+        memory: InMemoryResultCache | None = None,
+        database: DatabaseResultCache | None = None,
+    ) -> None:
+        self.memory = memory
+        self.database = database
+
+    @classmethod
+    def from_settings(cls) -> ProofreadingResultCache | None:
+        """Build the cache configured by ``PROOFREADING_CACHE_*`` settings."""
+        settings = get_settings()
+        if not settings.PROOFREADING_CACHE_ENABLED:
+            return None
+        ttl = settings.PROOFREADING_CACHE_TTL_SECONDS
+        memory = (
+            InMemoryResultCache(
+                max_entries=settings.PROOFREADING_CACHE_MEMORY_MAX_ENTRIES,
+                ttl_seconds=ttl,
+            )
+            if settings.PROOFREADING_CACHE_MEMORY_MAX_ENTRIES > 0
+            else None
+        )
+        database = (
+            DatabaseResultCache(
+                ttl_seconds=ttl,
+                max_entries=settings.PROOFREADING_CACHE_DB_MAX_ENTRIES,
+            )
+            if settings.PROOFREADING_CACHE_DB_MAX_ENTRIES > 0
+            else None
+        )
+        if memory is None and database is None:
+            return None
+        return cls(memory=memory, database=database)
+
+    async def get(self, key: str) -> CacheHit | None:
+        """Return a fresh copy of the cached result, or None on miss."""
+        record = await self.memory.get(key) if self.memory else None
+        tier = "memory"
+        if record is None and self.database is not None:
+            record = await self.database.get(key)
+            tier = "database"
+            if record is not None and self.memory is not None:
+                await self.memory.set(record)
+        if record is None:
+            return None
+        return CacheHit(
+            result=ProofreadingResult.model_validate(record.result),
+            tier=tier,
+            stored_at=record.stored_at,
+            hit_count=record.hit_count,
+        )
+
+    async def set(self, record: CacheRecord) -> None:
+        if record.stored_at is None:
+            record.stored_at = datetime.now(UTC)
+        if self.memory is not None:
+            await self.memory.set(record)
+        if self.database is not None:
+            await self.database.set(record)
@@ -0,0 +1,263 @@
+"""Execution backends for the deterministic rule engine.
+
+``DeterministicRuleEngine.run`` is pure-Python CPU work, so calling it from a
+coroutine stalls every other request on the event loop.  The service awaits a
+``RuleExecutor`` instead:
+
+- ``ThreadRuleExecutor`` (``PROOFREADING_RULE_WORKERS=0``, the default) runs
+  the engine in a worker thread.  The loop keeps serving requests, but rule
+  evaluation still shares the GIL with the API.
+- ``ProcessPoolRuleExecutor`` runs the engine in a pre-warmed
+  ``ProcessPoolExecutor``.  Each worker builds one engine in its initializer
+  (every rule plus the shared matcher compiled once) and reuses it for every
+  dispatch.  ``run_batch`` sends articles in chunks of
+  ``PROOFREADING_RULE_BATCH_SIZE``, so proofreading a corpus scales with the
+  cores available while API latency stays flat.
+
+Payloads and issues are pydantic models and cross the process boundary by
+pickling.  Learned rules live in the API process: every dispatch carries the
+active ``LearnedRuleSpec``, and a worker compiles each version once and keeps
+it cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+
+from src.config import get_logger, get_settings
+from src.services.proofreading.deterministic_engine import (
+    DeterministicRuleEngine,
+    EngineState,
+    RuleScope,
+)
+from src.services.proofreading.learned_rules import LearnedRuleRegistry, LearnedRuleSpec
+from src.services.proofreading.models import ArticlePayload, ProofreadingIssue
+
+logger = get_logger(__name__)
+
+
+class RuleExecutor(ABC):
+    """Runs ``DeterministicRuleEngine`` without blocking the event loop.
+
+    ``state`` (from ``engine.state()``) pins the learned rule set of a
+    dispatch; callers that key caches on the engine version take the state
+    first and pass it in, so the key and the issues always agree.
+    """
+
+    def __init__(self, engine: DeterministicRuleEngine | None = None) -> None:
+        # Parent-side engine: source of the version and the learned rule set
+        self.engine = engine or DeterministicRuleEngine()
+
+    @property
+    def version(self) -> str:
+        return self.engine.version
+
+    async def start(self) -> None:
+        """Prepare the backend ahead of the first request (no-op by default)."""
+        return None
+
+    async def close(self) -> None:
+        """Release the backend's resources (no-op by default)."""
+        return None
+
+    async def run(
+        self,
+        payload: ArticlePayload,
+        *,
+        scope: RuleScope | None = None,
+        state: EngineState | None = None,
+    ) -> list[ProofreadingIssue]:
+        """Issues for one article, as ``DeterministicRuleEngine.run`` returns them."""
+        [issues] = await self.run_batch([payload], scope=scope, state=state)
+        return issues
+
+    @abstractmethod
+    async def run_batch(
+        self,
+        payloads: Sequence[ArticlePayload],
+        *,
+        scope: RuleScope | None = None,
+        state: EngineState | None = None,
+    ) -> list[list[ProofreadingIssue]]:
+        """Issues for each article, in the order of ``payloads``."""
+
+
+class ThreadRuleExecutor(RuleExecutor):
+    """Runs the engine in a worker thread of the API process."""
+
+    async def run_batch(
+        self,
+        payloads: Sequence[ArticlePayload],
+        *,
+        scope: RuleScope | None = None,
+        state: EngineState | None = None,
+    ) -> list[list[ProofreadingIssue]]:
+        if not payloads:
+            return []
+        return await asyncio.to_thread(
+            _run_payloads, self.engine, list(payloads), scope, state or self.engine.state()
+        )
+
+
+class ProcessPoolRuleExecutor(RuleExecutor):
+    """Runs the engine in a pool of worker processes, each with its own compiled engine."""
+
+    def __init__(
+        self,
+        engine: DeterministicRuleEngine | None = None,
+        *,
+        max_workers: int,
+        batch_size: int = 16,
+    ) -> None:
+        super().__init__(engine)
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self._pool: ProcessPoolExecutor | None = None
+        self._start_lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        """Spawn the workers and wait until each has compiled its engine."""
+        async with self._start_lock:
+            if self._pool is not None:
+                return
+            # spawn: forking a process that runs an event loop and threads is unsafe
+            pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=get_context("spawn"),
+                initializer=_init_worker,
+            )
+            loop = asyncio.get_running_loop()
+            try:
+                pids = await asyncio.gather(
+                    *(loop.run_in_executor(pool, _warm_worker) for _ in range(self.max_workers))
+                )
+            except BaseException:
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+            self._pool = pool
+            logger.info(
+                "rule_worker_pool_started",
+                workers=self.max_workers,
+                warmed=len(set(pids)),
+                batch_size=self.batch_size,
+            )
+
+    async def close(self) -> None:
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            await asyncio.to_thread(pool.shutdown, True, cancel_futures=True)
+            logger.info("rule_worker_pool_stopped", workers=self.max_workers)
+
+    async def run_batch(
+        self,
+        payloads: Sequence[ArticlePayload],
+        *,
+        scope: RuleScope | None = None,
+        state: EngineState | None = None,
+    ) -> list[list[ProofreadingIssue]]:
+        if not payloads:
+            return []
+        # One learned rule set for every chunk, and the retry, of this batch
+        state = state or self.engine.state()
+        try:
+            return await self._dispatch(payloads, scope, state)
+        except BrokenProcessPool:
+            # A worker died (OOM, signal); replace the pool and retry once
+            logger.warning("rule_worker_pool_broken", workers=self.max_workers)
+            pool, self._pool = self._pool, None
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+            return await self._dispatch(payloads, scope, state)
+
+    async def _dispatch(
+        self,
+        payloads: Sequence[ArticlePayload],
+        scope: RuleScope | None,
+        state: EngineState,
+    ) -> list[list[ProofreadingIssue]]:
+        await self.start()
+        assert self._pool is not None
+        spec = state.learned.spec if state.learned is not None else None
+        loop = asyncio.get_running_loop()
+        chunks = [
+            list(payloads[start:start + self.batch_size])
+            for start in range(0, len(payloads), self.batch_size)
+        ]
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(self._pool, _run_chunk, chunk, scope, spec)
+                for chunk in chunks
+            )
+        )
+        return [issues for chunk_issues in results for issues in chunk_issues]
+
+
+def _run_payloads(
+    engine: DeterministicRuleEngine,
+    payloads: list[ArticlePayload],
+    scope: RuleScope | None,
+    state: EngineState | None = None,
+) -> list[list[ProofreadingIssue]]:
+    return [engine.run(payload, scope=scope, state=state) for payload in payloads]
+
+
+# ---------------------------------------------------------------------------
+# Worker process side
+# ---------------------------------------------------------------------------
+
+_worker_engine: DeterministicRuleEngine | None = None
+
+
+def _init_worker() -> None:
+    """Build and compile this worker's engine once."""
+    global _worker_engine
+    _worker_engine = DeterministicRuleEngine(learned_rules=LearnedRuleRegistry())
+    _worker_engine._get_matcher()
+
+
+def _warm_worker() -> int:
+    return os.getpid()
+
+
+def _run_chunk(
+    payloads: list[ArticlePayload],
+    scope: RuleScope | None,
+    learned: LearnedRuleSpec | None,
+) -> list[list[ProofreadingIssue]]:
+    if _worker_engine is None:
+        _init_worker()
+    assert _worker_engine is not None
+    _worker_engine.learned_rules.load(learned)
+    return _run_payloads(_worker_engine, payloads, scope)
+
+
+_executor: RuleExecutor | None = None
+
+
+def get_rule_executor() -> RuleExecutor:
+    """Process-wide rule executor configured from settings."""
+    global _executor
+    if _executor is None:
+        settings = get_settings()
+        if settings.PROOFREADING_RULE_WORKERS > 0:
+            _executor = ProcessPoolRuleExecutor(
+                max_workers=settings.PROOFREADING_RULE_WORKERS,
+                batch_size=settings.PROOFREADING_RULE_BATCH_SIZE,
+            )
+        else:
+            _executor = ThreadRuleExecutor()
+    return _executor
+
+
+async def close_rule_executor() -> None:
+    """Shut down the process-wide executor if it was ever created."""
+    global _executor
+    if _executor is not None:
+        await _executor.close()
+        _executor = None
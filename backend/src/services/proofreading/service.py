@@ -23,7 +23,15 @@ from src.services.proofreading.ai_prompt_builder import (
     load_default_manifest,
     load_full_manifest,
 )
-from src.services.proofreading.deterministic_engine import DeterministicRuleEngine
+from src.services.proofreading.deterministic_engine import EngineState, RuleScope
+from src.services.proofreading.incremental import (
+    IncrementalSnapshot,
+    ParagraphRecord,
+    ParagraphSegment,
+    attribute_ai_issues,
+    shift_issue,
+    split_paragraphs,
+)
 from src.services.proofreading.merger import ProofreadingResultMerger
 from src.services.proofreading.models import (
     ArticlePayload,
@@ -32,6 +40,13 @@ from src.services.proofreading.models import (
     ProofreadingResult,
     RuleSource,
 )
+from src.services.proofreading.result_cache import (
+    CacheHit,
+    CacheRecord,
+    ProofreadingResultCache,
+    build_cache_key,
+)
+from src.services.proofreading.rule_executor import RuleExecutor, get_rule_executor
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -65,6 +80,8 @@ class ProofreadingAnalysisService:
         manifest: RuleManifest | None = None,
         use_full_catalog: bool = True,
         max_rules_in_prompt: int | None = None,
+        result_cache: ProofreadingResultCache | None = None,
+        rule_executor: RuleExecutor | None = None,
     ) -> None:
         """Initialize the proofreading service.
 
@@ -73,6 +90,10 @@ class ProofreadingAnalysisService:
             manifest: Custom rule manifest (optional)
             use_full_catalog: Whether to use the full 405-rule catalog
             max_rules_in_prompt: Limit rules in prompt for token optimization
+            result_cache: Result cache (optional, defaults to the one
+                configured by ``PROOFREADING_CACHE_*`` settings)
+            rule_executor: Backend running the deterministic rules (optional,
+                defaults to the one configured by ``PROOFREADING_RULE_*`` settings)
         """
         # Load manifest - prefer full catalog if requested
         if manifest:
@@ -102,21 +123,34 @@ class ProofreadingAnalysisService:
             api_key=settings.ANTHROPIC_API_KEY
         )
         self.model = settings.ANTHROPIC_MODEL
-        self.rule_engine = DeterministicRuleEngine()
+        self.rule_executor = rule_executor or get_rule_executor()
+        self.rule_engine = self.rule_executor.engine
         self.merger = ProofreadingResultMerger()
+        self.manifest_fingerprint = self.prompt_builder.manifest_fingerprint
+        self.result_cache = (
+            result_cache
+            if result_cache is not None
+            else ProofreadingResultCache.from_settings()
+        )
 
     async def analyze_article(
         self,
         payload: ArticlePayload,
         mode: AnalysisMode = AnalysisMode.FULL,
         focus_categories: list[str] | None = None,
+        use_cache: bool = True,
     ) -> ProofreadingResult:
         """Run analysis pipeline returning merged result.
 
+        Results of AI-backed modes are cached by content address (payload,
+        prompt, rule manifest and engine versions); ``processing_metadata.notes
+        ["cache"]`` reports whether this call was a hit or a miss.
+
         Args:
             payload: Article data to analyze
             mode: Analysis mode (full, quick, seo_only, deterministic_only)
             focus_categories: Categories to focus on for quick mode (e.g., ["E", "F"])
+            use_cache: Set False to force a fresh analysis (result is still stored)
 
         Returns:
             ProofreadingResult with issues, suggestions, and metadata
@@ -125,16 +159,25 @@ class ProofreadingAnalysisService:
         if mode == AnalysisMode.DETERMINISTIC_ONLY:
             return await self._run_deterministic_only(payload)
 
-        # Build appropriate prompt based on mode
-        if mode == AnalysisMode.SEO_ONLY:
-            prompt = self.prompt_builder.build_seo_only_prompt(payload)
-        elif mode == AnalysisMode.QUICK:
-            prompt = self.prompt_builder.build_quick_check_prompt(
-                payload, focus_categories or ["E", "F"]
-            )
-        else:
-            prompt = self.prompt_builder.build_prompt(payload)
+        prompt = self._build_prompt(payload, mode, focus_categories)
         prompt_hash = self._hash_prompt(prompt)
+        # The cache key and the rule run must see the same learned rules
+        engine_state = self.rule_engine.state()
+
+        cache_key: str | None = None
+        if self.result_cache is not None:
+            cache_key = build_cache_key(
+                payload,
+                mode=mode.value,
+                prompt_hash=prompt_hash,
+                manifest_fingerprint=self.manifest_fingerprint,
+                engine_version=engine_state.version,
+                model=self.model,
+            )
+            if use_cache:
+                cached = await self.result_cache.get(cache_key)
+                if cached is not None:
+                    return self._with_cache_hit(payload, mode, cache_key, cached)
 
         logger.info(
             "proofreading_analysis_started",
@@ -146,31 +189,53 @@ class ProofreadingAnalysisService:
             prompt_hash=prompt_hash,
         )
 
-        start_time = time.perf_counter()
-        ai_response = await self._call_ai(prompt)
-        latency_ms = int((time.perf_counter() - start_time) * 1000)
-
-        ai_result = self._parse_ai_result(ai_response)
-        ai_result.article_id = payload.article_id
-        ai_result.processing_metadata.prompt_hash = prompt_hash
-        ai_result.processing_metadata.ai_model = self.model
-        ai_result.processing_metadata.ai_latency_ms = latency_ms
-        ai_result.processing_metadata.rule_manifest_version = self.manifest.version
+        ai_result = await self._run_ai(payload, prompt, prompt_hash)
 
         # For SEO-only mode, skip deterministic checks
         if mode == AnalysisMode.SEO_ONLY:
             ai_result.processing_metadata.notes["analysis_mode"] = "seo_only"
             ai_result.processing_metadata.notes["service_version"] = self.VERSION
+            await self._store_in_cache(
+                payload, mode, cache_key, ai_result, use_cache, engine_state
+            )
             return ai_result
 
-        # Deterministic scripts
-        script_issues = self.rule_engine.run(payload)
+        merged_result = await self._merge_with_rules(payload, mode, ai_result, engine_state)
+        await self._store_in_cache(
+            payload, mode, cache_key, merged_result, use_cache, engine_state
+        )
+        return merged_result
+
+    def build_batch_request(self, payload: ArticlePayload) -> dict[str, Any]:
+        """Messages API parameters for a full analysis inside a message batch."""
+        return self._request_params(self._build_prompt(payload, AnalysisMode.FULL))
+
+    async def complete_batch_result(
+        self, payload: ArticlePayload, message: Any
+    ) -> ProofreadingResult:
+        """Turn a message-batch answer into the result ``analyze_article`` returns."""
+        prompt = self._build_prompt(payload, AnalysisMode.FULL)
+        ai_result = self._parse_ai_result(self._read_message(message))
+        ai_result.article_id = payload.article_id
+        ai_result.processing_metadata.prompt_hash = self._hash_prompt(prompt)
+        ai_result.processing_metadata.ai_model = getattr(message, "model", None) or self.model
+        ai_result.processing_metadata.rule_manifest_version = self.manifest.version
+        ai_result.processing_metadata.notes["message_batch"] = True
+        return await self._merge_with_rules(payload, AnalysisMode.FULL, ai_result)
+
+    async def _merge_with_rules(
+        self,
+        payload: ArticlePayload,
+        mode: AnalysisMode,
+        ai_result: ProofreadingResult,
+        engine_state: EngineState | None = None,
+    ) -> ProofreadingResult:
+        """Run the deterministic scripts and merge them into ``ai_result``."""
+        engine_state = engine_state or self.rule_engine.state()
+        script_issues = await self.rule_executor.run(payload, state=engine_state)
 
-        # Merge results
         merged_result = self.merger.merge(ai_result, script_issues)
-        merged_result.processing_metadata.script_engine_version = (
-            self.rule_engine.VERSION
-        )
+        merged_result.processing_metadata.script_engine_version = engine_state.version
         merged_result.processing_metadata.notes.setdefault(
             "script_issue_count", len(script_issues)
         )
@@ -186,11 +251,242 @@ class ProofreadingAnalysisService:
             blocking=len(merged_result.blocking_issues),
             ai_issues=len(ai_result.issues),
             script_issues=len(script_issues),
-            latency_ms=latency_ms,
+            latency_ms=ai_result.processing_metadata.ai_latency_ms,
         )
-
         return merged_result
 
+    def _with_cache_hit(
+        self,
+        payload: ArticlePayload,
+        mode: AnalysisMode,
+        cache_key: str,
+        cached: CacheHit,
+    ) -> ProofreadingResult:
+        """Re-target a cached result at this payload and tag it as a hit."""
+        result = cached.result
+        result.article_id = payload.article_id
+        result.processing_metadata.notes["cache"] = {
+            "status": "hit",
+            "tier": cached.tier,
+            "key": cache_key,
+            "stored_at": cached.stored_at.isoformat() if cached.stored_at else None,
+            "hit_count": cached.hit_count,
+        }
+        logger.info(
+            "proofreading_cache_hit",
+            article_id=payload.article_id,
+            mode=mode.value,
+            tier=cached.tier,
+            cache_key=cache_key[:16],
+            issues=len(result.issues),
+        )
+        return result
+
+    async def _store_in_cache(
+        self,
+        payload: ArticlePayload,
+        mode: AnalysisMode,
+        cache_key: str | None,
+        result: ProofreadingResult,
+        use_cache: bool,
+        engine_state: EngineState,
+    ) -> None:
+        """Store a fresh result and tag it as a cache miss (or bypass)."""
+        if self.result_cache is None or cache_key is None:
+            return
+        await self.result_cache.set(
+            CacheRecord(
+                key=cache_key,
+                result=result.model_dump(mode="json"),
+                analysis_mode=mode.value,
+                prompt_hash=result.processing_metadata.prompt_hash,
+                manifest_fingerprint=self.manifest_fingerprint,
+                engine_version=engine_state.version,
+                article_id=payload.article_id,
+            )
+        )
+        result.processing_metadata.notes["cache"] = {
+            "status": "miss" if use_cache else "bypass",
+            "key": cache_key,
+        }
+
+    def _build_prompt(
+        self,
+        payload: ArticlePayload,
+        mode: AnalysisMode,
+        focus_categories: list[str] | None = None,
+    ) -> dict[str, str]:
+        """Build the prompt appropriate for ``mode``."""
+        if mode == AnalysisMode.SEO_ONLY:
+            return self.prompt_builder.build_seo_only_prompt(payload)
+        if mode == AnalysisMode.QUICK:
+            return self.prompt_builder.build_quick_check_prompt(
+                payload, focus_categories or ["E", "F"]
+            )
+        return self.prompt_builder.build_prompt(payload)
+
+    async def _run_ai(
+        self, payload: ArticlePayload, prompt: dict[str, str], prompt_hash: str
+    ) -> ProofreadingResult:
+        """Call the model and parse its answer into a ProofreadingResult."""
+        start_time = time.perf_counter()
+        ai_response = await self._call_ai(prompt)
+        latency_ms = int((time.perf_counter() - start_time) * 1000)
+
+        ai_result = self._parse_ai_result(ai_response)
+        ai_result.article_id = payload.article_id
+        ai_result.processing_metadata.prompt_hash = prompt_hash
+        ai_result.processing_metadata.ai_model = self.model
+        ai_result.processing_metadata.ai_latency_ms = latency_ms
+        ai_result.processing_metadata.rule_manifest_version = self.manifest.version
+        return ai_result
+
+    async def analyze_article_incremental(
+        self,
+        payload: ArticlePayload,
+        snapshot: IncrementalSnapshot | None = None,
+        *,
+        mode: AnalysisMode = AnalysisMode.FULL,
+        focus_categories: list[str] | None = None,
+    ) -> tuple[ProofreadingResult, IncrementalSnapshot]:
+        """Re-proofread only the paragraphs that changed since ``snapshot``.
+
+        Paragraph-scoped rules and the AI only see new or edited paragraphs;
+        stored issues of unchanged paragraphs are shifted to their new
+        offsets.  Document-scoped rules (length, structure, SEO fields) are
+        re-run on the whole article.  Without a compatible snapshot every
+        paragraph counts as changed.
+
+        Returns:
+            The merged result and the snapshot to pass to the next call.
+        """
+        if mode == AnalysisMode.SEO_ONLY:
+            raise ValueError("SEO-only analysis has no paragraph-level state")
+
+        segments = split_paragraphs(payload.original_content)
+        engine_state = self.rule_engine.state()
+        if snapshot is not None and not snapshot.is_compatible(
+            analysis_mode=mode.value,
+            engine_version=engine_state.version,
+            manifest_fingerprint=self.manifest_fingerprint,
+            ai_model=self.model,
+        ):
+            snapshot = None
+        previous = snapshot.records_by_digest() if snapshot else {}
+
+        start_time = time.perf_counter()
+        records: dict[str, ParagraphRecord] = {}
+        changed: list[ParagraphSegment] = []
+        for segment in segments:
+            if segment.digest in records:
+                continue
+            record = previous.get(segment.digest)
+            if record is None:
+                record = ParagraphRecord(digest=segment.digest)
+                changed.append(segment)
+            records[segment.digest] = record
+
+        # Paragraph rules for every new/edited paragraph in one batch dispatch
+        paragraph_issues = await self.rule_executor.run_batch(
+            [
+                payload.model_copy(update={"original_content": segment.text})
+                for segment in changed
+            ],
+            scope=RuleScope.PARAGRAPH,
+            state=engine_state,
+        )
+        for segment, issues in zip(changed, paragraph_issues, strict=True):
+            records[segment.digest].script_issues = issues
+
+        document_ai_issues = list(snapshot.document_ai_issues) if snapshot else []
+        seo_metadata = snapshot.seo_metadata if snapshot else None
+        suggested_content: str | None = None
+        ai_metadata = ProcessingMetadata()
+        if mode != AnalysisMode.DETERMINISTIC_ONLY and changed:
+            full_run = len(changed) == len(records)
+            ai_payload = payload if full_run else payload.model_copy(
+                update={"original_content": "".join(seg.text for seg in changed)}
+            )
+            prompt = self._build_prompt(ai_payload, mode, focus_categories)
+            ai_result = await self._run_ai(ai_payload, prompt, self._hash_prompt(prompt))
+            # AI offsets are relative to the text it saw: the article on a
+            # full run, the changed paragraphs back to back otherwise
+            if full_run:
+                by_digest, unattributed = attribute_ai_issues(
+                    ai_result.issues, segments, [seg.start for seg in segments]
+                )
+            else:
+                by_digest, unattributed = attribute_ai_issues(ai_result.issues, changed)
+            for digest, issues in by_digest.items():
+                records[digest].ai_issues = issues
+            document_ai_issues = unattributed
+            seo_metadata = ai_result.seo_metadata or seo_metadata
+            # A rewrite of only the edited paragraphs is not a full suggestion
+            suggested_content = ai_result.suggested_content if full_run else None
+            ai_metadata = ai_result.processing_metadata
+
+        ai_issues: list[ProofreadingIssue] = []
+        script_issues: list[ProofreadingIssue] = []
+        for segment in segments:
+            record = records[segment.digest]
+            ai_issues.extend(shift_issue(issue, segment.start) for issue in record.ai_issues)
+            script_issues.extend(
+                shift_issue(issue, segment.start) for issue in record.script_issues
+            )
+        ai_issues.extend(issue.model_copy(deep=True) for issue in document_ai_issues)
+        script_issues.extend(
+            await self.rule_executor.run(
+                payload, scope=RuleScope.DOCUMENT, state=engine_state
+            )
+        )
+
+        result = self.merger.merge(
+            ProofreadingResult(
+                article_id=payload.article_id,
+                issues=ai_issues,
+                suggested_content=suggested_content,
+                seo_metadata=seo_metadata,
+            ),
+            script_issues,
+        )
+        result.processing_metadata = ai_metadata
+        result.processing_metadata.script_engine_version = engine_state.version
+        result.processing_metadata.rule_manifest_version = self.manifest.version
+        result.processing_metadata.notes.update(
+            {
+                "analysis_mode": mode.value,
+                "service_version": self.VERSION,
+                "script_issue_count": len(script_issues),
+                "incremental": {
+                    "paragraphs": len(segments),
+                    "changed_paragraphs": len(changed),
+                    "reused_snapshot": snapshot is not None,
+                    "ai_called": ai_metadata.ai_model is not None,
+                },
+                "total_latency_ms": int((time.perf_counter() - start_time) * 1000),
+            }
+        )
+
+        logger.info(
+            "proofreading_incremental_completed",
+            article_id=payload.article_id,
+            mode=mode.value,
+            paragraphs=len(segments),
+            changed_paragraphs=len(changed),
+            issues=len(result.issues),
+        )
+
+        new_snapshot = IncrementalSnapshot(
+            analysis_mode=mode.value,
+            engine_version=engine_state.version,
+            manifest_fingerprint=self.manifest_fingerprint,
+            ai_model=self.model,
+            paragraphs=list(records.values()),
+            document_ai_issues=document_ai_issues,
+            seo_metadata=seo_metadata,
+        )
+        return result, new_snapshot
+
     async def _run_deterministic_only(
         self, payload: ArticlePayload
     ) -> ProofreadingResult:
@@ -204,10 +500,59 @@ class ProofreadingAnalysisService:
         )
 
         start_time = time.perf_counter()
-        script_issues = self.rule_engine.run(payload)
+        engine_state = self.rule_engine.state()
+        script_issues = await self.rule_executor.run(payload, state=engine_state)
+        latency_ms = int((time.perf_counter() - start_time) * 1000)
+        result = self._deterministic_result(payload, script_issues, latency_ms, engine_state)
+
+        logger.info(
+            "proofreading_deterministic_only_completed",
+            article_id=payload.article_id,
+            issues=len(script_issues),
+            blocking=len(result.blocking_issues),
+            latency_ms=latency_ms,
+        )
+
+        return result
+
+    async def analyze_articles_deterministic(
+        self, payloads: list[ArticlePayload]
+    ) -> list[ProofreadingResult]:
+        """Run only the deterministic rules over many articles at once.
+
+        Articles are dispatched to the rule executor in batches, so with
+        ``PROOFREADING_RULE_WORKERS`` set a corpus is proofread on every core
+        without blocking the event loop.  Results are in the order of
+        ``payloads``.
+        """
+        start_time = time.perf_counter()
+        engine_state = self.rule_engine.state()
+        issue_lists = await self.rule_executor.run_batch(payloads, state=engine_state)
         latency_ms = int((time.perf_counter() - start_time) * 1000)
 
-        # Convert to ProofreadingResult
+        results = [
+            self._deterministic_result(payload, issues, latency_ms, engine_state)
+            for payload, issues in zip(payloads, issue_lists, strict=True)
+        ]
+        for result in results:
+            result.processing_metadata.notes["batch_size"] = len(payloads)
+
+        logger.info(
+            "proofreading_deterministic_batch_completed",
+            articles=len(payloads),
+            issues=sum(len(issues) for issues in issue_lists),
+            latency_ms=latency_ms,
+        )
+        return results
+
+    def _deterministic_result(
+        self,
+        payload: ArticlePayload,
+        script_issues: list[ProofreadingIssue],
+        latency_ms: int,
+        engine_state: EngineState,
+    ) -> ProofreadingResult:
+        """Wrap rule-engine issues in a ProofreadingResult without AI output."""
         result = ProofreadingResult(
             article_id=payload.article_id,
             issues=script_issues,
@@ -217,7 +562,7 @@ class ProofreadingAnalysisService:
         result.processing_metadata = ProcessingMetadata(
             ai_model=None,
             ai_latency_ms=None,
-            script_engine_version=self.rule_engine.VERSION,
+            script_engine_version=engine_state.version,
             rule_manifest_version=self.manifest.version,
         )
         result.processing_metadata.notes = {
@@ -226,15 +571,6 @@ class ProofreadingAnalysisService:
             "script_issue_count": len(script_issues),
             "total_latency_ms": latency_ms,
         }
-
-        logger.info(
-            "proofreading_deterministic_only_completed",
-            article_id=payload.article_id,
-            issues=len(script_issues),
-            blocking=len(result.blocking_issues),
-            latency_ms=latency_ms,
-        )
-
         return result
 
     async def quick_check(
@@ -270,18 +606,29 @@ class ProofreadingAnalysisService:
         return result.seo_metadata or {}
 
     async def _call_ai(self, prompt: dict[str, str]) -> dict[str, Any]:
-        """Invoke Anthropic Messages API with the combined prompt."""
-        response = await self.ai_client.messages.create(
-            model=self.model,
-            max_tokens=8192,  # Increased to ensure complete JSON responses
-            temperature=0.2,
-            system=prompt["system"],  # System prompt as top-level parameter
-            messages=[
+        """Invoke Anthropic Messages API with the combined prompt.
+
+        The system prompt carries a prompt-cache breakpoint so the static
+        rule catalog is only billed at full price when the cache is cold.
+        """
+        response = await self.ai_client.messages.create(**self._request_params(prompt))
+        return self._read_message(response)
+
+    def _request_params(self, prompt: dict[str, str]) -> dict[str, Any]:
+        return {
+            "model": self.model,
+            "max_tokens": 8192,  # Increased to ensure complete JSON responses
+            "temperature": 0.2,
+            "system": ProofreadingPromptBuilder.system_blocks(prompt),
+            "messages": [
                 {"role": "user", "content": prompt["user"]},
             ],
-            stop_sequences=["```"],  # Prevent markdown code block wrappers
-        )
+            "stop_sequences": ["```"],  # Prevent markdown code block wrappers
+        }
 
+    @staticmethod
+    def _read_message(response: Any) -> dict[str, Any]:
+        """Extract text and token usage from a Messages API response."""
         # Anthropic returns content list; we take first text block
         text_content = response.content[0].text if response.content else "{}"
 
@@ -290,6 +637,8 @@ class ProofreadingAnalysisService:
             {
                 "input": getattr(usage, "input_tokens", None),
                 "output": getattr(usage, "output_tokens", None),
+                "cache_creation": getattr(usage, "cache_creation_input_tokens", None),
+                "cache_read": getattr(usage, "cache_read_input_tokens", None),
             }
             if usage
             else {}
@@ -352,6 +701,8 @@ class ProofreadingAnalysisService:
             prompt_tokens=ai_payload["tokens"].get("input"),
             completion_tokens=ai_payload["tokens"].get("output"),
             total_tokens=self._calc_total_tokens(ai_payload["tokens"]),
+            cache_creation_input_tokens=ai_payload["tokens"].get("cache_creation"),
+            cache_read_input_tokens=ai_payload["tokens"].get("cache_read"),
         )
         return result
 
@@ -452,9 +803,11 @@ class ProofreadingAnalysisService:
 
     @staticmethod
     def _calc_total_tokens(token_info: dict[str, Any]) -> int | None:
+        # Anthropic reports cached prompt tokens separately from input_tokens
         try:
-            return int(token_info.get("input") or 0) + int(
-                token_info.get("output") or 0
+            return sum(
+                int(token_info.get(key) or 0)
+                for key in ("input", "cache_creation", "cache_read", "output")
             )
         except (TypeError, ValueError):
             return None
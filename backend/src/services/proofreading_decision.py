@@ -4,10 +4,9 @@
 實現 T7.2 的核心業務邏輯。
 """
 
-import hashlib
-from collections import Counter, defaultdict
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Any
 
 from sqlalchemy import and_, case, distinct, func, select
@@ -25,6 +24,17 @@ from src.models.proofreading import (
     TuningJobStatus,
     TuningJobType,
 )
+from src.services.proofreading_decision_rollups import (
+    RollupDelta,
+    RollupTotals,
+    apply_rollup_deltas,
+    build_delta,
+    load_correction_counts,
+    load_daily_totals,
+    load_type_examples,
+    load_type_totals,
+    pattern_hash,
+)
 
 # ============================================================================
 # 數據模型定義
@@ -204,7 +214,9 @@ class ProofreadingDecisionService:
         self.min_pattern_threshold = 5  # 形成模式的最小決策數
         self.confidence_threshold = 0.8  # 規則置信度閾值
         self.cache_ttl = 3600  # 緩存時間（秒）
-        self._pattern_cache: dict[str, DecisionPatterns] = {}
+        # 分析結果緩存：key -> (過期時間 monotonic, 結果)
+        self._pattern_cache: dict[str, tuple[float, Any]] = {}
+        self._clock = time.monotonic
 
     # ========================================================================
     # 決策記錄方法
@@ -219,10 +231,13 @@ class ProofreadingDecisionService:
         decision: DecisionType,
         custom_correction: str | None = None,
         decision_reason: str | None = None,
-        tags: list[str] | None = None
+        tags: list[str] | None = None,
+        decided_by: int = 0
     ) -> ProofreadingDecision:
         """記錄單個校對決策
 
+        決策與其對應的日匯總增量在同一事務中提交。
+
         Args:
             session: 數據庫會話
             article_id: 文章ID
@@ -231,69 +246,43 @@ class ProofreadingDecisionService:
             decision: 決策類型
             custom_correction: 自定義修正
             decision_reason: 決策原因
-            tags: 標籤列表
+            tags: 標籤列表（決策表無對應列，不保存）
+            decided_by: 決策者用戶ID
 
         Returns:
             創建的決策記錄
         """
         try:
-            # 1. 驗證輸入
-            await self._validate_decision_input(
-                session, article_id, proofreading_history_id, suggestion_id
-            )
-
-            # 2. 檢查重複
-            existing = await self._check_existing_decision(
-                session, article_id, suggestion_id
-            )
-            if existing:
-                # 更新現有決策
-                existing.decision = decision
-                existing.custom_correction = custom_correction
-                existing.decision_reason = decision_reason
-                existing.updated_at = datetime.utcnow()
-                await session.commit()
-                self.logger.info(f"更新決策: article={article_id}, suggestion={suggestion_id}")
-                return existing
-
-            # 3. 獲取建議詳情
-            suggestion_detail = await self._get_suggestion_detail(
-                session, proofreading_history_id, suggestion_id
-            )
-
-            # 4. 創建決策記錄
-            new_decision = ProofreadingDecision(
-                article_id=article_id,
-                proofreading_history_id=proofreading_history_id,
-                suggestion_id=suggestion_id,
-                suggestion_type=suggestion_detail.get("type", "unknown"),
-                original_text=suggestion_detail.get("original", ""),
-                suggested_text=suggestion_detail.get("suggested", ""),
-                decision=decision,
-                custom_correction=custom_correction,
-                decision_reason=decision_reason,
-                confidence_score=await self._calculate_confidence(
-                    session, decision, suggestion_detail
+            record, deltas, created = await self._stage_decision(
+                session,
+                article_id,
+                proofreading_history_id,
+                DecisionInput(
+                    suggestion_id=suggestion_id,
+                    decision=decision,
+                    custom_correction=custom_correction,
+                    reason=decision_reason,
+                    tags=tags
                 ),
-                context_before=suggestion_detail.get("context_before", ""),
-                context_after=suggestion_detail.get("context_after", ""),
-                tags=tags or []
+                decided_by
             )
-
-            # 5. 保存到數據庫
-            session.add(new_decision)
+            await apply_rollup_deltas(session, deltas)
             await session.commit()
 
+            if not created:
+                self.logger.info(f"更新決策: article={article_id}, suggestion={suggestion_id}")
+                return record
+
             self.logger.info(
                 f"記錄決策: article={article_id}, suggestion={suggestion_id}, "
                 f"decision={decision}"
             )
 
-            # 6. 觸發異步學習（如果達到閾值）
+            # 觸發異步學習（如果達到閾值）
             if await self._should_trigger_learning(session, article_id):
                 await self._trigger_async_learning(session, article_id)
 
-            return new_decision
+            return record
 
         except Exception as e:
             self.logger.error(f"記錄決策失敗: {e}")
@@ -305,46 +294,114 @@ class ProofreadingDecisionService:
         session: AsyncSession,
         article_id: int,
         proofreading_history_id: int,
-        decisions: list[DecisionInput]
+        decisions: list[DecisionInput],
+        decided_by: int = 0
     ) -> list[ProofreadingDecision]:
         """批量記錄多個決策
 
+        所有決策及合併後的匯總增量在一個事務中提交。
+
         Args:
             session: 數據庫會話
             article_id: 文章ID
             proofreading_history_id: 校對歷史ID
             decisions: 決策輸入列表
+            decided_by: 決策者用戶ID
 
         Returns:
             創建的決策記錄列表
         """
-        created_decisions = []
+        recorded_decisions = []
+        deltas: list[RollupDelta] = []
+        created_any = False
 
         try:
-            # 開始事務
-            async with session.begin_nested():
-                for decision_input in decisions:
-                    decision = await self.record_decision(
-                        session=session,
-                        article_id=article_id,
-                        proofreading_history_id=proofreading_history_id,
-                        suggestion_id=decision_input.suggestion_id,
-                        decision=decision_input.decision,
-                        custom_correction=decision_input.custom_correction,
-                        decision_reason=decision_input.reason,
-                        tags=decision_input.tags
-                    )
-                    created_decisions.append(decision)
+            for decision_input in decisions:
+                record, record_deltas, created = await self._stage_decision(
+                    session, article_id, proofreading_history_id, decision_input, decided_by
+                )
+                recorded_decisions.append(record)
+                deltas.extend(record_deltas)
+                created_any = created_any or created
 
+            await apply_rollup_deltas(session, deltas)
             await session.commit()
-            self.logger.info(f"批量記錄 {len(created_decisions)} 個決策")
-            return created_decisions
+            self.logger.info(f"批量記錄 {len(recorded_decisions)} 個決策")
+
+            if created_any and await self._should_trigger_learning(session, article_id):
+                await self._trigger_async_learning(session, article_id)
+
+            return recorded_decisions
 
         except Exception as e:
             self.logger.error(f"批量記錄決策失敗: {e}")
             await session.rollback()
             raise DecisionServiceError(f"批量記錄失敗: {str(e)}")
 
+    async def _stage_decision(
+        self,
+        session: AsyncSession,
+        article_id: int,
+        proofreading_history_id: int,
+        decision_input: DecisionInput,
+        decided_by: int
+    ) -> tuple[ProofreadingDecision, list[RollupDelta], bool]:
+        """寫入（不提交）單個決策，返回 (記錄, 匯總增量, 是否新建)"""
+        # 1. 驗證輸入
+        await self._validate_decision_input(
+            session, article_id, proofreading_history_id, decision_input.suggestion_id
+        )
+
+        # 2. 檢查重複：更新現有決策，並把它從舊的匯總桶移到新的匯總桶
+        existing = await self._check_existing_decision(
+            session, article_id, decision_input.suggestion_id
+        )
+        if existing:
+            deltas = [self._rollup_delta(existing, count=-1)]
+            existing.decision_type = decision_input.decision
+            existing.modified_content = decision_input.custom_correction
+            existing.decision_rationale = decision_input.reason
+            existing.decided_by = decided_by
+            existing.decided_at = datetime.utcnow()
+            deltas.append(self._rollup_delta(existing, count=1))
+            return existing, deltas, False
+
+        # 3. 獲取建議詳情
+        suggestion_detail = await self._get_suggestion_detail(
+            session, proofreading_history_id, decision_input.suggestion_id
+        )
+
+        # 4. 創建決策記錄（created_at 顯式賦值，匯總按它取日期，無需刷新讀回）
+        now = datetime.utcnow()
+        rule_category = (
+            suggestion_detail.get("rule_category")
+            or suggestion_detail.get("category")
+            or suggestion_detail.get("type")
+        )
+        new_decision = ProofreadingDecision(
+            article_id=article_id,
+            proofreading_history_id=proofreading_history_id,
+            suggestion_id=decision_input.suggestion_id,
+            decision_type=decision_input.decision,
+            decision_rationale=decision_input.reason,
+            modified_content=decision_input.custom_correction,
+            original_text=suggestion_detail.get("original_text")
+            or suggestion_detail.get("original", ""),
+            suggested_text=suggestion_detail.get("suggested_text")
+            or suggestion_detail.get("suggested", ""),
+            rule_id=(suggestion_detail.get("rule_id") or "")[:20],
+            rule_category=rule_category[:10] if rule_category else None,
+            issue_position=suggestion_detail.get("position"),
+            decided_by=decided_by,
+            decided_at=now,
+            created_at=now,
+            updated_at=now
+        )
+        session.add(new_decision)
+        await session.flush()
+
+        return new_decision, [self._rollup_delta(new_decision, count=1)], True
+
     # ========================================================================
     # 決策查詢方法
     # ========================================================================
@@ -427,6 +484,8 @@ class ProofreadingDecisionService:
     ) -> DecisionPatterns:
         """分析決策模式
 
+        從日匯總表讀取統計，時間範圍按天取整。
+
         Args:
             session: 數據庫會話
             time_range: 時間範圍
@@ -437,14 +496,17 @@ class ProofreadingDecisionService:
         """
         try:
             # 檢查緩存
-            cache_key = self._get_cache_key("patterns", time_range)
-            if cache_key in self._pattern_cache:
-                return self._pattern_cache[cache_key]
+            cache_key = self._get_cache_key("patterns", time_range, min_occurrences)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
 
-            # 1. 收集決策數據
-            decisions = await self._collect_decisions(session, time_range)
+            start_day, end_day = self._rollup_days(time_range)
 
-            if not decisions:
+            # 1. 按建議類型讀取匯總
+            type_totals = await load_type_totals(session, start_day, end_day)
+
+            if not type_totals:
                 return DecisionPatterns(
                     common_acceptances=[],
                     common_rejections=[],
@@ -452,43 +514,43 @@ class ProofreadingDecisionService:
                     time_patterns=[]
                 )
 
-            # 2. 按建議類型分組
-            grouped = self._group_by_suggestion_type(decisions)
-
-            # 3. 計算統計指標
-            statistics = {}
-            for suggestion_type, group_decisions in grouped.items():
-                total = len(group_decisions)
-                if total < min_occurrences:
-                    continue
-
-                accepted = sum(1 for d in group_decisions if d.decision == DecisionType.ACCEPT)
-                rejected = sum(1 for d in group_decisions if d.decision == DecisionType.REJECT)
-                modified = sum(1 for d in group_decisions if d.decision == DecisionType.MODIFY)
-
-                statistics[suggestion_type] = {
-                    'total': total,
-                    'accepted': accepted,
-                    'rejected': rejected,
-                    'modified': modified,
-                    'acceptance_rate': accepted / total,
-                    'rejection_rate': rejected / total,
-                    'modification_rate': modified / total,
-                    'examples': [d.original_text for d in group_decisions[:5]]
+            # 2. 計算統計指標
+            significant = {
+                suggestion_type: totals
+                for suggestion_type, totals in type_totals.items()
+                if totals.total >= min_occurrences
+            }
+            examples = await load_type_examples(
+                session, list(significant), start_day, end_day
+            )
+            statistics = {
+                suggestion_type: {
+                    'total': totals.total,
+                    'accepted': totals.accepted,
+                    'rejected': totals.rejected,
+                    'modified': totals.modified,
+                    'acceptance_rate': totals.accepted / totals.total,
+                    'rejection_rate': totals.rejected / totals.total,
+                    'modification_rate': totals.modified / totals.total,
+                    'examples': examples.get(suggestion_type, [])
                 }
+                for suggestion_type, totals in significant.items()
+            }
 
-            # 4. 識別顯著模式
+            # 3. 識別顯著模式
             patterns = self._identify_significant_patterns(
                 statistics, min_occurrences=min_occurrences
             )
 
-            # 5. 提取自定義修正模式
+            # 4. 提取自定義修正模式
             custom_patterns = await self._extract_custom_patterns(
-                [d for d in decisions if d.custom_correction]
+                session, start_day, end_day
             )
 
-            # 6. 分析時間模式
-            time_patterns = self._analyze_time_patterns(decisions)
+            # 5. 分析時間模式
+            time_patterns = self._analyze_time_patterns(
+                await load_daily_totals(session, start_day, end_day)
+            )
 
             result = DecisionPatterns(
                 common_acceptances=patterns['acceptances'],
@@ -499,7 +561,7 @@ class ProofreadingDecisionService:
             )
 
             # 緩存結果
-            self._pattern_cache[cache_key] = result
+            self._cache_set(cache_key, result)
 
             return result
 
@@ -523,36 +585,35 @@ class ProofreadingDecisionService:
         Returns:
             用戶偏好分析結果
         """
-        # 獲取用戶決策歷史
-        decisions = await self.get_user_decision_history(
-            session, user_id, limit=1000
-        )
+        cache_key = self._get_cache_key("preferences", None, user_id, min_decisions)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
-        if len(decisions) < min_decisions:
-            self.logger.warning(f"決策數量不足: {len(decisions)} < {min_decisions}")
+        total = sum(t.total for t in (await load_type_totals(session)).values())
+
+        if total < min_decisions:
+            self.logger.warning(f"決策數量不足: {total} < {min_decisions}")
             return UserPreferences(confidence_level=0.0)
 
         preferences = UserPreferences()
 
         # 1. 分析寫作風格偏好
-        style_prefs = self._analyze_style_preferences(decisions)
-        preferences.style_preferences = style_prefs
+        preferences.style_preferences = self._analyze_style_preferences()
 
         # 2. 提取詞彙使用偏好
-        vocab_prefs = self._extract_vocabulary_preferences(decisions)
-        preferences.vocabulary_preferences = vocab_prefs
+        preferences.vocabulary_preferences = await self._extract_vocabulary_preferences(session)
 
         # 3. 識別語法規則偏好
-        grammar_rules = self._identify_grammar_preferences(decisions)
-        preferences.grammar_rules = grammar_rules
+        preferences.grammar_rules = await self._identify_grammar_preferences(session)
 
         # 4. 分析標點符號習慣
-        punctuation = self._analyze_punctuation_habits(decisions)
-        preferences.punctuation_habits = punctuation
+        preferences.punctuation_habits = await self._analyze_punctuation_habits(session)
 
         # 5. 計算置信度
-        preferences.confidence_level = min(len(decisions) / 100, 1.0)
+        preferences.confidence_level = min(total / 100, 1.0)
 
+        self._cache_set(cache_key, preferences)
         return preferences
 
     # ========================================================================
@@ -696,19 +757,20 @@ class ProofreadingDecisionService:
                 end_date = date.replace(month=date.month + 1, day=1)
 
         # 查詢統計數據
+        suggestion_type = self._suggestion_type_column()
         query = select(
             func.count(ProofreadingDecision.id).label('total'),
-            func.sum(case((ProofreadingDecision.decision == DecisionType.ACCEPT, 1), else_=0)).label('accepted'),
-            func.sum(case((ProofreadingDecision.decision == DecisionType.REJECT, 1), else_=0)).label('rejected'),
-            func.sum(case((ProofreadingDecision.decision == DecisionType.MODIFY, 1), else_=0)).label('modified'),
-            ProofreadingDecision.suggestion_type,
+            func.sum(case((ProofreadingDecision.decision_type == DecisionType.ACCEPTED, 1), else_=0)).label('accepted'),
+            func.sum(case((ProofreadingDecision.decision_type == DecisionType.REJECTED, 1), else_=0)).label('rejected'),
+            func.sum(case((ProofreadingDecision.decision_type == DecisionType.MODIFIED, 1), else_=0)).label('modified'),
+            suggestion_type,
             func.count(distinct(ProofreadingDecision.article_id)).label('unique_articles')
         ).where(
             and_(
                 ProofreadingDecision.created_at >= start_date,
                 ProofreadingDecision.created_at < end_date
             )
-        ).group_by(ProofreadingDecision.suggestion_type)
+        ).group_by(suggestion_type)
 
         result = await session.execute(query)
         stats = result.all()
@@ -761,19 +823,17 @@ class ProofreadingDecisionService:
         for decision in decisions:
             example = {
                 'input': decision.original_text,
-                'context_before': decision.context_before,
-                'context_after': decision.context_after,
-                'suggestion_type': decision.suggestion_type
+                'suggestion_type': self._suggestion_type(decision)
             }
 
-            if decision.decision == DecisionType.ACCEPT:
+            if decision.decision_type == DecisionType.ACCEPTED:
                 example['output'] = decision.suggested_text
                 positive_examples.append(example)
-            elif decision.decision == DecisionType.REJECT:
+            elif decision.decision_type == DecisionType.REJECTED:
                 example['output'] = decision.original_text
                 negative_examples.append(example)
-            elif decision.decision == DecisionType.MODIFY and decision.custom_correction:
-                example['output'] = decision.custom_correction
+            elif decision.decision_type == DecisionType.MODIFIED and decision.modified_content:
+                example['output'] = decision.modified_content
                 custom_examples.append(example)
 
         # 平衡數據集
@@ -811,42 +871,52 @@ class ProofreadingDecisionService:
         Returns:
             質量指標
         """
-        # 獲取決策數據
-        decisions = await self._collect_decisions(session, time_range)
-
-        if not decisions:
+        cache_key = self._get_cache_key("quality", time_range)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        start_day, end_day = self._rollup_days(time_range)
+        daily = await load_daily_totals(session, start_day, end_day)
+
+        totals = RollupTotals()
+        for _, day_totals in daily:
+            totals.accepted += day_totals.accepted
+            totals.rejected += day_totals.rejected
+            totals.modified += day_totals.modified
+            totals.total += day_totals.total
+            totals.confidence_sum += day_totals.confidence_sum
+
+        if not totals.total:
             return QualityMetrics(
                 accuracy=0, relevance=0, usefulness=0,
                 trend="stable", details={}
             )
 
-        total = len(decisions)
-        accepted = sum(1 for d in decisions if d.decision == DecisionType.ACCEPT)
-        modified = sum(1 for d in decisions if d.decision == DecisionType.MODIFY)
+        total = totals.total
 
         # 計算指標
-        accuracy = accepted / total
-        usefulness = (accepted + modified) / total
+        accuracy = totals.accepted / total
+        usefulness = (totals.accepted + totals.modified) / total
 
         # 計算相關性（基於置信度分數）
-        relevance = sum(d.confidence_score or 0 for d in decisions) / total
+        relevance = totals.confidence_sum / total
 
-        # 分析趨勢
-        trend = await self._analyze_quality_trend(session, time_range)
-
-        return QualityMetrics(
+        quality = QualityMetrics(
             accuracy=accuracy,
             relevance=relevance,
             usefulness=usefulness,
-            trend=trend,
+            trend=self._analyze_quality_trend(daily, time_range),
             details={
                 'total_decisions': total,
-                'accepted': accepted,
-                'rejected': total - accepted - modified,
-                'modified': modified,
+                'accepted': totals.accepted,
+                'rejected': total - totals.accepted - totals.modified,
+                'modified': totals.modified,
                 'avg_confidence': relevance
             }
         )
+        self._cache_set(cache_key, quality)
+        return quality
 
     async def identify_improvement_areas(
         self,
@@ -955,38 +1025,19 @@ class ProofreadingDecisionService:
         proofreading_history_id: int,
         suggestion_id: str
     ) -> dict[str, Any]:
-        """獲取建議詳情"""
+        """獲取建議詳情（從校對歷史的問題快照中查找）"""
         history = await session.get(ProofreadingHistory, proofreading_history_id)
-        if not history or not history.suggestions:
+        if not history or not history.issues_snapshot:
             return {}
 
-        for suggestion in history.suggestions:
-            if suggestion.get("id") == suggestion_id:
-                return suggestion
+        snapshot = history.issues_snapshot
+        issues = snapshot.get("issues", []) if isinstance(snapshot, dict) else snapshot
+        for issue in issues:
+            if issue.get("id") == suggestion_id:
+                return issue
 
         return {}
 
-    async def _calculate_confidence(
-        self,
-        session: AsyncSession,
-        decision: DecisionType,
-        suggestion_detail: dict[str, Any]
-    ) -> float:
-        """計算決策置信度"""
-        base_confidence = 0.5
-
-        # 基於決策類型調整
-        if decision == DecisionType.ACCEPT:
-            base_confidence += 0.2
-        elif decision == DecisionType.REJECT:
-            base_confidence -= 0.1
-
-        # 基於建議置信度調整
-        if "confidence" in suggestion_detail:
-            base_confidence = (base_confidence + suggestion_detail["confidence"]) / 2
-
-        return min(max(base_confidence, 0.0), 1.0)
-
     async def _should_trigger_learning(
         self,
         session: AsyncSession,
@@ -1051,16 +1102,6 @@ class ProofreadingDecisionService:
         result = await session.execute(query)
         return result.scalars().all()
 
-    def _group_by_suggestion_type(
-        self,
-        decisions: list[ProofreadingDecision]
-    ) -> dict[str, list[ProofreadingDecision]]:
-        """按建議類型分組"""
-        grouped = defaultdict(list)
-        for decision in decisions:
-            grouped[decision.suggestion_type].append(decision)
-        return dict(grouped)
-
     def _identify_significant_patterns(
         self,
         statistics: dict[str, dict],
@@ -1101,58 +1142,36 @@ class ProofreadingDecisionService:
 
     async def _extract_custom_patterns(
         self,
-        decisions_with_custom: list[ProofreadingDecision]
+        session: AsyncSession,
+        start_day: date | None = None,
+        end_day: date | None = None
     ) -> list[CorrectionPattern]:
-        """提取自定義修正模式"""
-        patterns = []
-        pattern_counter = Counter()
-
-        for decision in decisions_with_custom:
-            if not decision.custom_correction:
-                continue
-
-            # 創建模式標識
-            pattern_key = (
-                decision.suggestion_type,
-                decision.original_text[:50],  # 截取前50字符
-                decision.custom_correction[:50]
+        """提取自定義修正模式（至少出現3次）"""
+        counts = await load_correction_counts(
+            session, DecisionType.MODIFIED, start_day, end_day, min_count=3
+        )
+        return [
+            CorrectionPattern(
+                id=pattern_hash(c.original, c.replacement)[:8],
+                original_pattern=c.original,
+                correction_pattern=c.replacement,
+                frequency=c.count,
+                confidence=min(c.count / 10, 1.0),  # 簡單的置信度計算
+                context={'suggestion_type': c.suggestion_type}
             )
-            pattern_counter[pattern_key] += 1
-
-        # 提取頻繁模式
-        for (suggestion_type, original, correction), count in pattern_counter.items():
-            if count >= 3:  # 至少出現3次
-                patterns.append(CorrectionPattern(
-                    id=hashlib.md5(f"{original}_{correction}".encode()).hexdigest()[:8],
-                    original_pattern=original,
-                    correction_pattern=correction,
-                    frequency=count,
-                    confidence=min(count / 10, 1.0),  # 簡單的置信度計算
-                    context={'suggestion_type': suggestion_type}
-                ))
-
-        return sorted(patterns, key=lambda x: x.frequency, reverse=True)
+            for c in counts
+        ]
 
     def _analyze_time_patterns(
         self,
-        decisions: list[ProofreadingDecision]
+        daily: list[tuple[date, RollupTotals]]
     ) -> list[TimePattern]:
         """分析時間模式"""
-        if not decisions:
-            return []
-
-        # 按日期分組
-        daily_groups = defaultdict(list)
-        for decision in decisions:
-            date_key = decision.created_at.date()
-            daily_groups[date_key].append(decision)
-
         # 分析趨勢
-        dates = sorted(daily_groups.keys())
-        if len(dates) < 2:
+        if len(daily) < 2:
             return []
 
-        daily_counts = [len(daily_groups[date]) for date in dates]
+        daily_counts = [totals.total for _, totals in daily]
 
         # 簡單的趨勢判斷
         trend = "stable"
@@ -1218,10 +1237,7 @@ class ProofreadingDecisionService:
         else:
             return 0.95
 
-    def _analyze_style_preferences(
-        self,
-        decisions: list[ProofreadingDecision]
-    ) -> dict[str, Any]:
+    def _analyze_style_preferences(self) -> dict[str, Any]:
         """分析寫作風格偏好"""
         preferences = {
             'formal_level': 'neutral',  # formal, neutral, casual
@@ -1233,53 +1249,47 @@ class ProofreadingDecisionService:
 
         return preferences
 
-    def _extract_vocabulary_preferences(
+    async def _extract_vocabulary_preferences(
         self,
-        decisions: list[ProofreadingDecision]
+        session: AsyncSession
     ) -> list[str]:
-        """提取詞彙使用偏好"""
-        preferred_words = []
-
-        # 分析接受的詞彙修改
-        for decision in decisions:
-            if decision.decision == DecisionType.ACCEPT and decision.suggestion_type == "vocabulary":
-                # 提取偏好的詞彙
-                if decision.suggested_text:
-                    preferred_words.append(decision.suggested_text)
-
-        return list(set(preferred_words))[:50]  # 返回前50個
+        """提取詞彙使用偏好（接受次數最多的前50個詞彙）"""
+        counts = await load_correction_counts(
+            session, DecisionType.ACCEPTED, suggestion_types=["vocabulary"]
+        )
+        preferred_words: list[str] = []
+        for c in counts:
+            if c.replacement and c.replacement not in preferred_words:
+                preferred_words.append(c.replacement)
+        return preferred_words[:50]
 
-    def _identify_grammar_preferences(
+    async def _identify_grammar_preferences(
         self,
-        decisions: list[ProofreadingDecision]
+        session: AsyncSession
     ) -> list[str]:
-        """識別語法規則偏好"""
-        grammar_rules = []
-
-        # 分析語法相關的決策
-        for decision in decisions:
-            if decision.suggestion_type in ["grammar", "syntax"]:
-                if decision.decision == DecisionType.ACCEPT:
-                    # 記錄接受的語法規則
-                    if decision.decision_reason:
-                        grammar_rules.append(decision.decision_reason)
-
-        return list(set(grammar_rules))[:20]  # 返回前20條
+        """識別語法規則偏好（前20條接受理由）"""
+        query = select(distinct(ProofreadingDecision.decision_rationale)).where(
+            and_(
+                ProofreadingDecision.rule_category.in_(["grammar", "syntax"]),
+                ProofreadingDecision.decision_type == DecisionType.ACCEPTED,
+                ProofreadingDecision.decision_rationale.is_not(None)
+            )
+        ).limit(20)
+        result = await session.execute(query)
+        return list(result.scalars().all())
 
-    def _analyze_punctuation_habits(
+    async def _analyze_punctuation_habits(
         self,
-        decisions: list[ProofreadingDecision]
+        session: AsyncSession
     ) -> dict[str, str]:
         """分析標點符號習慣"""
-        habits = {}
-
-        # 分析標點相關的決策
-        for decision in decisions:
-            if decision.suggestion_type == "punctuation":
-                if decision.decision == DecisionType.ACCEPT:
-                    # 記錄接受的標點使用
-                    habits[decision.original_text] = decision.suggested_text
-
+        counts = await load_correction_counts(
+            session, DecisionType.ACCEPTED, suggestion_types=["punctuation"]
+        )
+        habits: dict[str, str] = {}
+        # 按次數降序，同一原文保留最常接受的寫法
+        for c in counts:
+            habits.setdefault(c.original, c.replacement)
         return habits
 
     def _create_style_rule(self, pattern: PatternDetail) -> LearningRule | None:
@@ -1338,38 +1348,115 @@ class ProofreadingDecisionService:
 
         return validated_rules
 
-    async def _analyze_quality_trend(
+    def _analyze_quality_trend(
         self,
-        session: AsyncSession,
+        daily: list[tuple[date, RollupTotals]],
         time_range: DateRange | None
     ) -> str:
-        """分析質量趨勢"""
-        # 獲取歷史數據進行比較
+        """分析質量趨勢（比較時間範圍前後兩半的準確率）"""
         if not time_range:
             return "stable"
 
-        # 計算前期和後期的質量指標
-        mid_point = time_range.start_date + (time_range.end_date - time_range.start_date) / 2
+        mid_point = (
+            time_range.start_date + (time_range.end_date - time_range.start_date) / 2
+        ).date()
 
-        earlier_range = DateRange(time_range.start_date, mid_point)
-        later_range = DateRange(mid_point, time_range.end_date)
+        def accuracy(days: list[tuple[date, RollupTotals]]) -> float:
+            total = sum(t.total for _, t in days)
+            return sum(t.accepted for _, t in days) / total if total else 0.0
 
-        earlier_metrics = await self.evaluate_suggestion_quality(session, earlier_range)
-        later_metrics = await self.evaluate_suggestion_quality(session, later_range)
+        earlier = accuracy([d for d in daily if d[0] < mid_point])
+        later = accuracy([d for d in daily if d[0] >= mid_point])
 
         # 比較準確率
-        if later_metrics.accuracy > earlier_metrics.accuracy * 1.1:
+        if later > earlier * 1.1:
             return "improving"
-        elif later_metrics.accuracy < earlier_metrics.accuracy * 0.9:
+        elif later < earlier * 0.9:
             return "declining"
         else:
             return "stable"
 
-    def _get_cache_key(self, prefix: str, time_range: DateRange | None) -> str:
+    def _rollup_delta(
+        self,
+        decision: ProofreadingDecision,
+        count: int
+    ) -> RollupDelta:
+        """決策記錄對應的匯總增量
+
+        與遷移回填一致：建議類型取 ``COALESCE(rule_category, 'unknown')``，
+        修改時替換文本為 ``modified_content``，否則為 ``suggested_text``。
+        決策表沒有置信度列，置信度計為 0（回填同樣如此），
+        撤銷舊決策的增量因此總能與原增量抵消。
+        """
+        replacement = (
+            decision.modified_content
+            if decision.decision_type == DecisionType.MODIFIED
+            else decision.suggested_text
+        )
+        return build_delta(
+            created_at=decision.created_at,
+            suggestion_type=self._suggestion_type(decision),
+            rule_id=decision.rule_id,
+            decision=decision.decision_type,
+            confidence=None,
+            original_text=decision.original_text,
+            replacement_text=replacement,
+            count=count
+        )
+
+    @staticmethod
+    def _suggestion_type(decision: ProofreadingDecision) -> str:
+        """決策的建議類型（規則類別，缺失時為 unknown）"""
+        return decision.rule_category or "unknown"
+
+    @staticmethod
+    def _suggestion_type_column():
+        """``_suggestion_type`` 的 SQL 表達式"""
+        return func.coalesce(ProofreadingDecision.rule_category, "unknown").label("suggestion_type")
+
+    def _rollup_days(
+        self,
+        time_range: DateRange | None
+    ) -> tuple[date | None, date | None]:
+        """時間範圍按天取整（包含起止日期）"""
+        if not time_range:
+            return None, None
+        return time_range.start_date.date(), time_range.end_date.date()
+
+    def _get_cache_key(
+        self,
+        prefix: str,
+        time_range: DateRange | None,
+        *params: Any
+    ) -> str:
         """生成緩存鍵"""
+        key = prefix
         if time_range:
-            return f"{prefix}_{time_range.start_date.date()}_{time_range.end_date.date()}"
-        return f"{prefix}_all"
+            key = f"{key}_{time_range.start_date.date()}_{time_range.end_date.date()}"
+        else:
+            key = f"{key}_all"
+        for param in params:
+            key = f"{key}_{param}"
+        return key
+
+    def _cache_get(self, key: str) -> Any | None:
+        """讀取未過期的緩存（超過 cache_ttl 秒即失效）"""
+        entry = self._pattern_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if self._clock() >= expires_at:
+            self._pattern_cache.pop(key, None)
+            return None
+        return value
+
+    def _cache_set(self, key: str, value: Any) -> None:
+        """寫入緩存並順帶清理過期項"""
+        now = self._clock()
+        expired = [k for k, (expires_at, _) in self._pattern_cache.items() if expires_at <= now]
+        for k in expired:
+            del self._pattern_cache[k]
+        self._pattern_cache[key] = (now + self.cache_ttl, value)
 
 
 # ============================================================================
@@ -0,0 +1,311 @@
+"""校對決策日匯總（rollup）
+
+``ProofreadingDecisionService`` 在記錄決策的同一事務中增量更新兩張匯總表：
+
+- ``proofreading_decision_rollups``：按 (日期, 建議類型, 規則, 決策) 計數，
+  並累加置信度，供模式分析、質量評估與時間趨勢使用；
+- ``proofreading_correction_rollups``：按 (日期, 建議類型, 決策, 修正對) 計數，
+  供自定義修正模式與詞彙/標點偏好使用。
+
+分析端點只讀取匯總表，查詢成本與決策總量無關，只與時間範圍內的天數和
+規則數相關。時間範圍按天（UTC）取整，起止日期均包含在內。
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.proofreading import DecisionType
+from src.models.proofreading_decision_rollup import (
+    ProofreadingCorrectionRollup,
+    ProofreadingDecisionRollup,
+)
+
+SNIPPET_LENGTH = 50
+
+
+@dataclass(frozen=True)
+class RollupDelta:
+    """單個決策對匯總表的增量（撤銷舊決策時 count 為 -1）"""
+    day: date
+    suggestion_type: str
+    rule_id: str
+    decision: str
+    count: int
+    confidence: float
+    original_text: str = ""
+    replacement_text: str | None = None
+
+
+@dataclass
+class RollupTotals:
+    """一組匯總行的合計"""
+    total: int = 0
+    accepted: int = 0
+    rejected: int = 0
+    modified: int = 0
+    confidence_sum: float = 0.0
+
+    def add(self, decision: str, count: int, confidence_sum: float) -> None:
+        self.total += count
+        self.confidence_sum += confidence_sum
+        if decision == DecisionType.ACCEPTED.value:
+            self.accepted += count
+        elif decision == DecisionType.REJECTED.value:
+            self.rejected += count
+        elif decision == DecisionType.MODIFIED.value:
+            self.modified += count
+
+
+@dataclass
+class CorrectionCount:
+    """某修正對在時間範圍內的出現次數"""
+    suggestion_type: str
+    original: str
+    replacement: str
+    count: int
+
+
+def pattern_hash(original: str, replacement: str) -> str:
+    """修正對標識，與遷移回填中的 ``MD5(original || '_' || replacement)`` 一致"""
+    return hashlib.md5(f"{original}_{replacement}".encode()).hexdigest()
+
+
+def build_delta(
+    *,
+    created_at: datetime | None,
+    suggestion_type: str | None,
+    rule_id: str | None,
+    decision: DecisionType | str,
+    confidence: float | None,
+    original_text: str | None,
+    replacement_text: str | None,
+    count: int = 1,
+) -> RollupDelta:
+    """由決策字段構建匯總增量"""
+    decision_value = getattr(decision, "value", decision)
+    replacement = None
+    if decision_value in (DecisionType.ACCEPTED.value, DecisionType.MODIFIED.value):
+        replacement = replacement_text or None
+    return RollupDelta(
+        day=(created_at or datetime.utcnow()).date(),
+        suggestion_type=(suggestion_type or "unknown")[:50],
+        rule_id=(rule_id or "")[:20],
+        decision=decision_value,
+        count=count,
+        confidence=(confidence or 0.0) * count,
+        original_text=original_text or "",
+        replacement_text=replacement,
+    )
+
+
+def _insert(session: AsyncSession, table: Any):
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite_insert(table)
+    return pg_insert(table)
+
+
+async def apply_rollup_deltas(session: AsyncSession, deltas: list[RollupDelta]) -> None:
+    """合併增量並寫入匯總表（不提交，由調用方與決策一起提交）"""
+    decision_rows: dict[tuple, dict[str, Any]] = {}
+    correction_rows: dict[tuple, dict[str, Any]] = {}
+
+    for delta in deltas:
+        key = (delta.day, delta.suggestion_type, delta.rule_id, delta.decision)
+        row = decision_rows.setdefault(key, {
+            "day": delta.day,
+            "suggestion_type": delta.suggestion_type,
+            "rule_id": delta.rule_id,
+            "decision": delta.decision,
+            "decision_count": 0,
+            "confidence_sum": 0.0,
+            "sample_text": delta.original_text[:SNIPPET_LENGTH] or None,
+        })
+        row["decision_count"] += delta.count
+        row["confidence_sum"] += delta.confidence
+
+        if delta.replacement_text is None:
+            continue
+        original = delta.original_text[:SNIPPET_LENGTH]
+        replacement = delta.replacement_text[:SNIPPET_LENGTH]
+        digest = pattern_hash(original, replacement)
+        key = (delta.day, delta.suggestion_type, delta.decision, digest)
+        row = correction_rows.setdefault(key, {
+            "day": delta.day,
+            "suggestion_type": delta.suggestion_type,
+            "decision": delta.decision,
+            "pattern_hash": digest,
+            "original_snippet": original,
+            "replacement_snippet": replacement,
+            "decision_count": 0,
+        })
+        row["decision_count"] += delta.count
+
+    rollup = ProofreadingDecisionRollup
+    for values in decision_rows.values():
+        if not values["decision_count"] and not values["confidence_sum"]:
+            continue
+        stmt = _insert(session, rollup).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["day", "suggestion_type", "rule_id", "decision"],
+            set_={
+                "decision_count": rollup.decision_count + stmt.excluded.decision_count,
+                "confidence_sum": rollup.confidence_sum + stmt.excluded.confidence_sum,
+                "sample_text": func.coalesce(rollup.sample_text, stmt.excluded.sample_text),
+                "updated_at": func.now(),
+            },
+        )
+        await session.execute(stmt)
+
+    correction = ProofreadingCorrectionRollup
+    for values in correction_rows.values():
+        if not values["decision_count"]:
+            continue
+        stmt = _insert(session, correction).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["day", "suggestion_type", "decision", "pattern_hash"],
+            set_={"decision_count": correction.decision_count + stmt.excluded.decision_count},
+        )
+        await session.execute(stmt)
+
+
+def _day_filter(column: Any, start_day: date | None, end_day: date | None) -> list[Any]:
+    conditions = []
+    if start_day is not None:
+        conditions.append(column >= start_day)
+    if end_day is not None:
+        conditions.append(column <= end_day)
+    return conditions
+
+
+async def load_type_totals(
+    session: AsyncSession,
+    start_day: date | None = None,
+    end_day: date | None = None,
+) -> dict[str, RollupTotals]:
+    """按建議類型合計決策數"""
+    rollup = ProofreadingDecisionRollup
+    query = select(
+        rollup.suggestion_type,
+        rollup.decision,
+        func.sum(rollup.decision_count).label("count"),
+        func.sum(rollup.confidence_sum).label("confidence_sum"),
+    ).where(
+        *_day_filter(rollup.day, start_day, end_day)
+    ).group_by(rollup.suggestion_type, rollup.decision)
+
+    totals: dict[str, RollupTotals] = {}
+    for row in (await session.execute(query)).all():
+        totals.setdefault(row.suggestion_type, RollupTotals()).add(
+            row.decision, int(row.count or 0), float(row.confidence_sum or 0.0)
+        )
+    return totals
+
+
+async def load_daily_totals(
+    session: AsyncSession,
+    start_day: date | None = None,
+    end_day: date | None = None,
+) -> list[tuple[date, RollupTotals]]:
+    """按日期合計決策數（按日期升序）"""
+    rollup = ProofreadingDecisionRollup
+    query = select(
+        rollup.day,
+        rollup.decision,
+        func.sum(rollup.decision_count).label("count"),
+        func.sum(rollup.confidence_sum).label("confidence_sum"),
+    ).where(
+        *_day_filter(rollup.day, start_day, end_day)
+    ).group_by(rollup.day, rollup.decision)
+
+    daily: dict[date, RollupTotals] = {}
+    for row in (await session.execute(query)).all():
+        daily.setdefault(row.day, RollupTotals()).add(
+            row.decision, int(row.count or 0), float(row.confidence_sum or 0.0)
+        )
+    return [(day, daily[day]) for day in sorted(daily) if daily[day].total > 0]
+
+
+async def load_type_examples(
+    session: AsyncSession,
+    suggestion_types: list[str],
+    start_day: date | None = None,
+    end_day: date | None = None,
+    per_type: int = 5,
+) -> dict[str, list[str]]:
+    """每個建議類型取最近若干條示例原文"""
+    if not suggestion_types:
+        return {}
+    rollup = ProofreadingDecisionRollup
+    ranked = select(
+        rollup.suggestion_type,
+        rollup.sample_text,
+        func.row_number().over(
+            partition_by=rollup.suggestion_type,
+            order_by=(rollup.day.desc(), rollup.rule_id),
+        ).label("rank"),
+    ).where(
+        rollup.suggestion_type.in_(suggestion_types),
+        rollup.sample_text.is_not(None),
+        *_day_filter(rollup.day, start_day, end_day),
+    ).subquery()
+    query = select(ranked.c.suggestion_type, ranked.c.sample_text).where(
+        ranked.c.rank <= per_type
+    ).order_by(ranked.c.suggestion_type, ranked.c.rank)
+
+    examples: dict[str, list[str]] = {}
+    for row in (await session.execute(query)).all():
+        examples.setdefault(row.suggestion_type, []).append(row.sample_text)
+    return examples
+
+
+async def load_correction_counts(
+    session: AsyncSession,
+    decision: DecisionType,
+    start_day: date | None = None,
+    end_day: date | None = None,
+    suggestion_types: list[str] | None = None,
+    min_count: int = 1,
+    limit: int | None = None,
+) -> list[CorrectionCount]:
+    """合計修正對出現次數（按次數降序）"""
+    correction = ProofreadingCorrectionRollup
+    count = func.sum(correction.decision_count).label("count")
+    conditions = [
+        correction.decision == decision.value,
+        *_day_filter(correction.day, start_day, end_day),
+    ]
+    if suggestion_types is not None:
+        conditions.append(correction.suggestion_type.in_(suggestion_types))
+
+    query = select(
+        correction.suggestion_type,
+        correction.original_snippet,
+        correction.replacement_snippet,
+        count,
+    ).where(*conditions).group_by(
+        correction.suggestion_type,
+        correction.pattern_hash,
+        correction.original_snippet,
+        correction.replacement_snippet,
+    ).having(count >= max(min_count, 1)).order_by(count.desc())
+    if limit:
+        query = query.limit(limit)
+
+    return [
+        CorrectionCount(
+            suggestion_type=row.suggestion_type,
+            original=row.original_snippet,
+            replacement=row.replacement_snippet,
+            count=int(row.count),
+        )
+        for row in (await session.execute(query)).all()
+    ]
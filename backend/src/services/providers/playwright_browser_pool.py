@@ -0,0 +1,312 @@
+"""Warm Chromium pool shared by the Playwright WordPress publishers.
+
+Launching Chromium on Cloud Run costs tens of seconds, and logging in to
+wp-admin costs as much again.  The pool keeps up to ``PLAYWRIGHT_POOL_SIZE``
+browsers alive between publishes and remembers each site's logged-in
+``storage_state`` until its auth cookies expire.  Every publish still gets
+a fresh ``BrowserContext``, so pages never leak state into each other.
+
+Browsers are health-checked on checkout and recycled after
+``PLAYWRIGHT_BROWSER_MAX_USES`` publishes or once Chromium's resident memory
+passes ``PLAYWRIGHT_BROWSER_MAX_MEMORY_MB``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src.config import get_logger, get_settings
+
+logger = get_logger(__name__)
+
+# Cloud Run compatible Chromium flags
+BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",  # Important for Docker/Cloud Run
+    "--disable-gpu",
+    "--disable-software-rasterizer",
+    # Use limited renderer processes instead of --single-process
+    # (--single-process causes I/O starvation on Cloud Run)
+    "--renderer-process-limit=1",
+    # Cloud Run cold-start networking optimizations
+    "--disable-background-networking",
+    "--no-first-run",
+    "--dns-prefetch-disable",
+    "--disable-extensions",
+    "--disable-component-update",
+    "--disable-default-apps",
+]
+
+# Treat a session as expired this long before its cookies actually do
+SESSION_EXPIRY_MARGIN_SECONDS = 300
+
+SessionKey = tuple[str, str, str]
+
+
+def session_key(cms_url: str, username: str, http_auth: tuple[str, str] | None = None) -> SessionKey:
+    """Identify a WordPress login: site, user and site-level basic-auth user."""
+    return (cms_url.rstrip("/"), username, http_auth[0] if http_auth else "")
+
+
+def session_expires_at(storage_state: dict[str, Any], ttl_seconds: float) -> float:
+    """Wall-clock time after which a saved login should no longer be reused."""
+    cookie_expiries = [
+        cookie["expires"]
+        for cookie in storage_state.get("cookies", [])
+        if cookie.get("name", "").startswith("wordpress_logged_in")
+        and cookie.get("expires", -1) > 0
+    ]
+    expires_at = min(cookie_expiries, default=time.time() + ttl_seconds)
+    return expires_at - SESSION_EXPIRY_MARGIN_SECONDS
+
+
+def chromium_rss_mb() -> float | None:
+    """Resident memory of this process's descendants (the Chromium tree).
+
+    Returns None where /proc is unavailable (non-Linux development hosts).
+    """
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return None
+
+    children: dict[int, list[int]] = {}
+    rss_pages: dict[int, int] = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+            statm = (entry / "statm").read_text()
+        except OSError:
+            continue
+        pid = int(entry.name)
+        # Fields after the parenthesised command name: state, ppid, ...
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(pid)
+        rss_pages[pid] = int(statm.split()[1])
+
+    total_pages = 0
+    pending = list(children.get(os.getpid(), []))
+    while pending:
+        pid = pending.pop()
+        total_pages += rss_pages.get(pid, 0)
+        pending.extend(children.get(pid, []))
+    return total_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+@dataclass
+class _PooledBrowser:
+    browser: Any
+    headless: bool
+    uses: int = 0
+    launched_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _SavedSession:
+    storage_state: dict[str, Any]
+    expires_at: float
+
+
+@dataclass
+class BrowserLease:
+    """One publish's context and page on a pooled browser."""
+
+    context: Any
+    page: Any
+    session_key: SessionKey
+    session_restored: bool
+    _pool: BrowserPool
+
+    async def save_session(self) -> None:
+        """Remember this context's cookies so later publishes skip the login."""
+        self._pool._save_session(self.session_key, await self.context.storage_state())
+
+    def invalidate_session(self) -> None:
+        """Forget the saved login, e.g. after WordPress redirected to wp-login.php."""
+        self._pool._sessions.pop(self.session_key, None)
+        self.session_restored = False
+
+
+class BrowserPool:
+    """Bounded pool of warm Chromium browsers with cached WordPress logins."""
+
+    def __init__(
+        self,
+        size: int,
+        max_uses: int,
+        max_memory_mb: int = 0,
+        session_ttl_seconds: float = 6 * 3600,
+        launcher: Callable[[bool], Awaitable[Any]] | None = None,
+    ) -> None:
+        self.size = size
+        self.max_uses = max_uses
+        self.max_memory_mb = max_memory_mb
+        self.session_ttl_seconds = session_ttl_seconds
+        self._launcher = launcher or self._launch_chromium
+        self._semaphore = asyncio.Semaphore(size)
+        self._idle: list[_PooledBrowser] = []
+        self._sessions: dict[SessionKey, _SavedSession] = {}
+        self._playwright: Any = None
+        self._playwright_lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        key: SessionKey,
+        *,
+        headless: bool = True,
+        context_options: dict[str, Any] | None = None,
+        error_screenshot: str | None = None,
+    ) -> AsyncIterator[BrowserLease]:
+        """Check out a browser and open a fresh context on it.
+
+        The context starts from the saved login for ``key`` when one is still
+        valid.  If the body raises, ``error_screenshot`` is captured before
+        the context is torn down.
+        """
+        async with self._semaphore:
+            pooled = await self._checkout(headless)
+            context = None
+            try:
+                saved = self._valid_session(key)
+                options = dict(context_options or {})
+                if saved is not None:
+                    options["storage_state"] = saved.storage_state
+                context = await pooled.browser.new_context(**options)
+                page = await context.new_page()
+                lease = BrowserLease(
+                    context=context,
+                    page=page,
+                    session_key=key,
+                    session_restored=saved is not None,
+                    _pool=self,
+                )
+                try:
+                    yield lease
+                except BaseException:
+                    if error_screenshot:
+                        try:
+                            await page.screenshot(path=error_screenshot, timeout=10000)
+                        except Exception:  # noqa: BLE001 - diagnostics only
+                            pass
+                    raise
+            finally:
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception as exc:  # noqa: BLE001 - browser may already be gone
+                        logger.debug("browser_pool_context_close_failed", error=str(exc))
+                pooled.uses += 1
+                await self._checkin(pooled)
+
+    async def close(self) -> None:
+        """Close idle browsers and stop the Playwright driver."""
+        idle, self._idle = self._idle, []
+        for pooled in idle:
+            await self._retire(pooled, reason="shutdown")
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def _valid_session(self, key: SessionKey) -> _SavedSession | None:
+        saved = self._sessions.get(key)
+        if saved is not None and saved.expires_at <= time.time():
+            del self._sessions[key]
+            logger.info("browser_pool_session_expired", cms_url=key[0])
+            return None
+        return saved
+
+    def _save_session(self, key: SessionKey, storage_state: dict[str, Any]) -> None:
+        expires_at = session_expires_at(storage_state, self.session_ttl_seconds)
+        if expires_at <= time.time():
+            return
+        self._sessions[key] = _SavedSession(storage_state=storage_state, expires_at=expires_at)
+        logger.info(
+            "browser_pool_session_saved",
+            cms_url=key[0],
+            reusable_for_s=round(expires_at - time.time()),
+        )
+
+    async def _checkout(self, headless: bool) -> _PooledBrowser:
+        while self._idle:
+            pooled = self._idle.pop()
+            if pooled.headless == headless and pooled.browser.is_connected():
+                logger.info("browser_pool_reuse", uses=pooled.uses)
+                return pooled
+            await self._retire(pooled, reason="unhealthy" if pooled.headless == headless else "mode")
+
+        started = time.monotonic()
+        browser = await self._launcher(headless)
+        logger.info("browser_pool_launch", elapsed_s=round(time.monotonic() - started, 1))
+        return _PooledBrowser(browser=browser, headless=headless)
+
+    async def _checkin(self, pooled: _PooledBrowser) -> None:
+        if not pooled.browser.is_connected():
+            await self._retire(pooled, reason="disconnected")
+        elif pooled.uses >= self.max_uses:
+            await self._retire(pooled, reason="max_uses")
+        elif (rss := await self._memory_over_limit()) is not None:
+            await self._retire(pooled, reason="memory", rss_mb=round(rss))
+        else:
+            self._idle.append(pooled)
+
+    async def _memory_over_limit(self) -> float | None:
+        """Chromium RSS in MB when it exceeds the configured limit, else None."""
+        if not self.max_memory_mb:
+            return None
+        rss = await asyncio.to_thread(chromium_rss_mb)
+        return rss if rss is not None and rss > self.max_memory_mb else None
+
+    async def _retire(self, pooled: _PooledBrowser, *, reason: str, **log_fields: Any) -> None:
+        logger.info("browser_pool_recycle", reason=reason, uses=pooled.uses, **log_fields)
+        try:
+            await pooled.browser.close()
+        except Exception as exc:  # noqa: BLE001 - browser may already be gone
+            logger.debug("browser_pool_close_failed", error=str(exc))
+
+    async def _launch_chromium(self, headless: bool) -> Any:
+        async with self._playwright_lock:
+            if self._playwright is None:
+                from playwright.async_api import async_playwright
+
+                self._playwright = await async_playwright().start()
+        args = BROWSER_ARGS if headless else [*BROWSER_ARGS, "--start-maximized"]
+        return await self._playwright.chromium.launch(
+            headless=headless,
+            args=args,
+            timeout=300000,  # 5 min for Cloud Run cold starts
+        )
+
+
+_browser_pool: BrowserPool | None = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """Process-wide browser pool configured from settings."""
+    global _browser_pool
+    if _browser_pool is None:
+        settings = get_settings()
+        _browser_pool = BrowserPool(
+            size=settings.PLAYWRIGHT_POOL_SIZE,
+            max_uses=settings.PLAYWRIGHT_BROWSER_MAX_USES,
+            max_memory_mb=settings.PLAYWRIGHT_BROWSER_MAX_MEMORY_MB,
+            session_ttl_seconds=settings.PLAYWRIGHT_SESSION_TTL_SECONDS,
+        )
+    return _browser_pool
+
+
+async def close_browser_pool() -> None:
+    """Shut down the process-wide pool if it was ever used."""
+    global _browser_pool
+    if _browser_pool is not None:
+        await _browser_pool.close()
+        _browser_pool = None
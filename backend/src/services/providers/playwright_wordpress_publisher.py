@@ -8,17 +8,22 @@ import json
 from typing import Any, Literal
 
 import anthropic
-from playwright.async_api import Browser, Page, async_playwright
+from playwright.async_api import Page
 
 from src.api.schemas.seo import SEOMetadata
 from src.config import get_logger, get_settings
+from src.services.providers.playwright_browser_pool import (
+    BrowserLease,
+    get_browser_pool,
+    session_key,
+)
 
 logger = get_logger(__name__)
 settings = get_settings()
 
-# Global semaphore: only 1 Playwright browser at a time per Cloud Run instance.
-# Concurrent browsers on 2-CPU/2GB RAM cause timeouts and resource starvation.
-_playwright_semaphore = asyncio.Semaphore(1)
+
+class WordPressLoginRequiredError(RuntimeError):
+    """WordPress redirected an admin page to wp-login.php."""
 
 
 class PlaywrightWordPressPublisher:
@@ -39,7 +44,6 @@ class PlaywrightWordPressPublisher:
         Args:
             config_path: Path to WordPress selectors configuration JSON file
         """
-        self.browser: Browser | None = None
         self.page: Page | None = None
         self._cms_url: str | None = None  # Store CMS URL for later use
 
@@ -198,27 +202,26 @@ class PlaywrightWordPressPublisher:
                 has_featured_image=bool(featured_image_path),
             )
 
-            # Serialize Playwright: only one browser at a time per instance
-            async with _playwright_semaphore:
-                return await self._run_publish(
-                    cms_url=cms_url,
-                    username=username,
-                    password=password,
-                    article_title=article_title,
-                    article_body=article_body,
-                    seo_data=seo_data,
-                    article_images=article_images,
-                    headless=headless,
-                    publish_mode=publish_mode,
-                    http_auth=http_auth,
-                    primary_category=primary_category,
-                    secondary_categories=secondary_categories,
-                    tags=tags,
-                    featured_image_path=featured_image_path,
-                    featured_image_alt_text=featured_image_alt_text,
-                    featured_image_description=featured_image_description,
-                    skip_visual_verification=skip_visual_verification,
-                )
+            # Concurrency is bounded by the shared browser pool
+            return await self._run_publish(
+                cms_url=cms_url,
+                username=username,
+                password=password,
+                article_title=article_title,
+                article_body=article_body,
+                seo_data=seo_data,
+                article_images=article_images,
+                headless=headless,
+                publish_mode=publish_mode,
+                http_auth=http_auth,
+                primary_category=primary_category,
+                secondary_categories=secondary_categories,
+                tags=tags,
+                featured_image_path=featured_image_path,
+                featured_image_alt_text=featured_image_alt_text,
+                featured_image_description=featured_image_description,
+                skip_visual_verification=skip_visual_verification,
+            )
         except Exception as e:
             logger.error(
                 "playwright_publish_failed",
@@ -227,6 +230,77 @@ class PlaywrightWordPressPublisher:
             )
             return {"success": False, "error": str(e)}
 
+    async def complete_post(
+        self,
+        cms_url: str,
+        username: str,
+        password: str,
+        post_id: int | str,
+        steps: list[str],
+        seo_data: SEOMetadata | None = None,
+        headless: bool = True,
+        publish_mode: Literal["publish", "draft"] = "draft",
+        http_auth: tuple[str, str] | None = None,
+        primary_category: str | None = None,
+        secondary_categories: list[str] | None = None,
+        tags: list[str] | None = None,
+        featured_image_path: str | None = None,
+        featured_image_alt_text: str | None = None,
+        featured_image_description: str | None = None,
+    ) -> dict[str, Any]:
+        """Run only the given editor steps on a post created over REST.
+
+        Used by the REST publisher for steps the site does not accept through
+        the API (e.g. SEO plugin fields that are not exposed to REST).
+
+        Args:
+            cms_url: WordPress site URL
+            username: WordPress username
+            password: WordPress password or application password
+            post_id: Existing WordPress post ID
+            steps: Any of "seo", "featured_image", "categories", "tags"
+            publish_mode: How to save the post once the steps are applied
+
+        Returns:
+            Result dictionary with ``success`` and, on success, ``editor_url``
+        """
+        logger.info("playwright_complete_post_started", post_id=post_id, steps=steps)
+        try:
+            async with get_browser_pool().lease(
+                session_key(cms_url, username, http_auth),
+                headless=headless,
+                context_options=self._context_options(http_auth),
+                error_screenshot="/tmp/playwright_error.png",
+            ) as lease:
+                self.page = lease.page
+                await self._step_open_editor(lease, cms_url, username, password, post_id=post_id)
+                await self._dismiss_gutenberg_welcome()
+
+                if "categories" in steps and (primary_category or secondary_categories):
+                    await self._step_set_categories(primary_category, secondary_categories or [])
+                if "tags" in steps and tags:
+                    await self._step_set_tags(tags)
+                if "featured_image" in steps and featured_image_path:
+                    await self._step_set_featured_image(
+                        featured_image_path,
+                        alt_text=featured_image_alt_text,
+                        description=featured_image_description,
+                    )
+                if "seo" in steps and seo_data:
+                    await self._step_configure_seo(seo_data)
+
+                location, _ = await self._step_publish(publish_mode=publish_mode)
+                logger.info("playwright_complete_post_completed", post_id=post_id, steps=steps)
+                return {"success": True, "editor_url": location}
+        except Exception as e:
+            logger.error(
+                "playwright_complete_post_failed",
+                post_id=post_id,
+                error=str(e),
+                exc_info=True,
+            )
+            return {"success": False, "error": str(e)}
+
     async def _run_publish(
         self,
         cms_url: str,
@@ -247,49 +321,16 @@ class PlaywrightWordPressPublisher:
         featured_image_description: str | None = None,
         skip_visual_verification: bool = False,
     ) -> dict[str, Any]:
-        """Internal publish method, runs under the semaphore."""
+        """Internal publish method, runs on a browser leased from the pool."""
         try:
-            # Start Playwright
-            async with async_playwright() as p:
-                # Launch browser with Cloud Run compatible options
-                browser_args = [
-                    "--no-sandbox",
-                    "--disable-setuid-sandbox",
-                    "--disable-dev-shm-usage",  # Important for Docker/Cloud Run
-                    "--disable-gpu",
-                    "--disable-software-rasterizer",
-                    # Use limited renderer processes instead of --single-process
-                    # (--single-process causes I/O starvation on Cloud Run)
-                    "--renderer-process-limit=1",
-                    # Cloud Run cold-start networking optimizations
-                    "--disable-background-networking",
-                    "--no-first-run",
-                    "--dns-prefetch-disable",
-                    "--disable-extensions",
-                    "--disable-component-update",
-                    "--disable-default-apps",
-                ]
-                if not headless:
-                    browser_args.append("--start-maximized")
-
-                self.browser = await p.chromium.launch(
-                    headless=headless,
-                    args=browser_args,
-                    timeout=300000,  # 5 min for Cloud Run cold starts
-                )
-
-                # Create context with HTTP Basic Auth if provided
-                context_options: dict[str, Any] = {
-                    "viewport": {"width": 1280, "height": 720},
-                    "ignore_https_errors": True,  # Ignore SSL errors for stability
-                }
-                if http_auth:
-                    context_options["http_credentials"] = {
-                        "username": http_auth[0],
-                        "password": http_auth[1],
-                    }
-                context = await self.browser.new_context(**context_options)
-                self.page = await context.new_page()
+            # Warm browser from the shared pool; reuses a saved login when valid
+            async with get_browser_pool().lease(
+                session_key(cms_url, username, http_auth),
+                headless=headless,
+                context_options=self._context_options(http_auth),
+                error_screenshot="/tmp/playwright_error.png",
+            ) as lease:
+                self.page = lease.page
 
                 # Enable verbose logging
                 self.page.on("console", lambda msg: logger.debug(f"Browser Console: {msg.text}"))
@@ -303,8 +344,7 @@ class PlaywrightWordPressPublisher:
                 )
 
                 # Execute publishing steps
-                await self._step_login(cms_url, username, password)
-                await self._step_navigate_to_new_post()
+                await self._step_open_editor(lease, cms_url, username, password)
                 
                 # Check for and dismiss Gutenberg "Welcome Guide"
                 await self._dismiss_gutenberg_welcome()
@@ -418,22 +458,24 @@ class PlaywrightWordPressPublisher:
                 error=str(e),
                 exc_info=True,
             )
-
-            # Take error screenshot (short timeout to avoid font-loading hangs)
-            if self.page:
-                try:
-                    await self.page.screenshot(path="/tmp/playwright_error.png", timeout=10000)
-                except Exception:
-                    pass
-
             return {
                 "success": False,
                 "error": str(e),
             }
 
-        finally:
-            if self.browser:
-                await self.browser.close()
+    @staticmethod
+    def _context_options(http_auth: tuple[str, str] | None) -> dict[str, Any]:
+        """Browser context options, with HTTP Basic Auth if provided."""
+        context_options: dict[str, Any] = {
+            "viewport": {"width": 1280, "height": 720},
+            "ignore_https_errors": True,  # Ignore SSL errors for stability
+        }
+        if http_auth:
+            context_options["http_credentials"] = {
+                "username": http_auth[0],
+                "password": http_auth[1],
+            }
+        return context_options
 
     async def _dismiss_gutenberg_welcome(self) -> None:
         """Dismiss the Gutenberg 'Welcome Guide' modal if it appears."""
@@ -476,6 +518,34 @@ class PlaywrightWordPressPublisher:
         except Exception as e:
             logger.debug(f"Error dismissing welcome guide: {e}")
 
+    async def _step_open_editor(
+        self,
+        lease: BrowserLease,
+        cms_url: str,
+        username: str,
+        password: str,
+        post_id: int | str | None = None,
+    ) -> None:
+        """Log in (unless a saved session was restored) and open the editor.
+
+        Opens a new post, or the existing ``post_id``.  A restored session
+        that WordPress no longer accepts is dropped and replaced by a fresh
+        login.
+        """
+        if lease.session_restored:
+            self._cms_url = cms_url.rstrip("/")
+            logger.info("playwright_session_reused", cms_url=self._cms_url)
+            try:
+                await self._step_navigate_to_new_post(post_id)
+                return
+            except WordPressLoginRequiredError:
+                logger.info("playwright_session_rejected", cms_url=self._cms_url)
+                lease.invalidate_session()
+
+        await self._step_login(cms_url, username, password)
+        await lease.save_session()
+        await self._step_navigate_to_new_post(post_id)
+
     async def _step_login(self, cms_url: str, username: str, password: str) -> None:
         """Step 1: Login to WordPress.
 
@@ -603,8 +673,8 @@ class PlaywrightWordPressPublisher:
 
         logger.info("playwright_login_completed", dashboard_url=post_login_url)
 
-    async def _step_navigate_to_new_post(self) -> None:
-        """Step 2: Navigate to new post page.
+    async def _step_navigate_to_new_post(self, post_id: int | str | None = None) -> None:
+        """Step 2: Navigate to new post page (or to ``post_id``'s editor).
 
         Uses domcontentloaded + element wait instead of the default "load"
         event, which requires ALL sub-resources (50+ JS/CSS for Gutenberg)
@@ -619,6 +689,8 @@ class PlaywrightWordPressPublisher:
             raise RuntimeError("CMS URL not stored - login step may have failed")
 
         new_post_url = f"{self._cms_url}/wp-admin/post-new.php"
+        if post_id is not None:
+            new_post_url = f"{self._cms_url}/wp-admin/post.php?post={post_id}&action=edit"
         nav_start = _time.monotonic()
 
         # Always navigate directly to post-new.php — more reliable than
@@ -661,6 +733,9 @@ class PlaywrightWordPressPublisher:
                 # Brief pause before retry
                 await asyncio.sleep(3)
 
+        if "wp-login.php" in self.page.url:
+            raise WordPressLoginRequiredError(f"Redirected to login page: {self.page.url}")
+
         # Wait for the editor element to appear — this is what we actually
         # need, NOT the full page load (which includes analytics/fonts/etc).
         gutenberg_title = self.config["editor"]["title_field"]  # includes fallback selectors
@@ -0,0 +1,462 @@
+"""REST-first WordPress publishing with per-step browser fallback.
+
+Creating a draft through the Gutenberg UI takes minutes and holds the
+instance's only browser slot.  Almost every step has a REST equivalent, so
+this publisher uploads media and resolves terms in parallel, creates the
+post in a single request and writes SEO plugin meta alongside it.  Steps
+the site refuses over REST are recorded in a capability matrix and replayed
+on the created post by ``PlaywrightWordPressPublisher.complete_post``; only
+when the post itself cannot be created does the caller fall back to the
+full browser flow.
+
+Step outcomes reported in ``result["steps"]``:
+
+    rest     done over the REST API
+    browser  done in the editor after the REST create
+    failed   neither path succeeded (the draft still exists)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import html
+import mimetypes
+import os
+import re
+from typing import Any, Literal
+from urllib.parse import urlparse
+
+import httpx
+
+from src.api.schemas.seo import SEOMetadata
+from src.config import get_logger, get_settings
+from src.services.cms_adapter.wordpress_adapter import WordPressAdapter
+from src.services.providers.playwright_wordpress_publisher import (
+    PlaywrightWordPressPublisher,
+)
+from src.services.storage.image_store import StoredImage, get_image_store
+
+logger = get_logger(__name__)
+
+# Steps the editor can redo on an existing post when REST cannot
+BROWSER_STEPS = ("categories", "tags", "featured_image", "seo")
+
+# Post meta written by each SEO plugin; only honoured when registered for REST
+SEO_META_KEYS: dict[str, dict[str, str]] = {
+    "yoast": {
+        "meta_title": "_yoast_wpseo_title",
+        "meta_description": "_yoast_wpseo_metadesc",
+        "focus_keyword": "_yoast_wpseo_focuskw",
+    },
+    "rankmath": {
+        "meta_title": "rank_math_title",
+        "meta_description": "rank_math_description",
+        "focus_keyword": "rank_math_focus_keyword",
+    },
+}
+SEO_PLUGIN_NAMESPACES = {"yoast/v1": "yoast", "rankmath/v1": "rankmath"}
+
+_PARAGRAPH_START_RE = re.compile(r"<p[\s>]", re.IGNORECASE)
+
+
+class RestPublishUnavailableError(RuntimeError):
+    """The post itself could not be created over REST."""
+
+
+class WordPressRestPublisher:
+    """Publish articles through the WordPress REST API."""
+
+    def __init__(
+        self,
+        cms_url: str,
+        username: str,
+        password: str,
+        *,
+        http_auth: tuple[str, str] | None = None,
+        adapter: WordPressAdapter | None = None,
+        browser_publisher: PlaywrightWordPressPublisher | None = None,
+        media_concurrency: int | None = None,
+    ) -> None:
+        """Initialize REST publisher.
+
+        Args:
+            cms_url: WordPress site URL
+            username: WordPress username
+            password: WordPress application password
+            http_auth: Optional site-level HTTP Basic Auth (username, password)
+            adapter: REST adapter to use (defaults to one built from the credentials)
+            browser_publisher: Publisher used for steps REST cannot perform
+            media_concurrency: Parallel media uploads (defaults to settings)
+        """
+        self.cms_url = cms_url.rstrip("/")
+        self.username = username
+        self.password = password
+        self.http_auth = http_auth
+        self.adapter = adapter or WordPressAdapter(
+            cms_url,
+            {"username": username, "application_password": password},
+            http_auth=http_auth,
+        )
+        self._browser_publisher = browser_publisher
+        self._media_semaphore = asyncio.Semaphore(
+            media_concurrency or get_settings().WORDPRESS_MEDIA_UPLOAD_CONCURRENCY
+        )
+
+    async def publish(
+        self,
+        article_title: str,
+        article_body: str,
+        seo_data: SEOMetadata | None = None,
+        article_images: list[dict[str, Any]] | None = None,
+        publish_mode: Literal["publish", "draft"] = "draft",
+        primary_category: str | None = None,
+        secondary_categories: list[str] | None = None,
+        tags: list[str] | None = None,
+        featured_image_path: str | None = None,
+        featured_image_alt_text: str | None = None,
+        featured_image_description: str | None = None,
+    ) -> dict[str, Any]:
+        """Create the post over REST, then finish unsupported steps in the editor.
+
+        Returns:
+            Publishing result in the same shape as the Playwright publisher,
+            plus ``steps`` (the capability matrix) and ``publishing_method``.
+
+        Raises:
+            RestPublishUnavailableError: If WordPress rejects the post creation
+        """
+        categories = [c for c in [primary_category, *(secondary_categories or [])] if c]
+        steps: dict[str, str] = {}
+
+        namespaces, featured, uploaded, tag_ids, category_ids = await asyncio.gather(
+            self._namespaces(),
+            self._upload_featured(
+                featured_image_path, featured_image_alt_text, featured_image_description
+            ),
+            self._upload_images(article_images or []),
+            self._resolve_terms("tags", tags or []),
+            self._resolve_terms("categories", categories),
+        )
+
+        post_data: dict[str, Any] = {
+            "title": article_title,
+            "content": self._place_images(article_body, uploaded),
+            # Finish as draft so editor fallbacks never touch a live post
+            "status": "draft",
+        }
+        if tags:
+            steps["tags"] = "rest" if tag_ids is not None else "browser"
+            if tag_ids:
+                post_data["tags"] = tag_ids
+        if categories:
+            steps["categories"] = "rest" if category_ids is not None else "browser"
+            if category_ids:
+                post_data["categories"] = category_ids
+        if featured_image_path:
+            steps["featured_image"] = "rest" if featured else "browser"
+            if featured:
+                post_data["featured_media"] = featured["id"]
+        if article_images:
+            steps["images"] = "rest" if len(uploaded) == len(article_images) else "failed"
+
+        seo_plugin = next(
+            (plugin for ns, plugin in SEO_PLUGIN_NAMESPACES.items() if ns in namespaces), None
+        )
+        seo_meta = self._seo_meta(seo_plugin, seo_data)
+        if seo_meta:
+            post_data["meta"] = seo_meta
+
+        try:
+            post = await self.adapter.create_post(post_data)
+        except httpx.HTTPError as exc:
+            # The full browser flow uploads everything again
+            media_ids = [image["media_id"] for image in uploaded]
+            await self._delete_media([featured["id"], *media_ids] if featured else media_ids)
+            raise RestPublishUnavailableError(f"WordPress REST post creation failed: {exc}") from exc
+
+        post_id = post["id"]
+        if seo_data:
+            echoed = post.get("meta") or {}
+            accepted = bool(seo_meta) and all(echoed.get(k) == v for k, v in seo_meta.items())
+            steps["seo"] = "rest" if accepted else "browser"
+
+        editor_url = f"{self.cms_url}/wp-admin/post.php?post={post_id}&action=edit"
+        browser_steps = [step for step in BROWSER_STEPS if steps.get(step) == "browser"]
+        completed: dict[str, Any] = {}
+        if browser_steps:
+            completed = await self._complete_in_browser(
+                post_id,
+                browser_steps,
+                seo_data=seo_data,
+                publish_mode=publish_mode,
+                primary_category=primary_category,
+                secondary_categories=secondary_categories,
+                tags=tags,
+                featured_image_path=featured_image_path,
+                featured_image_alt_text=featured_image_alt_text,
+                featured_image_description=featured_image_description,
+            )
+            if not completed.get("success"):
+                steps.update(dict.fromkeys(browser_steps, "failed"))
+        if publish_mode == "publish" and not (browser_steps and completed.get("success")):
+            try:
+                post = await self.adapter.update_post(post_id, {"status": "publish"})
+            except httpx.HTTPError as exc:
+                logger.error("wordpress_rest_status_update_failed", post_id=post_id, error=str(exc))
+                return {
+                    "success": False,
+                    "cms_article_id": str(post_id),
+                    "editor_url": editor_url,
+                    "error": f"Draft created but publishing failed: {exc}",
+                    "steps": steps,
+                    "publishing_method": "rest",
+                }
+
+        status_value = "draft" if publish_mode == "draft" else "published"
+        logger.info(
+            "wordpress_rest_publish_completed",
+            post_id=post_id,
+            publish_mode=publish_mode,
+            steps=steps,
+        )
+        return {
+            "success": True,
+            "cms_article_id": str(post_id),
+            "url": post.get("link") if publish_mode != "draft" else None,
+            "editor_url": editor_url if publish_mode == "draft" else None,
+            "status": status_value,
+            "steps": steps,
+            "publishing_method": "rest+browser" if browser_steps else "rest",
+        }
+
+    async def close(self) -> None:
+        """Close the REST client."""
+        await self.adapter.close()
+
+    async def _namespaces(self) -> list[str]:
+        try:
+            return await self.adapter.get_rest_namespaces()
+        except Exception as exc:  # noqa: BLE001 - only used to pick the SEO plugin
+            logger.warning("wordpress_rest_namespaces_failed", error=str(exc))
+            return []
+
+    async def _resolve_terms(
+        self, taxonomy: Literal["tags", "categories"], names: list[str]
+    ) -> list[int] | None:
+        """Term IDs, or None when the site refuses term lookups/creation over REST."""
+        if not names:
+            return []
+        try:
+            return await self.adapter.get_or_create_term_ids(taxonomy, names)
+        except Exception as exc:  # noqa: BLE001 - fall back to the editor
+            logger.warning("wordpress_rest_terms_failed", taxonomy=taxonomy, error=str(exc))
+            return None
+
+    async def _upload(self, path: str, **fields: Any) -> dict[str, Any] | None:
+        async with self._media_semaphore:
+            try:
+                return await self.adapter.upload_media(path, **fields)
+            except Exception as exc:  # noqa: BLE001 - reported via the step matrix
+                logger.warning("wordpress_rest_media_failed", path=path, error=str(exc))
+                return None
+
+    async def _upload_featured(
+        self, path: str | None, alt_text: str | None, description: str | None
+    ) -> dict[str, Any] | None:
+        if not path:
+            return None
+        return await self._upload(path, alt_text=alt_text or "", description=description or "")
+
+    async def _download(self, url: str | None) -> StoredImage | None:
+        """Fetch a body image that has no local copy into the image store."""
+        if not url or not url.startswith(("http://", "https://")):
+            return None
+        async with self._media_semaphore:
+            try:
+                return await get_image_store().fetch(url)
+            except Exception as exc:  # noqa: BLE001 - reported via the step matrix
+                logger.warning("wordpress_rest_media_download_failed", url=url[:100], error=str(exc))
+                return None
+
+    @staticmethod
+    def _download_filename(image: dict[str, Any], stored: StoredImage) -> str:
+        """Upload name for a downloaded image; blobs carry no extension."""
+        filename = (
+            image.get("filename")
+            or os.path.basename(urlparse(stored.url).path)
+            or stored.sha256[:16]
+        )
+        if not mimetypes.guess_type(filename)[0] and stored.content_type:
+            filename += mimetypes.guess_extension(stored.content_type) or ""
+        return filename
+
+    async def _upload_images(self, images: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Upload body images in parallel; returns the images that made it.
+
+        Images without a ``local_path`` are downloaded from ``source_url``.
+        """
+
+        async def upload(image: dict[str, Any]) -> dict[str, Any] | None:
+            path, filename = image.get("local_path"), image.get("filename")
+            if not path:
+                stored = await self._download(image.get("source_url"))
+                if stored is None:
+                    return None
+                path, filename = str(stored.path), self._download_filename(image, stored)
+            media = await self._upload(
+                path,
+                filename=filename,
+                alt_text=image.get("alt_text", ""),
+                caption=image.get("caption", ""),
+                description=image.get("description", ""),
+            )
+            if media is None:
+                return None
+            return {**image, "media_id": media["id"], "wordpress_url": media["source_url"]}
+
+        results = await asyncio.gather(*(upload(image) for image in images))
+        return [image for image in results if image is not None]
+
+    async def _delete_media(self, media_ids: list[int]) -> None:
+        """Best-effort removal of media uploaded for a post that was not created."""
+        results = await asyncio.gather(
+            *(self.adapter.delete_media(media_id) for media_id in media_ids),
+            return_exceptions=True,
+        )
+        for media_id, result in zip(media_ids, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "wordpress_rest_media_cleanup_failed", media_id=media_id, error=str(result)
+                )
+
+    @staticmethod
+    def _seo_meta(plugin: str | None, seo_data: SEOMetadata | None) -> dict[str, str]:
+        if plugin is None or seo_data is None:
+            return {}
+        values = {
+            "meta_title": seo_data.meta_title,
+            "meta_description": seo_data.meta_description,
+            "focus_keyword": seo_data.focus_keyword,
+        }
+        return {key: values[field] for field, key in SEO_META_KEYS[plugin].items() if values[field]}
+
+    @staticmethod
+    def _place_images(body: str, images: list[dict[str, Any]]) -> str:
+        """Point existing ``<img>`` sources at the uploads, or insert new figures.
+
+        Images whose source URL is not in the body are inserted before the
+        paragraph at their ``position`` (appended when past the end); images
+        sharing a position keep their input order.
+        """
+        inserts: list[tuple[int, str]] = []
+        for image in images:
+            source_url = image.get("source_url")
+            if source_url and source_url in body:
+                body = body.replace(source_url, image["wordpress_url"])
+                continue
+            figure = (
+                f'<figure class="wp-block-image"><img src="{html.escape(image["wordpress_url"])}"'
+                f' alt="{html.escape(image.get("alt_text", ""))}"'
+                f' class="wp-image-{image["media_id"]}"/>'
+            )
+            if image.get("caption"):
+                figure += f"<figcaption>{html.escape(image['caption'])}</figcaption>"
+            # Without a position the figure goes after the last paragraph
+            inserts.append((image.get("position", len(body)), figure + "</figure>"))
+
+        paragraph_starts = [m.start() for m in _PARAGRAPH_START_RE.finditer(body)]
+        figures_at: dict[int, list[str]] = {}
+        for position, figure in inserts:
+            offset = paragraph_starts[position] if position < len(paragraph_starts) else len(body)
+            figures_at.setdefault(offset, []).append(figure)
+
+        parts: list[str] = []
+        previous = 0
+        for offset in sorted(figures_at):
+            parts.append(body[previous:offset])
+            parts.extend(figures_at[offset])
+            previous = offset
+        parts.append(body[previous:])
+        return "".join(parts)
+
+    async def _complete_in_browser(
+        self, post_id: int, steps: list[str], **kwargs: Any
+    ) -> dict[str, Any]:
+        logger.info("wordpress_rest_browser_fallback", post_id=post_id, steps=steps)
+        publisher = self._browser_publisher or PlaywrightWordPressPublisher()
+        return await publisher.complete_post(
+            cms_url=self.cms_url,
+            username=self.username,
+            password=self.password,
+            post_id=post_id,
+            steps=steps,
+            http_auth=self.http_auth,
+            **kwargs,
+        )
+
+
+async def publish_rest_first(
+    cms_url: str,
+    username: str,
+    password: str,
+    article_title: str,
+    article_body: str,
+    seo_data: SEOMetadata | None = None,
+    article_images: list[dict[str, Any]] | None = None,
+    publish_mode: Literal["publish", "draft"] = "draft",
+    http_auth: tuple[str, str] | None = None,
+    primary_category: str | None = None,
+    secondary_categories: list[str] | None = None,
+    tags: list[str] | None = None,
+    featured_image_path: str | None = None,
+    featured_image_alt_text: str | None = None,
+    featured_image_description: str | None = None,
+    playwright_config_path: str | None = None,
+    skip_visual_verification: bool = True,
+) -> dict[str, Any]:
+    """Publish over REST when possible, otherwise drive the full editor flow.
+
+    Returns:
+        Publishing result dictionary (see ``WordPressRestPublisher.publish``)
+    """
+    browser_publisher = PlaywrightWordPressPublisher(playwright_config_path)
+    article = {
+        "article_title": article_title,
+        "article_body": article_body,
+        "seo_data": seo_data,
+        "article_images": article_images,
+        "publish_mode": publish_mode,
+        "primary_category": primary_category,
+        "secondary_categories": secondary_categories,
+        "tags": tags,
+        "featured_image_path": featured_image_path,
+        "featured_image_alt_text": featured_image_alt_text,
+        "featured_image_description": featured_image_description,
+    }
+
+    if get_settings().WORDPRESS_REST_PUBLISH_ENABLED:
+        rest_publisher = WordPressRestPublisher(
+            cms_url,
+            username,
+            password,
+            http_auth=http_auth,
+            browser_publisher=browser_publisher,
+        )
+        try:
+            return await rest_publisher.publish(**article)
+        except RestPublishUnavailableError as exc:
+            logger.warning("wordpress_rest_publish_unavailable", error=str(exc))
+        finally:
+            await rest_publisher.close()
+
+    result = await browser_publisher.publish_article(
+        cms_url=cms_url,
+        username=username,
+        password=password,
+        headless=True,
+        http_auth=http_auth,
+        skip_visual_verification=skip_visual_verification,
+        **article,
+    )
+    result.setdefault("publishing_method", "playwright")
+    return result
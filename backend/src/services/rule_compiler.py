@@ -38,9 +38,8 @@ class CompiledRule:
             return text, []
 
         # 檢查條件
-        if self.conditions and context:
-            if not self._check_conditions(context):
-                return text, []
+        if not self.applies_to(context):
+            return text, []
 
         changes = []
         result_text = text
@@ -52,16 +51,7 @@ class CompiledRule:
         for match in reversed(matches):
             start, end = match.span()
             original = match.group()
-
-            # 處理替換文本（支持捕獲組引用）
-            if self.replacement:
-                replacement = self.replacement
-                # 處理反向引用 \1, \2 等
-                for i, group in enumerate(match.groups(), 1):
-                    if group:
-                        replacement = replacement.replace(f"\\{i}", group)
-            else:
-                replacement = original
+            replacement = self.render_replacement(match)
 
             changes.append({
                 "rule_id": self.rule_id,
@@ -75,6 +65,22 @@ class CompiledRule:
 
         return result_text, changes
 
+    def applies_to(self, context: dict[str, Any] | None) -> bool:
+        """規則條件是否允許在此上下文中應用（無條件或無上下文時總是應用）"""
+        if not self.conditions or not context:
+            return True
+        return self._check_conditions(context)
+
+    def render_replacement(self, match: re.Match) -> str:
+        """計算某個匹配的替換文本（支持 \\1, \\2 等捕獲組引用）"""
+        if not self.replacement:
+            return match.group()
+        replacement = self.replacement
+        for i, group in enumerate(match.groups(), 1):
+            if group:
+                replacement = replacement.replace(f"\\{i}", group)
+        return replacement
+
     def _check_conditions(self, context: dict[str, Any]) -> bool:
         """檢查條件是否滿足"""
         if not self.conditions:
@@ -103,11 +109,14 @@ class RuleCompiler:
     def __init__(self):
         self.compiled_rules_cache = {}
 
-    def compile_rules(self, rules: list[DraftRule]) -> list[CompiledRule]:
+    def compile_rules(
+        self, rules: list[DraftRule], *, reviewed_only: bool = True
+    ) -> list[CompiledRule]:
         """編譯規則列表
 
         Args:
             rules: 要編譯的規則列表
+            reviewed_only: 只編譯已批准或已修改的規則（測試未審查規則時傳 False）
 
         Returns:
             編譯後的規則列表
@@ -116,7 +125,9 @@ class RuleCompiler:
 
         for rule in rules:
             # 只編譯已批准或已修改的規則
-            if rule.review_status not in [ReviewStatus.APPROVED, ReviewStatus.MODIFIED]:
+            if reviewed_only and rule.review_status not in [
+                ReviewStatus.APPROVED, ReviewStatus.MODIFIED
+            ]:
                 continue
 
             compiled_rule = self._compile_single_rule(rule)
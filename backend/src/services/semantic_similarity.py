@@ -4,10 +4,13 @@
 """
 
 import hashlib
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 import numpy as np
 from openai import AsyncOpenAI
-from sqlalchemy import and_, select, text
+from sqlalchemy import and_, func, select, text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.logging import get_logger
@@ -17,6 +20,14 @@ from src.models.topic_embedding import TopicEmbedding
 
 logger = get_logger(__name__)
 
+# 嵌入文本使用的正文前綴長度（字符）
+TOPIC_BODY_CHARS = 1000
+
+
+def build_topic_text(title: str, body_prefix: str | None) -> str:
+    """組合用於生成嵌入的文本：標題 + 正文前綴"""
+    return f"{title}\n\n{body_prefix or ''}"
+
 
 class SemanticSimilarityService:
     """語義相似度檢測服務
@@ -144,7 +155,9 @@ class SemanticSimilarityService:
         # 準備嵌入文本
         if not topic_text:
             # 使用標題和內容前 1000 字符
-            topic_text = f"{article.title}\n\n{article.body[:1000] if article.body else ''}"
+            topic_text = build_topic_text(
+                article.title, article.body[:TOPIC_BODY_CHARS] if article.body else None
+            )
 
         # 生成嵌入
         embedding = await self.generate_embedding(topic_text)
@@ -325,66 +338,111 @@ class SemanticSimilarityService:
     async def reindex_all_articles(
         self,
         session: AsyncSession,
-        batch_size: int = 50
+        batch_size: int = 50,
+        *,
+        start_after_id: int = 0,
+        force: bool = False,
+        checkpoint: Callable[[int], Awaitable[Any]] | None = None,
     ) -> int:
         """重新索引所有文章的嵌入
 
+        按文章 ID 進行 keyset 分頁，每頁只查詢 id、標題和正文前綴。
+        嵌入文本與已存儲的 topic_text 相同的文章會被跳過；
+        其餘文章每頁只發一次批量嵌入請求，並用一條 upsert 語句寫入
+        topic_embeddings。每頁提交後調用 ``checkpoint(last_id)``，
+        中斷後可用 ``start_after_id`` 從該位置繼續。
+
         Args:
             session: 數據庫會話
-            batch_size: 批處理大小
+            batch_size: 每頁文章數量（即每次嵌入請求的文本數）
+            start_after_id: 從該文章 ID 之後開始（斷點續傳）
+            force: 忽略內容比較，重新生成所有嵌入（如更換嵌入模型）
+            checkpoint: 每頁完成後的回調，參數為該頁最後一篇文章 ID
 
         Returns:
-            處理的文章數量
+            重新生成嵌入的文章數量
         """
-        # 獲取所有文章
-        result = await session.execute(
-            select(Article).where(
-                and_(
-                    Article.body.isnot(None),
-                    Article.body != ""
+        last_id = start_after_id
+        processed = 0
+        skipped = 0
+        failed = 0
+
+        logger.info(f"開始重新索引文章嵌入 (start_after_id={start_after_id}, force={force})")
+
+        while True:
+            result = await session.execute(
+                select(
+                    Article.id,
+                    Article.title,
+                    func.substr(Article.body, 1, TOPIC_BODY_CHARS).label("body_prefix"),
+                    TopicEmbedding.topic_text,
+                )
+                .outerjoin(TopicEmbedding, TopicEmbedding.article_id == Article.id)
+                .where(
+                    and_(
+                        Article.id > last_id,
+                        Article.body.isnot(None),
+                        Article.body != "",
+                    )
                 )
+                .order_by(Article.id)
+                .limit(batch_size)
+            )
+            rows = result.all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            # 只為內容有變化的文章生成嵌入
+            pending: list[tuple[int, str]] = []
+            for row in rows:
+                topic_text = build_topic_text(row.title, row.body_prefix)
+                if not force and row.topic_text == topic_text:
+                    skipped += 1
+                    continue
+                pending.append((row.id, topic_text))
+
+            if pending:
+                embeddings = await self.batch_generate_embeddings(
+                    [topic_text for _, topic_text in pending], batch_size=len(pending)
+                )
+                values = [
+                    {"article_id": article_id, "topic_text": topic_text, "embedding": embedding}
+                    for (article_id, topic_text), embedding in zip(pending, embeddings, strict=True)
+                    if embedding  # 跳過失敗的嵌入
+                ]
+                failed += len(pending) - len(values)
+                if values:
+                    await self._upsert_embeddings(session, values)
+                    processed += len(values)
+
+            await session.commit()
+            if checkpoint is not None:
+                await checkpoint(last_id)
+
+            logger.info(
+                f"進度: 已處理到文章 {last_id} "
+                f"(更新 {processed}, 跳過 {skipped}, 失敗 {failed})"
             )
-        )
-        articles = result.scalars().all()
-
-        if not articles:
-            logger.info("沒有文章需要索引")
-            return 0
-
-        logger.info(f"開始重新索引 {len(articles)} 篇文章")
-
-        # 批量處理
-        processed = 0
-        for i in range(0, len(articles), batch_size):
-            batch = articles[i:i + batch_size]
-
-            # 準備文本
-            texts = [
-                f"{article.title}\n\n{article.body[:1000]}"
-                for article in batch
-            ]
-
-            # 批量生成嵌入
-            embeddings = await self.batch_generate_embeddings(texts)
 
-            # 存儲嵌入
-            for article, text, embedding in zip(batch, texts, embeddings, strict=False):
-                if embedding:  # 跳過失敗的嵌入
-                    try:
-                        await self.store_article_embedding(
-                            session,
-                            article.id,
-                            text
-                        )
-                        processed += 1
-                    except Exception as e:
-                        logger.error(f"存儲嵌入失敗 (文章 {article.id}): {e}")
-
-            logger.info(f"進度: {min(i + batch_size, len(articles))}/{len(articles)}")
-
-        logger.info(f"重新索引完成，處理了 {processed} 篇文章")
+        logger.info(f"重新索引完成，更新 {processed} 篇，未變化 {skipped} 篇，失敗 {failed} 篇")
         return processed
 
+    async def _upsert_embeddings(
+        self, session: AsyncSession, values: list[dict[str, Any]]
+    ) -> None:
+        """以單條 INSERT ... ON CONFLICT 語句批量寫入嵌入"""
+        stmt = insert(TopicEmbedding).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[TopicEmbedding.article_id],
+            set_={
+                "topic_text": stmt.excluded.topic_text,
+                "embedding": stmt.excluded.embedding,
+                "updated_at": func.now(),
+            },
+        )
+        await session.execute(stmt)
+
     async def get_article_clusters(
         self,
         session: AsyncSession,
@@ -48,12 +48,7 @@ class SEOAnalyzerService:
                 target_keyword=target_keyword,
             )
 
-            response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=2048,
-                temperature=0.3,  # Lower temperature for more consistent SEO analysis
-                messages=[{"role": "user", "content": prompt}],
-            )
+            response = await self.client.messages.create(**self.build_request_params(prompt))
 
             # Parse JSON response
             content = response.content[0].text
@@ -72,6 +67,27 @@ class SEOAnalyzerService:
             logger.error("seo_analysis_failed", error=str(e), exc_info=True)
             raise
 
+    def build_request_params(self, prompt: str) -> dict[str, Any]:
+        """Messages API parameters for ``prompt`` (shared by sync and batch calls)."""
+        return {
+            "model": self.model,
+            "max_tokens": 2048,
+            "temperature": 0.3,  # Lower temperature for more consistent SEO analysis
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    def build_batch_request(
+        self, title: str, body: str, target_keyword: str | None = None
+    ) -> dict[str, Any]:
+        """Messages API parameters for analyzing one article in a message batch."""
+        return self.build_request_params(
+            self._build_seo_analysis_prompt(title, body, target_keyword)
+        )
+
+    def parse_batch_result(self, message: Any) -> SEOAnalysisResponse:
+        """Parse a message-batch answer like ``analyze_article`` does."""
+        return SEOAnalysisResponse(**self._parse_seo_response(message.content[0].text))
+
     def _build_seo_analysis_prompt(
         self,
         title: str,
@@ -1,5 +1,6 @@
 """Batch SEO analysis service for imported articles."""
 
+from typing import Any
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -66,34 +67,7 @@ class SEOBatchAnalyzer:
                 target_keyword=None,  # Auto-detect focus keyword
             )
 
-            # Extract SEO data
-            seo_data = analysis.seo_data
-
-            # Create SEO metadata record
-            seo_metadata = SEOMetadata(
-                article_id=article.id,
-                meta_title=seo_data.meta_title,
-                meta_description=seo_data.meta_description,
-                focus_keyword=seo_data.focus_keyword,
-                primary_keywords=seo_data.keywords[:5] if seo_data.keywords else None,
-                secondary_keywords=seo_data.keywords[5:15] if len(seo_data.keywords) > 5 else None,
-                readability_score=seo_data.readability_score,
-                seo_score=seo_data.seo_score,
-                # Store additional data in JSONB fields
-                open_graph_data={
-                    "og_title": seo_data.og_title,
-                    "og_description": seo_data.og_description,
-                    "og_image": seo_data.og_image,
-                } if seo_data.og_title else None,
-                schema_markup={
-                    "type": seo_data.schema_type,
-                } if seo_data.schema_type else None,
-            )
-
-            self.session.add(seo_metadata)
-
-            # Update article status to SEO_OPTIMIZED
-            article.status = ArticleStatus.SEO_OPTIMIZED
+            seo_metadata = self._add_seo_metadata(article, analysis.seo_data)
 
             await self.session.commit()
             await self.session.refresh(seo_metadata)
@@ -118,21 +92,61 @@ class SEOBatchAnalyzer:
             )
             raise
 
-    async def analyze_imported_articles(
-        self,
-        limit: int | None = None,
-    ) -> tuple[int, int, list[str]]:
-        """Analyze all imported articles without SEO metadata.
-
-        Args:
-            limit: Optional limit on number of articles to process
+    async def apply_batch_result(self, article: Article, message: Any) -> SEOMetadata | None:
+        """Save SEO metadata from a message-batch answer.
 
-        Returns:
-            tuple: (successful_count, failed_count, error_messages)
+        Returns None (and saves nothing) if the article got SEO metadata
+        while the batch was running.
         """
-        # Find articles with status IMPORTED that don't have SEO metadata
+        existing = await self.session.execute(
+            select(SEOMetadata.id).where(SEOMetadata.article_id == article.id)
+        )
+        if existing.scalar_one_or_none() is not None:
+            return None
+        analysis = self.seo_analyzer.parse_batch_result(message)
+        seo_metadata = self._add_seo_metadata(article, analysis.seo_data)
+        await self.session.commit()
+        return seo_metadata
+
+    def _add_seo_metadata(self, article: Article, seo_data: Any) -> SEOMetadata:
+        """Stage the SEO metadata row and mark the article SEO-optimized."""
+        seo_metadata = SEOMetadata(
+            article_id=article.id,
+            meta_title=seo_data.meta_title,
+            meta_description=seo_data.meta_description,
+            focus_keyword=seo_data.focus_keyword,
+            primary_keywords=seo_data.keywords[:5] if seo_data.keywords else None,
+            secondary_keywords=seo_data.keywords[5:15] if len(seo_data.keywords) > 5 else None,
+            readability_score=seo_data.readability_score,
+            seo_score=seo_data.seo_score,
+            # Store additional data in JSONB fields
+            open_graph_data={
+                "og_title": seo_data.og_title,
+                "og_description": seo_data.og_description,
+                "og_image": seo_data.og_image,
+            } if seo_data.og_title else None,
+            schema_markup={
+                "type": seo_data.schema_type,
+            } if seo_data.schema_type else None,
+        )
+
+        self.session.add(seo_metadata)
+
+        # Update article status to SEO_OPTIMIZED
+        article.status = ArticleStatus.SEO_OPTIMIZED
+        return seo_metadata
+
+    async def pending_article_ids(self, limit: int | None = None) -> list[int]:
+        """IDs of imported articles without SEO metadata, newest first."""
+        result = await self.session.execute(self._pending_query(Article.id, limit))
+        return list(result.scalars().all())
+
+    @staticmethod
+    def _pending_query(column: Any, limit: int | None) -> Any:
+        # Articles with status IMPORTED that don't have SEO metadata
         query = (
-            select(Article)
+            select(column)
+            .select_from(Article)
             .outerjoin(SEOMetadata, Article.id == SEOMetadata.article_id)
             .where(
                 Article.status == ArticleStatus.IMPORTED,
@@ -140,11 +154,23 @@ class SEOBatchAnalyzer:
             )
             .order_by(Article.created_at.desc())
         )
-
         if limit:
             query = query.limit(limit)
+        return query
+
+    async def analyze_imported_articles(
+        self,
+        limit: int | None = None,
+    ) -> tuple[int, int, list[str]]:
+        """Analyze all imported articles without SEO metadata.
+
+        Args:
+            limit: Optional limit on number of articles to process
 
-        result = await self.session.execute(query)
+        Returns:
+            tuple: (successful_count, failed_count, error_messages)
+        """
+        result = await self.session.execute(self._pending_query(Article, limit))
         articles = list(result.scalars().all())
 
         if not articles:
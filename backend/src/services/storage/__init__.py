@@ -4,8 +4,12 @@ from src.services.storage.google_drive_storage import (
     GoogleDriveStorage,
     create_google_drive_storage,
 )
+from src.services.storage.image_store import ImageStore, StoredImage, get_image_store
 
 __all__ = [
     "GoogleDriveStorage",
     "create_google_drive_storage",
+    "ImageStore",
+    "StoredImage",
+    "get_image_store",
 ]
@@ -1,12 +1,27 @@
-"""Google Drive storage service for file uploads."""
-
+"""Google Drive storage service for file uploads.
+
+``googleapiclient`` is synchronous: ``request.execute()`` and
+``MediaIoBaseDownload.next_chunk()`` block for the whole network transfer.
+Every Drive call is therefore run on a process-wide bounded thread pool
+(``GOOGLE_DRIVE_IO_WORKERS``) and awaited with a deadline, so a large export
+never stalls the event loop.  ``httplib2.Http`` is not thread-safe, so each
+worker thread keeps its own authorized keep-alive connection, reused across
+calls.
+"""
+
+import asyncio
 import io
 import json
 import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import BinaryIO
+from typing import Any, BinaryIO, TypeVar
 
+import httplib2
 from google.oauth2 import service_account
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload
 
@@ -15,6 +30,28 @@ from src.config import get_logger, get_settings
 logger = get_logger(__name__)
 settings = get_settings()
 
+T = TypeVar("T")
+
+# Default metadata fields returned by get_file_metadata
+FILE_METADATA_FIELDS = (
+    "id,name,mimeType,size,webViewLink,webContentLink,createdTime,modifiedTime,version"
+)
+
+_io_executor: ThreadPoolExecutor | None = None
+_io_executor_lock = threading.Lock()
+
+
+def _get_io_executor() -> ThreadPoolExecutor:
+    """Return the shared thread pool for blocking Drive API calls."""
+    global _io_executor
+    with _io_executor_lock:
+        if _io_executor is None:
+            _io_executor = ThreadPoolExecutor(
+                max_workers=settings.GOOGLE_DRIVE_IO_WORKERS,
+                thread_name_prefix="gdrive-io",
+            )
+        return _io_executor
+
 
 class GoogleDriveStorage:
     """Google Drive storage backend for file management.
@@ -28,7 +65,12 @@ class GoogleDriveStorage:
     def __init__(self) -> None:
         """Initialize Google Drive storage service."""
         self.service = None
+        self.credentials = None
         self.folder_id = settings.GOOGLE_DRIVE_FOLDER_ID
+        self.request_timeout = settings.GOOGLE_DRIVE_REQUEST_TIMEOUT_SECONDS
+        self.download_timeout = settings.GOOGLE_DRIVE_DOWNLOAD_TIMEOUT_SECONDS
+        self.chunk_size = settings.GOOGLE_DRIVE_DOWNLOAD_CHUNK_SIZE
+        self._local = threading.local()
         self._initialize_service()
 
     def _initialize_service(self) -> None:
@@ -69,6 +111,7 @@ class GoogleDriveStorage:
                 )
 
             # Build Drive API service
+            self.credentials = credentials
             self.service = build("drive", "v3", credentials=credentials)
 
             logger.info("google_drive_service_initialized")
@@ -81,6 +124,47 @@ class GoogleDriveStorage:
             )
             raise
 
+    def _authorized_http(self) -> AuthorizedHttp:
+        """Authorized connection owned by the current worker thread."""
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = AuthorizedHttp(
+                self.credentials,
+                http=httplib2.Http(timeout=self.request_timeout),
+            )
+            self._local.http = http
+        return http
+
+    async def _run(self, func: Callable[[], T], *, timeout: float | None = None) -> T:
+        """Run a blocking callable on the Drive I/O pool with a deadline.
+
+        On timeout the awaiting coroutine is released; the worker itself is
+        bounded by the socket timeout of its connection.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(_get_io_executor(), func)
+        return await asyncio.wait_for(future, timeout or self.request_timeout)
+
+    async def _execute(self, request, *, timeout: float | None = None) -> Any:
+        """Execute a ``googleapiclient`` request off the event loop."""
+        return await self._run(
+            lambda: request.execute(http=self._authorized_http()), timeout=timeout
+        )
+
+    def _stream_media(self, request, fd: BinaryIO, file_id: str) -> None:
+        """Blocking: download ``request`` into ``fd`` chunk by chunk."""
+        request.http = self._authorized_http()
+        downloader = MediaIoBaseDownload(fd, request, chunksize=self.chunk_size)
+        done = False
+        while not done:
+            status, done = downloader.next_chunk(num_retries=2)
+            if status:
+                logger.debug(
+                    "google_drive_download_progress",
+                    file_id=file_id,
+                    progress=int(status.progress() * 100),
+                )
+
     async def upload_file(
         self,
         file_content: BinaryIO,
@@ -119,14 +203,13 @@ class GoogleDriveStorage:
             )
 
             # Upload file
-            file = (
-                self.service.files()
-                .create(
+            file = await self._execute(
+                self.service.files().create(
                     body=file_metadata,
                     media_body=media,
                     fields="id,name,mimeType,size,webViewLink,webContentLink,createdTime",
-                )
-                .execute()
+                ),
+                timeout=self.download_timeout,
             )
 
             # Make file publicly accessible
@@ -204,19 +287,10 @@ class GoogleDriveStorage:
             request = self.service.files().get_media(fileId=file_id, supportsAllDrives=True)
 
             file_content = io.BytesIO()
-            downloader = MediaIoBaseDownload(file_content, request)
-
-            done = False
-            while not done:
-                status, done = downloader.next_chunk()
-                if status:
-                    logger.debug(
-                        "google_drive_download_progress",
-                        file_id=file_id,
-                        progress=int(status.progress() * 100),
-                    )
-
-            file_content.seek(0)
+            await self._run(
+                lambda: self._stream_media(request, file_content, file_id),
+                timeout=self.download_timeout,
+            )
 
             logger.info(
                 "google_drive_file_downloaded",
@@ -238,6 +312,10 @@ class GoogleDriveStorage:
     async def download_to_path(self, file_id: str, destination_path: str) -> str:
         """Download file from Google Drive to local path.
 
+        The file is streamed to ``<destination>.part`` in
+        ``GOOGLE_DRIVE_DOWNLOAD_CHUNK_SIZE`` chunks and renamed on success,
+        so it is never held in memory and a failed download leaves no file.
+
         Args:
             file_id: Google Drive file ID
             destination_path: Local path to save file
@@ -248,13 +326,30 @@ class GoogleDriveStorage:
         Raises:
             Exception: If download fails
         """
-        content = await self.download_file(file_id)
-
         destination = Path(destination_path)
-        destination.parent.mkdir(parents=True, exist_ok=True)
+        partial = destination.with_name(destination.name + ".part")
+        request = self.service.files().get_media(fileId=file_id, supportsAllDrives=True)
+
+        def stream_to_disk() -> None:
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                with open(partial, "wb") as f:
+                    self._stream_media(request, f, file_id)
+                os.replace(partial, destination)
+            except BaseException:
+                partial.unlink(missing_ok=True)
+                raise
 
-        with open(destination, "wb") as f:
-            f.write(content)
+        try:
+            await self._run(stream_to_disk, timeout=self.download_timeout)
+        except Exception as e:
+            logger.error(
+                "google_drive_download_failed",
+                file_id=file_id,
+                error=str(e),
+                exc_info=True,
+            )
+            raise
 
         logger.info(
             "google_drive_file_saved",
@@ -264,11 +359,30 @@ class GoogleDriveStorage:
 
         return str(destination)
 
-    async def get_file_metadata(self, file_id: str) -> dict:
+    async def export_file(self, file_id: str, mime_type: str) -> bytes:
+        """Export a Google Workspace document (e.g. a Doc as ``text/html``).
+
+        Args:
+            file_id: Google Drive file ID
+            mime_type: Target MIME type
+
+        Returns:
+            bytes: Exported content (Drive caps exports at 10 MB)
+
+        Raises:
+            Exception: If export fails
+        """
+        content = await self._execute(
+            self.service.files().export(fileId=file_id, mimeType=mime_type)
+        )
+        return content if isinstance(content, bytes) else str(content).encode("utf-8")
+
+    async def get_file_metadata(self, file_id: str, fields: str = FILE_METADATA_FIELDS) -> dict:
         """Get file metadata from Google Drive.
 
         Args:
             file_id: Google Drive file ID
+            fields: Drive ``fields`` selector
 
         Returns:
             dict: File metadata
@@ -277,14 +391,12 @@ class GoogleDriveStorage:
             Exception: If request fails
         """
         try:
-            file = (
-                self.service.files()
-                .get(
+            file = await self._execute(
+                self.service.files().get(
                     fileId=file_id,
-                    fields="id,name,mimeType,size,webViewLink,webContentLink,createdTime,modifiedTime",
+                    fields=fields,
                     supportsAllDrives=True,
                 )
-                .execute()
             )
 
             return file
@@ -326,7 +438,9 @@ class GoogleDriveStorage:
             Exception: If deletion fails
         """
         try:
-            self.service.files().delete(fileId=file_id, supportsAllDrives=True).execute()
+            await self._execute(
+                self.service.files().delete(fileId=file_id, supportsAllDrives=True)
+            )
 
             logger.info("google_drive_file_deleted", file_id=file_id)
 
@@ -356,11 +470,13 @@ class GoogleDriveStorage:
                 "role": "reader",
             }
 
-            self.service.permissions().create(
-                fileId=file_id,
-                body=permission,
-                supportsAllDrives=True,
-            ).execute()
+            await self._execute(
+                self.service.permissions().create(
+                    fileId=file_id,
+                    body=permission,
+                    supportsAllDrives=True,
+                )
+            )
 
             logger.debug("google_drive_file_made_public", file_id=file_id)
 
@@ -401,15 +517,26 @@ class GoogleDriveStorage:
 
         return mime_types.get(extension, "application/octet-stream")
 
-    async def list_files(self, folder_id: str | None = None, max_results: int = 100) -> list[dict]:
+    async def list_files(
+        self,
+        folder_id: str | None = None,
+        max_results: int = 100,
+        *,
+        modified_after: str | None = None,
+        order_by: str | None = None,
+    ) -> list[dict]:
         """List files in folder.
 
         Args:
             folder_id: Folder ID to list (uses default if None)
             max_results: Maximum number of files to return
+            modified_after: Only return files with ``modifiedTime`` at or after
+                this RFC 3339 timestamp
+            order_by: Drive ``orderBy`` expression (e.g. ``"modifiedTime"``)
 
         Returns:
-            list[dict]: List of file metadata
+            list[dict]: List of file metadata, including ``modifiedTime``
+            and ``version`` for change detection
 
         Raises:
             Exception: If request fails
@@ -418,18 +545,23 @@ class GoogleDriveStorage:
             target_folder = folder_id or self.folder_id
 
             query = f"'{target_folder}' in parents and trashed=false"
+            if modified_after:
+                query += f" and modifiedTime >= '{modified_after}'"
+
+            list_kwargs: dict[str, Any] = {
+                "q": query,
+                "pageSize": max_results,
+                "fields": (
+                    "files(id,name,mimeType,size,webViewLink,createdTime,"
+                    "modifiedTime,version)"
+                ),
+                "supportsAllDrives": True,
+                "includeItemsFromAllDrives": True,
+            }
+            if order_by:
+                list_kwargs["orderBy"] = order_by
 
-            results = (
-                self.service.files()
-                .list(
-                    q=query,
-                    pageSize=max_results,
-                    fields="files(id,name,mimeType,size,webViewLink,createdTime)",
-                    supportsAllDrives=True,
-                    includeItemsFromAllDrives=True,
-                )
-                .execute()
-            )
+            results = await self._execute(self.service.files().list(**list_kwargs))
 
             files = results.get("files", [])
 
@@ -451,13 +583,22 @@ class GoogleDriveStorage:
             raise
 
 
+_shared_storage: GoogleDriveStorage | None = None
+
+
 async def create_google_drive_storage() -> GoogleDriveStorage:
     """Factory function for Google Drive storage service.
 
+    The instance is shared per process so credentials and per-thread
+    connections are reused across requests.
+
     Returns:
         GoogleDriveStorage: Configured service instance
 
     Raises:
         ValueError: If credentials not configured
     """
-    return GoogleDriveStorage()
+    global _shared_storage
+    if _shared_storage is None:
+        _shared_storage = GoogleDriveStorage()
+    return _shared_storage
@@ -0,0 +1,456 @@
+"""Content-addressed local cache for article images.
+
+The same Drive or CDN image used to be downloaded on every reparse, every
+auto-publish and every alt-text run.  ``ImageStore`` keeps one copy of each
+distinct image under ``blobs/<sha256>`` together with what has been derived
+from it (PIL metadata, preview thumbnail, generated alt text), and remembers
+which blob each URL last resolved to.
+
+A URL checked within ``IMAGE_CACHE_REVALIDATE_SECONDS`` is served without a
+network call.  After that it is revalidated with ``If-None-Match`` /
+``If-Modified-Since`` (Drive files: by their ``version``), so an unchanged
+image costs a single 304.  Once the blobs outgrow ``IMAGE_CACHE_MAX_BYTES``
+the least recently used ones are evicted, except those accessed within
+``IMAGE_CACHE_MIN_IDLE_SECONDS``: a caller may still be reading or uploading
+the ``StoredImage`` it was handed.
+
+The index is a SQLite file next to the blobs so all workers on a host share
+it.  Index and file operations run off the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+import weakref
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from src.config import get_logger, get_settings
+from src.services.storage.google_drive_storage import create_google_drive_storage
+
+logger = get_logger(__name__)
+
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+_DRIVE_FILE_ID = re.compile(r"/file/d/([a-zA-Z0-9_-]+)")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    sha256 TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL,
+    metadata TEXT,
+    alt_texts TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS blobs_last_access ON blobs (last_access);
+CREATE TABLE IF NOT EXISTS urls (
+    url TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    content_type TEXT,
+    checked_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS urls_sha256 ON urls (sha256);
+"""
+
+
+@dataclass(frozen=True)
+class StoredImage:
+    """A cached image file and where it came from."""
+
+    url: str
+    sha256: str
+    path: Path
+    size: int
+    content_type: str | None
+    from_cache: bool  # True when no image body was transferred
+
+    @property
+    def preview_path(self) -> Path:
+        """Where the preview thumbnail of this content is kept."""
+        return self.path.with_suffix(".preview")
+
+
+class ImageStore:
+    """Content-addressed image files plus derived data, keyed by URL and sha256."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        max_bytes: int = 2 * 1024**3,
+        revalidate_seconds: float = 86400,
+        min_idle_seconds: float = 3600,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self.root = Path(root)
+        self.blob_dir = self.root / "blobs"
+        self.tmp_dir = self.root / "tmp"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.revalidate_seconds = revalidate_seconds
+        self.min_idle_seconds = min_idle_seconds
+        self.http_client = http_client or httpx.AsyncClient(
+            timeout=30.0,
+            follow_redirects=True,
+            headers={
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+            },
+        )
+
+        self._db = sqlite3.connect(
+            self.root / "index.sqlite3",
+            timeout=30,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self._db_lock = threading.Lock()
+        # One fetch per URL at a time, so duplicates in an article share a download
+        self._url_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+
+    # ------------------------------------------------------------------
+    # Fetching
+    # ------------------------------------------------------------------
+
+    async def fetch(self, url: str) -> StoredImage:
+        """Return the cached image for ``url``, downloading only when needed.
+
+        Raises:
+            httpx.HTTPError: If the image has to be downloaded and that fails
+        """
+        lock = self._url_locks.get(url)
+        if lock is None:
+            lock = self._url_locks[url] = asyncio.Lock()
+        async with lock:
+            entry = await asyncio.to_thread(self._lookup_url, url)
+            if entry and time.time() - entry["checked_at"] < self.revalidate_seconds:
+                return await self._hit(url, entry, revalidated=False)
+
+            drive_match = _DRIVE_FILE_ID.search(url)
+            if drive_match:
+                return await self._fetch_drive(url, drive_match.group(1), entry)
+            return await self._fetch_http(url, entry)
+
+    async def _fetch_http(self, url: str, entry: dict[str, Any] | None) -> StoredImage:
+        headers = {}
+        if entry and entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        async with self.http_client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 304 and entry:
+                return await self._hit(url, entry, revalidated=True)
+            response.raise_for_status()
+            tmp_path, sha256, size = await self._receive(
+                response.aiter_bytes(DOWNLOAD_CHUNK_SIZE)
+            )
+            return await self._ingest(
+                url,
+                tmp_path,
+                sha256,
+                size,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+                content_type=response.headers.get("content-type"),
+            )
+
+    async def _fetch_drive(
+        self, url: str, file_id: str, entry: dict[str, Any] | None
+    ) -> StoredImage:
+        """Drive files have no HTTP validators; their ``version`` plays the ETag."""
+        storage = await create_google_drive_storage()
+        info = await storage.get_file_metadata(file_id, fields="version,mimeType")
+        version = f"drive-v{info.get('version')}"
+        if entry and entry["etag"] == version:
+            return await self._hit(url, entry, revalidated=True)
+
+        tmp_path = self._tmp_path()
+        try:
+            await storage.download_to_path(file_id, str(tmp_path))
+            sha256, size = await asyncio.to_thread(_hash_file, tmp_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return await self._ingest(
+            url,
+            tmp_path,
+            sha256,
+            size,
+            etag=version,
+            last_modified=None,
+            content_type=info.get("mimeType"),
+        )
+
+    async def _receive(self, chunks: AsyncIterator[bytes]) -> tuple[Path, str, int]:
+        """Stream ``chunks`` into a temp file, hashing as they arrive."""
+        tmp_path = self._tmp_path()
+        digest = hashlib.sha256()
+        size = 0
+        fh = await asyncio.to_thread(open, tmp_path, "wb")
+        try:
+            async for chunk in chunks:
+                digest.update(chunk)
+                size += len(chunk)
+                await asyncio.to_thread(fh.write, chunk)
+        except BaseException:
+            await asyncio.to_thread(fh.close)
+            tmp_path.unlink(missing_ok=True)
+            raise
+        await asyncio.to_thread(fh.close)
+        return tmp_path, digest.hexdigest(), size
+
+    async def _ingest(
+        self,
+        url: str,
+        tmp_path: Path,
+        sha256: str,
+        size: int,
+        *,
+        etag: str | None,
+        last_modified: str | None,
+        content_type: str | None,
+    ) -> StoredImage:
+        path = await asyncio.to_thread(
+            self._store_blob, url, tmp_path, sha256, size, etag, last_modified, content_type
+        )
+        logger.debug("image_store_downloaded", url=url[:100], sha256=sha256, size=size)
+        return StoredImage(url, sha256, path, size, content_type, from_cache=False)
+
+    async def _hit(
+        self, url: str, entry: dict[str, Any], *, revalidated: bool
+    ) -> StoredImage:
+        await asyncio.to_thread(self._touch, url, entry["sha256"], revalidated)
+        return StoredImage(
+            url,
+            entry["sha256"],
+            self.blob_path(entry["sha256"]),
+            entry["size"],
+            entry["content_type"],
+            from_cache=True,
+        )
+
+    # ------------------------------------------------------------------
+    # Derived data
+    # ------------------------------------------------------------------
+
+    async def metadata(self, sha256: str) -> dict[str, Any] | None:
+        """Cached image metadata for the content ``sha256``."""
+        rows = await asyncio.to_thread(
+            self._query, "SELECT metadata FROM blobs WHERE sha256 = ?", (sha256,)
+        )
+        return json.loads(rows[0][0]) if rows and rows[0][0] else None
+
+    async def save_metadata(self, sha256: str, metadata: dict[str, Any]) -> None:
+        await asyncio.to_thread(
+            self._query,
+            "UPDATE blobs SET metadata = ? WHERE sha256 = ?",
+            (json.dumps(metadata, ensure_ascii=False), sha256),
+        )
+
+    async def alt_text(self, sha256: str, key: str) -> dict[str, Any] | None:
+        """Alt text generated for the content ``sha256`` under ``key``.
+
+        ``key`` identifies everything else the generation depended on (model,
+        article context), so a changed context is a miss.
+        """
+        rows = await asyncio.to_thread(
+            self._query, "SELECT alt_texts FROM blobs WHERE sha256 = ?", (sha256,)
+        )
+        return json.loads(rows[0][0]).get(key) if rows else None
+
+    async def save_alt_text(self, sha256: str, key: str, suggestion: dict[str, Any]) -> None:
+        await asyncio.to_thread(self._merge_alt_text, sha256, key, suggestion)
+
+    async def read_bytes(self, image: StoredImage) -> bytes:
+        return await asyncio.to_thread(image.path.read_bytes)
+
+    async def link_to(self, source: Path, destination: str | Path) -> None:
+        """Place a copy of a cached file at ``destination``.
+
+        A hard link when possible, so no bytes are copied and eviction of the
+        blob leaves ``destination`` intact.
+        """
+        await asyncio.to_thread(_link_or_copy, Path(source), Path(destination))
+
+    def blob_path(self, sha256: str) -> Path:
+        return self.blob_dir / sha256[:2] / sha256
+
+    # ------------------------------------------------------------------
+    # Blocking helpers (run in threads)
+    # ------------------------------------------------------------------
+
+    def _tmp_path(self) -> Path:
+        fd, name = tempfile.mkstemp(dir=self.tmp_dir)
+        os.close(fd)
+        return Path(name)
+
+    def _query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        with self._db_lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def _lookup_url(self, url: str) -> dict[str, Any] | None:
+        rows = self._query(
+            "SELECT u.sha256, u.etag, u.last_modified, u.content_type, u.checked_at, b.size "
+            "FROM urls u JOIN blobs b ON b.sha256 = u.sha256 WHERE u.url = ?",
+            (url,),
+        )
+        if not rows:
+            return None
+        sha256, etag, last_modified, content_type, checked_at, size = rows[0]
+        if not self.blob_path(sha256).exists():
+            return None
+        return {
+            "sha256": sha256,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_type": content_type,
+            "checked_at": checked_at,
+            "size": size,
+        }
+
+    def _touch(self, url: str, sha256: str, revalidated: bool) -> None:
+        now = time.time()
+        with self._db_lock:
+            self._db.execute("UPDATE blobs SET last_access = ? WHERE sha256 = ?", (now, sha256))
+            if revalidated:
+                self._db.execute("UPDATE urls SET checked_at = ? WHERE url = ?", (now, url))
+
+    def _store_blob(
+        self,
+        url: str,
+        tmp_path: Path,
+        sha256: str,
+        size: int,
+        etag: str | None,
+        last_modified: str | None,
+        content_type: str | None,
+    ) -> Path:
+        path = self.blob_path(sha256)
+        if path.exists():
+            # Known content under a new URL (or a changed URL back to old bytes)
+            tmp_path.unlink(missing_ok=True)
+        else:
+            path.parent.mkdir(exist_ok=True)
+            os.replace(tmp_path, path)
+
+        now = time.time()
+        with self._db_lock:
+            self._db.execute(
+                "INSERT INTO blobs (sha256, size, last_access) VALUES (?, ?, ?) "
+                "ON CONFLICT (sha256) DO UPDATE SET last_access = excluded.last_access",
+                (sha256, size, now),
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO urls "
+                "(url, sha256, etag, last_modified, content_type, checked_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, sha256, etag, last_modified, content_type, now),
+            )
+        self._evict(keep=sha256)
+        return path
+
+    def _merge_alt_text(self, sha256: str, key: str, suggestion: dict[str, Any]) -> None:
+        with self._db_lock:
+            rows = self._db.execute(
+                "SELECT alt_texts FROM blobs WHERE sha256 = ?", (sha256,)
+            ).fetchall()
+            if not rows:
+                return
+            alt_texts = json.loads(rows[0][0])
+            alt_texts[key] = suggestion
+            self._db.execute(
+                "UPDATE blobs SET alt_texts = ? WHERE sha256 = ?",
+                (json.dumps(alt_texts, ensure_ascii=False), sha256),
+            )
+
+    def _evict(self, keep: str) -> None:
+        """Drop least recently used blobs until the store fits ``max_bytes``.
+
+        Blobs accessed within ``min_idle_seconds`` are spared even if the
+        store stays over budget, since ``fetch`` callers (in any worker) may
+        still be using their paths.
+        """
+        idle_before = time.time() - self.min_idle_seconds
+        with self._db_lock:
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            victims = []
+            for sha256, size in self._db.execute(
+                "SELECT sha256, size FROM blobs "
+                "WHERE sha256 != ? AND last_access < ? ORDER BY last_access",
+                (keep, idle_before),
+            ):
+                victims.append(sha256)
+                total -= size
+                if total <= self.max_bytes:
+                    break
+            for sha256 in victims:
+                self._db.execute("DELETE FROM urls WHERE sha256 = ?", (sha256,))
+                self._db.execute("DELETE FROM blobs WHERE sha256 = ?", (sha256,))
+        for sha256 in victims:
+            path = self.blob_path(sha256)
+            path.unlink(missing_ok=True)
+            path.with_suffix(".preview").unlink(missing_ok=True)
+        logger.info("image_store_evicted", blobs=len(victims), remaining_bytes=total)
+
+    async def close(self) -> None:
+        await self.http_client.aclose()
+        with self._db_lock:
+            self._db.close()
+
+
+def _hash_file(path: Path) -> tuple[str, int]:
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as fh:
+        while chunk := fh.read(DOWNLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def _link_or_copy(source: Path, destination: Path) -> None:
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    destination.unlink(missing_ok=True)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+
+
+_shared_store: ImageStore | None = None
+
+
+def get_image_store() -> ImageStore:
+    """Process-wide ``ImageStore`` configured from settings."""
+    global _shared_store
+    if _shared_store is None:
+        settings = get_settings()
+        _shared_store = ImageStore(
+            settings.IMAGE_CACHE_PATH,
+            max_bytes=settings.IMAGE_CACHE_MAX_BYTES,
+            revalidate_seconds=settings.IMAGE_CACHE_REVALIDATE_SECONDS,
+            min_idle_seconds=settings.IMAGE_CACHE_MIN_IDLE_SECONDS,
+        )
+    return _shared_store
@@ -1,7 +1,8 @@
 """Auto-publish service: Google Doc URL -> parse -> proofread -> WordPress draft.
 
 Composes existing services (GoogleDriveSyncService, WorklistPipelineService,
-PlaywrightWordPressPublisher) into a single automated pipeline callable by
+WordPressRestPublisher with PlaywrightWordPressPublisher fallback) into a
+single automated pipeline callable by
 Google Apps Script via the /v1/pipeline/auto-publish endpoint.
 """
 
@@ -39,7 +40,7 @@ from src.models.seo import SEOMetadata
 from src.models.seo_suggestions import SEOSuggestion
 from src.models.title_suggestions import TitleSuggestion
 from src.services.google_drive.sync_service import GoogleDriveSyncService
-from src.services.storage import create_google_drive_storage
+from src.services.storage import create_google_drive_storage, get_image_store
 from src.services.worklist.pipeline import WorklistPipelineService
 
 logger = get_logger(__name__)
@@ -122,12 +123,9 @@ class AutoPublishService:
 
             # Fetch and hydrate Google Doc
             storage = await create_google_drive_storage()
-            file_metadata = (
-                storage.service.files()
-                .get(fileId=file_id,
-                     fields="id,name,mimeType,webViewLink,createdTime",
-                     supportsAllDrives=True)
-                .execute()
+            file_metadata = await storage.get_file_metadata(
+                file_id,
+                fields="id,name,mimeType,webViewLink,createdTime,modifiedTime,version",
             )
             sync_service = GoogleDriveSyncService(session_a)
             parsed = await sync_service._hydrate_document(storage, file_metadata)
@@ -189,10 +187,10 @@ class AutoPublishService:
             # db_config.session() auto-commits on exit
 
         # ------------------------------------------------------------------
-        # Phase D: Playwright publish (takes 3-7 minutes)
-        # Load article data in a SHORT session, close it, then run
-        # Playwright WITHOUT holding a DB connection.  This prevents
-        # pool exhaustion during the 3-7 minute browser automation.
+        # Phase D: WordPress publish (seconds over REST, 3-7 minutes when
+        # the browser is needed).  Load article data in a SHORT session,
+        # close it, then publish WITHOUT holding a DB connection.  This
+        # prevents pool exhaustion during browser automation.
         # ------------------------------------------------------------------
         article_d = None
         async with db_config.session() as session_d:
@@ -212,7 +210,7 @@ class AutoPublishService:
                 session_d.expunge(article_d)
         # Session closed — connection returned to pool.
 
-        # Run Playwright (3-7 min, no DB connection held)
+        # Publish (no DB connection held)
         publish_result = await self._publish_as_draft(
             item_d, session=None, article=article_d,
         )
@@ -495,7 +493,10 @@ class AutoPublishService:
         *,
         article: Article | None = None,
     ) -> dict[str, Any]:
-        """Publish a worklist item as a WordPress draft using Playwright.
+        """Publish a worklist item as a WordPress draft.
+
+        Uses the REST fast path, with the Playwright editor for steps the
+        site does not accept over REST (see ``publish_rest_first``).
 
         Args:
             item: WorklistItem to publish.
@@ -505,9 +506,7 @@ class AutoPublishService:
                      skips the DB query (used when session is unavailable).
         """
         from src.api.schemas.seo import SEOMetadata
-        from src.services.providers.playwright_wordpress_publisher import (
-            PlaywrightWordPressPublisher,
-        )
+        from src.services.providers.wordpress_rest_publisher import publish_rest_first
 
         settings = self.settings
 
@@ -612,6 +611,7 @@ class AutoPublishService:
                     else:
                         article_images.append({
                             "filename": f"image_{img.position}.jpg",
+                            "position": img.position,
                             "source_url": img_url,
                             "alt_text": alt_text,
                             "caption": img.caption or "",
@@ -636,9 +636,7 @@ class AutoPublishService:
         if settings.CMS_HTTP_AUTH_USERNAME and settings.CMS_HTTP_AUTH_PASSWORD:
             http_auth = (settings.CMS_HTTP_AUTH_USERNAME, settings.CMS_HTTP_AUTH_PASSWORD)
 
-        publisher = PlaywrightWordPressPublisher()
-
-        # Download featured image if it's a URL (Playwright needs local file path)
+        # Download featured image if it's a URL (uploads need a local file path)
         local_featured_image = None
         if featured_image_path and featured_image_path.startswith("data:"):
             try:
@@ -698,7 +696,7 @@ class AutoPublishService:
 
         try:
             try:
-                result = await publisher.publish_article(
+                result = await publish_rest_first(
                     cms_url=settings.CMS_BASE_URL,
                     username=settings.CMS_USERNAME,
                     password=settings.CMS_APPLICATION_PASSWORD,
@@ -706,7 +704,6 @@ class AutoPublishService:
                     article_body=body,
                     seo_data=seo_data,
                     article_images=article_images,
-                    headless=True,
                     publish_mode="draft",
                     http_auth=http_auth,
                     primary_category=primary_category,
@@ -816,22 +813,13 @@ class AutoPublishService:
                     pass
 
     async def _download_image_to_temp(self, url: str) -> str:
-        """Download image from URL to a temporary file. Returns local path."""
-        import httpx
+        """Place the image at ``url`` in a temporary file. Returns local path.
 
-        # Handle Google Drive URLs: extract file ID and use Drive API
-        drive_match = re.search(r'/file/d/([a-zA-Z0-9_-]+)', url)
-        if drive_match:
-            file_id = drive_match.group(1)
-            storage = await create_google_drive_storage()
-            data = storage.service.files().get_media(fileId=file_id, supportsAllDrives=True).execute()
-        else:
-            # Google Docs embedded images (lh3.googleusercontent.com) and regular URLs
-            # are both publicly accessible and can be downloaded with httpx
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                resp = await client.get(url)
-                resp.raise_for_status()
-                data = resp.content
+        The bytes come from the shared image store (Drive files via the Drive
+        API), so republishing an article re-downloads nothing; the temp file
+        is a hard link to the cached copy and is safe to unlink afterwards.
+        """
+        stored = await get_image_store().fetch(url)
 
         # Determine file extension from URL or content type
         suffix = ".jpg"  # Default
@@ -840,10 +828,10 @@ class AutoPublishService:
                 suffix = ext
                 break
 
-        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
-        tmp.write(data)
-        tmp.close()
-        return tmp.name
+        fd, tmp_path = tempfile.mkstemp(suffix=suffix)
+        os.close(fd)
+        await get_image_store().link_to(stored.path, tmp_path)
+        return tmp_path
 
     @staticmethod
     def _decode_data_uri_to_temp(data_uri: str) -> str:
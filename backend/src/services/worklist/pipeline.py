@@ -26,14 +26,36 @@ from src.services.proofreading import (
 )
 from src.services.parser import ArticleParserService
 from src.services.parser.html_utils import (
+    PlainTextOffsetMap,
     strip_html_tags,
-    calculate_plain_text_position,
     find_text_position_in_plain,
 )
 from src.services.worklist.diff_generator import generate_content_diff, generate_word_diff
 
 logger = get_logger(__name__)
 
+# Small parser fields worth showing in the review UI before parsing finishes
+PARSING_PREVIEW_FIELDS = frozenset(
+    {
+        "title_prefix",
+        "title_main",
+        "title_suffix",
+        "author_line",
+        "author_name",
+        "seo_title",
+        "meta_description",
+        "seo_keywords",
+        "tags",
+        "primary_category",
+        "secondary_categories",
+        "focus_keyword",
+        "suggested_titles",
+        "suggested_seo",
+        "images",
+        "faqs",
+    }
+)
+
 
 class WorklistPipelineService:
     """Create articles from Worklist items and trigger automatic proofreading."""
@@ -150,10 +172,28 @@ class WorklistPipelineService:
             # parse_document() uses the synchronous anthropic.Anthropic client
             # which blocks the event loop.  Run it in a thread so that
             # asyncio.wait_for timeouts can actually fire.
-            parsing_result = await asyncio.wait_for(
-                asyncio.to_thread(self.parser_service.parse_document, raw_html),
-                timeout=120.0,  # 120s budget for AI parsing
+            # Fields streamed by the parser are saved as a preview while the
+            # rest of the answer (mostly body_html) is still being generated.
+            loop = asyncio.get_running_loop()
+            preview_queue: asyncio.Queue[tuple[str, Any] | None] = asyncio.Queue()
+
+            def on_section(key: str, value: Any) -> None:
+                if key in PARSING_PREVIEW_FIELDS:
+                    loop.call_soon_threadsafe(preview_queue.put_nowait, (key, value))
+
+            preview_writer = asyncio.create_task(
+                self._write_parsing_preview(item, preview_queue)
             )
+            try:
+                parsing_result = await asyncio.wait_for(
+                    asyncio.to_thread(
+                        self.parser_service.parse_document, raw_html, on_section=on_section
+                    ),
+                    timeout=120.0,  # 120s budget for AI parsing
+                )
+            finally:
+                preview_queue.put_nowait(None)
+                await preview_writer
 
             if not parsing_result.success:
                 # Parsing failed
@@ -281,6 +321,9 @@ class WorklistPipelineService:
             metadata["title_suffix"] = parsed_article.title_suffix
             metadata["author_line"] = parsed_article.author_line
 
+            # The full result supersedes the streamed preview
+            metadata.pop("parsing_preview", None)
+
             # Store parsing metadata
             metadata["parsing"] = {
                 "method": parsed_article.parsing_method,
@@ -460,6 +503,42 @@ class WorklistPipelineService:
             self.session.add(item)
             return False  # Signal failure to caller
 
+    async def _write_parsing_preview(
+        self,
+        item: WorklistItem,
+        updates: asyncio.Queue[tuple[str, Any] | None],
+    ) -> None:
+        """Persist streamed parser fields under ``drive_metadata["parsing_preview"]``.
+
+        Runs until a None sentinel arrives; fields that arrive together are
+        written in one commit.  Failures only disable the preview.
+        """
+        done = False
+        while not done:
+            batch = [await updates.get()]
+            while not updates.empty():
+                batch.append(updates.get_nowait())
+            fields = {}
+            for update in batch:
+                if update is None:
+                    done = True
+                else:
+                    fields[update[0]] = update[1]
+            if not fields:
+                continue
+            try:
+                metadata = dict(item.drive_metadata or {})
+                metadata["parsing_preview"] = {**metadata.get("parsing_preview", {}), **fields}
+                item.drive_metadata = metadata
+                self.session.add(item)
+                await self.session.commit()
+            except Exception as exc:  # noqa: BLE001 - the preview is best effort
+                logger.warning(
+                    "worklist_parsing_preview_failed", worklist_id=item.id, error=str(exc)
+                )
+                await self.session.rollback()
+                return
+
     async def _run_proofreading(self, item: WorklistItem, article: Article) -> None:
         """Invoke AI + deterministic proofreading and persist the results."""
         payload = self._build_payload(article, item)
@@ -623,8 +702,10 @@ class WorklistPipelineService:
         if not html_content:
             return issues
 
-        # Pre-compute plain text content for text search fallback
-        plain_content = strip_html_tags(html_content)
+        # One tokenizer pass gives both the plain text (for text search
+        # fallback) and O(1) HTML→plain offset conversion for every issue
+        offset_map = PlainTextOffsetMap(html_content)
+        plain_content = offset_map.plain_text
         search_start_index = 0
 
         for issue in issues:
@@ -653,9 +734,7 @@ class WorklistPipelineService:
 
                     if html_start is not None and html_end is not None:
                         try:
-                            plain_pos = calculate_plain_text_position(
-                                html_content, html_start, html_end
-                            )
+                            plain_pos = offset_map.to_plain(html_start, html_end)
                             issue["plain_text_position"] = plain_pos.to_dict()
                             logger.debug(
                                 "issue_plain_text_position_calculated",
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Any
 
 from sqlalchemy import func, select
-from sqlalchemy.orm import defer, selectinload
+from sqlalchemy.orm import load_only, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.logging import get_logger
@@ -18,10 +18,29 @@ from src.models import (
     WorklistStatus,
 )
 from src.services.google_drive import GoogleDriveSyncService
+from src.services.pagination import cached_count, keyset_page
 from src.services.worklist.pipeline import WorklistPipelineService
 
 logger = get_logger(__name__)
 
+# Columns the worklist list view serializes; content and raw_html stay in the DB
+LIST_COLUMNS = (
+    WorklistItem.id,
+    WorklistItem.drive_file_id,
+    WorklistItem.title,
+    WorklistItem.status,
+    WorklistItem.author,
+    WorklistItem.article_id,
+    WorklistItem.drive_metadata,
+    WorklistItem.notes,
+    WorklistItem.synced_at,
+    WorklistItem.created_at,
+    WorklistItem.updated_at,
+    WorklistItem.wordpress_draft_url,
+    WorklistItem.wordpress_draft_uploaded_at,
+    WorklistItem.wordpress_post_id,
+)
+
 
 class WorklistService:
     """Provide worklist querying, status management, and sync helpers."""
@@ -34,14 +53,17 @@ class WorklistService:
         status: str | None = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> tuple[list[WorklistItem], int]:
-        """List worklist items filtered by status with pagination."""
-        query = (
-            select(WorklistItem)
-            .options(defer(WorklistItem.content))
-            .order_by(WorklistItem.updated_at.desc())
-        )
+        """List worklist items filtered by status, newest change first.
+
+        Pages with ``cursor`` (see ``src.services.pagination``) when given,
+        otherwise with ``offset``.  Only ``LIST_COLUMNS`` are loaded and the
+        total is a cached count.
+        """
+        query = select(WorklistItem).options(load_only(*LIST_COLUMNS))
         count_query = select(func.count()).select_from(WorklistItem)
+        count_key = "worklist_items"
 
         if status:
             try:
@@ -51,12 +73,21 @@ class WorklistService:
 
             query = query.where(WorklistItem.status == status_enum)
             count_query = count_query.where(WorklistItem.status == status_enum)
+            count_key = f"worklist_items:{status_enum.value}"
+
+        query = keyset_page(query, WorklistItem, cursor, limit)
+        if not cursor:
+            query = query.offset(offset)
 
-        result = await self.session.execute(query.offset(offset).limit(limit))
+        result = await self.session.execute(query)
         items = list(result.scalars().all())
 
-        total = await self.session.execute(count_query)
-        total_count = int(total.scalar_one())
+        total_count = await cached_count(
+            self.session,
+            count_query,
+            count_key,
+            table=None if status else WorklistItem.__tablename__,
+        )
 
         return items, total_count
 
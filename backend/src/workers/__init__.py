@@ -1 +1 @@
-"""Workers package (Celery removed — all tasks run as asyncio background jobs)."""
+"""Workers package: durable job queue (``queue``) and job handlers (``tasks``)."""
@@ -0,0 +1,344 @@
+"""Bulk AI jobs on the Anthropic Message Batches API.
+
+Backfills used to send one synchronous Claude request per article.  Here a
+backfill packs up to ``AI_BATCH_MAX_REQUESTS`` prompts into one message
+batch and enqueues a ``message_batch_collect`` job whose payload holds the
+batch ID.  That job polls the batch with ``RetryJobLaterError`` (so no worker
+slot is held while Anthropic works on it) and, once the batch has ended,
+feeds each answer to the same persistence code the synchronous path uses.
+
+A ``BatchKind`` knows how to build the request for one article and how to
+apply its answer.  Kinds are registered with ``@batch_kind``; results are
+matched back through the ``article-<id>`` custom ID.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from contextlib import AbstractAsyncContextManager
+from typing import Any, ClassVar
+
+from anthropic import AsyncAnthropic
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import get_logger, get_settings
+from src.workers.queue import JobQueue, RetryJobLaterError, get_job_queue
+
+logger = get_logger(__name__)
+
+SUBMIT_TASK = "message_batch_submit"
+COLLECT_TASK = "message_batch_collect"
+
+# Errors kept in a collect job's result; the rest are only counted
+MAX_REPORTED_ERRORS = 100
+
+SessionScope = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+def custom_id_for(article_id: int) -> str:
+    return f"article-{article_id}"
+
+
+def article_id_from(custom_id: str) -> int:
+    return int(custom_id.rsplit("-", 1)[1])
+
+
+class BatchKind(ABC):
+    """Request builder + result handler for one kind of bulk AI job."""
+
+    name: ClassVar[str]
+
+    async def pending_ids(self, session: AsyncSession, limit: int | None) -> list[int]:
+        """Articles a backfill without explicit IDs should cover."""
+        raise ValueError(f"{self.name} batches need explicit article_ids")
+
+    async def load(self, session: AsyncSession, article_ids: Iterable[int]) -> dict[int, Any]:
+        from src.models import Article
+
+        rows = await session.scalars(select(Article).where(Article.id.in_(list(article_ids))))
+        return {article.id: article for article in rows}
+
+    @abstractmethod
+    async def build(self, session: AsyncSession, article: Any) -> dict[str, Any]:
+        """Messages API parameters for ``article``; ValueError skips it."""
+
+    @abstractmethod
+    async def apply(self, session: AsyncSession, article: Any, message: Any) -> None:
+        """Persist the answer for ``article`` and commit."""
+
+
+_kinds: dict[str, type[BatchKind]] = {}
+
+
+def batch_kind(cls: type[BatchKind]) -> type[BatchKind]:
+    """Register ``cls`` under ``cls.name``."""
+    _kinds[cls.name] = cls
+    return cls
+
+
+def batch_kinds() -> list[str]:
+    return sorted(_kinds)
+
+
+def get_batch_kind(name: str) -> BatchKind:
+    try:
+        return _kinds[name]()
+    except KeyError:
+        raise ValueError(f"Unknown message batch kind: {name}") from None
+
+
+def _default_sessions() -> SessionScope:
+    from src.config.database import get_db_config
+
+    return get_db_config().session
+
+
+def _default_client() -> AsyncAnthropic:
+    return AsyncAnthropic(api_key=get_settings().ANTHROPIC_API_KEY)
+
+
+async def submit_message_batches(
+    kind_name: str,
+    article_ids: list[int] | None = None,
+    *,
+    limit: int | None = None,
+    client: Any = None,
+    queue: JobQueue | None = None,
+    sessions: SessionScope | None = None,
+    max_requests: int | None = None,
+) -> list[dict[str, Any]]:
+    """Submit message batches for ``article_ids`` (or the kind's backlog).
+
+    Returns one entry per chunk with the batch ID, the collect job ID and
+    the articles that were skipped because no request could be built (a
+    chunk with nothing to send has no batch).
+    """
+    kind = get_batch_kind(kind_name)
+    settings = get_settings()
+    client = client or _default_client()
+    queue = queue or get_job_queue()
+    sessions = sessions or _default_sessions()
+    max_requests = max_requests or settings.AI_BATCH_MAX_REQUESTS
+
+    submitted: list[dict[str, Any]] = []
+    async with sessions() as session:
+        ids = list(article_ids) if article_ids else await kind.pending_ids(session, limit)
+        for start in range(0, len(ids), max_requests):
+            chunk = ids[start : start + max_requests]
+            articles = await kind.load(session, chunk)
+            requests: list[dict[str, Any]] = []
+            skipped: dict[int, str] = {}
+            for article_id in chunk:
+                article = articles.get(article_id)
+                if article is None:
+                    skipped[article_id] = "article not found"
+                    continue
+                try:
+                    params = await kind.build(session, article)
+                except ValueError as exc:
+                    skipped[article_id] = str(exc)
+                    continue
+                requests.append({"custom_id": custom_id_for(article_id), "params": params})
+            if not requests:
+                logger.warning("message_batch_chunk_skipped", kind=kind.name, skipped=skipped)
+                submitted.append(
+                    {"batch_id": None, "task_id": None, "requests": 0, "skipped": skipped}
+                )
+                continue
+
+            batch = await client.messages.batches.create(requests=requests)
+            task_id = await queue.enqueue(
+                COLLECT_TASK,
+                {"kind": kind.name, "batch_id": batch.id, "requests": len(requests)},
+                delay_seconds=settings.AI_BATCH_POLL_INTERVAL_SECONDS,
+            )
+            logger.info(
+                "message_batch_submitted",
+                kind=kind.name,
+                batch_id=batch.id,
+                task_id=task_id,
+                requests=len(requests),
+                skipped=len(skipped),
+            )
+            submitted.append(
+                {
+                    "batch_id": batch.id,
+                    "task_id": task_id,
+                    "requests": len(requests),
+                    "skipped": skipped,
+                }
+            )
+    return submitted
+
+
+async def collect_message_batch(
+    payload: dict[str, Any],
+    *,
+    client: Any = None,
+    sessions: SessionScope | None = None,
+) -> dict[str, Any]:
+    """Apply the results of a finished batch, or defer until it has ended.
+
+    Each answer is applied in its own session, so one bad answer only fails
+    its article.  Kinds apply idempotently, which makes re-running a collect
+    job after a crash safe.
+    """
+    kind = get_batch_kind(payload["kind"])
+    batch_id = payload["batch_id"]
+    client = client or _default_client()
+    sessions = sessions or _default_sessions()
+
+    batch = await client.messages.batches.retrieve(batch_id)
+    if batch.processing_status != "ended":
+        raise RetryJobLaterError(
+            get_settings().AI_BATCH_POLL_INTERVAL_SECONDS,
+            f"batch {batch_id} is {batch.processing_status}",
+        )
+
+    succeeded = 0
+    errors: list[str] = []
+    async for entry in await client.messages.batches.results(batch_id):
+        article_id = article_id_from(entry.custom_id)
+        result = entry.result
+        if result.type != "succeeded":
+            error = getattr(result, "error", None)
+            errors.append(f"article {article_id}: {result.type} {error or ''}".strip())
+            continue
+        try:
+            async with sessions() as session:
+                article = (await kind.load(session, [article_id])).get(article_id)
+                if article is None:
+                    raise ValueError("article not found")
+                await kind.apply(session, article, result.message)
+            succeeded += 1
+        except Exception as exc:  # noqa: BLE001 - one bad answer must not sink the batch
+            logger.warning(
+                "message_batch_result_failed",
+                kind=kind.name,
+                batch_id=batch_id,
+                article_id=article_id,
+                error=str(exc),
+            )
+            errors.append(f"article {article_id}: {exc}")
+
+    logger.info(
+        "message_batch_collected",
+        kind=kind.name,
+        batch_id=batch_id,
+        succeeded=succeeded,
+        failed=len(errors),
+    )
+    return {
+        "kind": kind.name,
+        "batch_id": batch_id,
+        "succeeded": succeeded,
+        "failed": len(errors),
+        "errors": errors[:MAX_REPORTED_ERRORS],
+        "status": "completed",
+    }
+
+
+# ---------------------------------------------------------------------------
+# Batch kinds
+# ---------------------------------------------------------------------------
+
+
+@batch_kind
+class UnifiedOptimizationBatch(BatchKind):
+    """Title + SEO + FAQ suggestions (``UnifiedOptimizationService``)."""
+
+    name = "unified_optimization"
+
+    async def pending_ids(self, session: AsyncSession, limit: int | None) -> list[int]:
+        from src.models import Article
+
+        query = (
+            select(Article.id)
+            .where(
+                Article.unified_optimization_generated.is_(False),
+                or_(Article.body_html.is_not(None), Article.body.is_not(None)),
+            )
+            .order_by(Article.id)
+        )
+        if limit:
+            query = query.limit(limit)
+        return list(await session.scalars(query))
+
+    @staticmethod
+    def _service(session: AsyncSession) -> Any:
+        from src.services.parser.unified_optimization_service import UnifiedOptimizationService
+
+        # The batch path never calls the client
+        return UnifiedOptimizationService(None, session)  # type: ignore[arg-type]
+
+    async def build(self, session: AsyncSession, article: Any) -> dict[str, Any]:
+        return self._service(session).build_batch_request(article)
+
+    async def apply(self, session: AsyncSession, article: Any, message: Any) -> None:
+        await self._service(session).apply_batch_result(article, message)
+
+
+@batch_kind
+class ProofreadingBatch(BatchKind):
+    """Full AI + deterministic proofreading of worklist articles."""
+
+    name = "proofreading"
+
+    def __init__(self) -> None:
+        self._proofreading: Any = None
+
+    def _pipeline(self, session: AsyncSession) -> Any:
+        from src.services.proofreading import ProofreadingAnalysisService
+        from src.services.worklist.pipeline import WorklistPipelineService
+
+        if self._proofreading is None:
+            self._proofreading = ProofreadingAnalysisService()
+        return WorklistPipelineService(session, proofreading_service=self._proofreading)
+
+    async def _payload(self, session: AsyncSession, article: Any) -> tuple[Any, Any]:
+        from src.models import WorklistItem
+
+        item = await session.scalar(
+            select(WorklistItem).where(WorklistItem.article_id == article.id).limit(1)
+        )
+        if item is None:
+            raise ValueError(f"Article {article.id} has no worklist item")
+        pipeline = self._pipeline(session)
+        return pipeline, pipeline._build_payload(article, item)
+
+    async def build(self, session: AsyncSession, article: Any) -> dict[str, Any]:
+        pipeline, payload = await self._payload(session, article)
+        return pipeline.proofreading_service.build_batch_request(payload)
+
+    async def apply(self, session: AsyncSession, article: Any, message: Any) -> None:
+        pipeline, payload = await self._payload(session, article)
+        result = await pipeline.proofreading_service.complete_batch_result(payload, message)
+        pipeline._apply_proofreading_result(article, result)
+        session.add(article)
+        await session.commit()
+
+
+@batch_kind
+class SEOAnalysisBatch(BatchKind):
+    """SEO metadata for imported articles (``SEOBatchAnalyzer``)."""
+
+    name = "seo_analysis"
+
+    @staticmethod
+    def _analyzer(session: AsyncSession) -> Any:
+        from src.services.seo_batch_analyzer import SEOBatchAnalyzer
+
+        return SEOBatchAnalyzer(session)
+
+    async def pending_ids(self, session: AsyncSession, limit: int | None) -> list[int]:
+        return await self._analyzer(session).pending_article_ids(limit)
+
+    async def build(self, session: AsyncSession, article: Any) -> dict[str, Any]:
+        return self._analyzer(session).seo_analyzer.build_batch_request(
+            article.title, article.body
+        )
+
+    async def apply(self, session: AsyncSession, article: Any, message: Any) -> None:
+        await self._analyzer(session).apply_batch_result(article, message)
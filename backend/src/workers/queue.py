@@ -0,0 +1,532 @@
+"""Durable job queue on the ``pipeline_tasks`` table.
+
+Jobs are ``PipelineTask`` rows.  Each API process runs a ``JobWorker`` that
+claims due ``pending`` rows with ``SELECT ... FOR UPDATE SKIP LOCKED`` — so
+a job runs on exactly one instance — and holds a lease on them that a
+heartbeat renews while the handler runs.  When an instance dies its leases
+expire and the job is handed to another worker.  Failures are retried with
+exponential backoff until ``max_attempts``; ``ValueError`` (bad input,
+missing records) fails immediately.
+
+Handlers are registered per task type with ``@job_handler`` (see
+``src.workers.tasks``).  ``concurrency`` bounds how many jobs of that type
+one worker runs at a time.  Long handlers can call ``save_job_checkpoint``
+to persist progress into the job payload, so a retried job resumes there.
+Handlers that wait on external work raise ``RetryJobLaterError`` to be run again
+after a delay without using up an attempt.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import uuid
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import get_logger, get_settings
+from src.models.pipeline_task import DEDUPE_INDEX_WHERE, PipelineTask, PipelineTaskStatus
+
+logger = get_logger(__name__)
+
+JobHandler = Callable[[dict[str, Any]], Awaitable[dict[str, Any] | None]]
+
+@dataclass(frozen=True)
+class JobSpec:
+    """Execution policy for one task type."""
+
+    task_type: str
+    handler: JobHandler
+    concurrency: int = 1
+    max_attempts: int = 3
+    lease_seconds: int | None = None
+    retry_backoff_seconds: float = 30.0
+    max_backoff_seconds: float = 1800.0
+    fatal_errors: tuple[type[BaseException], ...] = (ValueError,)
+
+    def backoff(self, attempts: int) -> timedelta:
+        """Delay before retry number ``attempts`` (1-based), doubling each time."""
+        seconds = self.retry_backoff_seconds * 2 ** max(attempts - 1, 0)
+        return timedelta(seconds=min(seconds, self.max_backoff_seconds))
+
+
+class RetryJobLaterError(Exception):
+    """Raised by a handler to be run again after ``delay_seconds``.
+
+    The attempt is not counted, so a job can poll external work (e.g. a
+    message batch) for hours without exhausting ``max_attempts`` or holding
+    a worker slot in between.
+    """
+
+    def __init__(self, delay_seconds: float, reason: str = "") -> None:
+        super().__init__(reason or f"retry in {delay_seconds}s")
+        self.delay_seconds = delay_seconds
+
+
+_registry: dict[str, JobSpec] = {}
+
+
+def _insert(session: AsyncSession):
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite_insert(PipelineTask)
+    return pg_insert(PipelineTask)
+
+
+def job_handler(
+    task_type: str,
+    *,
+    concurrency: int = 1,
+    max_attempts: int = 3,
+    lease_seconds: int | None = None,
+    retry_backoff_seconds: float = 30.0,
+) -> Callable[[JobHandler], JobHandler]:
+    """Register ``func`` as the handler for ``task_type`` jobs."""
+
+    def decorator(func: JobHandler) -> JobHandler:
+        _registry[task_type] = JobSpec(
+            task_type=task_type,
+            handler=func,
+            concurrency=concurrency,
+            max_attempts=max_attempts,
+            lease_seconds=lease_seconds,
+            retry_backoff_seconds=retry_backoff_seconds,
+        )
+        return func
+
+    return decorator
+
+
+def registered_jobs() -> dict[str, JobSpec]:
+    """Return a snapshot of the handler registry."""
+    return dict(_registry)
+
+
+@dataclass
+class ClaimedJob:
+    """A job leased to a worker."""
+
+    id: str
+    task_type: str
+    payload: dict[str, Any]
+    attempts: int
+    max_attempts: int
+
+
+# (queue, job, owner) of the job running in the current asyncio task
+_current_job: ContextVar[tuple[JobQueue, ClaimedJob, str] | None] = ContextVar(
+    "current_job", default=None
+)
+
+
+async def save_job_checkpoint(values: dict[str, Any]) -> bool:
+    """Merge ``values`` into the running job's payload.
+
+    The payload is what a retry (after a failure or an expired lease) is
+    started with, so handlers store their resume position here.  Returns
+    False outside a job or if the lease was lost.
+    """
+    current = _current_job.get()
+    if current is None:
+        return False
+    queue, job, owner = current
+    job.payload.update(values)
+    return await queue._update_owned(job.id, owner, input=dict(job.payload))
+
+
+class JobQueue:
+    """Enqueue, claim and settle jobs stored in ``pipeline_tasks``."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        *,
+        lease_seconds: int | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self.lease_seconds = lease_seconds or get_settings().JOB_QUEUE_LEASE_SECONDS
+        # Set on enqueue so a local worker picks the job up without waiting a poll
+        self.wakeup = asyncio.Event()
+
+    def _sessions(self) -> async_sessionmaker[AsyncSession]:
+        if self._session_factory is None:
+            from src.config.database import get_db_config
+
+            self._session_factory = get_db_config().get_session_factory()
+        return self._session_factory
+
+    async def enqueue(
+        self,
+        task_type: str,
+        payload: dict[str, Any] | None = None,
+        *,
+        priority: int = 0,
+        max_attempts: int | None = None,
+        delay_seconds: float = 0,
+        dedupe: bool = False,
+        dedupe_key: str | None = None,
+    ) -> str | None:
+        """Persist a new job and return its ID.
+
+        With ``dedupe`` nothing is enqueued (and None is returned) while
+        another job of the same type and ``dedupe_key`` (default: the task
+        type) is still pending or processing.  The check is the insert
+        itself, against a partial unique index, so concurrent enqueues from
+        several instances cannot both succeed.
+        """
+        spec = _registry.get(task_type)
+        now = datetime.now(UTC)
+        task_id = str(uuid.uuid4())
+        async with self._sessions()() as session:
+            stmt = _insert(session).values(
+                id=task_id,
+                task_type=task_type,
+                status=PipelineTaskStatus.PENDING.value,
+                input=payload,
+                priority=priority,
+                attempts=0,
+                max_attempts=max_attempts or (spec.max_attempts if spec else 3),
+                run_after=now + timedelta(seconds=delay_seconds),
+                dedupe_key=(dedupe_key or task_type) if dedupe else None,
+            )
+            if dedupe:
+                stmt = stmt.on_conflict_do_nothing(
+                    index_elements=["task_type", "dedupe_key"],
+                    index_where=text(DEDUPE_INDEX_WHERE),
+                )
+            inserted = await session.scalar(stmt.returning(PipelineTask.id))
+            await session.commit()
+        if inserted is None:
+            logger.info("job_enqueue_deduplicated", task_type=task_type, dedupe_key=dedupe_key)
+            return None
+
+        self.wakeup.set()
+        logger.info("job_enqueued", task_id=task_id, task_type=task_type, priority=priority)
+        return task_id
+
+    async def claim(
+        self, task_type: str, owner: str, limit: int, *, lease_seconds: int | None = None
+    ) -> list[ClaimedJob]:
+        """Lease up to ``limit`` due jobs of ``task_type`` to ``owner``."""
+        if limit <= 0:
+            return []
+        now = datetime.now(UTC)
+        lease = timedelta(seconds=lease_seconds or self.lease_seconds)
+        async with self._sessions()() as session:
+            tasks = (
+                await session.scalars(
+                    select(PipelineTask)
+                    .where(
+                        PipelineTask.task_type == task_type,
+                        PipelineTask.status == PipelineTaskStatus.PENDING.value,
+                        PipelineTask.run_after <= now,
+                    )
+                    .order_by(
+                        PipelineTask.priority.desc(),
+                        PipelineTask.run_after,
+                        PipelineTask.created_at,
+                    )
+                    .limit(limit)
+                    .with_for_update(skip_locked=True)
+                )
+            ).all()
+            claimed = []
+            for task in tasks:
+                task.status = PipelineTaskStatus.PROCESSING.value
+                task.lease_owner = owner
+                task.lease_expires_at = now + lease
+                task.heartbeat_at = now
+                task.attempts += 1
+                task.started_at = task.started_at or now
+                claimed.append(
+                    ClaimedJob(
+                        id=task.id,
+                        task_type=task.task_type,
+                        payload=dict(task.input or {}),
+                        attempts=task.attempts,
+                        max_attempts=task.max_attempts,
+                    )
+                )
+            await session.commit()
+        return claimed
+
+    async def heartbeat(self, job_id: str, owner: str, *, lease_seconds: int | None = None) -> bool:
+        """Extend the lease; False if ``owner`` no longer holds the job."""
+        now = datetime.now(UTC)
+        lease = timedelta(seconds=lease_seconds or self.lease_seconds)
+        return await self._update_owned(
+            job_id, owner, lease_expires_at=now + lease, heartbeat_at=now
+        )
+
+    async def complete(self, job_id: str, owner: str, result: dict[str, Any] | None) -> bool:
+        return await self._update_owned(
+            job_id,
+            owner,
+            status=PipelineTaskStatus.COMPLETED.value,
+            result=result,
+            error=None,
+            completed_at=datetime.now(UTC),
+            lease_owner=None,
+            lease_expires_at=None,
+        )
+
+    async def fail(
+        self, job: ClaimedJob, owner: str, error: str, *, retry_in: timedelta | None
+    ) -> bool:
+        """Re-queue the job after ``retry_in``, or mark it failed if None."""
+        now = datetime.now(UTC)
+        if retry_in is not None:
+            values: dict[str, Any] = {
+                "status": PipelineTaskStatus.PENDING.value,
+                "run_after": now + retry_in,
+            }
+        else:
+            values = {"status": PipelineTaskStatus.FAILED.value, "completed_at": now}
+        return await self._update_owned(
+            job.id, owner, error=error, lease_owner=None, lease_expires_at=None, **values
+        )
+
+    async def release(self, job_id: str, owner: str, *, delay_seconds: float = 0) -> bool:
+        """Hand an unfinished job back without counting the attempt.
+
+        Used on shutdown and, with a delay, for ``RetryJobLaterError``.
+        """
+        return await self._update_owned(
+            job_id,
+            owner,
+            status=PipelineTaskStatus.PENDING.value,
+            attempts=PipelineTask.attempts - 1,
+            run_after=datetime.now(UTC) + timedelta(seconds=delay_seconds),
+            lease_owner=None,
+            lease_expires_at=None,
+        )
+
+    async def cancel(self, job_id: str) -> bool:
+        """Cancel a job that has not started yet."""
+        async with self._sessions()() as session:
+            result = await session.execute(
+                update(PipelineTask)
+                .where(
+                    PipelineTask.id == job_id,
+                    PipelineTask.status == PipelineTaskStatus.PENDING.value,
+                )
+                .values(
+                    status=PipelineTaskStatus.CANCELLED.value,
+                    completed_at=datetime.now(UTC),
+                )
+            )
+            await session.commit()
+        return (result.rowcount or 0) == 1
+
+    async def reap_expired(self) -> int:
+        """Re-queue (or fail) processing jobs whose lease has expired."""
+        now = datetime.now(UTC)
+        async with self._sessions()() as session:
+            tasks = (
+                await session.scalars(
+                    select(PipelineTask)
+                    .where(
+                        PipelineTask.status == PipelineTaskStatus.PROCESSING.value,
+                        PipelineTask.lease_expires_at < now,
+                    )
+                    .with_for_update(skip_locked=True)
+                )
+            ).all()
+            for task in tasks:
+                logger.warning(
+                    "job_lease_expired",
+                    task_id=task.id,
+                    task_type=task.task_type,
+                    lease_owner=task.lease_owner,
+                    attempts=task.attempts,
+                )
+                if task.attempts >= task.max_attempts:
+                    task.status = PipelineTaskStatus.FAILED.value
+                    task.error = f"Lease expired after {task.attempts} attempt(s)"
+                    task.completed_at = now
+                else:
+                    task.status = PipelineTaskStatus.PENDING.value
+                    task.run_after = now
+                task.lease_owner = None
+                task.lease_expires_at = None
+            await session.commit()
+        return len(tasks)
+
+    async def _update_owned(self, job_id: str, owner: str, **values: Any) -> bool:
+        async with self._sessions()() as session:
+            result = await session.execute(
+                update(PipelineTask)
+                .where(
+                    PipelineTask.id == job_id,
+                    PipelineTask.lease_owner == owner,
+                    PipelineTask.status == PipelineTaskStatus.PROCESSING.value,
+                )
+                .values(**values)
+            )
+            await session.commit()
+        return (result.rowcount or 0) == 1
+
+
+class JobWorker:
+    """Poll the queue and run claimed jobs within per-type concurrency limits."""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        *,
+        poll_interval: float | None = None,
+        owner: str | None = None,
+        specs: dict[str, JobSpec] | None = None,
+    ) -> None:
+        self.queue = queue
+        self.poll_interval = poll_interval or get_settings().JOB_QUEUE_POLL_INTERVAL_SECONDS
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._specs = specs
+        self._running: dict[str, set[asyncio.Task]] = defaultdict(set)
+        self._loop_task: asyncio.Task | None = None
+        self._stopping = False
+
+    @property
+    def specs(self) -> dict[str, JobSpec]:
+        return self._specs if self._specs is not None else registered_jobs()
+
+    @property
+    def running(self) -> int:
+        return sum(len(tasks) for tasks in self._running.values())
+
+    def start(self) -> None:
+        if self._loop_task is None:
+            self._stopping = False
+            self._loop_task = asyncio.create_task(self._run_loop(), name="job-worker")
+            logger.info("job_worker_started", owner=self.owner, task_types=sorted(self.specs))
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """Stop polling, let running jobs finish, then release the rest."""
+        self._stopping = True
+        self.queue.wakeup.set()
+        if self._loop_task is not None:
+            await self._loop_task
+            self._loop_task = None
+        running = [task for tasks in self._running.values() for task in tasks]
+        if running:
+            _, pending = await asyncio.wait(running, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        logger.info("job_worker_stopped", owner=self.owner)
+
+    async def run_once(self) -> list[asyncio.Task]:
+        """Reap expired leases and start as many due jobs as limits allow."""
+        await self.queue.reap_expired()
+        started: list[asyncio.Task] = []
+        for task_type, spec in self.specs.items():
+            free = spec.concurrency - len(self._running[task_type])
+            for job in await self.queue.claim(
+                task_type, self.owner, free, lease_seconds=spec.lease_seconds
+            ):
+                task = asyncio.create_task(self._execute(spec, job), name=f"job-{job.id}")
+                self._running[task_type].add(task)
+                task.add_done_callback(self._running[task_type].discard)
+                started.append(task)
+        return started
+
+    async def _run_loop(self) -> None:
+        while not self._stopping:
+            self.queue.wakeup.clear()
+            try:
+                await self.run_once()
+            except Exception as exc:  # noqa: BLE001 - keep polling after DB hiccups
+                logger.error("job_worker_poll_failed", error=str(exc), exc_info=True)
+            try:
+                await asyncio.wait_for(self.queue.wakeup.wait(), self.poll_interval)
+            except TimeoutError:
+                pass
+
+    async def _execute(self, spec: JobSpec, job: ClaimedJob) -> None:
+        _current_job.set((self.queue, job, self.owner))
+        lease_seconds = spec.lease_seconds or self.queue.lease_seconds
+        heartbeat = asyncio.create_task(
+            self._heartbeat(job, lease_seconds, asyncio.current_task())
+        )
+        logger.info(
+            "job_started", task_id=job.id, task_type=job.task_type, attempt=job.attempts
+        )
+        try:
+            result = await spec.handler(job.payload)
+        except asyncio.CancelledError:
+            await asyncio.shield(self._settle(self.queue.release(job.id, self.owner), job))
+            raise
+        except RetryJobLaterError as later:
+            logger.info(
+                "job_deferred",
+                task_id=job.id,
+                task_type=job.task_type,
+                delay_seconds=later.delay_seconds,
+                reason=str(later),
+            )
+            await self._settle(
+                self.queue.release(job.id, self.owner, delay_seconds=later.delay_seconds), job
+            )
+        except Exception as exc:
+            error = str(exc) or repr(exc)
+            retry_in = None
+            if not isinstance(exc, spec.fatal_errors) and job.attempts < job.max_attempts:
+                retry_in = spec.backoff(job.attempts)
+            logger.error(
+                "job_failed",
+                task_id=job.id,
+                task_type=job.task_type,
+                attempt=job.attempts,
+                retry_in_seconds=retry_in.total_seconds() if retry_in else None,
+                error=error,
+                exc_info=True,
+            )
+            await self._settle(self.queue.fail(job, self.owner, error, retry_in=retry_in), job)
+        else:
+            await self._settle(self.queue.complete(job.id, self.owner, result), job)
+            logger.info("job_completed", task_id=job.id, task_type=job.task_type)
+        finally:
+            heartbeat.cancel()
+
+    async def _settle(self, update_call: Awaitable[bool], job: ClaimedJob) -> None:
+        try:
+            if not await update_call:
+                logger.warning("job_lease_lost_before_settle", task_id=job.id)
+        except Exception as exc:  # noqa: BLE001 - lease expiry re-queues the job
+            logger.error("job_settle_failed", task_id=job.id, error=str(exc), exc_info=True)
+
+    async def _heartbeat(
+        self, job: ClaimedJob, lease_seconds: int, handler: asyncio.Task | None
+    ) -> None:
+        while True:
+            await asyncio.sleep(lease_seconds / 3)
+            try:
+                held = await self.queue.heartbeat(job.id, self.owner, lease_seconds=lease_seconds)
+            except Exception as exc:  # noqa: BLE001 - retry on the next beat
+                logger.warning("job_heartbeat_failed", task_id=job.id, error=str(exc))
+                continue
+            if not held:
+                logger.warning("job_lease_lost", task_id=job.id, task_type=job.task_type)
+                if handler is not None:
+                    handler.cancel()
+                return
+
+
+_job_queue: JobQueue | None = None
+
+
+def get_job_queue() -> JobQueue:
+    """Process-wide queue bound to the application database."""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue()
+    return _job_queue
@@ -1 +1,113 @@
-"""Task definitions (Celery removed — kept as empty package for import compat)."""
+"""Background job handlers run by the durable job queue (``src.workers.queue``).
+
+Importing this package registers every handler; enqueue jobs with
+``get_job_queue().enqueue(<task_type>, payload)``.
+"""
+
+from typing import Any
+
+from src.config.database import get_db_config
+from src.config.logging import get_logger
+from src.workers.queue import job_handler, save_job_checkpoint
+
+logger = get_logger(__name__)
+
+
+# One attempt: a retry after the WordPress draft was created but before it
+# was recorded would publish a second draft
+@job_handler("auto_publish", concurrency=2, max_attempts=1)
+async def run_auto_publish(payload: dict[str, Any]) -> dict[str, Any]:
+    """Google Doc → worklist → proofread → WordPress draft."""
+    from src.services.worklist.auto_publish import AutoPublishService
+
+    service = AutoPublishService(session=None)  # type: ignore[arg-type]
+    return await service.process_google_doc(
+        google_doc_url=payload["google_doc_url"],
+        sheet_row=payload.get("sheet_row"),
+    )
+
+
+@job_handler("worklist_sync", concurrency=1, max_attempts=2)
+async def run_worklist_sync(payload: dict[str, Any]) -> dict[str, Any]:
+    """Full Google Drive → worklist sync."""
+    from src.services.worklist.service import WorklistService
+
+    async with get_db_config().session() as session:
+        return await WorklistService(session).trigger_sync()
+
+
+@job_handler("seo_analysis", concurrency=2)
+async def analyze_seo_single_task(payload: dict[str, Any]) -> dict[str, Any]:
+    """Generate SEO metadata for one article."""
+    from src.services.seo_batch_analyzer import SEOBatchAnalyzer
+
+    async with get_db_config().session() as session:
+        seo = await SEOBatchAnalyzer(session).analyze_article_by_id(payload["article_id"])
+        return {
+            "article_id": seo.article_id,
+            "seo_id": seo.id,
+            "focus_keyword": seo.focus_keyword,
+            "seo_score": seo.seo_score,
+            "readability_score": seo.readability_score,
+            "status": "completed",
+        }
+
+
+@job_handler("seo_batch_analysis", concurrency=1, max_attempts=1)
+async def analyze_seo_batch_task(payload: dict[str, Any]) -> dict[str, Any]:
+    """Generate SEO metadata for imported articles that have none."""
+    from src.services.seo_batch_analyzer import SEOBatchAnalyzer
+
+    async with get_db_config().session() as session:
+        successful, failed, errors = await SEOBatchAnalyzer(session).analyze_imported_articles(
+            limit=payload.get("limit")
+        )
+    return {
+        "successful_count": successful,
+        "failed_count": failed,
+        "total_count": successful + failed,
+        "errors": errors,
+        "status": "completed",
+    }
+
+
+@job_handler("embedding_reindex", concurrency=1, max_attempts=5, retry_backoff_seconds=60)
+async def run_embedding_reindex(payload: dict[str, Any]) -> dict[str, Any]:
+    """Rebuild topic embeddings, resuming from the last checkpointed article."""
+    from src.services.semantic_similarity import get_semantic_service
+
+    async def checkpoint(last_id: int) -> None:
+        await save_job_checkpoint({"start_after_id": last_id})
+
+    async with get_db_config().session() as session:
+        processed = await get_semantic_service().reindex_all_articles(
+            session,
+            batch_size=payload.get("batch_size", 50),
+            start_after_id=payload.get("start_after_id", 0),
+            force=payload.get("force", False),
+            checkpoint=checkpoint,
+        )
+    return {"processed": processed, "status": "completed"}
+
+
+@job_handler("message_batch_submit", concurrency=1, max_attempts=1)
+async def run_message_batch_submit(payload: dict[str, Any]) -> dict[str, Any]:
+    """Pack a backfill into Anthropic message batches (one collect job per batch)."""
+    from src.workers.message_batches import submit_message_batches
+
+    batches = await submit_message_batches(
+        payload["kind"], payload.get("article_ids"), limit=payload.get("limit")
+    )
+    return {
+        "batches": batches,
+        "requests": sum(batch["requests"] for batch in batches),
+        "status": "submitted",
+    }
+
+
+@job_handler("message_batch_collect", concurrency=2, max_attempts=3, retry_backoff_seconds=120)
+async def run_message_batch_collect(payload: dict[str, Any]) -> dict[str, Any]:
+    """Poll a message batch and apply its results once it has ended."""
+    from src.workers.message_batches import collect_message_batch
+
+    return await collect_message_batch(payload)
@@ -0,0 +1,58 @@
+"""Unit tests for the shared deterministic-rule analysis context."""
+
+from src.services.proofreading.analysis_context import (
+    AnalysisContext,
+    UrlRangeIndex,
+    find_url_ranges,
+)
+from src.services.proofreading.deterministic_engine import is_within_url
+from src.services.proofreading.models import ArticlePayload
+
+
+class TestUrlRangeIndex:
+    def test_overlaps_matches_linear_scan(self):
+        content = "见 https://a.com/x,y 和 www.b.org/z 以及 c.net 结尾"
+        ranges = find_url_ranges(content)
+        index = UrlRangeIndex(ranges)
+
+        for start in range(len(content)):
+            for end in range(start + 1, min(len(content), start + 4) + 1):
+                assert index.overlaps(start, end) == is_within_url(start, end, ranges)
+
+    def test_contains_checks_start_offset(self):
+        index = UrlRangeIndex([(5, 10), (20, 25)])
+
+        assert index.contains(5)
+        assert index.contains(9)
+        assert not index.contains(10)
+        assert not index.contains(4)
+        assert index.contains(24)
+        assert not index.contains(30)
+
+    def test_empty_index_is_falsy(self):
+        index = UrlRangeIndex([])
+
+        assert not index
+        assert not index.overlaps(0, 100)
+        assert not index.contains(0)
+
+
+class TestAnalysisContext:
+    def test_views_are_computed_once(self):
+        context = AnalysisContext.from_payload(
+            ArticlePayload(title="Test", original_content="<p>第一段内容。</p><div>第二段！</div>")
+        )
+
+        assert context.soup is context.soup
+        assert context.block_texts == ["第一段内容。", "第二段！"]
+
+    def test_headings_sentences_and_paragraphs(self):
+        content = "## 小标题\n第一句。第二句！\n\n#### 跳级\n第三句？"
+        context = AnalysisContext.from_payload(
+            ArticlePayload(title="Test", original_content=content)
+        )
+
+        assert [(h.level, h.text) for h in context.headings] == [(2, "小标题"), (4, "跳级")]
+        assert context.sentences == ["## 小标题\n第一句", "第二句", "#### 跳级\n第三句"]
+        assert context.paragraphs == ["## 小标题\n第一句。第二句！", "#### 跳级\n第三句？"]
+        assert context.chinese_char_count == 14
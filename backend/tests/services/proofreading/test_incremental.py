@@ -0,0 +1,265 @@
+"""Unit tests for incremental paragraph-level re-proofreading."""
+
+import json
+from types import SimpleNamespace
+
+from src.services.proofreading.deterministic_engine import RuleScope
+from src.services.proofreading.incremental import (
+    IncrementalSnapshot,
+    attribute_ai_issues,
+    shift_issue,
+    split_paragraphs,
+)
+from src.services.proofreading.models import (
+    ArticlePayload,
+    ProofreadingIssue,
+    ProofreadingResult,
+    RuleSource,
+)
+from src.services.proofreading.service import AnalysisMode, ProofreadingAnalysisService
+
+
+class _RecordingMessages:
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+
+    async def create(self, **kwargs):
+        self.prompts.append(kwargs["messages"][0]["content"])
+        body = {
+            "issues": [
+                {
+                    "rule_id": "A3-005",
+                    "message": "错字",
+                    "original_text": "再接再励",
+                    "suggestion": "再接再厉",
+                    "severity": "error",
+                }
+            ]
+        }
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=json.dumps(body, ensure_ascii=False))],
+            usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+        )
+
+
+class _ScriptedMessages(_RecordingMessages):
+    """Answers each call with the next scripted list of issues."""
+
+    def __init__(self, *answers: list[dict]) -> None:
+        super().__init__()
+        self.answers = list(answers)
+
+    async def create(self, **kwargs):
+        self.prompts.append(kwargs["messages"][0]["content"])
+        body = {"issues": self.answers.pop(0)}
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=json.dumps(body, ensure_ascii=False))],
+            usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+        )
+
+
+def _service(
+    messages: _RecordingMessages | None = None,
+) -> tuple[ProofreadingAnalysisService, _RecordingMessages]:
+    messages = messages or _RecordingMessages()
+    service = ProofreadingAnalysisService(
+        anthropic_client=SimpleNamespace(messages=messages),
+    )
+    service.result_cache = None
+    return service, messages
+
+
+def _positions(issues):
+    return sorted(
+        (issue.rule_id, issue.location.get("offset"))
+        for issue in issues
+        if issue.location and "offset" in issue.location
+    )
+
+
+class TestSplitParagraphs:
+    def test_segments_cover_content(self):
+        content = "<p>第一段</p><h2>标题</h2>\n\n纯文本段落\n\n\n最后一段"
+        segments = split_paragraphs(content)
+
+        assert "".join(segment.text for segment in segments) == content
+        assert [segment.text for segment in segments] == [
+            "<p>第一段</p>",
+            "<h2>标题</h2>\n\n",
+            "纯文本段落\n\n\n",
+            "最后一段",
+        ]
+        assert all(content[s.start:s.end] == s.text for s in segments)
+
+    def test_digest_depends_only_on_text(self):
+        first = split_paragraphs("<p>甲</p><p>乙</p>")
+        second = split_paragraphs("<p>丙丙</p><p>乙</p>")
+
+        assert first[1].digest == second[1].digest
+        assert first[0].digest != second[0].digest
+
+    def test_shift_issue_moves_offsets_on_copy(self):
+        issue = ProofreadingIssue(
+            rule_id="A1-002",
+            category="A",
+            message="m",
+            severity="warning",
+            source=RuleSource.SCRIPT,
+            location={"offset": 3},
+        )
+
+        shifted = shift_issue(issue, 10)
+
+        assert shifted.location == {"offset": 13}
+        assert issue.location == {"offset": 3}
+
+    def test_attributed_ai_issues_are_paragraph_relative(self):
+        segments = split_paragraphs("<p>甲乙。</p><p>丙丁。</p>")
+        located = ProofreadingIssue(
+            rule_id="A", category="A", severity="warning", message="m",
+            source=RuleSource.AI, original_text="丁", location={"offset": 14},
+        )
+        by_text = located.model_copy(update={"location": None, "original_text": "乙"})
+
+        by_digest, unattributed = attribute_ai_issues([located, by_text], segments)
+
+        assert unattributed == []
+        [second] = by_digest[segments[1].digest]
+        assert second.location == {"offset": 4}
+        [first] = by_digest[segments[0].digest]
+        assert first.original_text == "乙"
+
+
+class TestIncrementalAnalysis:
+    async def test_only_changed_paragraphs_reach_ai(self):
+        service, messages = _service()
+        original = "<p>他再接再励，裡面很熱。</p><p>部份人說成份不明。</p>"
+        payload = ArticlePayload(article_id=1, title="标题", original_content=original)
+
+        _, snapshot = await service.analyze_article_incremental(payload)
+        edited = payload.model_copy(
+            update={"original_content": "<p>新的开头段落。</p>" + original}
+        )
+        result, _ = await service.analyze_article_incremental(edited, snapshot)
+
+        assert len(messages.prompts) == 2
+        assert "新的开头段落" in messages.prompts[1]
+        assert "部份人說成份不明" not in messages.prompts[1]
+        notes = result.processing_metadata.notes["incremental"]
+        assert notes["changed_paragraphs"] == 1
+        assert notes["paragraphs"] == 3
+
+    async def test_shifted_issues_match_full_rule_run(self):
+        service, _ = _service()
+        original = "<p>他再接再励，裡面很熱。</p><p>部份人說成份不明。</p>"
+        payload = ArticlePayload(title="标题", original_content=original)
+        _, snapshot = await service.analyze_article_incremental(
+            payload, mode=AnalysisMode.DETERMINISTIC_ONLY
+        )
+
+        edited = payload.model_copy(
+            update={"original_content": "<p>插入一段。</p>" + original}
+        )
+        result, _ = await service.analyze_article_incremental(
+            edited, snapshot, mode=AnalysisMode.DETERMINISTIC_ONLY
+        )
+
+        expected = service.merger.merge(
+            ProofreadingResult(),
+            service.rule_engine.run(edited, scope=RuleScope.PARAGRAPH)
+            + service.rule_engine.run(edited, scope=RuleScope.DOCUMENT),
+        )
+        assert _positions(expected.issues)
+        assert _positions(result.issues) == _positions(expected.issues)
+
+    async def test_paragraph_punctuation_rules_match_full_run(self):
+        service, _ = _service()
+        original = (
+            "<p>他说..真的吗??太好了!!</p>\n"
+            "<p>注意:明天见;然后,再说。</p>\n"
+            "<p>共有 12345 人，占50%，电錶坏了，真是莫明其妙。</p>\n"
+            "<p>这一段没有标点\n</p>"
+        )
+        payload = ArticlePayload(title="标题", original_content=original)
+        _, snapshot = await service.analyze_article_incremental(
+            payload, mode=AnalysisMode.DETERMINISTIC_ONLY
+        )
+
+        edited = payload.model_copy(
+            update={
+                "original_content": "<p>插入一段:内容!!</p>\n"
+                + original.replace("明天见", "后天见")
+            }
+        )
+        result, _ = await service.analyze_article_incremental(
+            edited, snapshot, mode=AnalysisMode.DETERMINISTIC_ONLY
+        )
+
+        expected = service.merger.merge(
+            ProofreadingResult(), service.rule_engine.run(edited)
+        )
+        local_rules = {"B1-001", "B1-002", "B1-003", "B1-004", "B1-006", "B1-007", "B2-002"}
+        scopes = {rule.rule_id: rule.scope for rule in service.rule_engine.rules}
+        assert all(scopes[rule_id] is RuleScope.PARAGRAPH for rule_id in local_rules)
+        assert local_rules <= {issue.rule_id for issue in expected.issues}
+        assert _positions(result.issues) == _positions(expected.issues)
+
+    async def test_unchanged_article_skips_ai(self):
+        service, messages = _service()
+        payload = ArticlePayload(title="标题", original_content="<p>他再接再励。</p>")
+
+        first, snapshot = await service.analyze_article_incremental(payload)
+        second, _ = await service.analyze_article_incremental(payload, snapshot)
+
+        assert len(messages.prompts) == 1
+        assert second.processing_metadata.notes["incremental"]["ai_called"] is False
+        assert [i.rule_id for i in second.issues] == [i.rule_id for i in first.issues]
+
+    async def test_incompatible_snapshot_is_ignored(self):
+        service, messages = _service()
+        payload = ArticlePayload(title="标题", original_content="<p>他再接再励。</p>")
+        _, snapshot = await service.analyze_article_incremental(payload)
+
+        stale = IncrementalSnapshot.model_validate(
+            {**snapshot.model_dump(), "engine_version": "0.0.1"}
+        )
+        await service.analyze_article_incremental(payload, stale)
+
+        assert len(messages.prompts) == 2
+
+    async def test_ai_offsets_follow_edits_without_piling_up(self):
+        original = "<p>他再接再励。</p><p>部份人。</p>"
+        edited = "<p>前言。</p><p>他再接再励。</p><p>部份人改了。</p>"
+        partial_prompt = "<p>前言。</p><p>部份人改了。</p>"
+        document_issue = {
+            "rule_id": "F1-001", "message": "全文结构", "suggestion": "补充小标题", "severity": "info",
+        }
+        messages = _ScriptedMessages(
+            [
+                {"rule_id": "E1-001", "message": "语气", "original_text": "再接再励",
+                 "suggestion": "再接再厉", "severity": "error", "location": {"offset": original.index("再接再励")}},
+                document_issue,
+            ],
+            [
+                {"rule_id": "E1-002", "message": "用词", "original_text": "部份",
+                 "suggestion": "部分", "severity": "warning",
+                 "location": {"offset": partial_prompt.index("部份")}},
+                document_issue,
+            ],
+        )
+        service, _ = _service(messages)
+        payload = ArticlePayload(title="标题", original_content=original)
+
+        _, snapshot = await service.analyze_article_incremental(payload)
+        result, _ = await service.analyze_article_incremental(
+            payload.model_copy(update={"original_content": edited}), snapshot
+        )
+
+        ai_offsets = {
+            issue.rule_id: issue.location.get("offset")
+            for issue in result.issues
+            if issue.source == RuleSource.AI and issue.location
+        }
+        assert ai_offsets["E1-001"] == edited.index("再接再励")
+        assert ai_offsets["E1-002"] == edited.index("部份")
+        assert [i.rule_id for i in result.issues].count("F1-001") == 1
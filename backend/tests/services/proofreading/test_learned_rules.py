@@ -0,0 +1,188 @@
+"""Unit tests for learned rules hot-loaded into the deterministic engine."""
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.models.learned_proofreading_rule import LearnedProofreadingRule
+from src.schemas.proofreading_decision import DraftRule, ReviewStatus
+from src.services.proofreading.deterministic_engine import DeterministicRuleEngine
+from src.services.proofreading.learned_rule_store import (
+    save_published_rules,
+    sync_learned_rules,
+)
+from src.services.proofreading.learned_rules import (
+    LEARNED_CATEGORY,
+    LearnedRuleRegistry,
+    screen_pattern,
+)
+from src.services.proofreading.models import ArticlePayload
+
+
+def _rule(rule_id="L-001", pattern="其實", replacement="其实", **kwargs):
+    kwargs.setdefault("review_status", ReviewStatus.APPROVED)
+    return DraftRule(
+        rule_id=rule_id,
+        rule_type="vocabulary",
+        natural_language="統一使用简体用字",
+        pattern=pattern,
+        replacement=replacement,
+        confidence=0.9,
+        **kwargs,
+    )
+
+
+def _learned(issues):
+    return [issue for issue in issues if issue.category == LEARNED_CATEGORY]
+
+
+class TestScreenPattern:
+    def test_literal_and_simple_regex_pass(self):
+        assert screen_pattern(re.compile("其實"), 50) is None
+        assert screen_pattern(re.compile(r"(\d+)\s*%"), 50) is None
+
+    def test_nested_quantifier_is_rejected(self):
+        assert "backtracking" in screen_pattern(re.compile(r"(a+)+b"), 50)
+        assert "backtracking" in screen_pattern(re.compile(r"(a|aa)*c"), 50)
+
+    def test_nested_quantifier_behind_extra_groups_is_rejected(self):
+        assert "backtracking" in screen_pattern(re.compile(r"((a+))+b"), 50)
+        assert "backtracking" in screen_pattern(re.compile(r"((ab)*)*c"), 50)
+        assert screen_pattern(re.compile(r"(?:\d{3},)+"), 50) is None
+
+    def test_hanging_probe_is_killed(self):
+        # Polynomial blow-up the static check does not catch; the probe never
+        # finishes on its own, so it must be killed at the deadline
+        reason = screen_pattern(re.compile(r"a*a*a*a*a*a*a*a*a*b"), 50)
+        assert reason is not None and "killed" in reason
+
+    def test_slow_pattern_exceeds_budget(self):
+        # Polynomial backtracking the static check does not catch
+        reason = screen_pattern(re.compile(r"a*a*a*a*a*b"), 1)
+        assert reason is not None and "time budget" in reason
+
+
+class TestLearnedRuleRegistry:
+    def test_compile_is_cached_by_content_hash(self):
+        registry = LearnedRuleRegistry(time_budget_ms=50)
+
+        first = registry.compile([_rule()])
+        again = registry.compile([_rule()])
+        changed = registry.compile([_rule(replacement="实际上")])
+
+        assert again is first
+        assert changed.version != first.version
+
+    def test_unreviewed_and_unsafe_rules_are_left_out(self):
+        registry = LearnedRuleRegistry(time_budget_ms=50)
+
+        ruleset = registry.compile([
+            _rule("L-001"),
+            _rule("L-002", pattern="裡面", review_status=ReviewStatus.PENDING),
+            _rule("L-003", pattern=r"(\w+)+$"),
+            _rule("L-004", pattern="(unclosed"),
+        ])
+
+        assert [rule.rule_id for rule in ruleset.rules] == ["L-001"]
+        rejected = {r.rule_id: r.reason for r in ruleset.rejected}
+        assert set(rejected) == {"L-003", "L-004"}
+        assert rejected["L-004"].startswith("Invalid regex pattern")
+
+    def test_publish_merges_by_rule_id_and_swaps_version(self):
+        registry = LearnedRuleRegistry(time_budget_ms=50)
+
+        first = registry.publish([_rule("L-001"), _rule("L-002", pattern="裏")])
+        second = registry.publish([_rule("L-002", pattern="裡", replacement="里")])
+
+        assert registry.active is second
+        assert second.version != first.version
+        assert sorted(rule.rule_id for rule in second.rules) == ["L-001", "L-002"]
+        assert not registry.activate(second)
+        registry.clear()
+        assert registry.active is None
+
+
+class TestEngineIntegration:
+    def test_published_rules_take_effect_without_rebuilding_engine(self):
+        registry = LearnedRuleRegistry(time_budget_ms=50)
+        engine = DeterministicRuleEngine(learned_rules=registry)
+        payload = ArticlePayload(title="Test", original_content="其實我們都知道這件事")
+
+        assert _learned(engine.run(payload)) == []
+        base_version = engine.version
+
+        registry.publish([_rule()])
+        [issue] = _learned(engine.run(payload))
+
+        assert issue.rule_id == "L-001"
+        assert issue.original_text == "其實"
+        assert issue.suggested_text == "其实"
+        assert issue.location == {"offset": 0}
+        assert engine.version.startswith(f"{base_version}+")
+        assert len(engine.version) <= 20
+
+    def test_backreference_replacement_and_url_filtering(self):
+        registry = LearnedRuleRegistry(time_budget_ms=50)
+        registry.publish([
+            _rule("L-010", pattern=r"(\d+)\s*%", replacement=r"\1%"),
+            _rule("L-011", pattern="example"),
+        ])
+        engine = DeterministicRuleEngine(learned_rules=registry)
+        payload = ArticlePayload(
+            title="Test",
+            original_content="增長 15 % 見 https://example.com/ 說明",
+        )
+
+        issues = _learned(engine.run(payload))
+
+        assert [(i.rule_id, i.suggested_text) for i in issues] == [("L-010", "15%")]
+
+    def test_overrunning_set_is_disabled_until_next_publish(self):
+        registry = LearnedRuleRegistry(time_budget_ms=50)
+        ruleset = registry.publish([_rule()])
+        ruleset.time_budget_ms = 0  # every scan now overruns
+        engine = DeterministicRuleEngine(learned_rules=registry)
+        payload = ArticlePayload(title="Test", original_content="其實" * 10)
+
+        for _ in range(3):
+            engine.run(payload)
+
+        assert registry.active is None
+        assert _learned(engine.run(payload)) == []
+        registry.activate(ruleset)
+        assert registry.active is ruleset
+
+
+class TestPublishedRulePersistence:
+    def test_concurrent_publishes_keep_every_rule(self):
+        registry = LearnedRuleRegistry(time_budget_ms=50)
+        rules = [_rule(f"L-{index:03d}", pattern=f"詞{index}") for index in range(8)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda rule: registry.publish([rule]), rules))
+
+        assert sorted(rule.rule_id for rule in registry.active.rules) == [
+            rule.rule_id for rule in rules
+        ]
+
+    async def test_stored_rules_load_into_a_fresh_process(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'rules.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(LearnedProofreadingRule.__table__.create)
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+        async with sessions() as session:
+            await save_published_rules(session, [_rule("L-001"), _rule("L-002", pattern="裏")])
+            await save_published_rules(session, [_rule("L-002", pattern="裡")], ruleset_id="r2")
+
+        registry = LearnedRuleRegistry(time_budget_ms=50)
+        async with sessions() as session:
+            ruleset = await sync_learned_rules(session, registry)
+            # Reloading an unchanged table keeps the active set
+            assert await sync_learned_rules(session, registry) is ruleset
+        await engine.dispose()
+
+        assert registry.active is ruleset
+        patterns = {rule.rule_id: rule.pattern.pattern for rule in ruleset.rules}
+        assert patterns == {"L-001": "其實", "L-002": "裡"}
@@ -0,0 +1,120 @@
+"""Unit tests for the shared multi-pattern matcher."""
+
+import re
+
+from src.services.proofreading.deterministic_engine import (
+    DeterministicRuleEngine,
+    PatternMatchingRule,
+)
+from src.services.proofreading.matcher import (
+    AhoCorasickAutomaton,
+    MultiPatternMatcher,
+    literal_text,
+)
+from src.services.proofreading.models import ArticlePayload
+
+
+def _spans(matches):
+    return [(m.start(), m.end(), m.group()) for m in matches]
+
+
+class TestLiteralText:
+    def test_escaped_literal_is_recognised(self):
+        assert literal_text(re.compile(re.escape("a.b(c)"))) == "a.b(c)"
+
+    def test_character_class_is_regex(self):
+        assert literal_text(re.compile(r"[裡裏]")) is None
+
+    def test_ignore_case_is_regex(self):
+        assert literal_text(re.compile("covid", re.IGNORECASE)) is None
+
+    def test_backslash_class_is_regex(self):
+        assert literal_text(re.compile(r"\d+")) is None
+
+
+class TestAhoCorasickAutomaton:
+    def test_reports_overlapping_keywords(self):
+        automaton = AhoCorasickAutomaton(["he", "she", "hers"])
+        hits = sorted(automaton.iter_matches("ushers"))
+        assert hits == [(1, 1), (2, 0), (2, 2)]
+
+    def test_no_keywords_in_text(self):
+        automaton = AhoCorasickAutomaton(["再接再励"])
+        assert list(automaton.iter_matches("这是一篇干净的文章。")) == []
+
+
+class TestMultiPatternMatcher:
+    def test_matches_equal_per_pattern_finditer(self):
+        patterns = [
+            re.compile(re.escape("aa")),
+            re.compile(re.escape("aaa")),
+            re.compile(r"a(?=b)"),
+            re.compile(r"[ab]b"),
+            re.compile("AB", re.IGNORECASE),
+        ]
+        matcher = MultiPatternMatcher()
+        for index, pattern in enumerate(patterns):
+            matcher.add(pattern, owner=index)
+        text = "aaaab aabab aaaaa abab"
+
+        hits = matcher.scan(text)
+
+        for index, pattern in enumerate(patterns):
+            assert _spans(hits.get(index, [])) == _spans(pattern.finditer(text))
+
+    def test_shared_pattern_routes_to_every_owner(self):
+        pattern = re.compile(re.escape("松驰"))
+        matcher = MultiPatternMatcher()
+        matcher.add(pattern, owner="A2-030")
+        matcher.add(re.compile(re.escape("松驰")), owner="A3-047")
+
+        hits = matcher.scan("肌肉松驰，松驰。")
+
+        assert matcher.pattern_count == 1
+        assert _spans(hits["A2-030"]) == _spans(hits["A3-047"])
+        assert len(hits["A2-030"]) == 2
+
+    def test_flags_and_group_references_survive_merging(self):
+        patterns = [
+            re.compile(r"^foo\d", re.MULTILINE),
+            re.compile(r"a.b", re.DOTALL),
+            re.compile(r"(?P<w>x)y"),
+            re.compile(r"(?P<w>z)y"),
+            re.compile(r"(a)\1"),
+            re.compile(r"(b)(c)\2"),
+            re.compile(r"(?i)FOO"),
+            re.compile(r"foo  # trailing comment", re.VERBOSE),
+        ]
+        matcher = MultiPatternMatcher()
+        for index, pattern in enumerate(patterns):
+            matcher.add(pattern, owner=index)
+        text = "x\nfoo1 a\nb xy zy aa/bcc Foo"
+
+        hits = matcher.scan(text)
+
+        for index, pattern in enumerate(patterns):
+            assert _spans(hits.get(index, [])) == _spans(pattern.finditer(text)), pattern
+        assert _spans(hits[0]) == [(2, 6, "foo1")]
+        assert _spans(hits[1])[0] == (7, 10, "a\nb")
+
+
+class TestEngineUsesSharedScan:
+    def test_engine_matches_individual_rule_evaluation(self):
+        engine = DeterministicRuleEngine()
+        payload = ArticlePayload(
+            title="Test",
+            original_content="他再接再励，裡面很熱，部份人說成份不明，检察结果完全不对，COVID 19。",
+        )
+
+        expected = []
+        for rule in engine.rules:
+            if isinstance(rule, PatternMatchingRule):
+                expected.extend(rule.evaluate(payload))
+
+        pattern_rule_ids = {
+            rule.rule_id for rule in engine.rules if isinstance(rule, PatternMatchingRule)
+        }
+        actual = [issue for issue in engine.run(payload) if issue.rule_id in pattern_rule_ids]
+
+        assert [i.model_dump() for i in actual] == [i.model_dump() for i in expected]
+        assert {"A3-005", "A1-002", "A2-003"} <= {issue.rule_id for issue in actual}
@@ -0,0 +1,68 @@
+"""Prompt caching of the static proofreading system prompt."""
+
+import json
+from types import SimpleNamespace
+
+from src.services.proofreading.ai_prompt_builder import ProofreadingPromptBuilder
+from src.services.proofreading.models import ArticlePayload
+from src.services.proofreading.service import ProofreadingAnalysisService
+
+
+class _StubMessages:
+    def __init__(self) -> None:
+        self.requests: list[dict] = []
+
+    async def create(self, **kwargs):
+        self.requests.append(kwargs)
+        warm = len(self.requests) > 1
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=json.dumps({"issues": []}))],
+            usage=SimpleNamespace(
+                input_tokens=120,
+                output_tokens=30,
+                cache_creation_input_tokens=0 if warm else 9000,
+                cache_read_input_tokens=9000 if warm else 0,
+            ),
+        )
+
+
+def _payload(article_id: int, content: str) -> ArticlePayload:
+    return ArticlePayload(article_id=article_id, title="标题", original_content=content)
+
+
+async def test_system_prompt_sent_as_cached_block_and_usage_recorded():
+    messages = _StubMessages()
+    service = ProofreadingAnalysisService(anthropic_client=SimpleNamespace(messages=messages))
+    service.result_cache = None
+
+    cold = await service.analyze_article(_payload(1, "第一篇文章内容。"))
+    warm = await service.analyze_article(_payload(2, "第二篇完全不同的内容。"))
+
+    first, second = messages.requests
+    [block] = first["system"]
+    assert block["type"] == "text"
+    assert block["cache_control"] == {"type": "ephemeral"}
+    assert second["system"] == first["system"]
+    assert "第一篇文章内容" not in block["text"]
+    assert "第二篇完全不同的内容" in second["messages"][0]["content"]
+
+    assert cold.processing_metadata.cache_creation_input_tokens == 9000
+    assert cold.processing_metadata.cache_read_input_tokens == 0
+    assert warm.processing_metadata.cache_read_input_tokens == 9000
+    assert warm.processing_metadata.total_tokens == 120 + 9000 + 30
+
+
+def test_system_prompt_rendered_once_per_manifest(monkeypatch):
+    builder = ProofreadingPromptBuilder(max_rules_in_prompt=5)
+    system = builder.cached_system_prompt()
+
+    def _fail():
+        raise AssertionError("system prompt re-rendered")
+
+    monkeypatch.setattr(builder, "_build_system_prompt", _fail)
+    again = ProofreadingPromptBuilder(builder.manifest, max_rules_in_prompt=5)
+    monkeypatch.setattr(again, "_build_system_prompt", _fail)
+
+    assert builder.build_prompt(_payload(1, "甲"))["system"] is system
+    assert again.cached_system_prompt() is system
+    assert builder.manifest_fingerprint[:12] in system
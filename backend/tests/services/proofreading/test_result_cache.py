@@ -0,0 +1,159 @@
+"""Unit tests for the content-addressed proofreading result cache."""
+
+import json
+from types import SimpleNamespace
+
+from src.services.proofreading.models import ArticlePayload, ProofreadingResult
+from src.services.proofreading.result_cache import (
+    CacheRecord,
+    InMemoryResultCache,
+    ProofreadingResultCache,
+    build_cache_key,
+    hash_payload,
+)
+from src.services.proofreading.service import AnalysisMode, ProofreadingAnalysisService
+
+
+def _key(payload: ArticlePayload, **overrides) -> str:
+    params = {
+        "mode": "full",
+        "prompt_hash": "p" * 64,
+        "manifest_fingerprint": "m" * 64,
+        "engine_version": "2.1.0",
+        "model": "claude-test",
+    }
+    params.update(overrides)
+    return build_cache_key(payload, **params)
+
+
+def _record(key: str) -> CacheRecord:
+    return CacheRecord(
+        key=key,
+        result=ProofreadingResult().model_dump(mode="json"),
+        analysis_mode="full",
+        prompt_hash=None,
+        manifest_fingerprint="m" * 64,
+        engine_version="2.1.0",
+    )
+
+
+class _StubMessages:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        body = {
+            "issues": [
+                {
+                    "rule_id": "A1-001",
+                    "message": "用字不统一",
+                    "original_text": "裡",
+                    "severity": "warning",
+                }
+            ]
+        }
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=json.dumps(body, ensure_ascii=False))],
+            usage=SimpleNamespace(input_tokens=100, output_tokens=20),
+        )
+
+
+class TestCacheKey:
+    def test_article_id_does_not_change_key(self):
+        first = ArticlePayload(article_id=1, title="T", original_content="内容")
+        second = ArticlePayload(article_id=2, title="T", original_content="内容")
+
+        assert hash_payload(first) == hash_payload(second)
+        assert _key(first) == _key(second)
+
+    def test_content_and_versions_change_key(self):
+        payload = ArticlePayload(title="T", original_content="内容")
+        base = _key(payload)
+
+        assert _key(payload.model_copy(update={"original_content": "内容2"})) != base
+        assert _key(payload, engine_version="2.2.0") != base
+        assert _key(payload, manifest_fingerprint="x" * 64) != base
+        assert _key(payload, prompt_hash="q" * 64) != base
+        assert _key(payload, mode="quick") != base
+
+
+class TestInMemoryResultCache:
+    async def test_lru_eviction(self):
+        cache = InMemoryResultCache(max_entries=2, ttl_seconds=60)
+        for key in ("a", "b"):
+            await cache.set(_record(key))
+        await cache.get("a")  # "b" becomes least recently used
+        await cache.set(_record("c"))
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+        assert await cache.get("c") is not None
+
+    async def test_ttl_expiry(self):
+        now = [0.0]
+        cache = InMemoryResultCache(max_entries=10, ttl_seconds=60, clock=lambda: now[0])
+        await cache.set(_record("a"))
+
+        now[0] = 59.0
+        assert await cache.get("a") is not None
+        now[0] = 60.0
+        assert await cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestServiceCaching:
+    def _service(self) -> tuple[ProofreadingAnalysisService, _StubMessages]:
+        messages = _StubMessages()
+        service = ProofreadingAnalysisService(
+            anthropic_client=SimpleNamespace(messages=messages),
+            result_cache=ProofreadingResultCache(
+                memory=InMemoryResultCache(max_entries=8, ttl_seconds=60)
+            ),
+        )
+        return service, messages
+
+    async def test_unchanged_article_skips_ai_call(self):
+        service, messages = self._service()
+        payload = ArticlePayload(article_id=1, title="标题", original_content="<p>裡面很熱。</p>")
+
+        first = await service.analyze_article(payload)
+        second = await service.analyze_article(payload)
+
+        assert messages.calls == 1
+        assert first.processing_metadata.notes["cache"]["status"] == "miss"
+        assert second.processing_metadata.notes["cache"]["status"] == "hit"
+        assert second.processing_metadata.notes["cache"]["tier"] == "memory"
+        assert second.article_id == 1
+        assert [i.model_dump() for i in second.issues] == [i.model_dump() for i in first.issues]
+
+    async def test_hits_are_independent_copies(self):
+        service, _ = self._service()
+        payload = ArticlePayload(title="标题", original_content="<p>裡面很熱。</p>")
+        await service.analyze_article(payload)
+
+        hit = await service.analyze_article(payload)
+        hit.issues.clear()
+
+        again = await service.analyze_article(payload)
+        assert again.issues
+
+    async def test_changed_content_and_bypass_call_ai(self):
+        service, messages = self._service()
+        payload = ArticlePayload(title="标题", original_content="<p>裡面很熱。</p>")
+
+        await service.analyze_article(payload)
+        await service.analyze_article(payload.model_copy(update={"original_content": "<p>外面很冷。</p>"}))
+        bypass = await service.analyze_article(payload, use_cache=False)
+
+        assert messages.calls == 3
+        assert bypass.processing_metadata.notes["cache"]["status"] == "bypass"
+
+    async def test_mode_is_part_of_key(self):
+        service, messages = self._service()
+        payload = ArticlePayload(title="标题", original_content="<p>裡面很熱。</p>")
+
+        await service.analyze_article(payload)
+        await service.analyze_article(payload, mode=AnalysisMode.QUICK)
+
+        assert messages.calls == 2
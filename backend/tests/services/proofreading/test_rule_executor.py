@@ -0,0 +1,90 @@
+"""Unit tests for the deterministic rule execution backends."""
+
+from src.schemas.proofreading_decision import DraftRule, ReviewStatus
+from src.services.proofreading.deterministic_engine import (
+    DeterministicRuleEngine,
+    RuleScope,
+)
+from src.services.proofreading.learned_rules import LearnedRuleRegistry
+from src.services.proofreading.models import ArticlePayload
+from src.services.proofreading.rule_executor import (
+    ProcessPoolRuleExecutor,
+    ThreadRuleExecutor,
+)
+
+ARTICLES = [
+    "他再接再励，裡面很熱。",
+    "部份人說成份不明，检察结果完全不对。",
+    "其實我們都知道 COVID 19 的事。",
+    "增長 15 % 見 https://example.com/ 說明。",
+    "這是一段沒有問題的文字。",
+]
+
+
+def _payloads():
+    return [
+        ArticlePayload(article_id=index, title="Test", original_content=content)
+        for index, content in enumerate(ARTICLES)
+    ]
+
+
+def _engine():
+    registry = LearnedRuleRegistry(time_budget_ms=50)
+    registry.publish([
+        DraftRule(
+            rule_id="L-001",
+            rule_type="vocabulary",
+            natural_language="統一使用简体用字",
+            pattern="其實",
+            replacement="其实",
+            confidence=0.9,
+            review_status=ReviewStatus.APPROVED,
+        )
+    ])
+    return DeterministicRuleEngine(learned_rules=registry)
+
+
+def _dump(issue_lists):
+    return [[issue.model_dump() for issue in issues] for issues in issue_lists]
+
+
+async def test_thread_executor_matches_inline_engine():
+    engine = _engine()
+    executor = ThreadRuleExecutor(engine)
+    payloads = _payloads()
+
+    results = await executor.run_batch(payloads, scope=RuleScope.PARAGRAPH)
+
+    expected = [engine.run(payload, scope=RuleScope.PARAGRAPH) for payload in payloads]
+    assert _dump(results) == _dump(expected)
+    assert await executor.run_batch([]) == []
+
+
+async def test_process_pool_executor_batches_across_workers():
+    engine = _engine()
+    executor = ProcessPoolRuleExecutor(engine, max_workers=2, batch_size=2)
+    payloads = _payloads()
+    try:
+        await executor.start()
+        results = await executor.run_batch(payloads)
+        single = await executor.run(payloads[2])
+    finally:
+        await executor.close()
+
+    expected = [engine.run(payload) for payload in payloads]
+    assert _dump(results) == _dump(expected)
+    # Learned rules published in this process reach the workers
+    assert "L-001" in {issue.rule_id for issue in single}
+    assert executor.version == engine.version
+
+
+async def test_pinned_state_ignores_a_publish_mid_run():
+    engine = _engine()
+    executor = ThreadRuleExecutor(engine)
+    state = engine.state()
+    engine.learned_rules.replace([])
+
+    [issues] = await executor.run_batch(_payloads()[2:3], state=state)
+
+    assert "L-001" in {issue.rule_id for issue in issues}
+    assert state.version != engine.version
@@ -1,6 +1,7 @@
 """Tests for GoogleDriveSyncService."""
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from src.models import Base, WorklistItem
@@ -19,7 +20,7 @@ class StubDriveStorage:
     def __init__(self):
         self.iteration = 0
 
-    async def list_files(self, folder_id=None, max_results=100):
+    async def list_files(self, folder_id=None, max_results=100, **kwargs):
         return [
             {
                 "id": "file-123",
@@ -92,3 +93,162 @@ async def test_sync_worklist_creates_and_updates_items(monkeypatch, db_session:
     assert refreshed.title == "My Title Updated"
     assert "Refined body content." in refreshed.content
     assert refreshed.synced_at >= initial_synced_at
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sync_bounds_workers_and_isolates_errors(monkeypatch):
+    """With db_config, files run in bounded pools and one failure stays local."""
+    import asyncio
+    from contextlib import asynccontextmanager
+    from types import SimpleNamespace
+
+    class ManyFilesStorage:
+        async def list_files(self, folder_id=None, max_results=100, **kwargs):
+            return [
+                {"id": f"file-{index}", "mimeType": "text/plain", "name": f"Doc {index}"}
+                for index in range(6)
+            ]
+
+        async def download_file(self, file_id: str) -> bytes:
+            await asyncio.sleep(0.01)
+            if file_id == "file-3":
+                raise RuntimeError("export failed")
+            return f"Title for {file_id}\nBody.".encode()
+
+    async def fake_create_google_drive_storage():
+        return ManyFilesStorage()
+
+    class FakeDbConfig:
+        @asynccontextmanager
+        async def session(self):
+            yield SimpleNamespace(get=lambda model, item_id: _async_value(item_id))
+
+    async def _async_value(value):
+        return value
+
+    upserted: list[str] = []
+
+    async def fake_upsert(self, payload, session=None):
+        upserted.append(payload["drive_metadata"]["id"])
+        return SimpleNamespace(id=len(upserted)), True
+
+    running = {"now": 0, "peak": 0}
+
+    async def fake_process_new_item(self, item):
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await asyncio.sleep(0.01)
+        running["now"] -= 1
+
+    monkeypatch.setattr(
+        "src.services.google_drive.sync_service.create_google_drive_storage",
+        fake_create_google_drive_storage,
+    )
+    monkeypatch.setattr(GoogleDriveSyncService, "_upsert_worklist_item", fake_upsert)
+    monkeypatch.setattr(
+        "src.services.google_drive.sync_service.WorklistPipelineService.process_new_item",
+        fake_process_new_item,
+    )
+
+    service = GoogleDriveSyncService(
+        None, db_config=FakeDbConfig(), export_concurrency=3, pipeline_concurrency=2
+    )
+    summary = await service.sync_worklist()
+
+    assert summary["processed"] == 6
+    assert summary["created"] == 5
+    assert summary["skipped"] == 1  # export failure is logged and skipped
+    assert summary["auto_processed"] == 5
+    assert running["peak"] <= 2
+    assert sorted(upserted) == [f"file-{index}" for index in (0, 1, 2, 4, 5)]
+
+
+@pytest.mark.asyncio
+async def test_sync_skips_unchanged_revisions_and_advances_watermark(
+    monkeypatch, db_session: AsyncSession
+):
+    """Unchanged modifiedTime/version skips the export; the watermark moves forward."""
+    from src.models import DriveSyncState
+
+    class VersionedStorage:
+        def __init__(self):
+            self.files = {
+                "doc-a": {"modifiedTime": "2026-01-01T00:00:00.000Z", "version": "3"},
+                "doc-b": {"modifiedTime": "2026-01-02T00:00:00.000Z", "version": "7"},
+            }
+            self.bodies = {"doc-a": b"Title A\nBody A.", "doc-b": b"Title B\nBody B."}
+            self.listed_after: list[str | None] = []
+            self.downloads: list[str] = []
+
+        async def list_files(self, folder_id=None, max_results=100, **kwargs):
+            modified_after = kwargs.get("modified_after")
+            self.listed_after.append(modified_after)
+            return [
+                {"id": file_id, "mimeType": "text/plain", "name": file_id, **revision}
+                for file_id, revision in sorted(
+                    self.files.items(), key=lambda entry: entry[1]["modifiedTime"]
+                )
+                if modified_after is None or revision["modifiedTime"] >= modified_after
+            ]
+
+        async def download_file(self, file_id: str) -> bytes:
+            self.downloads.append(file_id)
+            return self.bodies[file_id]
+
+    storage = VersionedStorage()
+
+    async def fake_create_google_drive_storage():
+        return storage
+
+    async def fake_process_new_item(self, item):
+        return None
+
+    monkeypatch.setattr(
+        "src.services.google_drive.sync_service.create_google_drive_storage",
+        fake_create_google_drive_storage,
+    )
+    monkeypatch.setattr(
+        "src.services.google_drive.sync_service.WorklistPipelineService.process_new_item",
+        fake_process_new_item,
+    )
+    service = GoogleDriveSyncService(db_session)
+
+    first = await service.sync_worklist()
+    assert first["created"] == 2
+    state = await db_session.get(DriveSyncState, "drive-folder")
+    assert state.modified_watermark == "2026-01-02T00:00:00.000Z"
+
+    # Nothing changed: only doc-b (at the watermark) is listed, and not exported.
+    storage.downloads.clear()
+    second = await service.sync_worklist()
+    assert storage.listed_after[-1] == "2026-01-02T00:00:00.000Z"
+    assert second["processed"] == 1
+    assert second["unchanged"] == 1
+    assert storage.downloads == []
+
+    # New revision with identical bytes: exported, but only metadata is refreshed.
+    storage.files["doc-a"] = {"modifiedTime": "2026-01-03T00:00:00.000Z", "version": "4"}
+    third = await service.sync_worklist()
+    assert storage.downloads == ["doc-a"]
+    assert third["unchanged"] == 2
+    assert third["updated"] == 0
+
+    # Real edit plus a failing export: the watermark waits at the failed file.
+    storage.files["doc-a"] = {"modifiedTime": "2026-01-04T00:00:00.000Z", "version": "5"}
+    storage.bodies["doc-a"] = b"Title A\nEdited body."
+    storage.files["doc-c"] = {"modifiedTime": "2026-01-05T00:00:00.000Z", "version": "1"}
+    storage.bodies["doc-c"] = None  # decode() fails -> export failure
+    fourth = await service.sync_worklist()
+    assert fourth["updated"] == 1
+    assert fourth["skipped"] == 1
+    await db_session.refresh(state)
+    assert state.modified_watermark == "2026-01-05T00:00:00.000Z"
+
+    item = (
+        await db_session.execute(
+            select(WorklistItem).where(WorklistItem.drive_file_id == "doc-a")
+        )
+    ).scalar_one()
+    assert item.drive_metadata["version"] == "5"
+    assert item.drive_metadata["content_hash"]
+    assert "Edited body." in item.content
@@ -0,0 +1,137 @@
+"""Tests for the durable pipeline_tasks job queue."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+from src.models.pipeline_task import PipelineTask, PipelineTaskStatus
+from src.workers.queue import JobQueue, JobSpec, JobWorker
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw):  # pragma: no cover - test shim
+    return "JSON"
+
+
+@pytest.fixture
+async def queue(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'queue.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(PipelineTask.__table__.create)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    yield JobQueue(sessions, lease_seconds=60)
+    await engine.dispose()
+
+
+async def _task(queue: JobQueue, task_id: str) -> PipelineTask:
+    async with queue._sessions()() as session:
+        return await session.get(PipelineTask, task_id)
+
+
+async def test_claim_orders_by_priority_and_leases(queue):
+    low = await queue.enqueue("demo", {"n": 1})
+    high = await queue.enqueue("demo", {"n": 2}, priority=5)
+    await queue.enqueue("other", {"n": 3})
+
+    claimed = await queue.claim("demo", "worker-a", 1)
+
+    assert [job.id for job in claimed] == [high]
+    assert claimed[0].attempts == 1
+    task = await _task(queue, high)
+    assert task.status == PipelineTaskStatus.PROCESSING.value
+    assert task.lease_owner == "worker-a"
+    # The leased job is skipped; only the remaining "demo" job is handed out
+    [other] = await queue.claim("demo", "worker-b", 5)
+    assert other.id == low
+    assert (await _task(queue, low)).lease_owner == "worker-b"
+
+
+async def test_complete_requires_lease_owner(queue):
+    task_id = await queue.enqueue("demo", {})
+    await queue.claim("demo", "worker-a", 1)
+
+    assert await queue.complete(task_id, "worker-b", {"ok": True}) is False
+    assert await queue.complete(task_id, "worker-a", {"ok": True}) is True
+    task = await _task(queue, task_id)
+    assert task.status == PipelineTaskStatus.COMPLETED.value
+    assert task.result == {"ok": True}
+    assert task.lease_owner is None
+
+
+async def test_expired_lease_is_requeued_then_failed(queue):
+    task_id = await queue.enqueue("demo", {}, max_attempts=2)
+
+    for attempt in (1, 2):
+        [job] = await queue.claim("demo", f"worker-{attempt}", 1, lease_seconds=1)
+        assert job.attempts == attempt
+        async with queue._sessions()() as session:
+            task = await session.get(PipelineTask, task_id)
+            task.lease_expires_at = datetime.now(UTC) - timedelta(seconds=1)
+            await session.commit()
+        assert await queue.reap_expired() == 1
+
+    task = await _task(queue, task_id)
+    assert task.status == PipelineTaskStatus.FAILED.value
+    assert "Lease expired" in task.error
+    # The old owner can no longer settle the job
+    assert await queue.heartbeat(task_id, "worker-2") is False
+
+
+async def test_dedupe_and_cancel(queue):
+    first = await queue.enqueue("worklist_sync", {}, dedupe=True)
+
+    assert await queue.enqueue("worklist_sync", {}, dedupe=True) is None
+    assert await queue.cancel(first) is True
+    assert (await _task(queue, first)).status == PipelineTaskStatus.CANCELLED.value
+    assert await queue.enqueue("worklist_sync", {}, dedupe=True) is not None
+
+
+async def test_concurrent_dedupe_enqueues_one_job_per_key(queue):
+    ids = await asyncio.gather(
+        *(queue.enqueue("worklist_sync", {}, dedupe=True) for _ in range(5)),
+        queue.enqueue("worklist_sync", {}, dedupe=True, dedupe_key="folder-b"),
+    )
+
+    assert sum(task_id is not None for task_id in ids[:5]) == 1
+    assert ids[5] is not None
+    # Jobs enqueued without dedupe are never blocked
+    assert await queue.enqueue("worklist_sync", {}) is not None
+
+
+async def test_worker_retries_with_backoff_and_respects_concurrency(queue):
+    calls: list[int] = []
+    running = {"now": 0, "peak": 0}
+
+    async def handler(payload):
+        calls.append(payload["n"])
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await asyncio.sleep(0.01)
+        running["now"] -= 1
+        if payload["n"] == 0:
+            raise RuntimeError("transient")
+        if payload["n"] == 1:
+            raise ValueError("bad input")
+        return {"n": payload["n"]}
+
+    spec = JobSpec(task_type="demo", handler=handler, concurrency=2, max_attempts=3)
+    worker = JobWorker(queue, owner="worker-a", specs={"demo": spec})
+    ids = [await queue.enqueue("demo", {"n": n}) for n in range(4)]
+
+    while started := await worker.run_once():
+        await asyncio.gather(*started)
+
+    assert running["peak"] == 2
+    assert sorted(calls) == [0, 1, 2, 3]
+
+    retried, fatal, *done = [await _task(queue, task_id) for task_id in ids]
+    assert retried.status == PipelineTaskStatus.PENDING.value
+    assert retried.attempts == 1
+    assert retried.error == "transient"
+    assert retried.run_after.replace(tzinfo=UTC) > datetime.now(UTC) + timedelta(seconds=20)
+    assert fatal.status == PipelineTaskStatus.FAILED.value
+    assert [task.result for task in done] == [{"n": 2}, {"n": 3}]
@@ -0,0 +1,158 @@
+"""Tests for bulk AI jobs on the Message Batches API (fake batch endpoint)."""
+
+import asyncio
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+from src.models.pipeline_task import PipelineTask, PipelineTaskStatus
+from src.workers import message_batches
+from src.workers.message_batches import (
+    COLLECT_TASK,
+    BatchKind,
+    collect_message_batch,
+    submit_message_batches,
+)
+from src.workers.queue import JobQueue, JobSpec, JobWorker
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw):  # pragma: no cover - test shim
+    return "JSON"
+
+
+class RecordingKind(BatchKind):
+    name = "recording"
+    applied: dict[int, str] = {}
+
+    async def pending_ids(self, session, limit):
+        return [1, 2, 3, 4, 5][:limit]
+
+    async def load(self, session, article_ids):
+        return {i: SimpleNamespace(id=i) for i in article_ids if i != 404}
+
+    async def build(self, session, article):
+        if article.id == 3:
+            raise ValueError("no content")
+        return {"messages": [{"role": "user", "content": f"prompt {article.id}"}]}
+
+    async def apply(self, session, article, message):
+        if message.content[0].text == "boom":
+            raise ValueError("unparseable answer")
+        RecordingKind.applied[article.id] = message.content[0].text
+
+
+class FakeBatches:
+    """In-memory stand-in for ``client.messages.batches``."""
+
+    def __init__(self):
+        self.created: dict[str, list[dict]] = {}
+        self.status: dict[str, str] = {}
+
+    async def create(self, *, requests):
+        batch_id = f"msgbatch_{len(self.created) + 1}"
+        self.created[batch_id] = requests
+        self.status[batch_id] = "in_progress"
+        return SimpleNamespace(id=batch_id, processing_status="in_progress")
+
+    async def retrieve(self, batch_id):
+        return SimpleNamespace(id=batch_id, processing_status=self.status[batch_id])
+
+    async def results(self, batch_id):
+        async def stream():
+            for request in self.created[batch_id]:
+                text = request["params"]["messages"][0]["content"]
+                if text.endswith(" 2"):
+                    result = SimpleNamespace(type="errored", error="overloaded")
+                else:
+                    answer = "boom" if text.endswith(" 4") else text.upper()
+                    message = SimpleNamespace(content=[SimpleNamespace(text=answer)])
+                    result = SimpleNamespace(type="succeeded", message=message)
+                yield SimpleNamespace(custom_id=request["custom_id"], result=result)
+
+        return stream()
+
+
+@pytest.fixture
+async def env(tmp_path, monkeypatch):
+    monkeypatch.setitem(message_batches._kinds, RecordingKind.name, RecordingKind)
+    RecordingKind.applied = {}
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'batches.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(PipelineTask.__table__.create)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    client = SimpleNamespace(messages=SimpleNamespace(batches=FakeBatches()))
+    yield SimpleNamespace(
+        queue=JobQueue(sessions, lease_seconds=60), sessions=sessions, client=client
+    )
+    await engine.dispose()
+
+
+async def test_submit_packs_requests_and_stores_batch_ids(env):
+    submitted = await submit_message_batches(
+        "recording",
+        [1, 2, 3, 404, 4],
+        client=env.client,
+        queue=env.queue,
+        sessions=env.sessions,
+        max_requests=2,
+    )
+
+    batches = env.client.messages.batches.created
+    assert [len(requests) for requests in batches.values()] == [2, 1]
+    assert batches["msgbatch_1"][0]["custom_id"] == "article-1"
+    assert submitted[1] == {
+        "batch_id": None,
+        "task_id": None,
+        "requests": 0,
+        "skipped": {3: "no content", 404: "article not found"},
+    }
+
+    async with env.sessions() as session:
+        tasks = (await session.scalars(select(PipelineTask))).all()
+    assert {task.task_type for task in tasks} == {COLLECT_TASK}
+    assert sorted(task.input["batch_id"] for task in tasks) == list(batches)
+    assert all(task.run_after > datetime.now(UTC).replace(tzinfo=None) for task in tasks)
+
+
+async def test_collect_defers_without_attempts_then_applies_results(env):
+    [submitted] = await submit_message_batches(
+        "recording", client=env.client, queue=env.queue, sessions=env.sessions
+    )
+    task_id = submitted["task_id"]
+    spec = JobSpec(
+        task_type=COLLECT_TASK,
+        handler=lambda payload: collect_message_batch(
+            payload, client=env.client, sessions=env.sessions
+        ),
+    )
+    worker = JobWorker(env.queue, specs={COLLECT_TASK: spec}, owner="w")
+
+    async def run_now():
+        async with env.sessions() as session:
+            task = await session.get(PipelineTask, task_id)
+            task.run_after = datetime.now(UTC)
+            await session.commit()
+        await asyncio.gather(*await worker.run_once())
+        async with env.sessions() as session:
+            return await session.get(PipelineTask, task_id)
+
+    task = await run_now()
+    assert task.status == PipelineTaskStatus.PENDING.value
+    assert task.attempts == 0
+    assert RecordingKind.applied == {}
+
+    env.client.messages.batches.status[submitted["batch_id"]] = "ended"
+    task = await run_now()
+
+    assert task.status == PipelineTaskStatus.COMPLETED.value
+    assert RecordingKind.applied == {1: "PROMPT 1", 5: "PROMPT 5"}
+    assert task.result["succeeded"] == 2
+    assert task.result["failed"] == 2
+    assert any("errored" in error for error in task.result["errors"])
+    assert any("unparseable" in error for error in task.result["errors"])
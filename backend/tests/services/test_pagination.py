@@ -0,0 +1,103 @@
+"""Keyset pagination and cached totals for list endpoints."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import inspect, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+from src.models import WorklistItem, WorklistStatus
+from src.services import pagination
+from src.services.pagination import decode_cursor, encode_cursor
+from src.services.worklist.service import WorklistService
+
+
+@compiles(ARRAY, "sqlite")
+def _compile_array_sqlite(type_, compiler, **kw):  # pragma: no cover - test shim
+    return "JSON"
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw):  # pragma: no cover - test shim
+    return "JSON"
+
+
+@pytest.fixture
+async def session(tmp_path):
+    pagination.clear_count_cache()
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'listing.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(WorklistItem.__table__.create)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as session:
+        yield session
+    await engine.dispose()
+    pagination.clear_count_cache()
+
+
+async def _add_items(session, count: int, base: datetime) -> None:
+    # Raw SQL: the Postgres ARRAY columns cannot bind on SQLite
+    await session.execute(
+        text(
+            "INSERT INTO worklist_items (drive_file_id, title, status, content, raw_html,"
+            " metadata, notes, synced_at, updated_at)"
+            " VALUES (:file_id, :title, 'pending', :content, :raw_html, '{}', '[]',"
+            " :synced_at, :updated_at)"
+        ),
+        [
+            {
+                "file_id": f"file-{base:%d}-{idx}",
+                "title": f"Doc {idx}",
+                "content": "Body " * 1000,
+                "raw_html": "<p>Body</p>" * 1000,
+                "synced_at": f"{base:%Y-%m-%d %H:%M:%S.%f}",
+                # Pairs share a timestamp so the id tiebreak is exercised
+                "updated_at": f"{base - timedelta(minutes=idx // 2):%Y-%m-%d %H:%M:%S.%f}",
+            }
+            for idx in range(count)
+        ],
+    )
+    await session.commit()
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    stamp = datetime(2026, 3, 1, 12, 30, tzinfo=UTC)
+    assert decode_cursor(encode_cursor(stamp, 42)) == (stamp, 42)
+    for bad in ("not-a-cursor", encode_cursor(stamp, 1)[:-3], "e30"):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(bad)
+
+
+async def test_cursor_pages_cover_every_item_once_with_projected_columns(session):
+    await _add_items(session, 7, datetime(2026, 3, 1, 12, 0))
+    service = WorklistService(session)
+
+    seen: list[int] = []
+    cursor = None
+    while True:
+        items, total = await service.list_items(limit=3, cursor=cursor)
+        seen.extend(item.id for item in items)
+        assert all({"content", "raw_html"} <= inspect(item).unloaded for item in items)
+        cursor = pagination.next_cursor(items, 3)
+        if cursor is None:
+            break
+
+    assert total == 7
+    assert seen == [2, 1, 4, 3, 6, 5, 7]
+    offset_page, _ = await service.list_items(limit=3, offset=3)
+    assert [item.id for item in offset_page] == seen[3:6]
+
+
+async def test_totals_are_cached_per_filter(session):
+    await _add_items(session, 2, datetime(2026, 3, 1, 12, 0))
+    service = WorklistService(session)
+    assert (await service.list_items())[1] == 2
+
+    await _add_items(session, 1, datetime(2026, 3, 2, 12, 0))
+    assert (await service.list_items())[1] == 2
+    assert (await service.list_items(status=WorklistStatus.PENDING.value))[1] == 3
+
+    pagination.clear_count_cache()
+    assert (await service.list_items())[1] == 3
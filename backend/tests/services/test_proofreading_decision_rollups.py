@@ -0,0 +1,250 @@
+"""Tests for the proofreading decision rollups behind the analytics endpoints."""
+
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+from src.models.article import Article
+from src.models.proofreading import (
+    DecisionType,
+    ProofreadingDecision,
+    ProofreadingHistory,
+)
+from src.models.proofreading_decision_rollup import (
+    ProofreadingCorrectionRollup,
+    ProofreadingDecisionRollup,
+)
+from src.services.proofreading_decision import (
+    DateRange,
+    DecisionInput,
+    ProofreadingDecisionService,
+)
+from src.services.proofreading_decision_rollups import (
+    apply_rollup_deltas,
+    build_delta,
+    load_correction_counts,
+    load_daily_totals,
+    load_type_totals,
+)
+
+
+@compiles(ARRAY, "sqlite")
+def _compile_array_sqlite(type_, compiler, **kw):  # pragma: no cover - test shim
+    return "JSON"
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw):  # pragma: no cover - test shim
+    return "JSON"
+
+
+@pytest.fixture
+async def session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'rollups.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(ProofreadingDecisionRollup.__table__.create)
+        await conn.run_sync(ProofreadingCorrectionRollup.__table__.create)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as session:
+        yield session
+    await engine.dispose()
+
+
+def _delta(day: int, decision: DecisionType, *, suggestion_type="punctuation",
+           rule_id="B1-001", original="，", replacement="、", count=1):
+    return build_delta(
+        created_at=datetime(2026, 4, day, 12),
+        suggestion_type=suggestion_type,
+        rule_id=rule_id,
+        decision=decision,
+        confidence=0.5,
+        original_text=original,
+        replacement_text=replacement,
+        count=count,
+    )
+
+
+async def _seed(session, deltas):
+    await apply_rollup_deltas(session, deltas)
+    await session.commit()
+
+
+async def test_deltas_accumulate_into_one_row_per_bucket(session):
+    await _seed(session, [_delta(1, DecisionType.ACCEPTED)] * 3)
+    await _seed(session, [_delta(1, DecisionType.ACCEPTED), _delta(1, DecisionType.REJECTED)])
+
+    rows = (await session.execute(select(ProofreadingDecisionRollup))).scalars().all()
+    counts = {row.decision: row.decision_count for row in rows}
+    assert counts == {"accepted": 4, "rejected": 1}
+    accepted = next(row for row in rows if row.decision == "accepted")
+    assert accepted.confidence_sum == pytest.approx(2.0)
+    assert accepted.sample_text == "，"
+
+    corrections = (await session.execute(select(ProofreadingCorrectionRollup))).scalars().all()
+    # Rejected decisions carry no replacement
+    assert [(c.decision, c.decision_count) for c in corrections] == [("accepted", 4)]
+
+
+async def test_changed_decision_moves_between_buckets(session):
+    await _seed(session, [_delta(1, DecisionType.ACCEPTED)])
+    await _seed(session, [
+        _delta(1, DecisionType.ACCEPTED, count=-1),
+        _delta(1, DecisionType.MODIFIED, replacement="；"),
+    ])
+
+    totals = await load_type_totals(session)
+    assert totals["punctuation"].total == 1
+    assert totals["punctuation"].accepted == 0
+    assert totals["punctuation"].modified == 1
+    assert await load_correction_counts(session, DecisionType.ACCEPTED) == []
+    [modified] = await load_correction_counts(session, DecisionType.MODIFIED)
+    assert (modified.original, modified.replacement, modified.count) == ("，", "；", 1)
+
+
+async def test_loaders_respect_inclusive_day_range(session):
+    await _seed(session, [
+        _delta(1, DecisionType.ACCEPTED),
+        _delta(2, DecisionType.ACCEPTED, rule_id="B1-002"),
+        _delta(3, DecisionType.REJECTED),
+    ])
+
+    daily = await load_daily_totals(session, date(2026, 4, 2), date(2026, 4, 3))
+
+    assert [(day.day, totals.total) for day, totals in daily] == [(2, 1), (3, 1)]
+    totals = await load_type_totals(session, date(2026, 4, 2), date(2026, 4, 2))
+    assert totals["punctuation"].accepted == 1
+
+
+async def test_analyze_patterns_reads_rollups(session):
+    await _seed(session, (
+        [_delta(1, DecisionType.ACCEPTED)] * 9
+        + [_delta(2, DecisionType.REJECTED)]
+        + [_delta(2, DecisionType.MODIFIED, suggestion_type="vocabulary",
+                  original="其實", replacement="实际上")] * 3
+    ))
+    service = ProofreadingDecisionService()
+
+    patterns = await service.analyze_decision_patterns(session, min_occurrences=3)
+
+    [acceptance] = patterns.common_acceptances
+    assert acceptance.pattern_type == "punctuation"
+    assert acceptance.frequency == 10
+    assert acceptance.rate == pytest.approx(0.9)
+    assert acceptance.examples == ["，", "，"]
+    [correction] = patterns.custom_corrections
+    assert (correction.original_pattern, correction.correction_pattern) == ("其實", "实际上")
+    assert correction.frequency == 3
+    assert patterns.time_patterns[0].metrics["max_daily_decisions"] == 9
+
+
+async def test_quality_metrics_and_trend_from_rollups(session):
+    await _seed(session, [
+        _delta(1, DecisionType.REJECTED),
+        _delta(1, DecisionType.ACCEPTED),
+        _delta(9, DecisionType.ACCEPTED),
+        _delta(9, DecisionType.MODIFIED),
+    ])
+    service = ProofreadingDecisionService()
+
+    quality = await service.evaluate_suggestion_quality(
+        session, DateRange(datetime(2026, 4, 1), datetime(2026, 4, 10))
+    )
+
+    assert quality.accuracy == pytest.approx(0.5)
+    assert quality.usefulness == pytest.approx(0.75)
+    assert quality.relevance == pytest.approx(0.5)
+    assert quality.details["rejected"] == 1
+    assert quality.trend == "stable"
+
+
+async def test_analytics_cache_expires_after_ttl(session):
+    clock = [1000.0]
+    service = ProofreadingDecisionService()
+    service._clock = lambda: clock[0]
+    service.cache_ttl = 60
+
+    await _seed(session, [_delta(1, DecisionType.ACCEPTED)])
+    first = await service.evaluate_suggestion_quality(session)
+    await _seed(session, [_delta(1, DecisionType.REJECTED)])
+
+    assert await service.evaluate_suggestion_quality(session) is first
+    clock[0] += 61
+    refreshed = await service.evaluate_suggestion_quality(session)
+    assert refreshed.details["total_decisions"] == 2
+
+
+@pytest.fixture
+async def decision_session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'decisions.db'}")
+    async with engine.begin() as conn:
+        for table in (
+            Article.__table__,
+            ProofreadingHistory.__table__,
+            ProofreadingDecision.__table__,
+            ProofreadingDecisionRollup.__table__,
+            ProofreadingCorrectionRollup.__table__,
+        ):
+            await conn.run_sync(table.create)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as session:
+        # Plain SQL: the ORM fills ARRAY columns with [] which sqlite cannot bind
+        await session.execute(text(
+            "INSERT INTO articles (id, title, body, status, author_id, source, "
+            "proofreading_issues, critical_issues_count, seo_title_extracted, "
+            "parsing_confirmed, unified_optimization_generated, article_metadata, formatting) "
+            "VALUES (1, '測試', '正文', 'draft', 1, 'test', '[]', 0, 0, 0, 0, '{}', '{}')"
+        ))
+        history = ProofreadingHistory(
+            article_id=1,
+            issues_snapshot={"issues": [
+                {"id": "s1", "rule_id": "B1-001", "rule_category": "B",
+                 "original_text": "，", "suggested_text": "、"},
+                {"id": "s2", "rule_id": "A1-001", "rule_category": "A",
+                 "original_text": "其實", "suggested_text": "其实"},
+                {"id": "s3", "rule_id": "X-001",
+                 "original_text": "foo", "suggested_text": "bar"},
+            ]},
+        )
+        session.add(history)
+        await session.commit()
+        yield session, 1, history.id
+    await engine.dispose()
+
+
+async def test_recorded_decisions_use_model_columns_and_update_rollups(decision_session):
+    session, article_id, history_id = decision_session
+    service = ProofreadingDecisionService()
+
+    record = await service.record_decision(
+        session, article_id, history_id, "s1", DecisionType.ACCEPTED,
+        decision_reason="統一頓號", decided_by=7,
+    )
+    batch = await service.record_batch_decisions(session, article_id, history_id, [
+        DecisionInput(suggestion_id="s2", decision=DecisionType.MODIFIED,
+                      custom_correction="实际上"),
+        DecisionInput(suggestion_id="s3", decision=DecisionType.REJECTED),
+    ])
+
+    assert (record.decision_type, record.rule_category, record.decided_by) == (
+        DecisionType.ACCEPTED, "B", 7
+    )
+    assert record.decision_rationale == "統一頓號"
+    assert [d.modified_content for d in batch] == ["实际上", None]
+
+    totals = await load_type_totals(session)
+    # suggestion_type is the rule category, as in the migration backfill
+    assert {key: t.total for key, t in totals.items()} == {"A": 1, "B": 1, "unknown": 1}
+    [modified] = await load_correction_counts(session, DecisionType.MODIFIED)
+    assert (modified.original, modified.replacement) == ("其實", "实际上")
+
+    # Changing a decision moves it between buckets instead of double counting
+    await service.record_decision(
+        session, article_id, history_id, "s1", DecisionType.REJECTED
+    )
+    totals = await load_type_totals(session)
+    assert (totals["B"].total, totals["B"].accepted, totals["B"].rejected) == (1, 0, 1)
+    assert await load_correction_counts(session, DecisionType.ACCEPTED) == []
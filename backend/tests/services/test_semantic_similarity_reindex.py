@@ -0,0 +1,119 @@
+"""Tests for the batched, resumable embedding reindex."""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import JSON, select
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+from src.models import Article, TopicEmbedding
+from src.services import semantic_similarity
+from src.services.semantic_similarity import SemanticSimilarityService
+
+
+@compiles(ARRAY, "sqlite")
+def _compile_array_sqlite(type_, compiler, **kw):  # pragma: no cover - test shim
+    return "JSON"
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw):  # pragma: no cover - test shim
+    return "JSON"
+
+
+class FakeEmbeddings:
+    """Records each embeddings.create call and returns deterministic vectors."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    async def create(self, model, input):
+        self.calls.append(list(input))
+        return SimpleNamespace(
+            data=[SimpleNamespace(embedding=[float(len(text)), 1.0]) for text in input]
+        )
+
+
+@pytest.fixture
+async def session(tmp_path, monkeypatch):
+    # sqlite has no array type; bind list columns as JSON for these tables only
+    for table in (Article.__table__, TopicEmbedding.__table__):
+        for column in table.columns:
+            if isinstance(column.type, ARRAY):
+                monkeypatch.setattr(column, "type", JSON())
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'reindex.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: Article.metadata.create_all(
+                sync_conn, tables=[Article.__table__, TopicEmbedding.__table__]
+            )
+        )
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        for index in range(5):
+            session.add(
+                Article(
+                    title=f"Title {index}",
+                    body="正文" * (400 + index),
+                    source="test",
+                    author_id=1,
+                )
+            )
+        session.add(Article(title="Empty", body="", source="test", author_id=1))
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+def service(monkeypatch):
+    embeddings = FakeEmbeddings()
+    monkeypatch.setattr(
+        semantic_similarity,
+        "AsyncOpenAI",
+        lambda api_key=None: SimpleNamespace(embeddings=embeddings),
+    )
+    return SemanticSimilarityService(), embeddings
+
+
+async def test_one_request_per_page_and_bulk_upsert(session, service):
+    service, embeddings = service
+    checkpoints: list[int] = []
+
+    async def checkpoint(last_id):
+        checkpoints.append(last_id)
+
+    processed = await service.reindex_all_articles(session, batch_size=2, checkpoint=checkpoint)
+
+    assert processed == 5
+    assert [len(call) for call in embeddings.calls] == [2, 2, 1]
+    assert checkpoints == [2, 4, 5]
+    rows = (await session.scalars(select(TopicEmbedding).order_by(TopicEmbedding.article_id))).all()
+    assert [row.article_id for row in rows] == [1, 2, 3, 4, 5]
+    assert rows[0].topic_text == "Title 0\n\n" + ("正文" * 400)[:1000]
+
+
+async def test_unchanged_articles_are_skipped(session, service):
+    service, embeddings = service
+    await service.reindex_all_articles(session, batch_size=10)
+    embeddings.calls.clear()
+
+    article = await session.get(Article, 3)
+    article.title = "Renamed"
+    await session.commit()
+
+    assert await service.reindex_all_articles(session, batch_size=10) == 1
+    assert embeddings.calls == [["Renamed\n\n" + ("正文" * 402)[:1000]]]
+    assert await service.reindex_all_articles(session, batch_size=10, force=True) == 5
+
+
+async def test_resume_from_checkpoint(session, service):
+    service, embeddings = service
+
+    processed = await service.reindex_all_articles(session, batch_size=2, start_after_id=3)
+
+    assert processed == 2
+    assert embeddings.calls and all(
+        text.startswith(("Title 3", "Title 4")) for text in embeddings.calls[0]
+    )
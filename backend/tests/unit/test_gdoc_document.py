@@ -0,0 +1,108 @@
+"""ParsedGoogleDoc: one parse of a Google Doc export shared by every extractor."""
+
+from bs4 import BeautifulSoup
+
+from src.services.parser import gdoc_document
+from src.services.parser.article_parser import ArticleParserService, _extract_metadata_sections
+from src.services.parser.faq_extractor import FAQExtractor
+from src.services.parser.gdoc_document import ParsedGoogleDoc, normalize_gdoc_html
+
+EXPORT = """
+<html><body>
+<h1 class="c7"><span class="c2">芋頭燉魷魚的養生之道</span></h1>
+<p class="c3"><span class="c0">文／王小明</span></p>
+<p class="c3"><span class="c0">芋頭與魷魚一起燉煮，</span><span class="c4">口感綿密又不油膩，是秋冬時節很受歡迎的家常菜。</span></p>
+<h2 class="c5"><span class="c1">常見問題</span></h2>
+<p class="c3"><span class="c0">Q1：芋頭要先蒸嗎？</span></p>
+<p class="c3"><span class="c0">A1：</span><span class="c4">先蒸過比較容易入味。</span></p>
+<p class="c3"><span class="c0">&#9552;&#9552;&#9552;&#9552;&#9552;&#9552;&#9552;&#9552;</span></p>
+<h2 class="c5"><span class="c1">Meta + AEO</span></h2>
+<p class="c3"><span class="c0">Focus Keyword</span></p>
+<p class="c3"><span class="c0">芋頭</span><span class="c4">燉魷魚</span></p>
+<h2 class="c5"><span class="c1">&#22294;&#29255; Alt Text</span></h2>
+<p class="c3"><span class="c0">1. 一碗燉煮的魷魚 </span><span class="c2"><a href="https://drive.google.com/file/d/abc/view">連結</a></span></p>
+</body></html>
+"""
+
+
+def test_sections_split_at_headings_and_keep_paragraphs_on_one_line():
+    doc = ParsedGoogleDoc(EXPORT)
+
+    assert list(doc.sections) == ["Meta + AEO", "圖片 Alt Text"]
+    assert doc.sections["Meta + AEO"].texts == ["Focus Keyword", "芋頭燉魷魚"]
+
+    metadata = _extract_metadata_sections(doc)
+    assert metadata["focus_keyword"] == "芋頭燉魷魚"
+    assert metadata["image_alt_texts"] == [
+        {
+            "position": 1,
+            "alt_text": "一碗燉煮的魷魚 連結",
+            "drive_link": "https://drive.google.com/file/d/abc/view",
+        }
+    ]
+
+
+def test_heuristic_parse_builds_the_export_tree_once(monkeypatch):
+    parsed_markup: list[str] = []
+
+    def counting_soup(markup, *args, **kwargs):
+        parsed_markup.append(markup)
+        return BeautifulSoup(markup, *args, **kwargs)
+
+    monkeypatch.setattr(gdoc_document, "BeautifulSoup", counting_soup)
+    parser = ArticleParserService(use_ai=False)
+
+    result = parser.parse_document(EXPORT)
+
+    assert result.success
+    assert result.parsed_article.focus_keyword == "芋頭燉魷魚"
+    assert parsed_markup.count(EXPORT) == 1
+
+
+def test_faq_extractor_reuses_a_parsed_document():
+    doc = ParsedGoogleDoc(EXPORT)
+    soup = doc.soup
+
+    result = FAQExtractor().extract(doc)
+
+    assert doc.soup is soup
+    assert result.detection_method == "header_based"
+    assert [faq.question for faq in result.faqs] == ["芋頭要先蒸嗎？"]
+    assert result.faqs[0].answer.startswith("先蒸過比較容易入味。")
+
+
+def test_normalize_pairs_each_span_with_its_own_close_tag():
+    styled = '<span style="color:#1155cc">作者介紹</span>'
+    nested = '<span class="c1">' * 2000 + "深" + "</span>" * 2000
+
+    assert normalize_gdoc_html(f'<p class="c3"><span class="c0">{styled}</span></p>') == (
+        f"<p>{styled}</p>"
+    )
+    assert normalize_gdoc_html(nested) == "深"
+    assert normalize_gdoc_html('<span class="c0">&#9552; 未結束') == '<span class="c0">═ 未結束'
+
+
+def test_normalize_keeps_trailing_text_outside_a_nested_styled_span():
+    # The old regex closed the outer span at the first </span> and pulled
+    # "y" into the styled one
+    assert normalize_gdoc_html('<span><span style="color:red">x</span>y</span>') == (
+        '<span style="color:red">x</span>y'
+    )
+
+
+def test_normalize_decodes_entities_before_unwrapping_spans():
+    assert normalize_gdoc_html('<p>&lt;span class="c0"&gt;&#9552;&lt;/span&gt;</p>') == (
+        "<p>═</p>"
+    )
+
+
+def test_malformed_nesting_keeps_text_and_decodes_entities():
+    html = (
+        "<h1>標題：副標<b>HTML<p>嵌套</b></h1><p>第二段內容。</p>"
+        "<h2>Meta + AEO</h2><p>Meta Description</p><p>描述 &lt;很好&gt;</p>"
+    )
+
+    article = ArticleParserService(use_ai=False).parse_document(html).parsed_article
+
+    assert article.title_suffix == "副標HTML嵌套"
+    assert article.meta_description == "描述 <很好>"
@@ -0,0 +1,124 @@
+"""Unit tests for the non-blocking GoogleDriveStorage wrappers."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httplib2
+import pytest
+
+from src.services.storage.google_drive_storage import GoogleDriveStorage
+
+PAYLOAD = b"0123456789abcdefghij"
+
+
+class FakeRangeHttp:
+    """Serves ``PAYLOAD`` in byte ranges like the Drive media endpoint."""
+
+    def __init__(self):
+        self.ranges: list[str] = []
+
+    def request(self, uri, method="GET", headers=None, **kwargs):
+        byte_range = headers["range"]
+        self.ranges.append(byte_range)
+        start, end = (int(part) for part in byte_range.split("=")[1].split("-"))
+        chunk = PAYLOAD[start : end + 1]
+        response = httplib2.Response(
+            {
+                "status": 206,
+                "content-range": f"bytes {start}-{start + len(chunk) - 1}/{len(PAYLOAD)}",
+            }
+        )
+        return response, chunk
+
+
+class SlowRequest:
+    def __init__(self, result, delay: float):
+        self.result = result
+        self.delay = delay
+
+    def execute(self, http=None):
+        time.sleep(self.delay)
+        return self.result
+
+
+class FakeFiles:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    def get(self, **kwargs):
+        return SlowRequest({"id": kwargs["fileId"], "fields": kwargs["fields"]}, self.delay)
+
+    def get_media(self, **kwargs):
+        return SimpleNamespace(uri=f"https://drive.test/{kwargs['fileId']}", headers={}, http=None)
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    monkeypatch.setattr(GoogleDriveStorage, "_initialize_service", lambda self: None)
+    storage = GoogleDriveStorage()
+    storage.chunk_size = 8
+    http = FakeRangeHttp()
+    storage._authorized_http = lambda: http
+    storage.http = http
+    return storage
+
+
+def _with_files(storage: GoogleDriveStorage, files: FakeFiles) -> GoogleDriveStorage:
+    storage.service = SimpleNamespace(files=lambda: files)
+    return storage
+
+
+async def test_blocking_calls_do_not_stall_event_loop(storage):
+    _with_files(storage, FakeFiles(delay=0.2))
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    metadata = await storage.get_file_metadata("doc-1", fields="id,name")
+    task.cancel()
+
+    assert metadata == {"id": "doc-1", "fields": "id,name"}
+    assert ticks >= 5
+
+
+async def test_call_timeout(storage):
+    _with_files(storage, FakeFiles(delay=0.5))
+    storage.request_timeout = 0.05
+
+    with pytest.raises(asyncio.TimeoutError):
+        await storage.get_file_metadata("doc-1")
+
+
+async def test_download_streams_in_chunks(storage, tmp_path):
+    _with_files(storage, FakeFiles())
+
+    assert await storage.download_file("file-1") == PAYLOAD
+    assert storage.http.ranges == ["bytes=0-7", "bytes=8-15", "bytes=16-23"]
+
+    destination = tmp_path / "nested" / "file.bin"
+    path = await storage.download_to_path("file-1", str(destination))
+
+    assert path == str(destination)
+    assert destination.read_bytes() == PAYLOAD
+    assert not (tmp_path / "nested" / "file.bin.part").exists()
+
+
+async def test_failed_download_leaves_no_partial_file(storage, tmp_path):
+    _with_files(storage, FakeFiles())
+
+    def broken_request(uri, method="GET", headers=None, **kwargs):
+        raise httplib2.HttpLib2Error("connection reset")
+
+    storage.http.request = broken_request
+    destination = tmp_path / "file.bin"
+
+    with pytest.raises(httplib2.HttpLib2Error):
+        await storage.download_to_path("file-1", str(destination))
+
+    assert list(tmp_path.iterdir()) == []
@@ -6,6 +6,7 @@ Tests for strip_html_tags, calculate_plain_text_position, and related functions.
 
 import pytest
 from src.services.parser.html_utils import (
+    PlainTextOffsetMap,
     strip_html_tags,
     calculate_plain_text_position,
     find_text_position_in_plain,
@@ -165,6 +166,86 @@ class TestCalculatePlainTextPosition:
         assert result.end == 0
 
 
+class TestPlainTextOffsetMap:
+    """Tests for the single-pass HTML → plain text offset map."""
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            "<p>Hello <strong>World</strong></p>",
+            "<p>A &amp; B&nbsp;&lt;C&gt;</p>\n<p>  spaced   out </p>",
+            "<div><script>var x = '<p>';</script><p>段落</p><!-- note --></div>",
+            "<p>Unclosed <b>bold",
+            "<p>a &amp;lt; b</p>",
+            "<p>&lt 6 &ltfoo AT&T</p>",
+            "",
+        ],
+    )
+    def test_plain_text_matches_strip_html_tags(self, html):
+        """plain_text is the same string strip_html_tags produces."""
+        assert PlainTextOffsetMap(html).plain_text == strip_html_tags(html)
+
+    def test_word_after_closing_tag(self):
+        """Text after a block boundary starts after the inserted space."""
+        html = "<p>Hello</p><p>World</p>"
+        offsets = PlainTextOffsetMap(html)
+
+        result = offsets.to_plain(15, 20)
+
+        assert (result.start, result.end) == (6, 11)
+        assert offsets.plain_text[result.start:result.end] == "World"
+
+    def test_entities_map_to_decoded_characters(self):
+        """An entity maps to the single character it decodes to."""
+        html = "<p>A &amp; B</p>"
+        offsets = PlainTextOffsetMap(html)
+
+        result = offsets.to_plain(html.index("&amp;"), html.index(" B"))
+
+        assert offsets.plain_text[result.start:result.end] == "&"
+
+    def test_entities_are_decoded_once(self):
+        """An escaped entity stays an entity, like a browser shows it."""
+        offsets = PlainTextOffsetMap("<p>a &amp;lt; b</p>")
+
+        assert offsets.plain_text == "a &lt; b"
+        assert strip_html_tags("<p>a &amp;lt; b</p>") == "a &lt; b"
+
+    def test_reference_without_semicolon(self):
+        """Named references may omit ";" as in HTML5 ("&lt 6" is "< 6")."""
+        html = "<p>&lt 6 &ltfoo</p>"
+        offsets = PlainTextOffsetMap(html)
+
+        assert offsets.plain_text == strip_html_tags(html) == "< 6 <foo"
+        result = offsets.to_plain(html.index("foo"), html.index("</p>"))
+        assert offsets.plain_text[result.start:result.end] == "foo"
+
+    def test_agrees_with_calculate_plain_text_position(self):
+        """Reusing one map gives the same answers as per-call conversion."""
+        html = "<p>健康飲食很重要。</p><p>段落二</p>"
+        offsets = PlainTextOffsetMap(html)
+
+        for start, end in [(3, 5), (7, 10), (17, 20)]:
+            assert offsets.to_plain(start, end) == calculate_plain_text_position(
+                html, start, end
+            )
+
+    def test_to_plain_many_marks_invalid_ranges(self):
+        """Invalid ranges yield None instead of raising."""
+        offsets = PlainTextOffsetMap("<p>Hello</p>")
+
+        results = offsets.to_plain_many([(3, 8), (5, 3), (0, 100)])
+
+        assert results == [Position(start=0, end=5), None, None]
+
+    def test_invalid_positions_raise(self):
+        """to_plain validates like calculate_plain_text_position."""
+        offsets = PlainTextOffsetMap("<p>Hello</p>")
+
+        with pytest.raises(ValueError):
+            offsets.to_plain(-1, 5)
+
+
 class TestFindTextPositionInPlain:
     """Tests for find_text_position_in_plain function."""
 
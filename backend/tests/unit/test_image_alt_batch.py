@@ -0,0 +1,127 @@
+"""Batch vision alt-text generation (fake CDN and fake OpenAI client)."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from src.services import image_alt_generator
+from src.services.image_alt_generator import (
+    GenerationMethod,
+    ImageAltGeneratorService,
+    ImageAltRequest,
+)
+from src.services.storage.image_store import ImageStore
+
+
+class FakeCompletions:
+    def __init__(self, drop_index: int | None = None):
+        self.calls: list[list[dict]] = []
+        self.in_flight = 0
+        self.peak = 0
+        self.drop_index = drop_index
+
+    async def create(self, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+        content = kwargs["messages"][1]["content"]
+        self.calls.append(content)
+        images = [part for part in content if part["type"] == "image_url"]
+        answer = {"image_type": "photo", "alt_text": "alt", "description": "desc"}
+        if not kwargs["messages"][0]["content"].endswith(
+            ImageAltGeneratorService.PROMPT_BATCH_SUFFIX
+        ):
+            body = answer
+        else:
+            body = {
+                "images": [
+                    {**answer, "index": i, "alt_text": f"alt {i}"}
+                    for i in range(1, len(images) + 1)
+                    if i != self.drop_index
+                ]
+            }
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(body)))],
+            usage=SimpleNamespace(total_tokens=400),
+        )
+
+
+@pytest.fixture
+def env(tmp_path, monkeypatch):
+    fetched: list[str] = []
+
+    def cdn(request: httpx.Request) -> httpx.Response:
+        fetched.append(request.url.path)
+        body = request.url.path.encode() * 10
+        return httpx.Response(200, content=body, headers={"content-type": "image/png"})
+
+    store = ImageStore(tmp_path, http_client=httpx.AsyncClient(transport=httpx.MockTransport(cdn)))
+    monkeypatch.setattr(image_alt_generator, "get_image_store", lambda: store)
+    service = ImageAltGeneratorService()
+    service.use_vertex_ai = False
+    completions = FakeCompletions()
+    service.openai_client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return SimpleNamespace(service=service, completions=completions, fetched=fetched)
+
+
+def _requests(count: int) -> list[ImageAltRequest]:
+    return [
+        ImageAltRequest(
+            image_id=100 + i,
+            image_url=f"https://cdn.example/{i}.png",
+            article_context={"title": "標題", "position": i},
+        )
+        for i in range(count)
+    ]
+
+
+async def _collect(service, requests, **kwargs):
+    return [s async for s in service.generate_suggestions_batch(requests, **kwargs)]
+
+
+async def test_images_fetched_once_and_packed_into_bounded_calls(env):
+    suggestions = await _collect(
+        env.service, _requests(6), images_per_call=4, concurrency=2
+    )
+
+    assert sorted(s.image_id for s in suggestions) == list(range(100, 106))
+    assert sorted(env.fetched) == sorted(f"/{i}.png" for i in range(6))
+    assert [sum(p["type"] == "image_url" for p in call) for call in env.completions.calls] == [
+        4,
+        2,
+    ]
+    assert env.completions.peak <= 2
+    first_image = env.completions.calls[0][1]["image_url"]["url"]
+    assert first_image.startswith("data:image/png;base64,")
+    assert all(s.generation_method == GenerationMethod.VISION_PHOTO for s in suggestions)
+    assert {s.tokens_used for s in suggestions} == {100, 200}
+
+    # Repeat run: answers and bytes come from the image store
+    env.fetched.clear()
+    env.completions.calls.clear()
+    again = await _collect(env.service, _requests(6), images_per_call=4)
+    assert env.fetched == [] and env.completions.calls == []
+    assert {s.image_id: s.suggested_alt_text for s in again} == {
+        s.image_id: s.suggested_alt_text for s in suggestions
+    }
+
+
+async def test_images_missing_from_packed_answer_retried_singly(env):
+    env.completions.drop_index = 2
+
+    suggestions = await _collect(env.service, _requests(3), images_per_call=3)
+
+    by_id = {s.image_id: s for s in suggestions}
+    assert len(env.completions.calls) == 2
+    # The retry reuses the loaded bytes instead of fetching again
+    assert sorted(env.fetched) == ["/0.png", "/1.png", "/2.png"]
+    retry_image = env.completions.calls[1][0]["image_url"]["url"]
+    assert retry_image.startswith("data:image/png;base64,")
+    assert by_id[101].suggested_alt_text == "alt"
+    assert by_id[100].suggested_alt_text == "alt 1"
+    assert by_id[102].suggested_alt_text == "alt 3"
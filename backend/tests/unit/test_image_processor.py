@@ -1,12 +1,18 @@
 """Unit tests for ImageProcessorService (Phase 7)."""
 
+import asyncio
 import io
 from pathlib import Path
+from types import SimpleNamespace
 
+import httpx
 import pytest
 from PIL import Image
 
+from src.services.parser.article_processor import ArticleProcessingService
 from src.services.parser.image_processor import ImageProcessorService
+from src.services.parser.models import ParsedImage
+from src.services.storage.image_store import ImageStore
 
 
 class TestImageProcessorService:
@@ -265,3 +271,79 @@ class TestImageMetadataIntegration:
         assert image_metadata.width == 640
         assert image_metadata.height == 480
         assert image_metadata.format == "JPEG"
+
+
+class TestConcurrentImageIngestion:
+    """ArticleProcessingService._process_images against a mock transport."""
+
+    @staticmethod
+    def _jpeg(size: tuple[int, int]) -> bytes:
+        buffer = io.BytesIO()
+        Image.new("RGB", size, color="green").save(buffer, format="JPEG")
+        return buffer.getvalue()
+
+    async def test_downloads_bounded_per_host_and_keep_document_order(self, tmp_path):
+        large, small = self._jpeg((1600, 1200)), self._jpeg((200, 150))
+        in_flight: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            host = request.url.host
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            if request.url.path.endswith("missing.jpg"):
+                return httpx.Response(404)
+            body = large if "large" in request.url.path else small
+            return httpx.Response(200, content=body)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        processor = ImageProcessorService(http_client=client)
+        store = ImageStore(tmp_path / "cache", http_client=client)
+        service = ArticleProcessingService(
+            article_parser=None,
+            image_processor=processor,
+            storage_base_path=str(tmp_path),
+            internal_link_service=SimpleNamespace(is_configured=False),
+            max_images_per_host=2,
+            preview_max_size=400,
+            image_store=store,
+        )
+        urls = [f"https://a.example/{i}.jpg" for i in range(5)] + [
+            "https://b.example/large.jpg",
+            "https://b.example/missing.jpg",
+        ]
+        parsed = [
+            ParsedImage(source_url=url, position=i, caption=f"c{i}") for i, url in enumerate(urls)
+        ]
+        added = []
+
+        images = await service._process_images(7, parsed, SimpleNamespace(add=added.append))
+
+        assert peak["a.example"] == 2
+        assert [img.position for img in images] == [0, 1, 2, 3, 4, 5]
+        assert added == images
+        assert not (tmp_path / "article_7" / "image_6_.jpg").exists()
+
+        small_img, large_img = images[0], images[5]
+        assert small_img.preview_path == small_img.source_path
+        assert large_img.preview_path != large_img.source_path
+        with Image.open(large_img.preview_path) as preview:
+            assert max(preview.size) == 400
+        specs = large_img.image_metadata["image_technical_specs"]
+        assert (specs["width"], specs["height"]) == (1600, 1200)
+        assert specs["file_size_bytes"] == len(large)
+
+        # A reparse is served entirely from the image store
+        in_flight.clear()
+        peak.clear()
+        again = await service._process_images(7, parsed, SimpleNamespace(add=added.append))
+        await store.close()
+
+        assert peak == {"b.example": 1}  # only the 404 is retried
+        assert [img.image_metadata["image_technical_specs"] for img in again] == [
+            img.image_metadata["image_technical_specs"] for img in images
+        ]
+        assert again[3].image_metadata["source_info"]["original_url"] == urls[3]
+        assert Path(again[5].preview_path).exists()
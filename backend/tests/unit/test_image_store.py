@@ -0,0 +1,117 @@
+"""Unit tests for the content-addressed ImageStore."""
+
+import httpx
+import pytest
+
+from src.services.storage.image_store import ImageStore
+
+
+class FakeCDN:
+    """Serves fixed bodies with ETags and honours If-None-Match."""
+
+    def __init__(self, bodies: dict[str, bytes]):
+        self.bodies = bodies
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        body = self.bodies[request.url.path]
+        etag = f'"{hash(body)}"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(
+            200, content=body, headers={"etag": etag, "content-type": "image/jpeg"}
+        )
+
+
+@pytest.fixture
+def cdn():
+    return FakeCDN({"/a.jpg": b"A" * 1000, "/copy-of-a.jpg": b"A" * 1000, "/b.jpg": b"B" * 1000})
+
+
+def _store(tmp_path, cdn, **kwargs) -> ImageStore:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(cdn))
+    return ImageStore(tmp_path, http_client=client, **kwargs)
+
+
+async def test_fresh_entries_need_no_request_and_content_is_shared(tmp_path, cdn):
+    store = _store(tmp_path, cdn)
+
+    first = await store.fetch("https://cdn.example/a.jpg")
+    again = await store.fetch("https://cdn.example/a.jpg")
+    copy = await store.fetch("https://cdn.example/copy-of-a.jpg")
+
+    assert len(cdn.requests) == 2
+    assert (first.from_cache, again.from_cache) == (False, True)
+    assert copy.path == first.path
+    assert first.path.read_bytes() == b"A" * 1000
+    assert list(store.tmp_dir.iterdir()) == []
+    await store.close()
+
+
+async def test_stale_entries_revalidate_with_etag(tmp_path, cdn):
+    store = _store(tmp_path, cdn, revalidate_seconds=0)
+
+    first = await store.fetch("https://cdn.example/a.jpg")
+    second = await store.fetch("https://cdn.example/a.jpg")
+
+    assert cdn.requests[1].headers["if-none-match"] == f'"{hash(b"A" * 1000)}"'
+    assert second.from_cache
+    assert second.sha256 == first.sha256
+
+    cdn.bodies["/a.jpg"] = b"changed"
+    third = await store.fetch("https://cdn.example/a.jpg")
+    assert not third.from_cache
+    assert third.path.read_bytes() == b"changed"
+    await store.close()
+
+
+async def test_least_recently_used_blobs_evicted_over_budget(tmp_path, cdn):
+    store = _store(tmp_path, cdn, max_bytes=1500, min_idle_seconds=0)
+
+    a = await store.fetch("https://cdn.example/a.jpg")
+    await store.save_metadata(a.sha256, {"width": 1})
+    b = await store.fetch("https://cdn.example/b.jpg")
+
+    assert not a.path.exists()
+    assert b.path.exists()
+    assert await store.metadata(a.sha256) is None
+    refetched = await store.fetch("https://cdn.example/a.jpg")
+    assert not refetched.from_cache
+    await store.close()
+
+
+async def test_recently_fetched_blobs_survive_eviction(tmp_path, cdn):
+    cdn.bodies["/c.jpg"] = b"C" * 1000
+    store = _store(tmp_path, cdn, max_bytes=1500, min_idle_seconds=60)
+
+    a = await store.fetch("https://cdn.example/a.jpg")
+    b = await store.fetch("https://cdn.example/b.jpg")
+    assert a.path.read_bytes() == b"A" * 1000
+
+    # a goes idle; b was just fetched and may still be in use
+    store._query(
+        "UPDATE blobs SET last_access = last_access - 120 WHERE sha256 = ?", (a.sha256,)
+    )
+    c = await store.fetch("https://cdn.example/c.jpg")
+
+    assert not a.path.exists()
+    assert b.path.exists() and c.path.exists()
+    await store.close()
+
+
+async def test_derived_data_is_keyed_by_content(tmp_path, cdn):
+    store = _store(tmp_path, cdn)
+    image = await store.fetch("https://cdn.example/a.jpg")
+
+    await store.save_metadata(image.sha256, {"width": 640})
+    await store.save_alt_text(image.sha256, "ctx-1", {"suggested_alt_text": "一隻貓"})
+
+    assert await store.metadata(image.sha256) == {"width": 640}
+    assert await store.alt_text(image.sha256, "ctx-1") == {"suggested_alt_text": "一隻貓"}
+    assert await store.alt_text(image.sha256, "ctx-2") is None
+
+    linked = tmp_path / "out" / "a.jpg"
+    await store.link_to(image.path, linked)
+    assert linked.read_bytes() == b"A" * 1000
+    await store.close()
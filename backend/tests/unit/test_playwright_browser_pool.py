@@ -0,0 +1,150 @@
+"""Unit tests for the warm Playwright browser pool."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.services.providers.playwright_browser_pool import (
+    SESSION_EXPIRY_MARGIN_SECONDS,
+    BrowserPool,
+    session_key,
+)
+
+KEY = session_key("https://cms.test/", "editor")
+
+
+class FakeContext:
+    def __init__(self, options):
+        self.options = options
+        self.closed = False
+
+    async def new_page(self):
+        return object()
+
+    async def storage_state(self):
+        return {
+            "cookies": [
+                {"name": "wordpress_logged_in_abc", "expires": time.time() + 3600},
+                {"name": "wp-settings-1", "expires": time.time() + 86400},
+            ]
+        }
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts: list[FakeContext] = []
+        self.connected = True
+        self.closed = False
+
+    def is_connected(self):
+        return self.connected and not self.closed
+
+    async def new_context(self, **options):
+        context = FakeContext(options)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def launched():
+    return []
+
+
+@pytest.fixture
+def make_pool(launched):
+    def factory(**kwargs):
+        async def launcher(headless):
+            browser = FakeBrowser()
+            launched.append(browser)
+            return browser
+
+        kwargs.setdefault("size", 1)
+        kwargs.setdefault("max_uses", 10)
+        return BrowserPool(launcher=launcher, **kwargs)
+
+    return factory
+
+
+async def test_browser_and_login_are_reused(make_pool, launched):
+    pool = make_pool()
+
+    async with pool.lease(KEY, context_options={"viewport": {"width": 1}}) as lease:
+        assert lease.session_restored is False
+        await lease.save_session()
+
+    async with pool.lease(KEY) as lease:
+        assert lease.session_restored is True
+
+    [browser] = launched
+    first, second = browser.contexts
+    assert "storage_state" not in first.options
+    assert second.options["storage_state"]["cookies"][0]["name"].startswith("wordpress_logged_in")
+    assert first.closed and second.closed
+
+
+async def test_expired_session_and_other_sites_log_in_again(make_pool):
+    pool = make_pool()
+    async with pool.lease(KEY) as lease:
+        await lease.save_session()
+
+    async with pool.lease(session_key("https://other.test", "editor")) as lease:
+        assert lease.session_restored is False
+
+    expiry = pool._sessions[KEY].expires_at
+    assert expiry < time.time() + 3600 - SESSION_EXPIRY_MARGIN_SECONDS + 1
+    pool._sessions[KEY].expires_at = time.time() - 1
+    async with pool.lease(KEY) as lease:
+        assert lease.session_restored is False
+    assert KEY not in pool._sessions
+
+
+async def test_recycles_after_max_uses_and_disconnect(make_pool, launched):
+    pool = make_pool(max_uses=2)
+
+    for _ in range(3):
+        async with pool.lease(KEY):
+            pass
+    assert len(launched) == 2
+    assert launched[0].closed and not launched[1].closed
+
+    launched[1].connected = False
+    async with pool.lease(KEY):
+        pass
+    assert len(launched) == 3
+
+
+async def test_concurrency_is_bounded(make_pool, launched):
+    pool = make_pool(size=2)
+    running = {"now": 0, "peak": 0}
+
+    async def publish():
+        async with pool.lease(KEY):
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+            await asyncio.sleep(0.01)
+            running["now"] -= 1
+
+    await asyncio.gather(*(publish() for _ in range(6)))
+
+    assert running["peak"] == 2
+    assert len(launched) == 2
+
+
+async def test_failed_publish_releases_browser(make_pool, launched):
+    pool = make_pool()
+
+    with pytest.raises(RuntimeError):
+        async with pool.lease(KEY):
+            raise RuntimeError("editor never loaded")
+
+    async with pool.lease(KEY):
+        pass
+    assert len(launched) == 1
+    assert all(context.closed for context in launched[0].contexts)
@@ -0,0 +1,90 @@
+"""Incremental JSON parsing of streamed AI answers."""
+
+import json
+from types import SimpleNamespace
+
+import anthropic
+
+from src.services.parser.article_parser import ArticleParserService
+from src.services.parser.streaming_json import JSONObjectStream
+
+ANSWER = {
+    "title_main": '标题 "引号"',
+    "author_line": "文／作者",
+    "images": [{"url": "https://example.com/a.jpg", "caption": "{not a brace}"}],
+    "body_html": "<p>正文</p>",
+}
+
+
+def _chunks(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def test_members_emitted_as_they_complete_across_chunk_boundaries():
+    text = "```json\n" + json.dumps(ANSWER, ensure_ascii=False) + "\n```"
+    stream = JSONObjectStream()
+    emitted = []
+    for chunk in _chunks(text, 3):
+        emitted.extend(stream.feed(chunk))
+
+    assert [key for key, _ in emitted] == list(ANSWER)
+    assert stream.members == ANSWER
+    assert stream.complete
+    assert stream.text == text
+
+
+def test_truncated_answer_keeps_finished_members():
+    text = '{"title_main": "标题", "body_html": "<p>第一行\n第二行</p>", "faqs": [{"q": "问'
+    stream = JSONObjectStream()
+    for chunk in _chunks(text, 5):
+        stream.feed(chunk)
+
+    assert stream.members == {"title_main": "标题", "body_html": "<p>第一行\n第二行</p>"}
+    assert not stream.complete
+
+
+class _FakeStream:
+    def __init__(self, text: str, stop_reason: str) -> None:
+        self._text = text
+        self._stop_reason = stop_reason
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    @property
+    def text_stream(self):
+        return iter(_chunks(self._text, 7))
+
+    def get_final_message(self):
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=self._text)],
+            stop_reason=self._stop_reason,
+            usage=SimpleNamespace(input_tokens=100, output_tokens=50),
+        )
+
+
+def test_parser_uses_streamed_fields_when_output_hits_max_tokens(monkeypatch):
+    text = json.dumps(ANSWER, ensure_ascii=False)[:-1] + ', "faqs": [{"question": "未完'
+
+    class _FakeAnthropic:
+        def __init__(self, api_key):
+            self.messages = SimpleNamespace(stream=lambda **kw: _FakeStream(text, "max_tokens"))
+
+    monkeypatch.setattr(anthropic, "Anthropic", _FakeAnthropic)
+    seen = []
+    parser = ArticleParserService(use_ai=True, anthropic_api_key="test-key")
+
+    result = parser.parse_document(
+        "<html><body><p>正文</p></body></html>",
+        fallback_to_heuristic=False,
+        on_section=lambda key, value: seen.append(key),
+    )
+
+    assert seen == list(ANSWER)
+    assert result.success
+    assert result.parsed_article.title_main == ANSWER["title_main"]
+    assert result.metadata["truncated"] is True
+    assert result.metadata["streamed_sections"] == list(ANSWER)
@@ -539,3 +539,57 @@ class TestCostCalculation:
 
         # Should use default pricing without crashing
         assert cost > 0
+
+
+class TestStreamingBrokenOff:
+    """A stream that stops before the JSON object closes."""
+
+    @staticmethod
+    def _client(text: str) -> MagicMock:
+        class _Stream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            @property
+            async def text_stream(self):
+                for index in range(0, len(text), 7):
+                    yield text[index:index + 7]
+
+            async def get_final_message(self):
+                return MagicMock(
+                    content=[MagicMock(text=text)],
+                    usage=MagicMock(input_tokens=100, output_tokens=50),
+                    stop_reason="max_tokens",
+                )
+
+        client = MagicMock()
+        client.messages.stream = MagicMock(return_value=_Stream())
+        return client
+
+    @pytest.mark.asyncio
+    async def test_partial_answer_is_not_marked_generated(self):
+        text = (
+            '{"title_suggestions": {"suggested_title_sets": []}, '
+            '"seo_keywords": {}, "meta_description": {}, "tags": {}, '
+            '"faqs": [{"question": "Q'
+        )
+        service = UnifiedOptimizationService(
+            anthropic_client=self._client(text), db_session=MagicMock()
+        )
+        service._build_unified_prompt = MagicMock(return_value="prompt")
+        service._save_group = AsyncMock()
+        service._store_optimizations = AsyncMock()
+        service._mark_generated = AsyncMock()
+        article = MagicMock(id=1, body_html="<p>x</p>", unified_optimization_generated=False)
+
+        result = await service.generate_all_optimizations(article, stream=True)
+
+        assert result["partial"] is True
+        assert result["faq_applicable"] is None
+        assert result["title_suggestions"] == {"suggested_title_sets": []}
+        assert [c.args[1] for c in service._save_group.await_args_list] == ["title", "seo"]
+        service._store_optimizations.assert_not_awaited()
+        service._mark_generated.assert_not_awaited()
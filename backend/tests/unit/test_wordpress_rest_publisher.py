@@ -0,0 +1,223 @@
+"""Unit tests for the REST-first WordPress publisher."""
+
+import json
+
+import httpx
+import pytest
+
+from src.api.schemas.seo import SEOMetadata
+from src.services.cms_adapter.taxonomy import clear_taxonomy_caches
+from src.services.cms_adapter.wordpress_adapter import WordPressAdapter
+from src.services.providers import wordpress_rest_publisher
+from src.services.providers.wordpress_rest_publisher import (
+    RestPublishUnavailableError,
+    WordPressRestPublisher,
+)
+from src.services.storage.image_store import ImageStore
+
+SITE = "https://cms.test"
+
+
+class FakeWordPress:
+    """Minimal WP REST API served through httpx.MockTransport."""
+
+    def __init__(self, namespaces=("wp/v2",), echo_meta=True, post_status=201):
+        self.namespaces = list(namespaces)
+        self.echo_meta = echo_meta
+        self.post_status = post_status
+        self.posts: list[dict] = []
+        self.media: list[dict] = []
+        self.deleted_media: list[int] = []
+        self.tags = [{"id": 7, "name": "Health"}]
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/wp-json":
+            return httpx.Response(200, json={"namespaces": self.namespaces})
+        if path == "/wp-json/wp/v2/tags" and request.method == "GET":
+            return httpx.Response(200, json=self.tags)
+        if path == "/wp-json/wp/v2/tags":
+            return httpx.Response(201, json={"id": 8})
+        if path == "/wp-json/wp/v2/categories" and request.method == "GET":
+            return httpx.Response(404, json={"code": "rest_no_route"})
+        if path == "/wp-json/wp/v2/media":
+            media_id = 100 + len(self.media)
+            self.media.append({"id": media_id, "type": request.headers["content-type"]})
+            return httpx.Response(
+                201, json={"id": media_id, "source_url": f"{SITE}/uploads/{media_id}.png"}
+            )
+        if path.startswith("/wp-json/wp/v2/media/"):
+            media_id = int(path.rsplit("/", 1)[1])
+            if request.method == "DELETE":
+                self.deleted_media.append(media_id)
+                return httpx.Response(200, json={"deleted": True})
+            return httpx.Response(
+                200, json={"id": media_id, "source_url": f"{SITE}/uploads/{media_id}.png"}
+            )
+        if path == "/wp-json/wp/v2/posts":
+            payload = json.loads(request.content)
+            self.posts.append(payload)
+            if self.post_status >= 400:
+                return httpx.Response(self.post_status, json={"code": "rest_cannot_create"})
+            meta = payload.get("meta", {}) if self.echo_meta else {}
+            return httpx.Response(
+                201, json={"id": 55, "link": f"{SITE}/?p=55", "status": "draft", "meta": meta}
+            )
+        if path == "/wp-json/wp/v2/posts/55":
+            return httpx.Response(200, json={"id": 55, "link": f"{SITE}/p55", "status": "publish"})
+        return httpx.Response(404)
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.calls: list[dict] = []
+
+    async def complete_post(self, **kwargs):
+        self.calls.append(kwargs)
+        return {"success": True, "editor_url": "editor"}
+
+
+def _publisher(site: FakeWordPress, browser: FakeBrowser) -> WordPressRestPublisher:
+    adapter = WordPressAdapter(SITE, {"username": "u", "application_password": "p"})
+    adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(site.handler))
+    return WordPressRestPublisher(
+        SITE, "u", "p", adapter=adapter, browser_publisher=browser, media_concurrency=2
+    )
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    clear_taxonomy_caches()
+    yield
+    clear_taxonomy_caches()
+
+
+@pytest.fixture
+def image_file(tmp_path):
+    path = tmp_path / "photo.png"
+    path.write_bytes(b"\x89PNG fake")
+    return str(path)
+
+
+SEO = SEOMetadata(
+    meta_title="A sufficiently long title",
+    meta_description="A sufficiently long description",
+    focus_keyword="health",
+)
+
+
+async def test_draft_created_over_rest_with_browser_only_for_unsupported_steps(image_file):
+    site = FakeWordPress(namespaces=["wp/v2", "yoast/v1"], echo_meta=False)
+    browser = FakeBrowser()
+    publisher = _publisher(site, browser)
+
+    result = await publisher.publish(
+        article_title="Title",
+        article_body="<p>one</p><p>two</p>",
+        seo_data=SEO,
+        article_images=[
+            {"local_path": image_file, "filename": "a.png", "alt_text": "A", "position": 1},
+        ],
+        primary_category="News",
+        tags=["health", "New tag"],
+        featured_image_path=image_file,
+    )
+
+    [post] = site.posts
+    assert post["status"] == "draft"
+    assert post["tags"] == [7, 8]
+    assert post["featured_media"] in {100, 101}
+    assert post["meta"]["_yoast_wpseo_focuskw"] == "health"
+    assert post["content"].startswith("<p>one</p><figure")
+    assert "wp-image-" in post["content"] and post["content"].endswith("<p>two</p>")
+    assert {m["type"] for m in site.media} == {"image/png"}
+
+    assert result["success"] is True
+    assert result["cms_article_id"] == "55"
+    assert result["editor_url"] == f"{SITE}/wp-admin/post.php?post=55&action=edit"
+    assert result["publishing_method"] == "rest+browser"
+    assert result["steps"] == {
+        "tags": "rest",
+        "categories": "browser",
+        "featured_image": "rest",
+        "images": "rest",
+        "seo": "browser",
+    }
+    [call] = browser.calls
+    assert call["post_id"] == 55
+    assert call["steps"] == ["categories", "seo"]
+
+
+async def test_publish_mode_uses_rest_only_when_everything_is_supported():
+    site = FakeWordPress(namespaces=["wp/v2", "rankmath/v1"])
+    browser = FakeBrowser()
+
+    result = await _publisher(site, browser).publish(
+        article_title="Title",
+        article_body="<p>body</p>",
+        seo_data=SEO,
+        publish_mode="publish",
+        tags=["health"],
+    )
+
+    assert site.posts[0]["meta"]["rank_math_description"] == SEO.meta_description
+    assert result["steps"] == {"tags": "rest", "seo": "rest"}
+    assert result["publishing_method"] == "rest"
+    assert result["status"] == "published"
+    assert result["url"] == f"{SITE}/p55"
+    assert browser.calls == []
+
+
+async def test_rejected_post_creation_raises_for_full_browser_fallback():
+    site = FakeWordPress(post_status=401)
+
+    with pytest.raises(RestPublishUnavailableError):
+        await _publisher(site, FakeBrowser()).publish(
+            article_title="Title", article_body="<p>body</p>"
+        )
+
+
+async def test_rejected_post_creation_removes_uploaded_media(image_file):
+    site = FakeWordPress(post_status=401)
+
+    with pytest.raises(RestPublishUnavailableError):
+        await _publisher(site, FakeBrowser()).publish(
+            article_title="Title",
+            article_body="<p>body</p>",
+            article_images=[{"local_path": image_file, "position": 0}],
+            featured_image_path=image_file,
+        )
+
+    assert sorted(site.deleted_media) == [100, 101]
+
+
+def test_figures_at_the_same_position_keep_their_order():
+    images = [
+        {"wordpress_url": f"{SITE}/{name}.png", "media_id": index, "position": 1}
+        for index, name in enumerate(["first", "second", "third"])
+    ]
+
+    body = WordPressRestPublisher._place_images("<p>one</p><p>two</p>", images)
+
+    assert body.index("first") < body.index("second") < body.index("third")
+    assert body.startswith("<p>one</p><figure") and body.endswith("<p>two</p>")
+
+
+async def test_images_without_local_path_are_downloaded(tmp_path, monkeypatch):
+    def cdn(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"\x89PNG fake", headers={"content-type": "image/png"})
+
+    store = ImageStore(tmp_path, http_client=httpx.AsyncClient(transport=httpx.MockTransport(cdn)))
+    monkeypatch.setattr(wordpress_rest_publisher, "get_image_store", lambda: store)
+    site = FakeWordPress()
+    source_url = "https://cdn.example/photo"
+
+    result = await _publisher(site, FakeBrowser()).publish(
+        article_title="Title",
+        article_body=f'<p><img src="{source_url}"/></p>',
+        article_images=[{"source_url": source_url, "alt_text": "A"}],
+    )
+
+    assert result["steps"] == {"images": "rest"}
+    assert site.media == [{"id": 100, "type": "image/png"}]
+    assert f'src="{SITE}/uploads/100.png"' in site.posts[0]["content"]
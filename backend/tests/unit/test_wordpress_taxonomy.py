@@ -0,0 +1,101 @@
+"""Unit tests for the cached WordPress taxonomy resolver."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.services.cms_adapter.taxonomy import clear_taxonomy_caches, get_taxonomy_cache
+from src.services.cms_adapter.wordpress_adapter import WordPressAdapter
+
+SITE = "https://cms.test"
+
+
+class FakeTerms:
+    """Paged /tags endpoint with a slow create to expose races."""
+
+    def __init__(self, count: int):
+        self.terms = [{"id": i, "name": f"Tag {i}"} for i in range(1, count + 1)]
+        self.terms.append({"id": 999, "name": "Q&amp;A"})
+        self.list_calls: list[int] = []
+        self.created: list[str] = []
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            page = int(request.url.params["page"])
+            per_page = int(request.url.params["per_page"])
+            self.list_calls.append(page)
+            total_pages = -(-len(self.terms) // per_page)
+            chunk = self.terms[(page - 1) * per_page : page * per_page]
+            return httpx.Response(200, json=chunk, headers={"X-WP-TotalPages": str(total_pages)})
+
+        name = json.loads(request.content)["name"]
+        await asyncio.sleep(0.01)
+        if name == "Tag 7":
+            return httpx.Response(
+                400, json={"code": "term_exists", "data": {"status": 400, "term_id": 7}}
+            )
+        self.created.append(name)
+        return httpx.Response(201, json={"id": 5000 + len(self.created), "name": name})
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    clear_taxonomy_caches()
+    yield
+    clear_taxonomy_caches()
+
+
+def _adapter(site: FakeTerms) -> WordPressAdapter:
+    adapter = WordPressAdapter(SITE, {"username": "u", "application_password": "p"})
+    adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(site.handler))
+    return adapter
+
+
+async def test_pages_through_all_terms_once_and_matches_case_insensitively():
+    site = FakeTerms(count=250)
+
+    ids = await _adapter(site).get_or_create_term_ids("tags", ["tag 250", "TAG 1", "q&a"])
+    again = await _adapter(site).get_or_create_term_ids("tags", ["Tag 101"])
+
+    assert ids == [250, 1, 999]
+    assert again == [101]
+    assert sorted(site.list_calls) == [1, 2, 3]
+    assert site.created == []
+
+
+async def test_missing_terms_are_created_once_and_cached():
+    site = FakeTerms(count=3)
+    adapter = _adapter(site)
+
+    first, second = await asyncio.gather(
+        adapter.get_or_create_term_ids("tags", ["New", "Other", "new", "Tag 2"]),
+        adapter.get_or_create_term_ids("tags", ["NEW"]),
+    )
+
+    assert sorted(site.created) == ["New", "Other"]
+    assert first[0] == second[0]
+    assert first[2] == 2 and len(first) == 3
+    assert await adapter.get_or_create_term_ids("tags", ["other"]) == [first[1]]
+    assert len(site.created) == 2
+
+
+async def test_term_created_elsewhere_resolves_to_existing_id():
+    site = FakeTerms(count=3)
+    adapter = _adapter(site)
+    await adapter.load_terms("tags")
+
+    assert await adapter.get_or_create_term_ids("tags", ["Tag 7"]) == [7]
+    assert get_taxonomy_cache(adapter.api_base, "tags").get("tag 7") == 7
+
+
+async def test_expired_cache_is_reloaded():
+    site = FakeTerms(count=3)
+    adapter = _adapter(site)
+    await adapter.load_terms("tags")
+    get_taxonomy_cache(adapter.api_base, "tags").invalidate()
+
+    await adapter.get_or_create_term_ids("tags", ["Tag 1"])
+
+    assert site.list_calls == [1, 1]